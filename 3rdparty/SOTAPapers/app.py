@@ -44,26 +44,21 @@ def read_index():
 
 @app.get("/api/papers", response_model=PaperGraph)
 async def get_paper_graph():
-    async with db.AsyncSession as session:
-        all_papers = await db.get_all_papers_async()
+    # papers are streamed from the DB; references come back as id stubs
+    nodes = []
+    async for paper in db.iter_papers_async():
+        nodes.append(paper)
 
-        # Create nodes
-        nodes = []
-        id_map = {}
-        for paper in all_papers:
-            logger.info(f"Paper: {paper.title}")
-            nodes.append(paper)
+    node_ids = {paper.id for paper in nodes}
+    edges = []
+    for paper in nodes:
+        if not paper.content or not paper.content.references:
+            continue
+        for ref in paper.content.references:
+            if ref.id in node_ids:
+                edges.append(PaperEdge(source=paper.id, target=ref.id))
 
-        # Create edges
-        edges = []
-        for paper in id_map.values():
-            if not paper.content or not paper.content.references:
-                continue
-            for ref in paper.content.references:
-                if ref.id in id_map:
-                    edges.append(PaperEdge(source=paper.id, target=ref.id))
-
-        return PaperGraph(nodes=nodes, edges=edges)
+    return PaperGraph(nodes=nodes, edges=edges)
 
 if __name__ == "__main__":
     import uvicorn
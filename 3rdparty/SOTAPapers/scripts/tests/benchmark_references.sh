@@ -0,0 +1,4 @@
+#!/bin/bash
+uv run sotapapers/modules/paper_reader.py \
+    --benchmark-dir sotapapers/assets/examples \
+    --num-processes 4
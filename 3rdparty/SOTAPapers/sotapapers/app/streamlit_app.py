@@ -1,3 +1,4 @@
+import asyncio
 import streamlit as st
 import loguru # Import loguru for logging
 import pandas as pd # Added pandas for DataFrame handling
@@ -5,6 +6,7 @@ import pandas as pd # Added pandas for DataFrame handling
 from sotapapers.utils.config import get_config_path
 from sotapapers.core.settings import Settings
 from sotapapers.core.database import DataBase
+from sotapapers.core.models import PaperORM
 from sotapapers.modules.database_query_agent import DatabaseQueryAgent
 
 settings = Settings(get_config_path())
@@ -56,9 +58,24 @@ def login_screen():
             else:
                 st.error("Please enter both username and password to register.")
 
+async def _collect_papers_with_code() -> pd.DataFrame:
+    rows = []
+    async for paper in db.iter_papers_async(PaperORM.github_url.isnot(None)):
+        rows.append({
+            'Title': paper.title,
+            'Year': paper.year,
+            'Venue': paper.venue,
+            'GitHub': paper.media.github_url,
+            'Stars': paper.metrics.github_star_count,
+            'Citations': paper.metrics.citations_total,
+            'References': len(paper.content.references),
+            'Cited by': len(paper.content.cited_by),
+        })
+    return pd.DataFrame(rows)
+
 def load_papers_with_code():
-    # load papers from database
-    papers = db.get_papers_with_code()
+    # stream papers from database
+    papers = asyncio.run(_collect_papers_with_code())
     st.dataframe(papers)
 
 def show_main_app():
@@ -1,10 +1,10 @@
-from sqlalchemy import create_engine, select, text
+from sqlalchemy import create_engine, or_, select, text
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker, joinedload, selectinload
-from sotapapers.core.models import Base, PaperORM, UserORM
+from sqlalchemy.orm import sessionmaker, joinedload, noload
+from sotapapers.core.models import Base, PaperORM, UserORM, paper_references
 from sotapapers.core.paper import create_paper_from_schema, create_paper_from_orm
-from sotapapers.core.schemas import Paper
-from typing import List, Optional
+from sotapapers.core.schemas import Paper, PaperRef
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Union
 import loguru
 from sqlalchemy.ext.asyncio import AsyncSession
 from passlib.hash import bcrypt
@@ -185,35 +185,76 @@ class DataBase:
 
             return paper
 
-    async def get_all_papers_async(self) -> List[Paper]:
-        async with self.AsyncSession as session:
-            result = await session.execute(
-                select(PaperORM)
-                .options(
-                    selectinload(PaperORM.references),
-                    selectinload(PaperORM.cited_by),
+    async def iter_papers_async(self, *criteria, batch_size: int = 500, identity_map: Optional[Dict[str, Paper]] = None) -> AsyncIterator[Paper]:
+        """Stream papers matching ``criteria`` (PaperORM column expressions).
+
+        Rows are read through a server-side cursor ``batch_size`` at a time and
+        each paper is converted once. ``references`` / ``cited_by`` hold
+        PaperRef stubs (ids only); use resolve_papers_async to load them.
+        Converted papers are kept in ``identity_map`` when one is given.
+        """
+        stubs: Dict[str, PaperRef] = {}
+
+        def stub(paper_id: str) -> PaperRef:
+            ref = stubs.get(paper_id)
+            if ref is None:
+                ref = stubs[paper_id] = PaperRef(id=paper_id)
+            return ref
+
+        stmt = (
+            select(PaperORM)
+            .where(*criteria)
+            .options(noload(PaperORM.references), noload(PaperORM.cited_by))
+            .order_by(PaperORM.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async with self.AsyncSession() as session, self.async_engine.connect() as edge_conn:
+            result = await session.stream_scalars(stmt)
+            async for paper_orms in result.partitions():
+                ids = [paper_orm.id for paper_orm in paper_orms]
+                references = {paper_id: [] for paper_id in ids}
+                cited_by = {paper_id: [] for paper_id in ids}
+                edges = await edge_conn.execute(
+                    select(paper_references.c.paper_id, paper_references.c.reference_id).where(
+                        or_(paper_references.c.paper_id.in_(ids), paper_references.c.reference_id.in_(ids))
+                    )
                 )
-            )
-            paper_orms = result.scalars().all()
+                for paper_id, reference_id in edges:
+                    if paper_id in references:
+                        references[paper_id].append(stub(reference_id))
+                    if reference_id in cited_by:
+                        cited_by[reference_id].append(stub(paper_id))
 
-            papers = [create_paper_from_orm(paper) for paper in paper_orms]
-            
-            for i, paper in enumerate(papers):
-                paper_orm = paper_orms[i]
+                for paper_orm in paper_orms:
+                    paper = identity_map.get(paper_orm.id) if identity_map is not None else None
+                    if paper is None:
+                        paper = create_paper_from_orm(paper_orm)
+                        paper.content.references = references[paper_orm.id]
+                        paper.content.cited_by = cited_by[paper_orm.id]
+                        if identity_map is not None:
+                            identity_map[paper.id] = paper
+                    yield paper
 
-                references = []
-                cited_by = []
+    async def resolve_papers_async(self, refs: Iterable[Union[str, PaperRef, Paper]], identity_map: Optional[Dict[str, Paper]] = None) -> List[Paper]:
+        """Load the papers behind ids / PaperRef stubs, in the given order.
 
-                if paper_orm.references is not None:
-                    for ref in paper_orm.references:
-                        references.append(create_paper_from_orm(ref))
-                if paper_orm.cited_by is not None:
-                    for citing in paper_orm.cited_by:
-                        cited_by.append(create_paper_from_orm(citing))
+        Papers already in ``identity_map`` are reused; the rest are fetched in
+        one query per batch and added to it. Unknown ids are skipped.
+        """
+        if identity_map is None:
+            identity_map = {}
+        ids = [ref if isinstance(ref, str) else ref.id for ref in refs]
+        missing = list(dict.fromkeys(paper_id for paper_id in ids if paper_id not in identity_map))
+        # stay below SQLite's bound parameter limit
+        for start in range(0, len(missing), 500):
+            chunk = missing[start:start + 500]
+            async for _ in self.iter_papers_async(PaperORM.id.in_(chunk), identity_map=identity_map):
+                pass
+        return [identity_map[paper_id] for paper_id in ids if paper_id in identity_map]
 
-                paper.content.references = references
-                paper.content.cited_by = cited_by 
-            return papers
+    async def get_all_papers_async(self) -> List[Paper]:
+        """All papers as a list; relations are PaperRef stubs (see iter_papers_async)."""
+        return [paper async for paper in self.iter_papers_async()]
 
     def get_paper_by_title_and_year(self, title: str, year: Optional[int] = None) -> Optional[Paper]:
         session = self.Session()
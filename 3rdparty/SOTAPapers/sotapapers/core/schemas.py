@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 from enum import Enum
 
 from sotapapers.utils.id_util import detect_arxiv_id_from_citation
@@ -33,10 +33,14 @@ class PaperComparison(str, Enum):
     SIMILAR = "similar"
     NOT_THAT_GOOD = "not_that_good"
     
+class PaperRef(BaseModel):
+    """Id-only stand-in for a related paper; resolve with DataBase.resolve_papers_async."""
+    id: str
+
 class PaperContent(BaseModel):
     abstract: Optional[str]
-    references: Optional[List['Paper']]
-    cited_by: Optional[List['Paper']]
+    references: Optional[List[Union['Paper', PaperRef]]]
+    cited_by: Optional[List[Union['Paper', PaperRef]]]
     bibtex: Optional[str]
     primary_task: Optional[str]
     secondary_task: Optional[str]
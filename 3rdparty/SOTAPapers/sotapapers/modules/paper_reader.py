@@ -1,8 +1,11 @@
 import ast
 import re
+import os
 import json
+import time
 import argparse
 import loguru
+import multiprocessing
 import fitz
 import pandas as pd
 
@@ -33,15 +36,25 @@ from sotapapers.utils.string_util import (
     tatr_table_to_csv
 )
 
-from sotapapers.utils.pdf_utils import get_full_text_from_pdf
+from sotapapers.utils.pdf_utils import get_full_text_from_pdf, get_pdf_hash
 
 from pathlib import Path
 from collections import Counter
+from typing import Iterable, Iterator, Optional
 
 from gmft.auto import TATRDetectorConfig, AutoFormatConfig, AutoTableDetector, AutoTableFormatter
 from gmft.pdf_bindings import PyPDFium2Document
 from selenium.webdriver.common.by import By
 
+# patterns used for every reference are compiled once per process
+REFERENCES_START_CHUNK_PATTERN = re.compile(r'^\[\d|(?<=\d)\.(?=\s)')
+NUMBER_INDEX_PATTERN = re.compile(r'[0-9]+\.\s')
+NUMBERED_LINE_PATTERN = re.compile(r'^(?<=\d)\.\s')
+HYPHENATED_WORD_PATTERN = re.compile(r'(\w+)-\s+(\w+)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+DIGITS_PATTERN = re.compile(r'\d+')
+CONFERENCE_VENUE_KEYWORDS = ['Conf.', 'Conference', 'Workshop', 'Workshops', 'Symposium', 'Symposia', 'Symposiums', 'Conference on', 'Workshop on', 'Symposium on', 'Conference of', 'Workshop of', 'Symposium of']
+
 class PaperReader(Agent):
     def __init__(self, settings: Settings, logger: loguru.logger):
         self.settings = settings
@@ -212,7 +225,7 @@ class PaperReader(Agent):
                 references_content = references_content[1:]
             '''
             references_content = references_section
-            start_chunk_matches = re.search(r'^\[\d|(?<=\d)\.(?=\s)', references_content)
+            start_chunk_matches = REFERENCES_START_CHUNK_PATTERN.search(references_content)
             if start_chunk_matches is None:
                 references_content = replace_newlines_except_after_dot(references_content, ' ')
                 references_content = remove_garbage_lines(references_content)
@@ -257,6 +270,46 @@ class PaperReader(Agent):
             self.reference_papers = []
         return self.reference_papers
 
+    def extract_references_from_file(self, file_path: Path) -> list[Paper]:
+        # references only need the PDF itself, not the text/LLM setup of set_file_path()
+        self.file_path = file_path
+        return self.extract_references()
+
+    def extract_references_batch(self, file_paths: Iterable[Path], processes: Optional[int] = None, use_cache: bool = True) -> Iterator[tuple[Path, list[Paper]]]:
+        """Extract references from many PDFs, yielding (path, papers) as each PDF is done.
+
+        PDFs are parsed in a process pool whose workers each keep one PaperReader.
+        Parsed reference lists are cached by PDF content hash, so a PDF that was
+        already parsed is answered from the cache without starting a worker.
+        """
+        cache_path = Path(self.settings.config.paper_reader.references_cache_path) if use_cache else None
+        pending = []
+        for file_path in file_paths:
+            file_path = Path(file_path)
+            pdf_hash = get_pdf_hash(file_path)
+            cached = _load_cached_references(cache_path, pdf_hash) if cache_path else None
+            if cached is not None:
+                yield file_path, cached
+            else:
+                pending.append((file_path, pdf_hash))
+
+        if len(pending) == 0:
+            return
+
+        if processes is None:
+            processes = int(self.settings.config.paper_reader.num_processes or 0) or multiprocessing.cpu_count()
+        processes = min(processes, len(pending))
+        self.log.debug(f'extracting references from {len(pending)} PDFs by {processes} processes')
+
+        with multiprocessing.Pool(processes=processes, initializer=_init_reference_worker, initargs=(self.settings.to_dict(),)) as pool:
+            for file_path, pdf_hash, papers in pool.imap_unordered(_extract_references_task, pending):
+                if papers is None:
+                    yield file_path, []
+                    continue
+                if cache_path:
+                    _store_cached_references(cache_path, pdf_hash, papers)
+                yield file_path, papers
+
     def extract_references_arxiv(self, paper: Paper):
         url = paper.media.arxiv_url
         self.log.debug(f'arxiv url: {url}')
@@ -376,8 +429,7 @@ class PaperReader(Agent):
 
     def _parse_number_indexed_references_text(self, text):
         def new_line_index(text) -> bool:
-            pattern = r'[0-9]+\.\s'
-            matches = re.search(pattern, text) 
+            matches = NUMBER_INDEX_PATTERN.search(text)
             if matches is not None:
                 return matches.start(), matches.end()
             return -1, -1
@@ -412,8 +464,7 @@ class PaperReader(Agent):
                 return False
             if text[0] == '[':
                 return True
-            pattern = r'^(?<=\d)\.\s'
-            match = re.search(pattern, text)
+            match = NUMBERED_LINE_PATTERN.search(text)
             if match:
                 return True
             return False
@@ -477,8 +528,8 @@ class PaperReader(Agent):
         # Final cleaning
         final_refs = []
         for ref in refs:
-            ref = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', ref)
-            ref = re.sub(r'\s+', ' ', ref).strip()
+            ref = HYPHENATED_WORD_PATTERN.sub(r'\1\2', ref)
+            ref = WHITESPACE_PATTERN.sub(' ', ref).strip()
             final_refs.append(ref)
         return final_refs
          
@@ -562,7 +613,7 @@ class PaperReader(Agent):
                     else:
                         year_str = date_str
                     #year_str = year_str[:4]
-                    numbers = re.findall(r'\d+', year_str)
+                    numbers = DIGITS_PATTERN.findall(year_str)
                     if len(numbers) > 0:
                         year = int(numbers[0][:4])
                     else:
@@ -620,8 +671,7 @@ class PaperReader(Agent):
 
         arxiv_id = None
         if paper_type is not None:
-            conf_keywords = ['Conf.', 'Conference', 'Workshop', 'Workshops', 'Symposium', 'Symposia', 'Symposiums', 'Conference on', 'Workshop on', 'Symposium on', 'Conference of', 'Workshop of', 'Symposium of']
-            if paper_type == 'paper-conference' or any(conf_keyword in venue for conf_keyword in conf_keywords):
+            if paper_type == 'paper-conference' or any(conf_keyword in venue for conf_keyword in CONFERENCE_VENUE_KEYWORDS):
                 paper_type = PaperType.CONFERENCE_PAPER
             elif paper_type == 'article-journal':
                 is_arxiv = False
@@ -769,16 +819,87 @@ class PaperReader(Agent):
             text += text_chunk
         return text
 
+# reference extraction workers (see PaperReader.extract_references_batch)
+_reference_reader: Optional[PaperReader] = None
+
+def _init_reference_worker(settings_dict: dict):
+    global _reference_reader
+    settings = Settings.from_dict(settings_dict)
+    _reference_reader = PaperReader(settings, loguru.logger.bind(process_id=os.getpid()))
+
+def _extract_references_task(item: tuple[Path, str]) -> tuple[Path, str, Optional[list[Paper]]]:
+    file_path, pdf_hash = item
+    try:
+        return file_path, pdf_hash, _reference_reader.extract_references_from_file(file_path)
+    except Exception as e:
+        _reference_reader.log.error(f'failed to extract references from [{file_path.name}]: {e}')
+        return file_path, pdf_hash, None
+
+def _load_cached_references(cache_path: Path, pdf_hash: str) -> Optional[list[Paper]]:
+    cache_file = cache_path / f'{pdf_hash}.json'
+    if not cache_file.exists():
+        return None
+    with open(cache_file) as f:
+        return [Paper.model_validate(paper) for paper in json.load(f)]
+
+def _store_cached_references(cache_path: Path, pdf_hash: str, papers: list[Paper]):
+    cache_path.mkdir(parents=True, exist_ok=True)
+    cache_file = cache_path / f'{pdf_hash}.json'
+    temp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    with open(temp_file, 'w') as f:
+        json.dump([paper.model_dump(mode='json') for paper in papers], f)
+    temp_file.replace(cache_file)
+
+def benchmark_reference_extraction(settings: Settings, logger: loguru.logger, pdf_dir: Path, processes: Optional[int] = None):
+    pdf_paths = sorted(pdf_dir.glob('*.pdf'))
+    if len(pdf_paths) == 0:
+        logger.warning(f'no PDFs found in {pdf_dir}')
+        return {}
+
+    results = {}
+
+    # one-by-one with a fresh reader per PDF, as the crawler used to do
+    start = time.perf_counter()
+    num_references = 0
+    for pdf_path in pdf_paths:
+        num_references += len(PaperReader(settings, logger).extract_references_from_file(pdf_path))
+    results['sequential'] = (time.perf_counter() - start, num_references)
+
+    paper_reader = PaperReader(settings, logger)
+    start = time.perf_counter()
+    num_references = sum(len(papers) for _, papers in paper_reader.extract_references_batch(pdf_paths, processes=processes, use_cache=False))
+    results['batch'] = (time.perf_counter() - start, num_references)
+
+    # first pass fills the cache, second pass is served from it
+    list(paper_reader.extract_references_batch(pdf_paths, processes=processes))
+    start = time.perf_counter()
+    num_references = sum(len(papers) for _, papers in paper_reader.extract_references_batch(pdf_paths, processes=processes))
+    results['batch_cached'] = (time.perf_counter() - start, num_references)
+
+    for name, (seconds, num_references) in results.items():
+        logger.info(f'{name}: {len(pdf_paths)} PDFs, {num_references} references in {seconds:.2f}s ({seconds / len(pdf_paths):.2f}s/PDF)')
+    return results
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument('--pdf-path', type=str, required=True)
+    parser.add_argument('--pdf-path', type=str)
+    parser.add_argument('--benchmark-dir', type=str, help='benchmark reference extraction over the PDFs in this directory')
+    parser.add_argument('--num-processes', type=int, default=None)
     parser.add_argument('--config-path', type=str, default=get_config_path().absolute())
     args = parser.parse_args()
 
-    pdf_path = Path(args.pdf_path)
     settings = Settings(args.config_path)
     logger = loguru.logger
 
+    if args.benchmark_dir is not None:
+        benchmark_reference_extraction(settings, logger, Path(args.benchmark_dir), processes=args.num_processes)
+        raise SystemExit(0)
+
+    if args.pdf_path is None:
+        parser.error('--pdf-path is required')
+
+    pdf_path = Path(args.pdf_path)
+
     paper_reader = PaperReader(settings, logger)
     paper_reader.set_file_path(pdf_path)
     
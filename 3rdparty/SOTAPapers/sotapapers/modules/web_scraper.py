@@ -3,6 +3,7 @@ import os
 import random
 import loguru
 import requests
+from requests.adapters import HTTPAdapter
 
 from sotapapers.core.settings import Settings
 from sotapapers.utils.url_utils import apply_url_prefix
@@ -18,7 +19,6 @@ from selenium.common.exceptions import ElementClickInterceptedException, NoSuchE
 from bs4 import BeautifulSoup
 
 from pathlib import Path
-from time import sleep
 import time
 
 # define a User Agent rotator
@@ -44,13 +44,33 @@ def install_chrome_driver(logger: loguru.logger = None, max_attempts: int = 3, s
     options.add_argument(f"--user-agent={next(user_agent_cycle)}")
     return options
 
+# one pooled HTTP session per process for the plain-HTTP fetch path
+_http_session = None
+
+def get_http_session() -> requests.Session:
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        _http_session.mount('http://', adapter)
+        _http_session.mount('https://', adapter)
+        _http_session.headers['User-Agent'] = user_agents[0]
+    return _http_session
+
 class WebScraper:
+    # Chrome is started on first use and kept open (warm) until close(), so
+    # instances that only parse HTML or fetch over plain HTTP never start one
     def __init__(self, settings: Settings, logger: loguru.logger, request_timeout: int = 300):
         self.settings = settings
         self.log = logger
         self.request_timeout = request_timeout
         self.driver = None # Initialize driver to None
-        self.open()
+        self.stats = {'http': 0, 'browser': 0, 'http_fallbacks': 0, 'http_seconds': 0.0, 'browser_seconds': 0.0}
+
+    def _ensure_driver(self):
+        if self.driver is None:
+            self.open()
+        return self.driver is not None
 
     def open(self):
         try:
@@ -78,9 +98,6 @@ class WebScraper:
                 self.driver = None
 
     def fetch_url(self, url, save_path: Path = None, stream: bool = False):
-        if self.driver is None:
-            self.log.error("WebScraper is not initialized. Cannot fetch URL.")
-            return
         # Apply URL prefix
         url = apply_url_prefix(url, self.settings)
         self.log.debug(f'fetching url: {url}')
@@ -89,6 +106,11 @@ class WebScraper:
             self.download_file(url, save_path)
             return
 
+        if not self._ensure_driver():
+            self.log.error("WebScraper is not initialized. Cannot fetch URL.")
+            return
+
+        started = time.monotonic()
         try:
             self.driver.get(url)
             self._wait_for_page_load()
@@ -96,12 +118,50 @@ class WebScraper:
         except Exception as e:
             self.log.error(f'Failed to fetch url: {url} (error: {e})')
             return
+        finally:
+            self.stats['browser'] += 1
+            self.stats['browser_seconds'] += time.monotonic() - started
+
+    def fetch_html(self, url, ready=None, browser_action=None) -> str:
+        """Page HTML over plain HTTP, falling back to the browser.
+
+        The browser is used when the HTTP response is not 200 or
+        ``ready(html)`` returns False (e.g. content rendered by JavaScript);
+        ``browser_action(self)`` then runs after the page loaded (clicks,
+        condition waits) before the page source is read.
+        """
+        url = apply_url_prefix(url, self.settings)
+        started = time.monotonic()
+        html = None
+        try:
+            response = get_http_session().get(url, timeout=min(self.request_timeout, 60))
+            if response.status_code == 200:
+                html = response.text
+        except requests.RequestException as e:
+            self.log.debug(f'HTTP fetch of {url} failed: {e}')
+        finally:
+            self.stats['http'] += 1
+            self.stats['http_seconds'] += time.monotonic() - started
+
+        if html is not None and (ready is None or ready(html)):
+            return html
+
+        self.stats['http_fallbacks'] += 1
+        self.fetch_url(url)
+        if self.driver is None:
+            return ''
+        if browser_action is not None:
+            browser_action(self)
+        return self.current_page_source()
 
     def set_html(self, html: str):
+        self._ensure_driver()
         script = f"document.body.innerHTML = `{html}`;"
         self.driver.execute_script(script)
 
     def current_page_source(self):
+        if self.driver is None:
+            return ''
         return self.driver.page_source
 
     def _wait_for_page_load(self, timeout=10):
@@ -135,6 +195,48 @@ class WebScraper:
             return False
         return True
     
+    def wait_until(self, condition, timeout=10, poll_frequency=0.25):
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(condition)
+        except Exception as e:
+            self.log.warning(f'Condition not met within {timeout} seconds: {e}')
+            return False
+        return True
+
+    TABLE_STATE_SCRIPT = (
+        'const t = document.getElementById(arguments[0]);'
+        'const rows = t && t.tBodies.length ? t.tBodies[0].rows.length : 0;'
+        'const trigger = arguments[1] ? document.getElementById(arguments[1]) : null;'
+        'return [rows, trigger !== null && trigger.offsetParent !== null];'
+    )
+
+    def count_table_rows(self, table_id: str) -> int:
+        rows, _ = self.driver.execute_script(WebScraper.TABLE_STATE_SCRIPT, table_id, None)
+        return rows
+
+    def wait_for_table_rows(self, table_id: str, min_rows: int = 1, timeout=60, settle_time=1.0, previous_rows: int = None, trigger_id: str = None) -> int:
+        # waits until the table has rows and the row count stopped growing.
+        # with previous_rows (the count before e.g. clicking a "fetch all" button), the settle
+        # window only starts once the count grew past it or the trigger element is gone
+        state = {'rows': -1 if previous_rows is None else previous_rows, 'since': 0.0, 'loading': previous_rows is None}
+
+        def settled(driver):
+            rows, trigger_visible = driver.execute_script(WebScraper.TABLE_STATE_SCRIPT, table_id, trigger_id)
+            now = time.monotonic()
+            if not state['loading']:
+                if rows <= previous_rows and (trigger_id is None or trigger_visible):
+                    return False
+                state['loading'] = True
+                state['rows'], state['since'] = rows, now
+                return False
+            if rows != state['rows']:
+                state['rows'], state['since'] = rows, now
+                return False
+            return rows >= min_rows and now - state['since'] >= settle_time
+
+        self.wait_until(settled, timeout=timeout)
+        return max(state['rows'], 0)
+
     def _wait_for_element_clickable(self, by, value, timeout=10):
         try:
             return WebDriverWait(self.driver, timeout).until(
@@ -214,25 +316,27 @@ class WebScraper:
         except Exception as e:
             self.log.error(f'An error occurred while fetching content from url {url}: {str(e)}')
 
-    def click_element_by_classname(self, value, wait_timeout=30, max_attempts=3, sleep_sec=5):
-        return self._click_element(By.CLASS_NAME, value, wait_timeout, max_attempts, sleep_sec)
+    def click_element_by_classname(self, value, wait_timeout=30, max_attempts=3):
+        return self._click_element(By.CLASS_NAME, value, wait_timeout, max_attempts)
 
-    def click_element_by_id(self, value, wait_timeout=30, max_attempts=3, sleep_sec=5):
-        return self._click_element(By.ID, value, wait_timeout, max_attempts, sleep_sec)
+    def click_element_by_id(self, value, wait_timeout=30, max_attempts=3):
+        return self._click_element(By.ID, value, wait_timeout, max_attempts)
 
-    def _click_element(self, by, value, wait_timeout=30, max_attempts=1, sleep_sec=5):
-        if self.driver is None:
-            self.open()
+    def _click_element(self, by, value, wait_timeout=30, max_attempts=1):
+        if not self._ensure_driver():
+            return False
 
+        # waits on the element itself instead of sleeping between attempts
         for attempt in range(max_attempts):
+            if not self._wait_for_element_located(by, value, wait_timeout):
+                continue
             try:
-                if self._wait_for_element_located(by, value, wait_timeout) is True:
-                    break
-            except Exception as e:
-                self.log.warning(f'Element [{value}] not located yet, retrying... (Attempt {attempt + 1}, sleeping {sleep_sec} sec ..)')
-                sleep(sleep_sec)
-                sleep_sec *= 1.5
+                element = self.driver.find_element(by, value)
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                self.driver.execute_script("arguments[0].click();", element)
+                return True
+            except (ElementClickInterceptedException, NoSuchElementException) as e:
+                self.log.warning(f'Click on [{value}] failed (attempt {attempt + 1}): {e}')
 
-        element = self.driver.find_element(by, value)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        self.driver.execute_script("arguments[0].click();", element)
+        self.log.error(f'Could not click element [{value}] after {max_attempts} attempts')
+        return False
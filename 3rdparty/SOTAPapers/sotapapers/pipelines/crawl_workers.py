@@ -0,0 +1,138 @@
+import multiprocessing
+import os
+import sys
+from dataclasses import dataclass
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import loguru
+
+from sotapapers.core.database import DataBase
+from sotapapers.core.paper import PaperDataDump
+from sotapapers.core.settings import Settings
+from sotapapers.modules.arxiv_client import ArxivClient
+from sotapapers.modules.github_repo_searcher import GitHubRepoSearcher
+from sotapapers.modules.google_scholar_scraper import GoogleScholarScraper
+from sotapapers.modules.paper_reader import PaperReader
+from sotapapers.modules.semantic_scholar_client import SemanticScholarClient
+from sotapapers.modules.web_scraper import WebScraper
+from sotapapers.utils.lookup_cache import LookupCache
+
+# Long-lived crawler worker processes.
+#
+# Each worker of a CrawlWorkerPool builds its settings, API clients, web
+# scraper and database handle once (init_worker) and keeps them for every
+# task it runs; tasks get them with worker_state(). Reference lookups are
+# shared between workers through an on-disk LookupCache so the same paper
+# is never looked up twice.
+
+
+@dataclass
+class WorkerState:
+    settings: Settings
+    log: Any
+    arxiv: ArxivClient
+    semantic_scholar: SemanticScholarClient
+    github_repo_searcher: GitHubRepoSearcher
+    google_scholar_scraper: GoogleScholarScraper
+    web_scraper: WebScraper
+    paper_reader: PaperReader
+    paper_data_dump: PaperDataDump
+    db: DataBase
+    lookup_cache: LookupCache
+
+    def close(self):
+        self.web_scraper.close()
+        self.google_scholar_scraper.web_scraper.close()
+        self.db.dispose()
+        self.lookup_cache.close()
+
+
+_state: Optional[WorkerState] = None
+
+
+def init_worker(settings_dict: dict):
+    """Pool initializer: build this process's clients and DB handle."""
+    global _state
+    settings = Settings.from_dict(settings_dict)
+    crawler_config = settings.config.paper_crawler
+
+    log = loguru.logger.bind(process_id=os.getpid())
+    if multiprocessing.parent_process() is not None:
+        log.remove()
+        log.add(sys.stderr, level=crawler_config.log_level)
+
+    _state = WorkerState(
+        settings=settings,
+        log=log,
+        arxiv=ArxivClient(settings, log),
+        semantic_scholar=SemanticScholarClient(settings, log),
+        github_repo_searcher=GitHubRepoSearcher(settings, log, request_timeout=crawler_config.request_timeout),
+        google_scholar_scraper=GoogleScholarScraper(settings, log),
+        web_scraper=WebScraper(settings, log, request_timeout=crawler_config.request_timeout),
+        paper_reader=PaperReader(settings, log),
+        paper_data_dump=PaperDataDump(log),
+        db=DataBase(settings.config.database.url, log),
+        lookup_cache=LookupCache(lookup_cache_path(settings)),
+    )
+    # pool workers skip atexit handlers, but run multiprocessing finalizers
+    Finalize(None, close_worker, exitpriority=10)
+
+
+def worker_state() -> WorkerState:
+    """This process's worker state (built from the default config if the pool did not)."""
+    if _state is None:
+        init_worker(Settings(Path("sotapapers/configs")).to_dict())
+    return _state
+
+
+def close_worker():
+    global _state
+    if _state is not None:
+        _state.close()
+        _state = None
+
+
+def lookup_cache_path(settings: Settings) -> Path:
+    return Path(settings.config.paper_crawler.pdf_download_basepath) / 'lookup_cache.sqlite'
+
+
+class CrawlWorkerPool:
+    """Process pool whose workers keep their clients between tasks."""
+
+    def __init__(self, settings: Settings, processes: Optional[int] = None):
+        self.settings_dict = settings.to_dict()
+        self.processes = processes or int(settings.config.paper_crawler.num_processes or 0) or multiprocessing.cpu_count()
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(
+                processes=self.processes,
+                initializer=init_worker,
+                initargs=(self.settings_dict,),
+            )
+        return self._pool
+
+    def imap_unordered(self, func: Callable, items: Iterable, chunksize: Optional[int] = None):
+        """Run ``func`` over ``items`` in the workers, yielding results as they finish."""
+        items = list(items)
+        if not items:
+            return iter(())
+        if chunksize is None:
+            # a few chunks per worker keeps IPC low while balancing uneven tasks
+            chunksize = max(1, len(items) // (self.processes * 4))
+        return self._get_pool().imap_unordered(func, items, chunksize)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
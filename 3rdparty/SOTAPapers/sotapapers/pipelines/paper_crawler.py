@@ -6,6 +6,8 @@ import loguru
 import requests
 import sys
 from selenium import webdriver
+from selenium.webdriver.common.by import By
+from bs4 import BeautifulSoup
 
 from sotapapers.core.schemas import Paper, PaperContent, PaperMedia, PaperMetrics, PaperType, PaperSessionType, PaperAcceptStatus, PaperComparison
 from sotapapers.core.paper import PaperDataDump
@@ -17,12 +19,12 @@ from sotapapers.modules.semantic_scholar_client import SemanticScholarClient
 from sotapapers.modules.github_repo_searcher import GitHubRepoSearcher
 from sotapapers.modules.google_scholar_scraper import GoogleScholarScraper
 from sotapapers.modules.web_scraper import WebScraper
+from sotapapers.pipelines.crawl_workers import CrawlWorkerPool, worker_state
 from sotapapers.utils.config import get_config_path
 from sotapapers.utils.id_util import make_generated_id
 from sotapapers.utils.url_utils import apply_url_prefix
 
 from pathlib import Path
-from time import sleep
 
 class PaperCrawler:
     def __init__(self, settings: Settings, logger: loguru.logger, request_timeout: int = 300):
@@ -35,6 +37,8 @@ class PaperCrawler:
         self.semantic_scholar = SemanticScholarClient(settings, logger)
         self.github_repo_searcher = GitHubRepoSearcher(self.settings, self.log, request_timeout=request_timeout)
         self.paper_data_dump = PaperDataDump(self.log)
+        # started on first use and kept for all conferences of a run
+        self.worker_pool = CrawlWorkerPool(settings)
 
     def run(self, keywords: list[str] = []):
         db = DataBase(self.settings.config.database.url, self.log)
@@ -47,6 +51,7 @@ class PaperCrawler:
             else:
                 raise ValueError(f'Invalid mode: {self.settings.mode}')
         finally:
+            self.worker_pool.close()
             db.dispose()
 
     @staticmethod
@@ -212,44 +217,43 @@ class PaperCrawler:
         return rows_in_raw_data
 
     def _grab_conference_papers_papercopilot(self, conference_name: str, url: str, year: int, mandatory_keywords: list[str] = [], additional_keywords: list[str] = [], crawl_references: bool = False):
-        # Initialize WebScraper locally for this method
-        temp_web_scraper = WebScraper(self.settings, self.log)
-        temp_web_scraper.fetch_url(url)
-
-        button_name = 'btn_fetchall'
-        temp_web_scraper.click_element_by_id(button_name, wait_timeout=30, max_attempts=2, sleep_sec=5)
-
-        sleep_sec = 10
-        self.log.debug(f'waiting for {sleep_sec} seconds to load paper list')
-        sleep(sleep_sec)
+        def table_complete(html: str) -> bool:
+            # the static page is enough only if it has rows and nothing left to fetch
+            table = self.web_scraper.get_table_from_html(html, 'paperlist')
+            tbody = table.find('tbody') if table is not None else None
+            return tbody is not None and len(tbody.find_all('tr')) > 0 and 'btn_fetchall' not in html
+
+        def load_all_papers(scraper: WebScraper):
+            rows_before = scraper.count_table_rows('paperlist')
+            scraper.click_element_by_id('btn_fetchall', wait_timeout=30, max_attempts=2)
+            num_rows = scraper.wait_for_table_rows('paperlist', timeout=120, previous_rows=rows_before, trigger_id='btn_fetchall')
+            self.log.debug(f'paper list loaded with {num_rows} rows')
 
         papers = []
-        page_source = temp_web_scraper.current_page_source()
-        settings_dict = self.settings.to_dict()
-        use_multiprocessing = True
+        page_source = self.web_scraper.fetch_html(url, ready=table_complete, browser_action=load_all_papers)
+        self.log.debug(f'page fetch stats: {self.web_scraper.stats}')
 
-        # Get raw data and prepare arguments for multiprocessing
+        # Get raw data and prepare arguments for the workers
         raw_paper_data = PaperCrawler._get_conference_papers_list(page_source, 'paperlist', conference_name, mandatory_keywords, additional_keywords, self.settings, self.log)
         num_papers = len(raw_paper_data)
         
         self.log.info(f'found {num_papers} papers')
 
-        num_processes = min(multiprocessing.cpu_count(), num_papers)
-
-        # get abstract by multiprocessing
-        row_args_abstract = []
+        # get abstracts in the worker pool
+        abstract_urls = []
         for row_in_raw_data in raw_paper_data:
             status = row_in_raw_data[7]
             if 'rejected' in status.lower():
                 continue
-            row_args_abstract.append((row_in_raw_data[2], settings_dict))
+            abstract_urls.append(row_in_raw_data[2])
 
-        self.log.debug(f'getting abstracts from papers by: {num_processes} processes')
-        
-        with multiprocessing.Pool(processes=num_processes) as pool:
-            abstract_list = pool.starmap(PaperCrawler._get_abstract_from_conference_website, row_args_abstract)
+        self.log.debug(f'getting abstracts from papers by: {self.worker_pool.processes} processes')
+
+        abstract_list = [None] * len(abstract_urls)
+        for index, abstract in self.worker_pool.imap_unordered(_fetch_abstract_task, enumerate(abstract_urls)):
+            abstract_list[index] = abstract
 
-        # Prepare arguments for starmap
+        # Prepare arguments for the workers
         row_args = []
         i = 0
         for row_in_raw_data in raw_paper_data:
@@ -262,7 +266,7 @@ class PaperCrawler:
             matched_keywords = [keyword for keyword in mandatory_keywords if keyword.lower() in title.lower().split(' ')]
 
             abstract = abstract_list[i]
-            matched_additional_keywords = [keyword for keyword in additional_keywords if keyword.lower() in abstract.lower().split(' ')]
+            matched_additional_keywords = [keyword for keyword in additional_keywords if keyword.lower() in (abstract or '').lower().split(' ')]
             i += 1
 
             if len(matched_keywords) < len(mandatory_keywords) / 2.0 or len(matched_additional_keywords) < len(additional_keywords) / 4.0:
@@ -271,13 +275,11 @@ class PaperCrawler:
                 continue 
 
             row_in_raw_data[3] = abstract
-            row_args.append((tuple(row_in_raw_data), settings_dict, conference_name, year, mandatory_keywords, additional_keywords))
+            row_args.append((tuple(row_in_raw_data), conference_name, year, mandatory_keywords, additional_keywords))
 
-        with multiprocessing.Pool(processes=num_processes) as pool:
-            results = pool.starmap(PaperCrawler._scrape_paper_info_papercopilot_single, row_args)
-            for p in results:
-                if p is not None:
-                    papers.append(p)
+        for p in self.worker_pool.imap_unordered(_scrape_paper_task, row_args):
+            if p is not None:
+                papers.append(p)
 
         return papers
 
@@ -300,27 +302,20 @@ class PaperCrawler:
             
             logger.debug(f'grabbing reference paper: {ref_paper.title} (year: {ref_paper.year}, recursive_depth: {recursive_depth})')
             looked_paper = PaperCrawler._lookup_paper(logger, ref_paper)
-            
-            # Re-initialize clients locally for multiprocessing safety if called from a worker
-            temp_settings = Settings(Path("sotapapers/configs")) # Re-initialize settings in the worker
-            temp_arxiv = ArxivClient(temp_settings, logger)
-            temp_scholarly_client = SemanticScholarClient(temp_settings, logger)
-            temp_github_repo_searcher = GitHubRepoSearcher(temp_settings, logger)
-            
-            PaperCrawler._update_paper_metrics(looked_paper, temp_arxiv, temp_scholarly_client, temp_github_repo_searcher, logger)
+            if looked_paper is None:
+                continue
+
+            state = worker_state()
+            PaperCrawler._update_paper_metrics(looked_paper, state.arxiv, state.semantic_scholar, state.github_repo_searcher, logger)
             db.insert_paper(looked_paper)
-            db.dispose()
-            
-            if looked_paper is not None:
-                PaperCrawler._grab_reference_papers(logger, db, looked_paper, year_after, recursive_depth - 1)
+
+            PaperCrawler._grab_reference_papers(logger, db, looked_paper, year_after, mandatory_keywords, additional_keywords, recursive_depth - 1)
 
     def _grab_citing_papers(logger: loguru.logger, db: DataBase, paper: Paper, year_after: int, mandatory_keywords: list[str], additional_keywords: list[str], recursive_depth: int = 1):
-        temp_settings = Settings(Path("sotapapers/configs"))
-        temp_google_scholar_scraper = GoogleScholarScraper(temp_settings, logger)
-        temp_google_scholar_scraper.search_citing_papers(paper)
+        state = worker_state()
+        state.google_scholar_scraper.search_citing_papers(paper)
 
         db.insert_paper(paper)
-        db.dispose()
         
         if recursive_depth <= 0:
             return
@@ -340,26 +335,19 @@ class PaperCrawler:
             if len(matched_keywords) < len(mandatory_keywords) / 2.0 or len(matched_additional_keywords) < len(additional_keywords) / 4.0:
                 continue
             
-            temp_arxiv = ArxivClient(temp_settings, logger)
-            temp_scholarly_client = SemanticScholarClient(temp_settings, logger)
-            temp_github_repo_searcher = GitHubRepoSearcher(temp_settings, logger)
-            PaperCrawler._update_paper_metrics(citing_paper, temp_arxiv, temp_scholarly_client, temp_github_repo_searcher, logger)
+            PaperCrawler._update_paper_metrics(citing_paper, state.arxiv, state.semantic_scholar, state.github_repo_searcher, logger)
 
             db.insert_paper(citing_paper)
-            db.dispose()
-            PaperCrawler._grab_citing_papers(logger, db, citing_paper, year_after, recursive_depth - 1) 
+            PaperCrawler._grab_citing_papers(logger, db, citing_paper, year_after, mandatory_keywords, additional_keywords, recursive_depth - 1)
 
     def _grab_citing_papers_semantic_scholar(logger: loguru.logger, db: DataBase, paper: Paper, year_after: int, mandatory_keywords: list[str], additional_keywords: list[str], recursive_depth: int = 1):
-        temp_settings = Settings(Path("sotapapers/configs")) # Re-initialize settings in the worker
-
-        temp_scholarly_client = SemanticScholarClient(temp_settings, logger)
-        searched_paper = temp_scholarly_client.search_by_title(paper.title)
+        state = worker_state()
+        searched_paper = state.semantic_scholar.search_by_title(paper.title)
 
         if searched_paper is not None and searched_paper.content is not None:
             paper.content.cited_by = searched_paper.content.cited_by
 
         db.insert_paper(paper)
-        db.dispose()
 
         if recursive_depth <= 0:
             return
@@ -379,44 +367,46 @@ class PaperCrawler:
             if len(matched_keywords) < len(mandatory_keywords) / 2.0 or len(matched_additional_keywords) < len(additional_keywords) / 4.0:
                 continue
             
-            temp_arxiv = ArxivClient(temp_settings, logger)
-            temp_github_repo_searcher = GitHubRepoSearcher(temp_settings, logger)
-            PaperCrawler._update_paper_metrics(citing_paper, temp_arxiv, temp_scholarly_client, temp_github_repo_searcher, logger)
+            PaperCrawler._update_paper_metrics(citing_paper, state.arxiv, state.semantic_scholar, state.github_repo_searcher, logger)
 
             db.insert_paper(citing_paper)
-            db.dispose()
-            PaperCrawler._grab_citing_papers(logger, db, citing_paper, year_after, recursive_depth - 1)
+            PaperCrawler._grab_citing_papers(logger, db, citing_paper, year_after, mandatory_keywords, additional_keywords, recursive_depth - 1)
 
     def _lookup_paper(logger: loguru.logger, ref_paper):
         logger.debug(f'looking up reference paper: {ref_paper.title} (type: {ref_paper.paper_type})')
         #if ref_paper.paper_type == PaperType.ARXIV_PAPER:
-        return PaperCrawler._lookup_paper_arxiv(logger, ref_paper)
+        # shared by all workers, so each reference is searched and downloaded once
+        found = worker_state().lookup_cache.get_or_compute(
+            f'arxiv:{ref_paper.title.strip().lower()}',
+            lambda: PaperCrawler._lookup_paper_arxiv(logger, ref_paper),
+        )
+        if found is None:
+            return None
+
+        ref_paper.media.pdf_url = found['pdf_url']
+        ref_paper.media.arxiv_url = found['arxiv_url']
+        ref_paper.year = found['year']
+        return ref_paper
     
-    def _lookup_paper_arxiv(logger: loguru.logger, ref_paper):
-        # Initialize WebScraper and PaperReader locally for multiprocessing safety if called from a worker
-        temp_settings = Settings(Path("sotapapers/configs")) # Re-initialize settings with Path
-        temp_web_scraper = WebScraper(temp_settings, logger, request_timeout=temp_settings.config.paper_crawler.request_timeout)
-        temp_paper_reader = PaperReader(temp_settings, logger)
-        temp_arxiv = ArxivClient(temp_settings, logger)
+    def _lookup_paper_arxiv(logger: loguru.logger, ref_paper) -> dict | None:
+        state = worker_state()
 
-        searched_arxiv_paper = temp_arxiv.search_by_title(ref_paper.title)
+        searched_arxiv_paper = state.arxiv.search_by_title(ref_paper.title)
         if searched_arxiv_paper is None:
             return None
         
-        ref_paper.media.pdf_url = searched_arxiv_paper.media.pdf_url
-        ref_paper.media.arxiv_url = searched_arxiv_paper.media.arxiv_url
-        ref_paper.year = searched_arxiv_paper.year
-
-        pdf_download_basepath = temp_settings.config.paper_crawler.pdf_download_basepath
-        pdf_save_dir = Path(f'{pdf_download_basepath}/arxiv/{ref_paper.year}')
+        pdf_download_basepath = state.settings.config.paper_crawler.pdf_download_basepath
+        pdf_save_dir = Path(f'{pdf_download_basepath}/arxiv/{searched_arxiv_paper.year}')
         pdf_save_dir.mkdir(parents=True, exist_ok=True)
         pdf_save_path = pdf_save_dir / f'{ref_paper.title}.pdf'
         
-        PaperCrawler._download_pdf(ref_paper.media.pdf_url, temp_settings, pdf_save_path)
-        temp_paper_reader.set_file_path(pdf_save_path)
+        PaperCrawler._download_pdf(searched_arxiv_paper.media.pdf_url, state.settings, pdf_save_path)
 
-        #ref_paper.content.references = temp_paper_reader.extract_references_arxiv(ref_paper)
-        return ref_paper
+        return {
+            'pdf_url': searched_arxiv_paper.media.pdf_url,
+            'arxiv_url': searched_arxiv_paper.media.arxiv_url,
+            'year': searched_arxiv_paper.year,
+        }
 
     def _lookup_paper_doi(self, paper: Paper):
         temp_settings = Settings(Path("sotapapers/configs")) # Re-initialize settings with Path
@@ -443,74 +433,60 @@ class PaperCrawler:
         
     @staticmethod
     def _download_pdf(url: str, settings: Settings, pdf_save_path: Path):
-        temp_scraper = WebScraper(settings, loguru.logger)
-        temp_scraper.download_file(url, pdf_save_path)
-        temp_scraper.close()
+        worker_state().web_scraper.download_file(url, pdf_save_path)
         return pdf_save_path
 
     @staticmethod
-    def _get_abstract_from_conference_website(url: str, settings_dict: dict):
-        logger = loguru.logger
-        settings = Settings.from_dict(settings_dict)
-        temp_scraper = WebScraper(settings, logger)
-
-        temp_scraper.fetch_url(url)
-        abstract = None
-
-        if 'openaccess.thecvf.com' in url:
-            abstract = temp_scraper.find_element_by_id('abstract').text
-        elif 'cvpr.thecvf.com' in url:
-            abstract = temp_scraper.find_element_by_id('abstractExample').text
-        elif 'iclr.cc' in url:
-            temp_scraper.click_element_by_classname('card-link')
-            elements = temp_scraper.find_element('div', {'id': 'abstractExample'})
-            if len(elements) > 0:
-                abstract_p = elements[0].find('p')
-                if abstract_p is not None:
-                    abstract = abstract_p.text
-                else:
-                    abstract = elements[0].text.replace('Abstract:', '').strip()
-        elif 'openreview.net' in url:
-            elements = temp_scraper.find_element('div', {'class': 'note-content-value markdown-rendered'})
-            if len(elements) > 0:
-                abstract_p = elements[0].find('p')
-                if abstract_p is not None:
-                    abstract = abstract_p.text
-                else:
-                    abstract = elements[0].text.replace('Abstract:', '').strip()
-
-        temp_scraper.close()
+    def _get_abstract_from_conference_website(url: str):
+        state = worker_state()
+        logger = state.log
+        temp_scraper = state.web_scraper
+
+        def parse_abstract(html: str):
+            soup = BeautifulSoup(html, 'html.parser')
+            element = None
+            if 'openaccess.thecvf.com' in url:
+                element = soup.find(id='abstract')
+            elif 'cvpr.thecvf.com' in url or 'iclr.cc' in url:
+                element = soup.find('div', {'id': 'abstractExample'})
+            elif 'openreview.net' in url:
+                element = soup.find('div', {'class': 'note-content-value'})
+                if element is None:
+                    meta = soup.find('meta', attrs={'name': 'citation_abstract'})
+                    return meta.get('content').strip() if meta and meta.get('content') else None
+            if element is None:
+                return None
+            abstract_p = element.find('p')
+            if abstract_p is not None:
+                return abstract_p.text
+            return element.text.replace('Abstract:', '').strip() or None
+
+        def reveal_abstract(scraper: WebScraper):
+            if 'iclr.cc' in url and scraper.click_element_by_classname('card-link', wait_timeout=10):
+                scraper._wait_for_element_located(By.ID, 'abstractExample', 10)
+            elif 'openreview.net' in url:
+                scraper._wait_for_element_located(By.CLASS_NAME, 'note-content-value', 10)
+
+        # static pages are parsed from plain HTTP; the browser only renders the rest
+        html = temp_scraper.fetch_html(url, ready=lambda html: parse_abstract(html) is not None, browser_action=reveal_abstract)
+        abstract = parse_abstract(html) if html else None
+
         if abstract is None:
             logger.warning(f'failed to get abstract for {url}')
         return abstract
         
     @staticmethod
-    def _scrape_paper_info_papercopilot_single(row_in_raw_data: tuple, settings_dict: dict, conference_name: str, year: int, mandatory_keywords: list[str], additional_keywords: list[str]):
-        # Reconstruct settings and logger within the worker process
-        from sotapapers.core.settings import Settings
-        from sotapapers.core.database import DataBase
-        from sotapapers.modules.web_scraper import WebScraper
-        from sotapapers.modules.arxiv_client import ArxivClient
-        from sotapapers.modules.semantic_scholar_client import SemanticScholarClient
-        from sotapapers.modules.github_repo_searcher import GitHubRepoSearcher
-        from sotapapers.modules.paper_reader import PaperReader
-        from sotapapers.core.paper import PaperDataDump
-        import loguru
-        from pathlib import Path
-        import os
-
-        settings = Settings.from_dict(settings_dict)
-        
-        log = loguru.logger.bind(process_id=os.getpid())
-        log.remove()
-        log.add(sys.stderr, level=settings.config.paper_crawler.log_level)
-
-        arxiv_client = ArxivClient(settings, log)
-        scholarly_client = SemanticScholarClient(settings, log)
-        github_repo_searcher = GitHubRepoSearcher(settings, log)
-        paper_data_dump = PaperDataDump(log)
-        temp_web_scraper = WebScraper(settings, log, request_timeout=settings.config.paper_crawler.request_timeout)
-        db = DataBase(settings.config.database.url, log)
+    def _scrape_paper_info_papercopilot_single(row_in_raw_data: tuple, conference_name: str, year: int, mandatory_keywords: list[str], additional_keywords: list[str]):
+        # clients and DB handle are built once per worker process
+        state = worker_state()
+        settings = state.settings
+        log = state.log
+        arxiv_client = state.arxiv
+        scholarly_client = state.semantic_scholar
+        github_repo_searcher = state.github_repo_searcher
+        paper_data_dump = state.paper_data_dump
+        temp_web_scraper = state.web_scraper
+        db = state.db
 
         try:
             title, url, conf_url, abstract, authors_list, affiliations_list, affiliations_country_list, session_type, citations, pdf_url, youtube_url, github_url, project_page_url, arxiv_url = row_in_raw_data
@@ -542,7 +518,6 @@ class PaperCrawler:
 
             # Add paper to DB
             db.insert_paper(paper)
-            # db.dispose() # Dispose DB connection after use (this should be handled by context manager or outer scope for long-running connections if not per-paper)
             
             # backward recursive crawling
             PaperCrawler._grab_reference_papers(log, db, paper, int(year), mandatory_keywords, additional_keywords, settings.config.paper_crawler.backward_recursive_depth)
@@ -554,13 +529,6 @@ class PaperCrawler:
         except Exception as e:
             log.error(f"Error downloading or processing paper: {e}")
             return None
-        
-        finally:
-            # Ensure the WebScraper's driver is quit when the task is done
-            if temp_web_scraper is not None:
-                temp_web_scraper.close()
-            if db is not None:
-                db.dispose()
 
     @staticmethod
     def _scrape_paper_info_papercopilot(settings: Settings, logger, conference_name: str, mandatory_keywords: list[str], additional_keywords: list[str], title, url, abstract, year, authors_list, affiliations_list, affiliations_country_list, session_type, citations, pdf_url, youtube_url, github_url, project_page_url, arxiv_url, web_scraper: WebScraper = None):
@@ -571,8 +539,9 @@ class PaperCrawler:
 
         logger.debug(f'getting links for {title}')
 
-        paper_reader = PaperReader(settings, logger)
-        arxiv_client = ArxivClient(settings, loguru.logger)
+        state = worker_state()
+        paper_reader = state.paper_reader
+        arxiv_client = state.arxiv
         pdf_download_basepath = settings.config.paper_crawler.pdf_download_basepath
         references = None
 
@@ -785,6 +754,13 @@ class PaperCrawler:
         )
         return paper
 
+def _fetch_abstract_task(indexed_url: tuple[int, str]) -> tuple[int, str | None]:
+    index, url = indexed_url
+    return index, PaperCrawler._get_abstract_from_conference_website(url)
+
+def _scrape_paper_task(args: tuple):
+    return PaperCrawler._scrape_paper_info_papercopilot_single(*args)
+
 if __name__ == "__main__":
     mp.set_start_method('spawn')
     
@@ -0,0 +1,79 @@
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+class LookupCache:
+    """Key -> JSON lookup results shared by all workers through a SQLite file.
+
+    The first worker to ask for a key claims it and computes the value;
+    workers asking for the same key meanwhile wait for that result instead
+    of repeating the lookup. Claims older than ``claim_timeout`` seconds
+    (e.g. from a crashed worker) can be taken over.
+
+    A ``None`` result (nothing found, or the lookup failed) is only kept for
+    ``miss_ttl`` seconds, after which the next worker asking looks it up again.
+    """
+
+    def __init__(self, path: Path, claim_timeout: float = 300, poll_interval: float = 0.5, miss_ttl: float = 3600):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.claim_timeout = claim_timeout
+        self.poll_interval = poll_interval
+        self.miss_ttl = miss_ttl
+        self.conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        # claimed_at is when the key was claimed, or stored once done
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS lookups ('
+            'key TEXT PRIMARY KEY, value TEXT, done INTEGER NOT NULL DEFAULT 0, '
+            'owner INTEGER, claimed_at REAL)'
+        )
+
+    def _row(self, key: str):
+        return self.conn.execute('SELECT value, done, claimed_at FROM lookups WHERE key = ?', (key,)).fetchone()
+
+    def _is_fresh(self, row) -> bool:
+        value, done, stored_at = row
+        return bool(done) and (value != 'null' or stored_at >= time.time() - self.miss_ttl)
+
+    def _claim(self, key: str, row) -> bool:
+        now = time.time()
+        if row is None:
+            cursor = self.conn.execute(
+                'INSERT OR IGNORE INTO lookups (key, owner, claimed_at) VALUES (?, ?, ?)', (key, os.getpid(), now)
+            )
+        else:
+            # take over a stale claim or an expired miss
+            cursor = self.conn.execute(
+                'UPDATE lookups SET done = 0, owner = ?, claimed_at = ? WHERE key = ? AND ('
+                '(done = 0 AND claimed_at < ?) OR (done = 1 AND value = ? AND claimed_at < ?))',
+                (os.getpid(), now, key, now - self.claim_timeout, 'null', now - self.miss_ttl),
+            )
+        return cursor.rowcount == 1
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Cached value for ``key``, computing (and storing) it if no worker has."""
+        row = self._row(key)
+        while True:
+            if row is not None and self._is_fresh(row):
+                return json.loads(row[0])
+            if self._claim(key, row):
+                break
+            time.sleep(self.poll_interval)
+            row = self._row(key)
+
+        try:
+            value = compute()
+        except BaseException:
+            self.conn.execute('DELETE FROM lookups WHERE key = ? AND owner = ? AND done = 0', (key, os.getpid()))
+            raise
+        self.conn.execute(
+            'UPDATE lookups SET value = ?, done = 1, claimed_at = ? WHERE key = ?', (json.dumps(value), time.time(), key)
+        )
+        return value
+
+    def close(self):
+        self.conn.close()
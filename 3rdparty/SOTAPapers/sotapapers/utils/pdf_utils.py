@@ -1,4 +1,5 @@
 import fitz
+import hashlib
 from typing import Optional
 from pathlib import Path
 
@@ -9,4 +10,10 @@ def get_full_text_from_pdf(file_path: Path) -> Optional[str]:
             text = page.get_text()
             full_text += text
         return full_text
-    return None
\ No newline at end of file
+    return None
+def get_pdf_hash(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -9,6 +9,7 @@ import csv
 import io
 import loguru
 
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from charset_normalizer import detect
 from pathlib import PosixPath
@@ -82,6 +83,8 @@ def remove_garbage_lines(text):
     pattern = r'^\s*[0-9]*\s*(Published as a conference paper.*)\s*\n'
     return re.sub(pattern, '\n\n', text, flags=re.MULTILINE)
 
+# compiled once per process and shared by every call
+@lru_cache(maxsize=None)
 def get_author_first_pattern():
     name_prefix_pattern = r"""
         (?:
@@ -153,27 +156,37 @@ def get_author_first_pattern():
     return regex.compile(author_pattern, regex.MULTILINE | regex.VERBOSE | regex.UNICODE), regex.compile(pattern, regex.MULTILINE | regex.VERBOSE | regex.UNICODE) 
     #return regex.compile(author_pattern, regex.VERBOSE | regex.UNICODE), regex.compile(pattern, regex.VERBOSE | regex.UNICODE) 
 
+YEARS_WITH_DOT_PATTERN = regex.compile(r'''
+    ^
+    (?:                                    # Non-capturing group for authors
+        (?:\p{L}+\s+)*                     # Possible prefixes in last name
+        \p{L}+                             # Last name
+        ,?\s+                              # Optional comma, followed by whitespace
+        (?:\p{L}\.\s*)+                    # One or more initials
+    )
+    (?:                                    # Additional authors
+        (?:,\s*|,\s*and\s+|,\s*&\s+| and\s+| &\s+|\s+and\s+|\s+&\s+)   # Separators
+        (?:\p{L}+\s+)*                     # Possible prefixes in last name
+        \p{L}+                             # Last name
+        ,?\s+                              # Optional comma, followed by whitespace
+        (?:\p{L}\.\s*)+                    # One or more initials
+    )*
+    \s*                                    # Optional whitespace
+    \(?\d{4}[a-z]?\)?\.                      # Year in parentheses, possibly with a letter, followed by a period
+''', regex.MULTILINE | regex.VERBOSE | regex.UNICODE)
+
+YEAR_PATTERN = regex.compile(r'\s\(?[1-2](0|9)\d{2}[a-z]?\)?\.', regex.MULTILINE | regex.VERBOSE | regex.UNICODE)
+GARBAGE_PATTERN = regex.compile(r'[0-9]+\.[0-9]+|[0-9]+-[0-9]+', regex.MULTILINE | regex.VERBOSE | regex.UNICODE)
+
+@lru_cache(maxsize=None)
+def get_author_after_dot_pattern():
+    author_pattern, _ = get_author_first_pattern()
+    return regex.compile(rf'\.{author_pattern.pattern}', regex.MULTILINE | regex.VERBOSE | regex.UNICODE)
+
 def split_text_at_years_with_dot(text):
-    pattern = r'''
-        ^
-        (?:                                    # Non-capturing group for authors
-            (?:\p{L}+\s+)*                     # Possible prefixes in last name
-            \p{L}+                             # Last name
-            ,?\s+                              # Optional comma, followed by whitespace
-            (?:\p{L}\.\s*)+                    # One or more initials
-        )
-        (?:                                    # Additional authors
-            (?:,\s*|,\s*and\s+|,\s*&\s+| and\s+| &\s+|\s+and\s+|\s+&\s+)   # Separators
-            (?:\p{L}+\s+)*                     # Possible prefixes in last name
-            \p{L}+                             # Last name
-            ,?\s+                              # Optional comma, followed by whitespace
-            (?:\p{L}\.\s*)+                    # One or more initials
-        )*
-        \s*                                    # Optional whitespace
-        \(?\d{4}[a-z]?\)?\.                      # Year in parentheses, possibly with a letter, followed by a period
-    '''
-   
-    regex_pattern = regex.compile(pattern, regex.MULTILINE | regex.VERBOSE | regex.UNICODE)
+    pattern = YEARS_WITH_DOT_PATTERN.pattern
+    regex_pattern = YEARS_WITH_DOT_PATTERN
+    author_pattern, author_first_pattern = get_author_first_pattern()
     matches = list(regex_pattern.finditer(text))
    
     author_first = False 
@@ -181,7 +194,7 @@ def split_text_at_years_with_dot(text):
         print(f'no matches found for pattern: {pattern}')
         author_first = True
        
-        author_pattern, regex_pattern = get_author_first_pattern()
+        regex_pattern = author_first_pattern
         matches = list(regex_pattern.finditer(text))
 
     # If no matches are found, return the whole text as one citation
@@ -216,7 +229,7 @@ def split_text_at_years_with_dot(text):
     cur_citation = ''
 
     if author_first:
-        author_after_dot_pattern = regex.compile(rf'\.{author_pattern}', regex.MULTILINE | regex.VERBOSE | regex.UNICODE)
+        author_after_dot_pattern = get_author_after_dot_pattern()
         dot_matches = list(author_after_dot_pattern.finditer(references_text))
         if dot_matches is not None:
             for dot_match in dot_matches:
@@ -227,8 +240,8 @@ def split_text_at_years_with_dot(text):
                 print(f'text having pattern recognized after dot: {dot_matches_text}')
    
     last_matched = False
-    year_pattern = regex.compile(r'\s\(?[1-2](0|9)\d{2}[a-z]?\)?\.', regex.MULTILINE | regex.VERBOSE | regex.UNICODE)
-    garbage_pattern = regex.compile(r'[0-9]+\.[0-9]+|[0-9]+-[0-9]+', regex.MULTILINE | regex.VERBOSE | regex.UNICODE)
+    year_pattern = YEAR_PATTERN
+    garbage_pattern = GARBAGE_PATTERN
 
     for line in references_text.split('\n'):
         citation = line.lstrip('0123456789').replace('- ', '')
@@ -0,0 +1,103 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from sotapapers.utils.lookup_cache import LookupCache
+
+
+def counting(value):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return value
+
+    return compute, calls
+
+
+def test_value_is_computed_once(tmp_path):
+    cache = LookupCache(tmp_path / 'cache.sqlite')
+    compute, calls = counting({'pdf_url': 'a.pdf'})
+
+    assert cache.get_or_compute('k', compute) == {'pdf_url': 'a.pdf'}
+    assert cache.get_or_compute('k', compute) == {'pdf_url': 'a.pdf'}
+    assert len(calls) == 1
+
+
+def test_waiter_gets_the_claim_holders_result(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    owner = LookupCache(path)
+    assert owner._claim('k', None)
+    results = []
+
+    def wait():
+        waiter = LookupCache(path, poll_interval=0.01)
+        results.append(waiter.get_or_compute('k', lambda: pytest.fail('waiter recomputed')))
+        waiter.close()
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    time.sleep(0.1)
+    assert not results
+    owner.conn.execute('UPDATE lookups SET value = ?, done = 1 WHERE key = ?', ('"found"', 'k'))
+    thread.join(timeout=5)
+
+    assert results == ['found']
+
+
+def test_stale_claim_is_taken_over(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    crashed = LookupCache(path)
+    assert crashed._claim('k', None)
+    crashed.conn.execute('UPDATE lookups SET claimed_at = ? WHERE key = ?', (time.time() - 60, 'k'))
+
+    cache = LookupCache(path, claim_timeout=30, poll_interval=0.01)
+    compute, calls = counting('fresh')
+
+    assert cache.get_or_compute('k', compute) == 'fresh'
+    assert len(calls) == 1
+
+
+def test_failed_compute_releases_the_claim(tmp_path):
+    cache = LookupCache(tmp_path / 'cache.sqlite')
+
+    def fail():
+        raise ConnectionError('offline')
+
+    with pytest.raises(ConnectionError):
+        cache.get_or_compute('k', fail)
+    assert cache._row('k') is None
+    assert cache.get_or_compute('k', lambda: 'later') == 'later'
+
+
+def test_misses_expire(tmp_path):
+    cache = LookupCache(tmp_path / 'cache.sqlite', miss_ttl=3600)
+    compute, calls = counting(None)
+
+    assert cache.get_or_compute('k', compute) is None
+    assert cache.get_or_compute('k', compute) is None
+    assert len(calls) == 1
+
+    cache.miss_ttl = 0
+    time.sleep(0.01)
+    assert cache.get_or_compute('k', lambda: {'pdf_url': 'a.pdf'}) == {'pdf_url': 'a.pdf'}
+    # hits never expire
+    assert cache.get_or_compute('k', lambda: pytest.fail('hit recomputed')) == {'pdf_url': 'a.pdf'}
+
+
+def test_reads_rows_written_before_misses_expired(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        'CREATE TABLE lookups (key TEXT PRIMARY KEY, value TEXT, done INTEGER NOT NULL DEFAULT 0, '
+        'owner INTEGER, claimed_at REAL)'
+    )
+    conn.execute("INSERT INTO lookups VALUES ('hit', '1', 1, 1, 0), ('miss', 'null', 1, 1, 0)")
+    conn.commit()
+    conn.close()
+
+    cache = LookupCache(path)
+    assert cache.get_or_compute('hit', lambda: pytest.fail('hit recomputed')) == 1
+    assert cache.get_or_compute('miss', lambda: 2) == 2
@@ -0,0 +1,101 @@
+"""Add corpus_stats table with trigger-maintained row counters
+
+Revision ID: add_corpus_stats
+Revises: 20251101_0000
+Create Date: 2026-10-18 01:00:00.000000
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_corpus_stats'
+down_revision = '20251101_0000'
+branch_labels = None
+depends_on = None
+
+# counter name -> source table (kept in sync with services/corpus_stats_service.py)
+COUNTER_TABLES = {
+    'papers_total': 'papers',
+    'authors_total': 'authors',
+    'citations_total': 'paper_references',
+    'llm_extractions_total': 'llm_extractions',
+    'pdfs_processed': 'pdf_contents',
+}
+
+# Statement-level triggers with transition tables: one counter update per
+# statement, regardless of how many rows a bulk insert/delete touched.
+COUNTER_FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION corpus_stats_count_inserts() RETURNS trigger AS $$
+    BEGIN
+        UPDATE corpus_stats
+        SET value = value + (SELECT COUNT(*) FROM new_rows), updated_at = NOW()
+        WHERE name = TG_ARGV[0];
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION corpus_stats_count_deletes() RETURNS trigger AS $$
+    BEGIN
+        UPDATE corpus_stats
+        SET value = GREATEST(value - (SELECT COUNT(*) FROM old_rows), 0), updated_at = NOW()
+        WHERE name = TG_ARGV[0];
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+]
+
+
+def counter_statements(name: str, table: str) -> list[str]:
+    """Seed a counter with the exact row count and install its triggers."""
+    return [
+        f"INSERT INTO corpus_stats (name, value) SELECT '{name}', COUNT(*) FROM {table}",
+        f"""
+        CREATE TRIGGER trg_{table}_corpus_stats_insert
+        AFTER INSERT ON {table}
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION corpus_stats_count_inserts('{name}')
+        """,
+        f"""
+        CREATE TRIGGER trg_{table}_corpus_stats_delete
+        AFTER DELETE ON {table}
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION corpus_stats_count_deletes('{name}')
+        """,
+    ]
+
+
+def upgrade() -> None:
+    """Create corpus_stats, seed exact counts and install counter triggers."""
+    op.create_table(
+        'corpus_stats',
+        sa.Column('name', sa.String(100), primary_key=True),
+        sa.Column('value', sa.BigInteger, nullable=False, server_default=sa.text('0'),
+                  comment='Counter value'),
+        sa.Column('data', postgresql.JSONB, nullable=True,
+                  comment='Breakdown payload for grouped statistics'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.text('NOW()')),
+    )
+
+    for statement in COUNTER_FUNCTIONS:
+        op.execute(statement)
+    for name, table in COUNTER_TABLES.items():
+        for statement in counter_statements(name, table):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop counter triggers and the corpus_stats table."""
+    for table in COUNTER_TABLES.values():
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_corpus_stats_delete ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_corpus_stats_insert ON {table}")
+
+    op.execute("DROP FUNCTION IF EXISTS corpus_stats_count_deletes()")
+    op.execute("DROP FUNCTION IF EXISTS corpus_stats_count_inserts()")
+    op.drop_table('corpus_stats')
@@ -0,0 +1,138 @@
+"""Add weekly/monthly aggregates for star and metric history
+
+Revision ID: add_history_aggregates
+Revises: add_corpus_stats
+Create Date: 2026-10-18 02:00:00.000000
+
+With TimescaleDB, github_star_snapshots and metric_snapshots become
+hypertables and the aggregates are real-time continuous aggregates with
+refresh policies. Without it they are plain materialized views with the
+same names and columns, refreshed by the scheduler.
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_history_aggregates'
+down_revision = 'add_corpus_stats'
+branch_labels = None
+depends_on = None
+
+# view name -> (bucket width, refresh policy start offset)
+# (kept in sync with services/history_service.py)
+STAR_VIEWS = {
+    'star_history_weekly': ('week', '3 months'),
+    'star_history_monthly': ('month', '2 years'),
+}
+METRIC_VIEWS = {
+    'metric_history_weekly': ('week', '3 months'),
+    'metric_history_monthly': ('month', '2 years'),
+}
+
+
+def _has_timescaledb() -> bool:
+    bind = op.get_bind()
+    return bind.execute(
+        sa.text("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+    ).scalar() is not None
+
+
+def _star_select(bucket_expr: str, last) -> str:
+    return f"""
+        SELECT paper_id,
+               {bucket_expr} AS bucket,
+               {last('star_count')} AS stars,
+               MIN(star_count) AS stars_min,
+               MAX(star_count) AS stars_max,
+               COUNT(*) AS samples
+        FROM github_star_snapshots
+        GROUP BY paper_id, bucket
+    """
+
+
+def _metric_select(bucket_expr: str, last) -> str:
+    return f"""
+        SELECT paper_id,
+               {bucket_expr} AS bucket,
+               {last('github_stars')} AS github_stars,
+               {last('citation_count')} AS citation_count,
+               {last('vote_count')} AS vote_count,
+               AVG(hype_score) AS hype_score,
+               COUNT(*) AS samples
+        FROM metric_snapshots
+        GROUP BY paper_id, bucket
+    """
+
+
+def _upgrade_timescaledb() -> None:
+    # Hypertable unique indexes must include the time column
+    op.execute("ALTER TABLE github_star_snapshots DROP CONSTRAINT IF EXISTS github_star_snapshots_pkey")
+    op.execute("ALTER TABLE github_star_snapshots ADD PRIMARY KEY (id, snapshot_date)")
+    for table in ('github_star_snapshots', 'metric_snapshots'):
+        op.execute(
+            f"SELECT create_hypertable('{table}', 'snapshot_date', "
+            f"chunk_time_interval => INTERVAL '30 days', "
+            f"migrate_data => true, if_not_exists => true)"
+        )
+
+    def last(column: str) -> str:
+        return f"last({column}, snapshot_date)"
+
+    views = [(name, spec, _star_select) for name, spec in STAR_VIEWS.items()]
+    views += [(name, spec, _metric_select) for name, spec in METRIC_VIEWS.items()]
+    for name, (bucket, start_offset), select in views:
+        # Refreshing inside the migration transaction is not allowed, so the
+        # views are created empty and backfilled below
+        op.execute(f"""
+            CREATE MATERIALIZED VIEW {name}
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            {select(f"time_bucket(INTERVAL '1 {bucket}', snapshot_date)", last)}
+            WITH NO DATA
+        """)
+        op.execute(f"""
+            SELECT add_continuous_aggregate_policy('{name}',
+                start_offset => INTERVAL '{start_offset}',
+                end_offset => INTERVAL '1 day',
+                schedule_interval => INTERVAL '1 hour')
+        """)
+
+    # The policies only refresh their start_offset window; once they have
+    # run, real-time aggregation only covers rows after the materialized
+    # range. Materialize the full history now so older buckets are kept.
+    with op.get_context().autocommit_block():
+        for name, _, _ in views:
+            op.execute(f"CALL refresh_continuous_aggregate('{name}', NULL, NULL)")
+
+
+def _upgrade_postgres() -> None:
+    def last(column: str) -> str:
+        return f"(array_agg({column} ORDER BY snapshot_date DESC))[1]"
+
+    views = [(name, spec, _star_select) for name, spec in STAR_VIEWS.items()]
+    views += [(name, spec, _metric_select) for name, spec in METRIC_VIEWS.items()]
+    for name, (bucket, _), select in views:
+        op.execute(f"""
+            CREATE MATERIALIZED VIEW {name} AS
+            {select(f"date_trunc('{bucket}', snapshot_date)::date", last)}
+            WITH DATA
+        """)
+        # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+        op.execute(f"CREATE UNIQUE INDEX idx_{name}_paper_bucket ON {name} (paper_id, bucket)")
+
+
+def upgrade() -> None:
+    """Create history aggregates (continuous aggregates when TimescaleDB is installed)."""
+    if _has_timescaledb():
+        _upgrade_timescaledb()
+    else:
+        _upgrade_postgres()
+
+
+def downgrade() -> None:
+    """Drop history aggregates.
+
+    Hypertable conversion is not reverted.
+    """
+    for name in list(METRIC_VIEWS) + list(STAR_VIEWS):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name} CASCADE")
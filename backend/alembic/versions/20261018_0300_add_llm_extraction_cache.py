@@ -0,0 +1,39 @@
+"""Add llm_extraction_cache table
+
+Revision ID: add_llm_extraction_cache
+Revises: add_history_aggregates
+Create Date: 2026-10-18 03:00:00.000000
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_llm_extraction_cache'
+down_revision = 'add_history_aggregates'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create llm_extraction_cache keyed by (pdf_sha256, prompt_hash, model_id)."""
+    op.create_table(
+        'llm_extraction_cache',
+        sa.Column('pdf_sha256', sa.String(64), primary_key=True,
+                  comment='SHA-256 of the PDF bytes'),
+        sa.Column('prompt_hash', sa.String(64), primary_key=True,
+                  comment='SHA-256 of the extraction prompt'),
+        sa.Column('model_id', sa.String(150), primary_key=True,
+                  comment="Provider and model, e.g. 'openai:gpt-4o'"),
+        sa.Column('result', postgresql.JSONB, nullable=False,
+                  comment='Parsed extraction result'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.text('NOW()')),
+    )
+
+
+def downgrade() -> None:
+    """Drop llm_extraction_cache."""
+    op.drop_table('llm_extraction_cache')
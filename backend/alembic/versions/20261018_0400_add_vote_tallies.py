@@ -0,0 +1,106 @@
+"""Add upvote/downvote tallies to papers with incremental trigger maintenance
+
+Revision ID: add_vote_tallies
+Revises: add_llm_extraction_cache
+Create Date: 2026-10-18 04:00:00.000000
+
+Replaces the vote_count trigger, which recounted every vote of the paper on
+each vote change, with one that applies the vote's delta to
+upvote_count/downvote_count/vote_count in the voting transaction.
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_vote_tallies'
+down_revision = 'add_llm_extraction_cache'
+branch_labels = None
+depends_on = None
+
+VOTE_TALLY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION update_paper_vote_count()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+           AND OLD.paper_id = NEW.paper_id
+           AND OLD.vote_type = NEW.vote_type THEN
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE papers
+            SET upvote_count = upvote_count - (OLD.vote_type = 'upvote')::int,
+                downvote_count = downvote_count - (OLD.vote_type = 'downvote')::int,
+                vote_count = vote_count - CASE WHEN OLD.vote_type = 'upvote' THEN 1 ELSE -1 END
+            WHERE id = OLD.paper_id;
+        END IF;
+
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE papers
+            SET upvote_count = upvote_count + (NEW.vote_type = 'upvote')::int,
+                downvote_count = downvote_count + (NEW.vote_type = 'downvote')::int,
+                vote_count = vote_count + CASE WHEN NEW.vote_type = 'upvote' THEN 1 ELSE -1 END
+            WHERE id = NEW.paper_id;
+        END IF;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+VOTE_TALLY_TRIGGER = """
+    CREATE TRIGGER vote_count_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON votes
+    FOR EACH ROW EXECUTE FUNCTION update_paper_vote_count();
+"""
+
+
+def upgrade() -> None:
+    """Add tally columns, backfill them and install the incremental trigger."""
+    op.add_column('papers', sa.Column(
+        'upvote_count', sa.Integer, nullable=False, server_default=sa.text('0'),
+        comment='Number of upvotes, updated by trigger'))
+    op.add_column('papers', sa.Column(
+        'downvote_count', sa.Integer, nullable=False, server_default=sa.text('0'),
+        comment='Number of downvotes, updated by trigger'))
+
+    op.execute("""
+        UPDATE papers p
+        SET upvote_count = v.upvotes,
+            downvote_count = v.downvotes,
+            vote_count = v.upvotes - v.downvotes
+        FROM (
+            SELECT paper_id,
+                   COUNT(*) FILTER (WHERE vote_type = 'upvote') AS upvotes,
+                   COUNT(*) FILTER (WHERE vote_type = 'downvote') AS downvotes
+            FROM votes
+            GROUP BY paper_id
+        ) v
+        WHERE p.id = v.paper_id
+    """)
+
+    op.execute(VOTE_TALLY_FUNCTION)
+    op.execute("DROP TRIGGER IF EXISTS vote_count_trigger ON votes")
+    op.execute(VOTE_TALLY_TRIGGER)
+
+
+def downgrade() -> None:
+    """Restore the recounting trigger and drop the tally columns."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_paper_vote_count()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE papers
+            SET vote_count = (
+                SELECT COALESCE(SUM(CASE WHEN vote_type = 'upvote' THEN 1 ELSE -1 END), 0)
+                FROM votes
+                WHERE paper_id = COALESCE(NEW.paper_id, OLD.paper_id)
+            )
+            WHERE id = COALESCE(NEW.paper_id, OLD.paper_id);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.drop_column('papers', 'downvote_count')
+    op.drop_column('papers', 'upvote_count')
@@ -0,0 +1,47 @@
+"""Add h-index, publication years and stats watermark to authors
+
+Revision ID: add_author_stats
+Revises: add_vote_tallies
+Create Date: 2026-10-18 05:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_author_stats'
+down_revision = 'add_vote_tallies'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add author statistics columns and indexes for incremental refresh."""
+    op.add_column('authors', sa.Column(
+        'h_index', sa.Integer, nullable=False, server_default=sa.text('0'),
+        comment='h-index over the papers in the corpus'))
+    op.add_column('authors', sa.Column(
+        'first_publication_year', sa.Integer, nullable=True,
+        comment='Year of earliest paper'))
+    op.add_column('authors', sa.Column(
+        'last_publication_year', sa.Integer, nullable=True,
+        comment='Year of most recent paper'))
+    op.add_column('authors', sa.Column(
+        'stats_updated_at', sa.DateTime, nullable=True,
+        comment='When statistics were last recomputed (UTC)'))
+
+    op.create_index('idx_authors_h_index', 'authors', [sa.text('h_index DESC')])
+    op.create_index('idx_papers_updated_at', 'papers', ['updated_at'])
+    op.create_index('idx_paper_authors_created_at', 'paper_authors', ['created_at'])
+
+
+def downgrade() -> None:
+    """Drop author statistics columns and indexes."""
+    op.drop_index('idx_paper_authors_created_at', table_name='paper_authors')
+    op.drop_index('idx_papers_updated_at', table_name='papers')
+    op.drop_index('idx_authors_h_index', table_name='authors')
+    op.drop_column('authors', 'stats_updated_at')
+    op.drop_column('authors', 'last_publication_year')
+    op.drop_column('authors', 'first_publication_year')
+    op.drop_column('authors', 'h_index')
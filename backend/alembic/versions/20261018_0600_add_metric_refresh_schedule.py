@@ -0,0 +1,47 @@
+"""Add metric_refresh_schedule table
+
+Revision ID: add_metric_refresh_schedule
+Revises: add_author_stats
+Create Date: 2026-10-18 06:00:00.000000
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_metric_refresh_schedule'
+down_revision = 'add_author_stats'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the per-paper refresh queue and enqueue existing papers as due."""
+    op.create_table(
+        'metric_refresh_schedule',
+        sa.Column('paper_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('papers.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('next_refresh_at', sa.DateTime, nullable=False,
+                  server_default=sa.text("timezone('utc', NOW())"),
+                  comment='When the paper is next due for a refresh (UTC)'),
+        sa.Column('refresh_interval_hours', sa.Float, nullable=False,
+                  server_default=sa.text('24'),
+                  comment='Current adaptive refresh interval'),
+        sa.Column('last_refreshed_at', sa.DateTime, nullable=True,
+                  comment='When metrics were last fetched (UTC)'),
+        sa.Column('last_github_stars', sa.Integer, nullable=True,
+                  comment='Stars at the last refresh'),
+        sa.Column('last_citation_count', sa.Integer, nullable=True,
+                  comment='Citations at the last refresh'),
+    )
+    op.create_index('idx_metric_refresh_schedule_next', 'metric_refresh_schedule', ['next_refresh_at'])
+
+    op.execute("INSERT INTO metric_refresh_schedule (paper_id) SELECT id FROM papers")
+
+
+def downgrade() -> None:
+    """Drop metric_refresh_schedule."""
+    op.drop_index('idx_metric_refresh_schedule_next', table_name='metric_refresh_schedule')
+    op.drop_table('metric_refresh_schedule')
@@ -0,0 +1,44 @@
+"""Add scheduled_job_status table
+
+Revision ID: add_scheduled_job_status
+Revises: add_metric_refresh_schedule
+Create Date: 2026-10-18 07:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_scheduled_job_status'
+down_revision = 'add_metric_refresh_schedule'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create scheduled_job_status keyed by job name."""
+    op.create_table(
+        'scheduled_job_status',
+        sa.Column('job_name', sa.String(100), primary_key=True),
+        sa.Column('state', sa.String(20), nullable=False,
+                  comment='running, succeeded, failed or lock_lost'),
+        sa.Column('holder', sa.String(200), nullable=True,
+                  comment='Replica (host:pid) holding or last holding the lock'),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True,
+                  comment='Running state is stale after this time without a heartbeat'),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text, nullable=True),
+        sa.Column('last_skipped_at', sa.DateTime(timezone=True), nullable=True,
+                  comment='Last time a replica skipped the job because another held the lock'),
+        sa.Column('skipped_by', sa.String(200), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.text('NOW()')),
+    )
+
+
+def downgrade() -> None:
+    """Drop scheduled_job_status."""
+    op.drop_table('scheduled_job_status')
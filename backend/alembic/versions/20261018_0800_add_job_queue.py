@@ -0,0 +1,46 @@
+"""Add job_queue table for the SQL job queue backend
+
+Revision ID: add_job_queue
+Revises: add_scheduled_job_status
+Create Date: 2026-10-18 08:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_job_queue'
+down_revision = 'add_scheduled_job_status'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create job_queue with a (status, priority, created_at) dequeue index."""
+    op.create_table(
+        'job_queue',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('job_type', sa.String(50), nullable=False),
+        sa.Column('params', sa.JSON, nullable=False),
+        sa.Column('user_id', sa.String(100), nullable=True),
+        sa.Column('priority', sa.SmallInteger, nullable=False,
+                  comment='0 = low, 1 = normal, 2 = high'),
+        sa.Column('status', sa.String(20), nullable=False,
+                  comment='queued, processing, success, failed or cancelled'),
+        sa.Column('visible_at', sa.DateTime, nullable=True,
+                  comment='Processing jobs are redelivered after this time (UTC)'),
+        sa.Column('attempts', sa.Integer, nullable=False),
+        sa.Column('results', sa.JSON, nullable=True),
+        sa.Column('error', sa.Text, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=False),
+        sa.Column('started_at', sa.DateTime, nullable=True),
+        sa.Column('processed_at', sa.DateTime, nullable=True),
+    )
+    op.create_index('idx_job_queue_dequeue', 'job_queue', ['status', 'priority', 'created_at'])
+
+
+def downgrade() -> None:
+    """Drop job_queue."""
+    op.drop_index('idx_job_queue_dequeue', table_name='job_queue')
+    op.drop_table('job_queue')
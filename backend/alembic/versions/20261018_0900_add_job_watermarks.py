@@ -0,0 +1,37 @@
+"""Add job_watermarks table for incremental job resume points
+
+Revision ID: add_job_watermarks
+Revises: add_job_queue
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_job_watermarks'
+down_revision = 'add_job_queue'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create job_watermarks keyed by job name.
+
+    No row is seeded: the first incremental author statistics run after this
+    migration falls back to a full recompute.
+    """
+    op.create_table(
+        'job_watermarks',
+        sa.Column('name', sa.String(100), primary_key=True),
+        sa.Column('watermark', sa.DateTime, nullable=False,
+                  comment='Start (UTC) of the last run whose work fully committed'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.text('NOW()')),
+    )
+
+
+def downgrade() -> None:
+    """Drop job_watermarks."""
+    op.drop_table('job_watermarks')
@@ -0,0 +1,87 @@
+"""Fixtures for backend benchmarks.
+
+Benchmarks run against a local Postgres database (``BENCH_DATABASE_URL``)
+seeded with a synthetic corpus of ``BENCH_SCALE`` papers (10k by default).
+"""
+import asyncio
+import os
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.synthetic_corpus import BENCH_DATABASE_URL, SCALES, ensure_corpus
+
+BENCH_SCALE = os.getenv("BENCH_SCALE", "10k")
+
+
+@pytest.fixture(scope="session")
+def bench_loop():
+    """Event loop shared by all benchmarks (benchmark() itself is synchronous)."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def run(bench_loop):
+    """Run a coroutine to completion on the benchmark loop."""
+    def _run(coro):
+        return bench_loop.run_until_complete(coro)
+    return _run
+
+
+@pytest.fixture(scope="session")
+def corpus_papers():
+    """Number of papers in the benchmark corpus."""
+    return SCALES[BENCH_SCALE]
+
+
+@pytest.fixture(scope="session")
+def bench_engine(run, corpus_papers):
+    """Async engine bound to the seeded benchmark database."""
+    engine = create_async_engine(BENCH_DATABASE_URL, pool_size=5, max_overflow=0)
+    run(ensure_corpus(engine, corpus_papers))
+    yield engine
+    run(engine.dispose())
+
+
+@pytest.fixture(scope="session")
+def bench_sessionmaker(bench_engine):
+    """Session factory for the benchmark database."""
+    return async_sessionmaker(bench_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture(scope="session")
+def bench_client(run, bench_sessionmaker):
+    """HTTP client for the paper, citation and GitHub routers on the bench database."""
+    from src.api.v1 import citations, github
+    from src.api.v1 import papers as papers_v1
+    from src.database import get_db, get_read_db
+
+    app = FastAPI()
+    app.include_router(papers_v1.router, prefix="/api/v1")
+    app.include_router(citations.router, prefix="/api/v1")
+    app.include_router(github.router, prefix="/api/v1")
+
+    async def override_db():
+        async with bench_sessionmaker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_read_db] = override_db
+
+    client = AsyncClient(app=app, base_url="http://bench")
+    yield client
+    run(client.aclose())
+
+
+@pytest.fixture
+def get_json(run, bench_client):
+    """GET a URL on the bench app and return its JSON body (asserting 200)."""
+    def _get(url, **params):
+        response = run(bench_client.get(url, params=params))
+        assert response.status_code == 200, response.text[:500]
+        return response.json()
+    return _get
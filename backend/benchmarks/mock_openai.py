@@ -0,0 +1,121 @@
+"""Local mock of the OpenAI Assistants endpoints used by ``OpenAILLMService``.
+
+Runs complete ``run_latency`` seconds after they are created, so batch
+throughput of ``AssistantRunDispatcher`` can be measured offline. Point
+``OpenAILLMService(base_url=server.url)`` at it.
+
+    python -m benchmarks.mock_openai --port 8765 --latency 2.0
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from typing import Optional
+
+from aiohttp import web
+
+DEFAULT_RESPONSE = {"datasets": ["ImageNet", "COCO"]}
+
+
+class MockOpenAIServer:
+    """In-process Assistants API mock with request counters."""
+
+    def __init__(self, run_latency: float = 0.2, response: Optional[dict] = None):
+        """Configure the mock.
+
+        Args:
+            run_latency: Seconds from run creation to completion
+            response: JSON object returned as the assistant message
+        """
+        self.run_latency = run_latency
+        self.response = json.dumps(response or DEFAULT_RESPONSE)
+        self.counts = {"files": 0, "assistants": 0, "threads": 0, "runs": 0, "polls": 0}
+        self.max_active_runs = 0
+        self._ids = itertools.count(1)
+        self._runs: dict[str, float] = {}
+        self._completed: set[str] = set()
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+        self.app = web.Application()
+        self.app.add_routes([
+            web.post("/v1/files", self.create_file),
+            web.post("/v1/assistants", self.create_assistant),
+            web.post("/v1/threads", self.create_thread),
+            web.post("/v1/threads/{thread_id}/messages", self.add_message),
+            web.get("/v1/threads/{thread_id}/messages", self.list_messages),
+            web.post("/v1/threads/{thread_id}/runs", self.create_run),
+            web.get("/v1/threads/{thread_id}/runs/{run_id}", self.get_run),
+        ])
+
+    def _id(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._ids)}"
+
+    async def create_file(self, request: web.Request) -> web.Response:
+        await request.read()
+        self.counts["files"] += 1
+        return web.json_response({"id": self._id("file")})
+
+    async def create_assistant(self, request: web.Request) -> web.Response:
+        self.counts["assistants"] += 1
+        return web.json_response({"id": self._id("asst")})
+
+    async def create_thread(self, request: web.Request) -> web.Response:
+        self.counts["threads"] += 1
+        return web.json_response({"id": self._id("thread")})
+
+    async def add_message(self, request: web.Request) -> web.Response:
+        await request.json()
+        return web.json_response({"id": self._id("msg")})
+
+    async def list_messages(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": [
+            {"role": "assistant", "content": [{"type": "text", "text": {"value": self.response}}]},
+        ]})
+
+    async def create_run(self, request: web.Request) -> web.Response:
+        self.counts["runs"] += 1
+        run_id = self._id("run")
+        self._runs[run_id] = time.monotonic() + self.run_latency
+        active = len(self._runs) - len(self._completed)
+        self.max_active_runs = max(self.max_active_runs, active)
+        return web.json_response({"id": run_id, "status": "queued"})
+
+    async def get_run(self, request: web.Request) -> web.Response:
+        self.counts["polls"] += 1
+        run_id = request.match_info["run_id"]
+        if time.monotonic() >= self._runs[run_id]:
+            self._completed.add(run_id)
+            return web.json_response({"id": run_id, "status": "completed"})
+        return web.json_response({"id": run_id, "status": "in_progress"})
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving; returns the API base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{bound_port}/v1"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def _serve(port: int, latency: float) -> None:
+    server = MockOpenAIServer(run_latency=latency)
+    print(f"Mock OpenAI API at {await server.start(port=port)} (run latency {latency}s)")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock OpenAI Assistants API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=2.0)
+    args = parser.parse_args()
+    asyncio.run(_serve(args.port, args.latency))
@@ -0,0 +1,71 @@
+"""Benchmarks for the hot read endpoints on the synthetic corpus."""
+import pytest
+
+from benchmarks.synthetic_corpus import paper_uuid
+
+LIST_SORTS = [
+    "published_date_desc",
+    "published_date_asc",
+    "github_stars_desc",
+    "citations_desc",
+    "weekly_hype_desc",
+    "monthly_hype_desc",
+    "stars",
+    "citations",
+]
+
+LIST_FILTERS = {
+    "none": {},
+    "primary_task": {"primary_task": "Image Generation"},
+    "venue": {"venue": "CVPR"},
+    "year_range": {"year_min": 2020, "year_max": 2023},
+    "has_github": {"has_github": "true"},
+    "search": {"search": "diffusion"},
+    "min_github_stars": {"min_github_stars": 100},
+}
+
+
+@pytest.mark.parametrize("sort", LIST_SORTS)
+def test_list_papers_sort(benchmark, get_json, sort):
+    benchmark.group = "list_papers:sort"
+    body = benchmark(get_json, "/api/v1/papers", sort=sort, page=5, page_size=20)
+    assert len(body["items"]) <= 20
+
+
+@pytest.mark.parametrize("name", list(LIST_FILTERS))
+def test_list_papers_filter(benchmark, get_json, name):
+    benchmark.group = "list_papers:filter"
+    benchmark(get_json, "/api/v1/papers", page_size=20, **LIST_FILTERS[name])
+
+
+@pytest.mark.parametrize("depth", [1, 2])
+@pytest.mark.parametrize("direction", ["in", "out", "both"])
+def test_citation_graph(benchmark, get_json, depth, direction):
+    benchmark.group = "citation_graph"
+    # Paper 0 sits at the head of the skewed citation distribution
+    benchmark(
+        get_json,
+        "/api/v1/citations/graph",
+        paper_id=str(paper_uuid(0)),
+        depth=depth,
+        direction=direction,
+        max_nodes=200,
+    )
+
+
+@pytest.mark.parametrize("sort_by", ["weekly_hype", "monthly_hype", "average_hype", "total_stars"])
+@pytest.mark.parametrize("period", ["week", "all_time"])
+def test_trending_papers(benchmark, get_json, sort_by, period):
+    benchmark.group = "trending"
+    benchmark(get_json, "/api/v1/github/trending", sort_by=sort_by, period=period, min_stars=10)
+
+
+def test_trending_papers_filtered(benchmark, get_json):
+    benchmark.group = "trending"
+    benchmark(
+        get_json,
+        "/api/v1/github/trending",
+        primary_task="Image Generation",
+        language="Python",
+        min_stars=10,
+    )
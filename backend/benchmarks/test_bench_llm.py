@@ -0,0 +1,42 @@
+"""Benchmark: OpenAI assistant-run dispatch against the local mock server."""
+import pytest
+
+from benchmarks.mock_openai import MockOpenAIServer
+from src.services.llm_service import AssistantRunDispatcher, OpenAILLMService
+
+BATCH_SIZE = 1_000
+RUN_LATENCY = 0.5
+
+
+@pytest.fixture
+def mock_openai(run):
+    server = MockOpenAIServer(run_latency=RUN_LATENCY)
+    run(server.start())
+    yield server
+    run(server.stop())
+
+
+@pytest.fixture(scope="module")
+def pdfs(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("pdfs")
+    paths = []
+    for i in range(BATCH_SIZE):
+        path = directory / f"paper_{i}.pdf"
+        path.write_bytes(b"%PDF-1.4 " + str(i).encode() * 64)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_concurrency", [16, 64, 256])
+def test_assistant_dispatcher_1000_papers(benchmark, run, mock_openai, pdfs, max_concurrency):
+    benchmark.group = "openai_dispatch"
+    llm = OpenAILLMService(api_key="test", base_url=mock_openai.url, poll_interval=0.1, max_poll_interval=1.0)
+    dispatcher = AssistantRunDispatcher(llm, max_concurrency=max_concurrency)
+    jobs = [(i, path, "Extract the datasets used.") for i, path in enumerate(pdfs)]
+
+    results = benchmark.pedantic(lambda: run(dispatcher.run(jobs)), rounds=1, iterations=1)
+
+    assert len(results) == BATCH_SIZE
+    assert not [r for r in results.values() if isinstance(r, Exception)]
+    assert mock_openai.max_active_runs <= max_concurrency
+    assert mock_openai.counts["assistants"] == 1
@@ -0,0 +1,114 @@
+"""Benchmarks for scoring, citation matching and star-tracker persistence."""
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic_corpus import WORDS, paper_uuid, synthetic_title
+from src.services.hype_score import calculate_hype_score, calculate_hype_scores_batch
+
+
+def test_calculate_hype_score_10k(benchmark):
+    benchmark.group = "hype_score"
+    rng = random.Random(0)
+    today = date.today()
+    inputs = [
+        (rng.randint(0, 100_000), rng.randint(0, 10_000), rng.randint(-5, 1_000),
+         today - timedelta(days=rng.randint(0, 3_000)))
+        for _ in range(10_000)
+    ]
+
+    def score_all():
+        return [calculate_hype_score(s, c, v, d) for s, c, v, d in inputs]
+
+    scores = benchmark(score_all)
+    assert len(scores) == len(inputs)
+
+
+def test_calculate_hype_scores_batch_1m(benchmark):
+    benchmark.group = "hype_score"
+    rng = np.random.default_rng(0)
+    size = 1_000_000
+    today = date.today()
+    stars = rng.integers(0, 100_000, size)
+    citations = rng.integers(0, 10_000, size)
+    votes = rng.integers(-5, 1_000, size)
+    published = today.toordinal() - rng.integers(0, 3_000, size)
+    growth = rng.normal(0.0, 0.2, size)
+
+    batch = benchmark(
+        calculate_hype_scores_batch, stars, citations, votes, published, growth, today
+    )
+    assert len(batch) == size
+
+
+@pytest.mark.parametrize("candidates", [1_000, 10_000])
+def test_citation_matcher_match_citation(benchmark, run, candidates):
+    from src.services.citation_service import CitationMatcher
+
+    benchmark.group = "citation_matcher"
+    rng = random.Random(1)
+    papers = [
+        SimpleNamespace(title=synthetic_title(rng, i), year=2015 + i % 10)
+        for i in range(candidates)
+    ]
+    target = papers[candidates // 2]
+
+    matcher = CitationMatcher()
+
+    # Skip the AnyStyle subprocess: benchmark the fuzzy matching loop only
+    async def parse_citation(citation_text):
+        return {"title": target.title, "year": target.year}
+
+    matcher.parse_citation = parse_citation
+
+    citation = f"{target.title}. {' '.join(WORDS[:5])}"
+    # A coroutine can only be awaited once: build a fresh one per round
+    match = benchmark(lambda: run(matcher.match_citation(citation, papers)))
+    assert match is not None
+
+
+def test_batch_topic_matcher_10k(benchmark):
+    from src.services.topic_matching_service import BatchTopicMatcher
+
+    benchmark.group = "topic_matching"
+    rng = random.Random(2)
+    topics = [
+        SimpleNamespace(id=i, name=" ".join(rng.sample(WORDS, 2)), keywords=rng.sample(WORDS, 5))
+        for i in range(200)
+    ]
+    papers = [(synthetic_title(rng, i), " ".join(rng.choices(WORDS, k=150))) for i in range(10_000)]
+    matcher = BatchTopicMatcher(topics)
+
+    def match_all():
+        return [matcher.score(title, abstract) for title, abstract in papers]
+
+    benchmark.pedantic(match_all, rounds=3, iterations=1)
+
+
+def test_star_tracker_persistence(benchmark, run, bench_sessionmaker, monkeypatch):
+    """Persist one day of star snapshots for 200 papers (GitHub API and rate-limit sleep stubbed)."""
+    from src.jobs import star_tracker
+
+    benchmark.group = "star_tracker"
+
+    async def fake_repo_details(self, url):
+        return SimpleNamespace(stars=hash(url) % 50_000)
+
+    async def no_sleep(_seconds):
+        return None
+
+    monkeypatch.setattr(star_tracker, "AsyncSessionLocal", bench_sessionmaker)
+    monkeypatch.setattr(star_tracker.AsyncGitHubService, "_get_repo_details", fake_repo_details)
+    monkeypatch.setattr(star_tracker.asyncio, "sleep", no_sleep)
+
+    paper_ids = [paper_uuid(i) for i in range(200)]
+    result = benchmark.pedantic(
+        lambda: run(star_tracker._async_track_stars(paper_ids=paper_ids)),
+        rounds=3,
+        iterations=1,
+    )
+    benchmark.extra_info["papers_updated"] = result["papers_updated"]
+    benchmark.extra_info["errors"] = result["errors"]
@@ -0,0 +1,103 @@
+"""Export the paper corpus as NDJSON, CSV or Parquet.
+
+Accepts the same filters as GET /api/v1/papers and streams rows from a
+server-side cursor, so large exports run in bounded memory.
+
+Usage:
+    python scripts/export_papers.py --format parquet --output papers.parquet --year-min 2023
+    python scripts/export_papers.py --format ndjson --has-github > papers.ndjson
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import AsyncReadSessionLocal  # noqa: E402
+from src.services.paper_export import (  # noqa: E402
+    EXPORT_BATCH_SIZE,
+    EXPORT_FORMATS,
+    PaperFilters,
+    ParquetStreamWriter,
+    export_chunks,
+    stream_export_rows,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--output", type=Path, help="Output file (default: stdout; required for parquet)")
+    parser.add_argument("--sort", default="published_date_desc")
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE)
+
+    filters = parser.add_argument_group("filters")
+    filters.add_argument("--topic-id")
+    filters.add_argument("--primary-task")
+    filters.add_argument("--secondary-task")
+    filters.add_argument("--method")
+    filters.add_argument("--datasets-used")
+    filters.add_argument("--metrics-used")
+    filters.add_argument("--min-github-stars", type=int)
+    filters.add_argument("--min-citations", type=int)
+    filters.add_argument("--venue")
+    filters.add_argument("--year", type=int)
+    filters.add_argument("--year-min", type=int)
+    filters.add_argument("--year-max", type=int)
+    filters.add_argument("--has-github", action="store_true", default=None)
+    filters.add_argument("--no-github", dest="has_github", action="store_false")
+    filters.add_argument("--paper-type")
+    filters.add_argument("--accept-status")
+    filters.add_argument("--search")
+
+    args = parser.parse_args()
+    if args.format == "parquet" and args.output is None:
+        parser.error("--output is required for parquet")
+    return args
+
+
+async def export_papers(args: argparse.Namespace) -> None:
+    filters = PaperFilters(
+        topic_id=args.topic_id,
+        primary_task=args.primary_task,
+        secondary_task=args.secondary_task,
+        method=args.method,
+        datasets_used=args.datasets_used,
+        metrics_used=args.metrics_used,
+        min_github_stars=args.min_github_stars,
+        min_citations=args.min_citations,
+        venue=args.venue,
+        year=args.year,
+        year_min=args.year_min,
+        year_max=args.year_max,
+        has_github=args.has_github,
+        paper_type=args.paper_type,
+        accept_status=args.accept_status,
+        search=args.search,
+    )
+
+    rows_written = 0
+    async with AsyncReadSessionLocal() as session:
+        if args.format == "parquet":
+            writer = ParquetStreamWriter(sink=str(args.output))
+            async for batch in stream_export_rows(session, filters, args.sort, args.batch_size):
+                writer.write_batch(batch)
+                rows_written += len(batch)
+            writer.close()
+        else:
+            out = open(args.output, "wb") if args.output else sys.stdout.buffer
+            try:
+                async for chunk in export_chunks(session, filters, args.format, args.sort, args.batch_size):
+                    out.write(chunk)
+            finally:
+                if args.output:
+                    out.close()
+
+    if args.format == "parquet":
+        print(f"Wrote {rows_written} papers to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    asyncio.run(export_papers(parse_args()))
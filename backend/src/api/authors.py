@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import get_db
+from src.database import get_read_db
 from src.services.author_service import AuthorService
 
 
@@ -24,6 +24,9 @@ class AuthorResponse(BaseModel):
     affiliations: Optional[List[str]] = None
     paper_count: int
     total_citation_count: int
+    h_index: int = 0
+    first_publication_year: Optional[int] = None
+    last_publication_year: Optional[int] = None
     email: Optional[str] = None
     website_url: Optional[str] = None
     created_at: date
@@ -45,6 +48,9 @@ class AuthorResponse(BaseModel):
             "affiliations": author.affiliations,
             "paper_count": author.paper_count,
             "total_citation_count": author.total_citation_count,
+            "h_index": author.h_index,
+            "first_publication_year": author.first_publication_year,
+            "last_publication_year": author.last_publication_year,
             "email": author.email,
             "website_url": author.website_url,
             "created_at": author.created_at,
@@ -68,7 +74,7 @@ class AuthorListResponse(BaseModel):
 )
 async def get_author(
     author_id: int,
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_read_db)
 ):
     """Get author details by ID.
 
@@ -110,7 +116,7 @@ async def search_authors(
     min_papers: Optional[int] = Query(None, ge=1, description="Minimum paper count"),
     min_citations: Optional[int] = Query(None, ge=1, description="Minimum total citations"),
     limit: int = Query(20, ge=1, le=100, description="Maximum results"),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_read_db)
 ):
     """Search and filter authors.
 
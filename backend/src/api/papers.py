@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..services import HypeScoreService, MetricService, PaperService
+from ..services.metric_refresh_service import record_paper_view
 from .cache import cache, cache_papers_list
 
 router = APIRouter(prefix="/api/v1/papers", tags=["papers"])
@@ -31,6 +32,8 @@ class PaperListItem(BaseModel):
     hype_score: float
     trend_label: str
     vote_count: int = 0  # Feature 003: voting
+    upvote_count: int = 0
+    downvote_count: int = 0
     quick_summary: Optional[str] = None  # Feature 003: enrichment
 
     class Config:
@@ -70,6 +73,8 @@ class PaperDetailResponse(BaseModel):
 
     # Feature 003: Voting & Enrichment
     vote_count: int = 0
+    upvote_count: int = 0
+    downvote_count: int = 0
     quick_summary: Optional[str] = None
     key_ideas: Optional[str] = None
     quantitative_performance: Optional[dict] = None
@@ -107,7 +112,7 @@ class PaperMetricsResponse(BaseModel):
 
 
 # Import database session dependency
-from ..database import get_db
+from ..database import get_read_db
 
 
 @router.get("", response_model=PapersListResponse)
@@ -116,7 +121,7 @@ async def get_papers(
     sort: str = Query("recency", description="Sort option: hype_score, recency, stars"),
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PapersListResponse:
     """Get papers with filtering and sorting.
 
@@ -179,6 +184,8 @@ async def get_papers(
                 hype_score=hype_data["hype_score"],
                 trend_label=hype_data["trend_label"],
                 vote_count=paper.vote_count,
+                upvote_count=paper.upvote_count,
+                downvote_count=paper.downvote_count,
                 quick_summary=paper.quick_summary,
             )
         )
@@ -199,7 +206,7 @@ async def get_papers(
 @router.get("/{paper_id}", response_model=PaperDetailResponse)
 async def get_paper_by_id(
     paper_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PaperDetailResponse:
     """Get paper details by ID.
 
@@ -219,6 +226,7 @@ async def get_paper_by_id(
     paper = await paper_service.get_paper_by_id(paper_id)
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
+    await record_paper_view(paper.id)
 
     hype_data = await hype_score_service.calculate_hype_score(paper)
 
@@ -241,6 +249,8 @@ async def get_paper_by_id(
         trend_label=hype_data["trend_label"],
         created_at=paper.created_at.isoformat(),
         vote_count=paper.vote_count,
+        upvote_count=paper.upvote_count,
+        downvote_count=paper.downvote_count,
         quick_summary=paper.quick_summary,
         key_ideas=paper.key_ideas,
         quantitative_performance=paper.quantitative_performance,
@@ -257,7 +267,7 @@ async def get_paper_by_id(
 async def get_paper_metrics(
     paper_id: UUID,
     days: int = Query(30, ge=1, le=365, description="Days of history"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PaperMetricsResponse:
     """Get metric history for a paper.
 
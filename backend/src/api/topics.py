@@ -52,12 +52,12 @@ class TopicDetailResponse(BaseModel):
 
 
 # Import database session dependency
-from ..database import get_db
+from ..database import get_read_db
 
 
 @router.get("", response_model=TopicsListResponse)
 async def get_topics(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> TopicsListResponse:
     """Get all topics with paper counts.
 
@@ -76,7 +76,7 @@ async def get_topics(
 @router.get("/{topic_id}", response_model=TopicDetailResponse)
 async def get_topic_by_id(
     topic_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> TopicDetailResponse:
     """Get a single topic by ID.
 
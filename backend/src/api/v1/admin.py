@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...database import get_db
+from ...database import get_db, get_read_db
 from ...models import AdminTaskLog, Paper
 from ...jobs.celery_app import celery_app
 from ...api.dependencies import get_current_user_required
@@ -220,7 +220,7 @@ async def trigger_reference_extraction(
 async def list_admin_tasks(
     limit: int = 50,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user: dict = Depends(get_current_user_required)
 ):
     """List recent admin tasks."""
@@ -250,7 +250,7 @@ async def list_admin_tasks(
 @router.get("/tasks/{task_id}", response_model=TaskLogResponse)
 async def get_task_details(
     task_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user: dict = Depends(get_current_user_required)
 ):
     """Get specific task details."""
@@ -4,7 +4,7 @@ API endpoints for async crawler job management via Cloudflare Workers + Upstash
 This is separate from the existing Celery-based jobs system in jobs.py.
 These endpoints use Cloudflare Workers for serverless job processing.
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -26,6 +26,9 @@ class EnqueueJobRequest(BaseModel):
     params: Dict[str, Any] = Field(
         ..., description="Job parameters (query, url, limit, etc.)"
     )
+    priority: Literal["high", "normal", "low"] = Field(
+        "normal", description="Queue priority: high, normal, low"
+    )
 
     class Config:
         json_schema_extra = {
@@ -77,6 +80,10 @@ class QueueStatsResponse(BaseModel):
     """Response with queue statistics."""
 
     queue_length: int
+    counts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Jobs per state: queued (and per priority), processing, expired, success, failed, cancelled",
+    )
     timestamp: str
 
 
@@ -125,6 +132,7 @@ async def enqueue_crawler_job(
             job_type=request.job_type,
             params=request.params,
             user_id=user_id,
+            priority=request.priority,
         )
 
         return EnqueueJobResponse(
@@ -6,7 +6,7 @@ from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
-from ...database import get_db
+from ...database import get_read_db
 from ...models import Author, Paper, PaperAuthor
 
 router = APIRouter()
@@ -19,6 +19,7 @@ class AuthorResponse(BaseModel):
     primary_affiliation: Optional[str] = None
     paper_count: Optional[int] = None
     total_citation_count: Optional[int] = None
+    h_index: Optional[int] = None
     email: Optional[str] = None
     website_url: Optional[str] = None
 
@@ -38,7 +39,7 @@ class AuthorPaper(BaseModel):
 async def search_authors(
     q: str = Query(..., min_length=1, description="Search query for author name"),
     limit: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Search for authors by name.
@@ -62,7 +63,7 @@ async def search_authors(
 @router.get("/{author_id}", response_model=AuthorResponse)
 async def get_author(
     author_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get detailed information about a specific author.
@@ -87,7 +88,7 @@ async def get_author_papers(
     author_id: int,
     limit: int = Query(10, ge=1, le=100),
     sort_by: str = Query("published_date", regex="^(published_date|citation_count)$"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get papers by a specific author.
@@ -15,7 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ...models import Paper, PaperReference
-from .dependencies import get_db
+from .dependencies import get_db, get_read_db
 
 router = APIRouter(prefix="/api/v1/citations", tags=["citations"])
 
@@ -125,7 +125,7 @@ async def get_citation_graph(
     direction: str = Query("both", regex="^(in|out|both)$", description="Traversal direction"),
     min_match_score: float = Query(70.0, ge=0, le=100, description="Minimum fuzzy match score"),
     max_nodes: int = Query(500, ge=1, le=1000, description="Maximum nodes to return"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CitationGraph:
     """Get citation graph with multi-level traversal.
 
@@ -493,7 +493,7 @@ async def get_citation_stats(
         description="Statistic to compute"
     ),
     limit: int = Query(10, ge=1, le=100, description="Limit for top-N results"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CitationStats:
     """Get citation statistics for a paper or corpus.
 
@@ -5,7 +5,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...database import AsyncSessionLocal
+from ...database import AsyncSessionLocal, get_read_db  # noqa: F401 - re-exported for routers
 
 security = HTTPBearer(auto_error=False)
 
@@ -10,15 +10,24 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ...models import Paper, GitHubMetrics, GitHubStarSnapshot
-from .dependencies import get_db
+from ...models import Paper, GitHubMetrics
+from ...services.history_service import HistoryService
+from ...services.leaderboard_service import (
+    get_leaderboard_store,
+    hydrate_trending,
+    query_trending_ids,
+)
+from .dependencies import get_read_db
 
 router = APIRouter(prefix="/api/v1/github", tags=["github"])
 
+# aggregate query value -> history bucket
+AGGREGATE_BUCKETS = {"auto": "auto", "daily": "day", "weekly": "week", "monthly": "month"}
+
 
 # Response models
 class StarHistoryPoint(BaseModel):
@@ -78,13 +87,16 @@ class TrendingResponse(BaseModel):
 @router.get("/metrics/{paper_id}", response_model=GitHubMetrics)
 async def get_github_metrics(
     paper_id: str,
-    history_days: int = Query(90, ge=1, le=365, description="Days of star history"),
+    history_days: int = Query(90, ge=1, le=3650, description="Days of star history"),
     aggregate: str = Query(
         "daily",
-        regex="^(daily|weekly|monthly)$",
-        description="Aggregate history by period"
+        regex="^(auto|daily|weekly|monthly)$",
+        description="Aggregate history by period (auto picks from the range)"
+    ),
+    max_points: Optional[int] = Query(
+        None, ge=3, le=5000, description="Downsample history to at most this many points (LTTB)"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> GitHubMetrics:
     """Get comprehensive GitHub metrics with time-series star history.
 
@@ -112,134 +124,21 @@ async def get_github_metrics(
 
     metrics = paper.github_metrics
 
-    # Get star history
-    cutoff_date = date.today() - timedelta(days=history_days)
-    history_query = (
-        select(GitHubStarSnapshot)
-        .where(
-            and_(
-                GitHubStarSnapshot.paper_id == paper.id,
-                GitHubStarSnapshot.snapshot_date >= cutoff_date,
-            )
-        )
-        .order_by(GitHubStarSnapshot.snapshot_date.asc())
+    # Star history: daily rows from snapshots, weekly/monthly from aggregates
+    points = await HistoryService(db).get_star_history(
+        paper.id,
+        start_date=date.today() - timedelta(days=history_days),
+        bucket=AGGREGATE_BUCKETS[aggregate],
+        max_points=max_points,
     )
-    history_result = await db.execute(history_query)
-    snapshots = list(history_result.scalars().all())
-
-    # Aggregate if requested
-    star_history = []
-
-    if aggregate == "daily":
-        # Return daily snapshots as-is
-        for snap in snapshots:
-            star_history.append(
-                StarHistoryPoint(
-                    date=snap.snapshot_date.isoformat(),
-                    stars=snap.star_count,
-                    forks=snap.fork_count,
-                    watchers=snap.watcher_count,
-                    delta=snap.stars_gained_since_yesterday,
-                )
-            )
-
-    elif aggregate == "weekly":
-        # Aggregate by week (Sunday to Saturday)
-        current_week = []
-        current_week_start = None
-
-        for snap in snapshots:
-            week_start = snap.snapshot_date - timedelta(days=snap.snapshot_date.weekday())
-
-            if current_week_start is None:
-                current_week_start = week_start
-
-            if week_start != current_week_start:
-                # New week, aggregate previous week
-                if current_week:
-                    first_snap = current_week[0]
-                    last_snap = current_week[-1]
-                    delta = last_snap.star_count - first_snap.star_count
-
-                    star_history.append(
-                        StarHistoryPoint(
-                            date=current_week_start.isoformat(),
-                            stars=last_snap.star_count,
-                            forks=last_snap.fork_count,
-                            watchers=last_snap.watcher_count,
-                            delta=delta,
-                        )
-                    )
-
-                current_week = [snap]
-                current_week_start = week_start
-            else:
-                current_week.append(snap)
-
-        # Add last week
-        if current_week:
-            first_snap = current_week[0]
-            last_snap = current_week[-1]
-            delta = last_snap.star_count - first_snap.star_count
-
-            star_history.append(
-                StarHistoryPoint(
-                    date=current_week_start.isoformat(),
-                    stars=last_snap.star_count,
-                    forks=last_snap.fork_count,
-                    watchers=last_snap.watcher_count,
-                    delta=delta,
-                )
-            )
-
-    elif aggregate == "monthly":
-        # Aggregate by month
-        current_month = []
-        current_month_start = None
-
-        for snap in snapshots:
-            month_start = snap.snapshot_date.replace(day=1)
-
-            if current_month_start is None:
-                current_month_start = month_start
-
-            if month_start != current_month_start:
-                # New month, aggregate previous month
-                if current_month:
-                    first_snap = current_month[0]
-                    last_snap = current_month[-1]
-                    delta = last_snap.star_count - first_snap.star_count
-
-                    star_history.append(
-                        StarHistoryPoint(
-                            date=current_month_start.isoformat(),
-                            stars=last_snap.star_count,
-                            forks=last_snap.fork_count,
-                            watchers=last_snap.watcher_count,
-                            delta=delta,
-                        )
-                    )
-
-                current_month = [snap]
-                current_month_start = month_start
-            else:
-                current_month.append(snap)
-
-        # Add last month
-        if current_month:
-            first_snap = current_month[0]
-            last_snap = current_month[-1]
-            delta = last_snap.star_count - first_snap.star_count
-
-            star_history.append(
-                StarHistoryPoint(
-                    date=current_month_start.isoformat(),
-                    stars=last_snap.star_count,
-                    forks=last_snap.fork_count,
-                    watchers=last_snap.watcher_count,
-                    delta=delta,
-                )
-            )
+    star_history = [
+        StarHistoryPoint(
+            date=point["date"].isoformat(),
+            stars=point["stars"],
+            delta=point["delta"],
+        )
+        for point in points
+    ]
 
     return GitHubMetrics(
         paper_id=str(paper.id),
@@ -267,7 +166,7 @@ async def get_github_metrics(
         tracking={
             "start_date": metrics.tracking_start_date.isoformat(),
             "last_tracked": metrics.last_tracked_at.isoformat(),
-            "total_snapshots": len(snapshots),
+            "total_snapshots": len(star_history),
             "enabled": metrics.tracking_enabled,
         },
         star_history=star_history,
@@ -293,86 +192,40 @@ async def get_trending_papers(
     language: Optional[str] = Query(None, description="Filter by primary language"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> TrendingResponse:
     """Get trending papers sorted by GitHub hype scores.
 
     Returns papers with rapidly growing repositories, sorted by specified metric.
+    Rankings come from the precomputed leaderboards unless venue/year filters
+    are given.
     """
-    # Build base query
-    query = (
-        select(Paper)
-        .join(GitHubMetrics, GitHubMetrics.paper_id == Paper.id)
-        .where(GitHubMetrics.current_stars >= min_stars)
-        .options(
-            selectinload(Paper.github_metrics),
-            selectinload(Paper.citations_in),
-        )
-    )
-
-    # Apply filters
-    filters = []
-
-    if primary_task:
-        filters.append(Paper.primary_task == primary_task)
-
-    if venue:
-        filters.append(Paper.venue.ilike(f"%{venue}%"))
-
-    if year:
-        filters.append(Paper.year == year)
-
-    if language:
-        filters.append(GitHubMetrics.primary_language == language)
-
-    # Apply period filter (based on tracking date)
-    if period == "day":
-        cutoff = date.today() - timedelta(days=1)
-    elif period == "week":
-        cutoff = date.today() - timedelta(days=7)
-    elif period == "month":
-        cutoff = date.today() - timedelta(days=30)
-    elif period == "quarter":
-        cutoff = date.today() - timedelta(days=90)
-    elif period == "year":
-        cutoff = date.today() - timedelta(days=365)
-    else:  # all_time
-        cutoff = None
-
-    if cutoff:
-        filters.append(GitHubMetrics.tracking_start_date <= cutoff)
-
-    if filters:
-        query = query.where(and_(*filters))
-
-    # Apply sorting
-    if sort_by == "weekly_hype":
-        query = query.order_by(GitHubMetrics.weekly_hype.desc().nulls_last())
-    elif sort_by == "monthly_hype":
-        query = query.order_by(GitHubMetrics.monthly_hype.desc().nulls_last())
-    elif sort_by == "average_hype":
-        query = query.order_by(GitHubMetrics.average_hype.desc().nulls_last())
-    elif sort_by == "total_stars":
-        query = query.order_by(GitHubMetrics.current_stars.desc())
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply pagination
     offset = (page - 1) * page_size
-    query = query.limit(page_size).offset(offset)
 
-    # Execute query
-    result = await db.execute(query)
-    papers = list(result.scalars().unique().all())
+    if venue is None and year is None:
+        snapshot = await get_leaderboard_store().get_snapshot(db)
+        ranking = snapshot.ranking(period, sort_by, primary_task, language, min_stars)
+        total = len(ranking)
+        page_ids = snapshot.page(ranking, offset, page_size)
+    else:
+        total, page_ids = await query_trending_ids(
+            db,
+            period=period,
+            sort_by=sort_by,
+            min_stars=min_stars,
+            offset=offset,
+            limit=page_size,
+            primary_task=primary_task,
+            venue=venue,
+            year=year,
+            language=language,
+        )
+
+    rows = await hydrate_trending(db, page_ids)
 
     # Build response
     trending_papers = []
-    for idx, paper in enumerate(papers, start=1):
-        metrics = paper.github_metrics
-
+    for idx, (paper, metrics, cited_by_count) in enumerate(rows, start=1):
         # Determine hype score based on sort_by
         if sort_by == "weekly_hype":
             hype_score = metrics.weekly_hype or 0.0
@@ -404,7 +257,7 @@ async def get_trending_papers(
                     "monthly_hype": metrics.monthly_hype,
                 },
                 trending_rank=offset + idx,
-                citations_count=len(paper.citations_in),
+                citations_count=cited_by_count,
             )
         )
 
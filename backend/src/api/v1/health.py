@@ -2,12 +2,15 @@
 from datetime import datetime
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...database import get_db
+from ...database import get_db, get_pool_metrics, get_read_db
+from ...middleware.query_profiler import get_query_profile_registry
 from ...services.cache_service import get_cache
+from ...services.corpus_stats_service import get_cached_corpus_stats, render_prometheus
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -82,113 +85,87 @@ async def readiness_check(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
 
 
 @router.get("/metrics", status_code=status.HTTP_200_OK)
-async def metrics(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def metrics(
+    format: str = Query("json", regex="^(json|prometheus)$", description="Response format"),
+    db: AsyncSession = Depends(get_read_db),
+):
     """System metrics endpoint.
 
+    Serves precomputed corpus counters from ``corpus_stats`` (falling back to
+    planner estimates), cached in-process for a short TTL so frequent scrapes
+    do not scan the large tables.
+
+    Args:
+        format: ``json`` (default) or ``prometheus`` text exposition format
+
     Returns:
         System metrics including database statistics
     """
-    from ...models import (
-        Author,
-        GitHubMetrics,
-        LLMExtraction,
-        Paper,
-        PDFContent,
-        PaperReference,
-    )
-
-    metrics_data = {}
+    metrics_data: Dict[str, Any] = {}
+    sources: Dict[str, str] = {}
+    stats_updated_at = None
 
     try:
-        # Count papers
-        result = await db.execute(text("SELECT COUNT(*) FROM papers"))
-        metrics_data["papers_total"] = result.scalar()
+        stats = await get_cached_corpus_stats(db)
+        metrics_data = dict(stats["metrics"])
+        sources = stats["sources"]
+        stats_updated_at = stats["updated_at"]
+    except Exception as e:
+        metrics_data["error"] = str(e)
 
-        # Count papers with GitHub repos
-        result = await db.execute(
-            text("SELECT COUNT(*) FROM papers WHERE github_url IS NOT NULL")
-        )
-        metrics_data["papers_with_github"] = result.scalar()
-
-        # Count authors
-        result = await db.execute(text("SELECT COUNT(*) FROM authors"))
-        metrics_data["authors_total"] = result.scalar()
-
-        # Count citations
-        result = await db.execute(text("SELECT COUNT(*) FROM paper_references"))
-        metrics_data["citations_total"] = result.scalar()
-
-        # Count LLM extractions
-        result = await db.execute(text("SELECT COUNT(*) FROM llm_extractions"))
-        metrics_data["llm_extractions_total"] = result.scalar()
-
-        # Count LLM extractions by verification status
-        result = await db.execute(
-            text(
-                "SELECT verification_status, COUNT(*) FROM llm_extractions "
-                "GROUP BY verification_status"
-            )
+    if format == "prometheus":
+        return PlainTextResponse(
+            render_prometheus({k: v for k, v in metrics_data.items() if k != "error"}),
+            media_type="text/plain; version=0.0.4",
         )
-        verification_counts = {row[0]: row[1] for row in result}
-        metrics_data["llm_extractions_by_status"] = verification_counts
 
-        # Count PDFs processed
-        result = await db.execute(text("SELECT COUNT(*) FROM pdf_content"))
-        metrics_data["pdfs_processed"] = result.scalar()
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "stats_updated_at": stats_updated_at,
+        "sources": sources,
+        "metrics": metrics_data,
+    }
 
-        # GitHub metrics
-        result = await db.execute(
-            text("SELECT COUNT(*) FROM github_metrics WHERE current_stars > 0")
-        )
-        metrics_data["repos_tracked"] = result.scalar()
 
-        result = await db.execute(
-            text("SELECT SUM(current_stars) FROM github_metrics")
-        )
-        total_stars = result.scalar()
-        metrics_data["total_stars_tracked"] = total_stars if total_stars else 0
-
-        # Average stars per repo
-        if metrics_data["repos_tracked"] > 0:
-            metrics_data["avg_stars_per_repo"] = (
-                metrics_data["total_stars_tracked"] / metrics_data["repos_tracked"]
-            )
-        else:
-            metrics_data["avg_stars_per_repo"] = 0
-
-        # Most popular tasks
-        result = await db.execute(
-            text(
-                "SELECT primary_task, COUNT(*) as count FROM papers "
-                "WHERE primary_task IS NOT NULL "
-                "GROUP BY primary_task "
-                "ORDER BY count DESC "
-                "LIMIT 10"
-            )
-        )
-        top_tasks = [{"task": row[0], "count": row[1]} for row in result]
-        metrics_data["top_tasks"] = top_tasks
-
-        # Most used datasets
-        result = await db.execute(
-            text(
-                "SELECT jsonb_array_elements_text(datasets_used) as dataset, "
-                "COUNT(*) as count FROM papers "
-                "WHERE datasets_used IS NOT NULL "
-                "GROUP BY dataset "
-                "ORDER BY count DESC "
-                "LIMIT 10"
-            )
-        )
-        top_datasets = [{"dataset": row[0], "count": row[1]} for row in result]
-        metrics_data["top_datasets"] = top_datasets
+@router.get("/db-pool", status_code=status.HTTP_200_OK)
+async def db_pool_metrics() -> Dict[str, Any]:
+    """Connection pool metrics for the primary and replica engines.
 
-    except Exception as e:
-        metrics_data["error"] = str(e)
+    Returns:
+        Per-engine pool size, in-use connections and checkout-wait times
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "engines": get_pool_metrics(),
+    }
+
+
+@router.get("/query-metrics", status_code=status.HTTP_200_OK)
+async def query_metrics(
+    format: str = Query("json", regex="^(json|prometheus)$", description="Response format"),
+):
+    """Per-route latency and sampled DB query statistics.
+
+    Includes query counts, DB time, rows returned and statement shapes
+    flagged as N+1 patterns.
+
+    Args:
+        format: ``json`` (default) or ``prometheus`` text exposition format
+
+    Returns:
+        Per-route query profile statistics
+    """
+    registry = get_query_profile_registry()
+
+    if format == "prometheus":
+        return PlainTextResponse(
+            registry.render_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
 
     return {
         "timestamp": datetime.utcnow().isoformat(),
-        "metrics": metrics_data,
+        **registry.snapshot(),
     }
 
 
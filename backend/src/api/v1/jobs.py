@@ -5,7 +5,7 @@ Endpoints:
 - GET /api/v1/jobs/{job_id} - Get job status and progress
 - POST /api/v1/jobs/{job_id}/cancel - Cancel running job
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import uuid4, UUID
 
@@ -14,7 +14,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...jobs.celery_app import celery_app
-from .dependencies import get_db, get_current_user
+from .dependencies import get_db, get_read_db, get_current_user
 from ...models.crawler_job import CrawlerJob
 
 router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
@@ -504,10 +504,53 @@ async def get_crawler_logs(job_id: str):
     return {"logs": logs}
 
 
+class ScheduledJobState(BaseModel):
+    """Latest state of a scheduled job across replicas."""
+
+    job_name: str
+    state: str
+    holder: Optional[str] = None
+    started_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    lease_expires_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    last_skipped_at: Optional[datetime] = None
+    skipped_by: Optional[str] = None
+    stale: bool = Field(False, description="Running but the holder's lease expired")
+
+    class Config:
+        from_attributes = True
+
+
+@router.get("/scheduled", response_model=list[ScheduledJobState])
+async def list_scheduled_jobs(
+    db: AsyncSession = Depends(get_read_db),
+) -> list[ScheduledJobState]:
+    """Get which replica runs (or last ran) each scheduled job.
+
+    Returns:
+        One entry per scheduled job that has run or been skipped
+    """
+    from sqlalchemy import select
+    from ...models import ScheduledJobStatus
+
+    result = await db.execute(select(ScheduledJobStatus).order_by(ScheduledJobStatus.job_name))
+    now = datetime.now(timezone.utc)
+    return [
+        ScheduledJobState.model_validate(status).model_copy(update={
+            "stale": status.state == "running"
+            and status.lease_expires_at is not None
+            and status.lease_expires_at < now,
+        })
+        for status in result.scalars().all()
+    ]
+
+
 @router.get("/{job_id}", response_model=JobStatus)
 async def get_job_status(
     job_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> JobStatus:
     """Get detailed job status including progress and results.
 
@@ -647,7 +690,7 @@ async def list_jobs(
     created_before: Optional[datetime] = Query(None, description="Filter jobs created before"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> dict:
     """List background jobs with filtering and pagination.
 
@@ -724,21 +767,22 @@ async def sync_database(
         if not papers:
             break
 
+        # 1. Enrich papers (GitHub URL, citations, etc.)
         for paper in papers:
             try:
-                # 1. Enrich paper (GitHub URL, citations, etc.)
                 await enrichment_service.enrich_paper(paper)
-
-                # 2. Extract and create author records
-                new_authors = await author_service.extract_authors_from_paper(paper, db)
-                authors_created += len(new_authors)
-
                 enriched_count += 1
 
             except Exception as e:
                 errors.append(f"Paper {paper.id}: {str(e)}")
                 continue
 
+        # 2. Extract and link author records for the whole batch
+        try:
+            authors_created += await author_service.extract_authors_from_papers(papers, db)
+        except Exception as e:
+            errors.append(f"Authors for papers {offset}-{offset + len(papers) - 1}: {str(e)}")
+
         # Commit batch
         await db.commit()
         offset += batch_size
@@ -2,23 +2,35 @@
 
 Endpoints:
 - GET /api/v1/papers - List with extended filters
+- GET /api/v1/papers/export - Stream the filtered corpus as NDJSON, CSV or Parquet
 - GET /api/v1/papers/{id} - Get single paper with full metadata
 - GET /api/v1/papers/{id}/citations - Get bidirectional citations
 - GET /api/v1/papers/{id}/github - Get GitHub metrics and history
+- GET /api/v1/papers/{id}/related - Get similar papers (TF-IDF similarity index)
 """
+import asyncio
 from datetime import date, datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ...models import Paper, PaperReference, GitHubMetrics, GitHubStarSnapshot, PaperTopicMatch
 from ...services import PaperService
-from .dependencies import get_db
+from ...services.metric_refresh_service import record_paper_view
+from ...services.paper_export import (
+    MEDIA_TYPES,
+    PaperFilters,
+    export_chunks,
+    paper_filter_conditions,
+)
+from ...services.similarity_index import get_similarity_index
+from .dependencies import get_read_db
 
 router = APIRouter(prefix="/api/v1/papers", tags=["papers"])
 
@@ -128,6 +140,25 @@ class GitHubMetricsDetailed(BaseModel):
     star_history: list[dict]
 
 
+class RelatedPaper(BaseModel):
+    """Paper similar to the requested paper."""
+
+    id: str
+    arxiv_id: Optional[str] = None
+    title: str
+    authors: list[str]
+    year: Optional[int] = None
+    venue: Optional[str] = None
+    similarity: float
+
+
+class RelatedPapersResponse(BaseModel):
+    """Related papers ordered by similarity."""
+
+    paper_id: str
+    related: list[RelatedPaper]
+
+
 class PapersListResponse(BaseModel):
     """Paginated papers list response."""
 
@@ -169,7 +200,7 @@ async def list_papers(
     accept_status: Optional[str] = Query(None, description="Filter by acceptance status"),
     search: Optional[str] = Query(None, description="Full-text search across title and abstract"),
 
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PapersListResponse:
     """List papers with extended filtering and sorting.
 
@@ -183,7 +214,22 @@ async def list_papers(
     )
 
     # Apply filters
-    filters = []
+    filters = PaperFilters(
+        topic_id=topic_id,
+        primary_task=primary_task,
+        secondary_task=secondary_task,
+        method=method,
+        datasets_used=datasets_used,
+        metrics_used=metrics_used,
+        venue=venue,
+        year=year,
+        year_min=year_min,
+        year_max=year_max,
+        has_github=has_github,
+        paper_type=paper_type,
+        accept_status=accept_status,
+        search=search,
+    )
 
     # Topic filter (join with paper_topic_matches table)
     if topic_id:
@@ -191,63 +237,9 @@ async def list_papers(
             PaperTopicMatch.topic_id == topic_id
         )
 
-    if primary_task:
-        filters.append(Paper.primary_task == primary_task)
-
-    if secondary_task:
-        filters.append(Paper.secondary_task == secondary_task)
-
-    if method:
-        filters.append(
-            or_(
-                Paper.primary_method == method,
-                Paper.secondary_method == method,
-                Paper.tertiary_method == method,
-            )
-        )
-
-    if datasets_used:
-        # JSONB containment query
-        filters.append(Paper.datasets_used.contains([datasets_used]))
-
-    if metrics_used:
-        filters.append(Paper.metrics_used.contains([metrics_used]))
-
-    if venue:
-        filters.append(Paper.venue.ilike(f"%{venue}%"))
-
-    if year:
-        filters.append(Paper.year == year)
-
-    if year_min:
-        filters.append(Paper.year >= year_min)
-
-    if year_max:
-        filters.append(Paper.year <= year_max)
-
-    if has_github is not None:
-        if has_github:
-            filters.append(Paper.github_url.isnot(None))
-        else:
-            filters.append(Paper.github_url.is_(None))
-
-    if paper_type:
-        filters.append(Paper.paper_type == paper_type)
-
-    if accept_status:
-        filters.append(Paper.accept_status == accept_status)
-
-    if search:
-        # Full-text search using PostgreSQL tsvector
-        search_filter = or_(
-            Paper.title.ilike(f"%{search}%"),
-            Paper.abstract.ilike(f"%{search}%"),
-        )
-        filters.append(search_filter)
-
-    # Apply all filters
-    if filters:
-        query = query.where(and_(*filters))
+    conditions = paper_filter_conditions(filters)
+    if conditions:
+        query = query.where(and_(*conditions))
 
     # Apply sorting
     if sort == "published_date_desc":
@@ -377,10 +369,76 @@ async def list_papers(
     )
 
 
+@router.get("/export")
+async def export_papers(
+    format: str = Query("ndjson", regex="^(ndjson|csv|parquet)$", description="Output format"),
+    sort: str = Query(
+        "published_date_desc",
+        description="Sort option",
+        regex="^(published_date_desc|published_date_asc|github_stars_desc|citations_desc|weekly_hype_desc|monthly_hype_desc|hype_score|published_date|stars|citations)$"
+    ),
+
+    # Filters (same as list_papers)
+    topic_id: Optional[str] = Query(None, description="Filter by topic ID"),
+    primary_task: Optional[str] = Query(None, description="Filter by primary research task"),
+    secondary_task: Optional[str] = Query(None, description="Filter by secondary research task"),
+    method: Optional[str] = Query(None, description="Filter by method (primary/secondary/tertiary)"),
+    datasets_used: Optional[str] = Query(None, description="Filter by dataset name (contains)"),
+    metrics_used: Optional[str] = Query(None, description="Filter by evaluation metric"),
+    min_github_stars: Optional[int] = Query(None, ge=0, description="Minimum GitHub stars"),
+    min_citations: Optional[int] = Query(None, ge=0, description="Minimum citation count"),
+    venue: Optional[str] = Query(None, description="Filter by venue/conference name"),
+    year: Optional[int] = Query(None, ge=1900, le=2100, description="Filter by publication year"),
+    year_min: Optional[int] = Query(None, description="Minimum publication year"),
+    year_max: Optional[int] = Query(None, description="Maximum publication year"),
+    has_github: Optional[bool] = Query(None, description="Filter papers with GitHub repositories"),
+    paper_type: Optional[str] = Query(None, description="Filter by paper type"),
+    accept_status: Optional[str] = Query(None, description="Filter by acceptance status"),
+    search: Optional[str] = Query(None, description="Full-text search across title and abstract"),
+
+    db: AsyncSession = Depends(get_read_db),
+) -> StreamingResponse:
+    """Stream every paper matching the filters, with GitHub metrics and citation counts.
+
+    Rows are read with a server-side cursor and sent as they are encoded, so
+    there is no pagination and no COUNT query.
+    """
+    if format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=501, detail="Parquet export requires pyarrow") from None
+
+    filters = PaperFilters(
+        topic_id=topic_id,
+        primary_task=primary_task,
+        secondary_task=secondary_task,
+        method=method,
+        datasets_used=datasets_used,
+        metrics_used=metrics_used,
+        min_github_stars=min_github_stars,
+        min_citations=min_citations,
+        venue=venue,
+        year=year,
+        year_min=year_min,
+        year_max=year_max,
+        has_github=has_github,
+        paper_type=paper_type,
+        accept_status=accept_status,
+        search=search,
+    )
+
+    return StreamingResponse(
+        export_chunks(db, filters, format, sort=sort),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="papers.{format}"'},
+    )
+
+
 @router.get("/{paper_id}", response_model=PaperDetailed)
 async def get_paper(
     paper_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PaperDetailed:
     """Get detailed paper information by UUID or ArXiv ID."""
     # Try to parse as UUID first
@@ -404,6 +462,7 @@ async def get_paper(
 
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
+    await record_paper_view(paper.id)
 
     # Calculate metrics - prefer scraped stars
     github_stars = (
@@ -470,7 +529,7 @@ async def get_paper_citations(
     direction: str = Query("both", regex="^(in|out|both)$", description="Citation direction"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CitationsResponse:
     """Get citation relationships for a paper (bidirectional).
 
@@ -572,7 +631,7 @@ async def get_paper_citations(
 async def get_paper_github(
     paper_id: str,
     history_days: int = Query(90, ge=1, le=365, description="Days of star history to return"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> GitHubMetricsDetailed:
     """Get GitHub repository metrics and star tracking history."""
     # Get paper with GitHub metrics
@@ -652,3 +711,62 @@ async def get_paper_github(
         },
         star_history=star_history,
     )
+
+
+@router.get("/{paper_id}/related", response_model=RelatedPapersResponse)
+async def get_related_papers(
+    paper_id: str,
+    limit: int = Query(10, ge=1, le=50, description="Number of related papers"),
+    db: AsyncSession = Depends(get_read_db),
+) -> RelatedPapersResponse:
+    """Get papers with similar titles and abstracts.
+
+    Papers not yet in the similarity index are embedded on the fly.
+    """
+    try:
+        paper_uuid = UUID(paper_id)
+        query = select(Paper.id, Paper.title, Paper.abstract).where(Paper.id == paper_uuid)
+    except ValueError:
+        query = select(Paper.id, Paper.title, Paper.abstract).where(Paper.arxiv_id == paper_id)
+
+    result = await db.execute(query)
+    paper = result.one_or_none()
+
+    if not paper:
+        raise HTTPException(status_code=404, detail="Paper not found")
+
+    index = get_similarity_index()
+
+    def find_neighbours():
+        vector = index.vector(paper.id)
+        if vector is None:
+            vector = index.embed_paper(paper.title, paper.abstract)
+        # Over-fetch: ids of deleted papers are dropped during hydration
+        return index.search(vector, k=limit + 5, exclude=[paper.id])
+
+    # Embedding and search are CPU-bound NumPy work; keep the event loop free
+    neighbours = await asyncio.to_thread(find_neighbours)
+
+    related = []
+    if neighbours:
+        related_result = await db.execute(
+            select(Paper).where(Paper.id.in_([related_id for related_id, _ in neighbours]))
+        )
+        by_id = {related_paper.id: related_paper for related_paper in related_result.scalars().all()}
+        for related_id, similarity in neighbours:
+            related_paper = by_id.get(related_id)
+            if related_paper is None:
+                continue
+            related.append(
+                RelatedPaper(
+                    id=str(related_paper.id),
+                    arxiv_id=related_paper.arxiv_id,
+                    title=related_paper.title,
+                    authors=related_paper.authors,
+                    year=related_paper.year,
+                    venue=related_paper.venue,
+                    similarity=round(similarity, 4),
+                )
+            )
+
+    return RelatedPapersResponse(paper_id=str(paper.id), related=related[:limit])
@@ -1,24 +1,22 @@
 """Enhanced paper endpoints with star history, hype scores, and PDF download."""
 from typing import Dict, List, Any, Optional
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...database import get_db
-from ...models import Paper, PaperReference, GitHubStarSnapshot, CitationSnapshot
+from ...database import get_db, get_read_db
+from ...models import Paper, PaperReference, CitationSnapshot
+from ...services.history_service import HistoryService
+from ...services.paper_hype_service import MAX_BULK_PAPERS, get_paper_hype_cache
 from ...services.pdf_service import PDFService
 
 router = APIRouter(prefix="/papers", tags=["Papers Enhanced"])
 
-# Simple in-memory cache for hype scores (1 hour TTL)
-hype_cache: Dict[str, Dict] = {}
-cache_ttl = 3600  # 1 hour in seconds
-
 
 class StarHistoryPoint(BaseModel):
     """Star history data point."""
@@ -41,6 +39,17 @@ class HypeScoresResponse(BaseModel):
     formula_explanation: str
 
 
+class BulkHypeScoresRequest(BaseModel):
+    """Bulk hype scores request."""
+    paper_ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BULK_PAPERS)
+
+
+class BulkHypeScoresResponse(BaseModel):
+    """Hype scores keyed by paper id, plus ids of unknown papers."""
+    scores: Dict[str, HypeScoresResponse]
+    missing: List[str] = []
+
+
 class ReferenceNode(BaseModel):
     """Citation graph node."""
     paper_id: str
@@ -63,40 +72,35 @@ class MetricPoint(BaseModel):
 async def get_metrics(
     paper_id: UUID,
     days: int = 30,
-    db: AsyncSession = Depends(get_db)
+    bucket: str = Query("auto", regex="^(auto|day|week|month)$", description="History bucket width"),
+    max_points: Optional[int] = Query(None, ge=3, le=5000, description="Downsample to at most this many points (LTTB)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get metrics history for a paper."""
-    from datetime import datetime, timedelta
-    from ...models import MetricSnapshot
+    """Get metrics history for a paper.
 
+    Long ranges are served from weekly/monthly aggregates (``bucket=auto``).
+    """
     # Check paper exists
-    result = await db.execute(select(Paper).where(Paper.id == paper_id))
-    paper = result.scalar_one_or_none()
-    if not paper:
+    result = await db.execute(select(Paper.id).where(Paper.id == paper_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Paper not found")
 
-    # Get metric snapshots
-    since_date = datetime.utcnow() - timedelta(days=days)
-
-    snapshots_result = await db.execute(
-        select(MetricSnapshot)
-        .where(
-            MetricSnapshot.paper_id == paper_id,
-            MetricSnapshot.snapshot_date >= since_date
-        )
-        .order_by(MetricSnapshot.snapshot_date)
+    points = await HistoryService(db).get_metric_history(
+        paper_id,
+        start_date=date.today() - timedelta(days=days),
+        bucket=bucket,
+        max_points=max_points,
     )
-    snapshots = snapshots_result.scalars().all()
 
     return [
         MetricPoint(
-            snapshot_date=snap.snapshot_date.isoformat(),
-            citation_count=snap.citation_count,
-            github_stars=snap.github_stars,
-            vote_count=snap.vote_count,
-            hype_score=snap.hype_score
+            snapshot_date=point["date"].isoformat(),
+            citation_count=point["citation_count"],
+            github_stars=point["github_stars"],
+            vote_count=point["vote_count"],
+            hype_score=point["hype_score"]
         )
-        for snap in snapshots
+        for point in points
     ]
 
 
@@ -104,133 +108,66 @@ async def get_metrics(
 async def get_star_history(
     paper_id: UUID,
     days: int = 30,
-    db: AsyncSession = Depends(get_db)
+    bucket: str = Query("auto", regex="^(auto|day|week|month)$", description="History bucket width"),
+    max_points: Optional[int] = Query(None, ge=3, le=5000, description="Downsample to at most this many points (LTTB)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get star history for a paper."""
+    """Get star history for a paper.
+
+    Long ranges are served from weekly/monthly aggregates (``bucket=auto``).
+    """
     # Check paper exists
     result = await db.execute(select(Paper).where(Paper.id == paper_id))
     paper = result.scalar_one_or_none()
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
 
-    # Get star snapshots
-    from datetime import datetime, timedelta
-    since_date = datetime.utcnow() - timedelta(days=days)
-
-    snapshots_result = await db.execute(
-        select(GitHubStarSnapshot)
-        .where(
-            GitHubStarSnapshot.paper_id == paper_id,
-            GitHubStarSnapshot.snapshot_date >= since_date
-        )
-        .order_by(GitHubStarSnapshot.snapshot_date)
+    points = await HistoryService(db).get_star_history(
+        paper_id,
+        start_date=date.today() - timedelta(days=days),
+        bucket=bucket,
+        max_points=max_points,
     )
-    snapshots = snapshots_result.scalars().all()
 
     return [
         StarHistoryPoint(
-            date=snap.snapshot_date.isoformat(),
-            stars=snap.star_count,
+            date=point["date"].isoformat(),
+            stars=point["stars"],
             citations=paper.citations or 0
         )
-        for snap in snapshots
+        for point in points
     ]
 
 
 @router.get("/{paper_id}/hype-scores", response_model=HypeScoresResponse)
 async def get_hype_scores(
     paper_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Calculate and return hype scores (cached for 1 hour)."""
-    from datetime import date
-
-    # Check cache first
-    cache_key = str(paper_id)
-    now = datetime.utcnow()
-    if cache_key in hype_cache:
-        cached_entry = hype_cache[cache_key]
-        if (now - cached_entry['timestamp']).total_seconds() < cache_ttl:
-            return cached_entry['data']
-
-    # Single optimized query to get paper and all star snapshots we need
-    paper_result = await db.execute(select(Paper).where(Paper.id == paper_id))
-    paper = paper_result.scalar_one_or_none()
-    if not paper:
+    """Calculate and return hype scores (cached, invalidated by new star snapshots)."""
+    scores = await get_paper_hype_cache().get_many(db, [paper_id])
+    if paper_id not in scores:
         raise HTTPException(status_code=404, detail="Paper not found")
+    return HypeScoresResponse(**scores[paper_id])
 
-    # Get all star snapshots for the last 30 days in one query (covers weekly and monthly)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
 
-    all_snaps_result = await db.execute(
-        select(GitHubStarSnapshot)
-        .where(
-            GitHubStarSnapshot.paper_id == paper_id,
-            GitHubStarSnapshot.snapshot_date >= thirty_days_ago
-        )
-        .order_by(GitHubStarSnapshot.snapshot_date.desc())
-    )
-    all_snaps = list(all_snaps_result.scalars().all())
-
-    # Get current stars (latest snapshot)
-    stars = all_snaps[0].star_count if all_snaps else 0
-
-    # Calculate age in days
-    if paper.published_date:
-        if isinstance(paper.published_date, date) and not isinstance(paper.published_date, datetime):
-            pub_datetime = datetime.combine(paper.published_date, datetime.min.time())
-        else:
-            pub_datetime = paper.published_date
-        age_days = (datetime.utcnow() - pub_datetime).days
-    else:
-        age_days = 1
-    age_days = max(age_days, 1)
-
-    # SOTAPapers formula: (citations * 100 + stars) / age_days
-    citations = paper.citation_count or 0
-    average_hype = (citations * 100 + stars) / age_days
-
-    # Filter snapshots for weekly and monthly calculations
-    weekly_snaps = [snap for snap in all_snaps if snap.snapshot_date >= seven_days_ago]
-    monthly_snaps = all_snaps  # Already filtered to 30 days
-
-    # Calculate weekly hype (last 7 days growth)
-    weekly_hype = 0.0
-    if len(weekly_snaps) >= 2:
-        # Sort by date (oldest first) for growth calculation
-        weekly_snaps.sort(key=lambda x: x.snapshot_date)
-        star_growth = weekly_snaps[-1].star_count - weekly_snaps[0].star_count
-        weekly_hype = star_growth / 7
-
-    # Calculate monthly hype (last 30 days growth)
-    monthly_hype = 0.0
-    if len(monthly_snaps) >= 2:
-        # Sort by date (oldest first) for growth calculation
-        monthly_snaps.sort(key=lambda x: x.snapshot_date)
-        star_growth = monthly_snaps[-1].star_count - monthly_snaps[0].star_count
-        monthly_hype = star_growth / 30
-
-    response = HypeScoresResponse(
-        average_hype=round(average_hype, 2),
-        weekly_hype=round(weekly_hype, 2),
-        monthly_hype=round(monthly_hype, 2),
-        formula_explanation=f"Average: (citations×100 + stars) / age_days = ({citations}×100 + {stars}) / {age_days}"
+@router.post("/hype-scores", response_model=BulkHypeScoresResponse)
+async def get_hype_scores_bulk(
+    request: BulkHypeScoresRequest,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Hype scores for many papers at once (e.g. all cards on a list page)."""
+    scores = await get_paper_hype_cache().get_many(db, request.paper_ids)
+    return BulkHypeScoresResponse(
+        scores={str(paper_id): HypeScoresResponse(**value) for paper_id, value in scores.items()},
+        missing=[str(paper_id) for paper_id in dict.fromkeys(request.paper_ids) if paper_id not in scores],
     )
 
-    # Cache the result
-    hype_cache[cache_key] = {
-        'data': response,
-        'timestamp': now
-    }
-
-    return response
-
 
 @router.get("/{paper_id}/references", response_model=List[ReferenceNode])
 async def get_references(
     paper_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get citation graph (papers this cites + papers citing this)."""
     # Check paper exists
@@ -278,7 +215,7 @@ async def get_references(
 async def get_citation_history(
     paper_id: UUID,
     days: int = 365,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get citation history for a paper."""
     # Check paper exists
@@ -313,6 +250,7 @@ async def get_citation_history(
 @router.get("/{paper_id}/download-pdf")
 async def download_pdf(
     paper_id: UUID,
+    # Writes pdf_local_path, so this needs the primary (not the read replica)
     db: AsyncSession = Depends(get_db)
 ):
     """Download PDF file (downloads from source if not cached locally)."""
@@ -7,7 +7,7 @@ from pydantic import BaseModel, EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...services.user_profile_service import UserProfileService
-from ...database import get_db
+from ...database import get_db, get_read_db
 from ..dependencies import get_current_user
 
 router = APIRouter(prefix="/profile", tags=["User Profile"])
@@ -219,7 +219,7 @@ async def update_my_preferences(
 async def get_my_crawler_jobs(
     status: Optional[str] = None,
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get current user's crawler jobs.
 
@@ -256,7 +256,7 @@ async def get_my_crawler_jobs(
 @router.get("/me/topics", response_model=list[TopicResponse])
 async def get_my_topics(
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get current user's custom topics.
 
@@ -287,7 +287,7 @@ async def get_my_topics(
 @router.get("/me/stats", response_model=UserStatsResponse)
 async def get_my_stats(
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get current user's statistics.
 
@@ -7,10 +7,12 @@ from pydantic import BaseModel
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...database import get_db
-from ...models import Topic, PaperTopicMatch, Paper
+from ...database import get_db, get_read_db
+from ...models import Topic, Paper
 from ...api.dependencies import get_current_user, get_user_id
 from ...jobs.celery_app import celery_app
+from ...services.cache_service import get_cache
+from ...services.topic_service import TopicService, paper_counts_cache_key
 
 router = APIRouter(prefix="/topics", tags=["Topics"])
 
@@ -46,17 +48,18 @@ class TopicResponse(BaseModel):
 
 @router.get("", response_model=List[TopicResponse])
 async def list_topics(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user: Optional[dict] = Depends(get_current_user)
 ):
     """List all topics (system + user's custom topics)."""
     # Build query: system topics OR user's topics
+    user_id = UUID(user["id"]) if user else None
     query = select(Topic)
-    if user:
+    if user_id:
         query = query.where(
             or_(
                 Topic.is_system == True,
-                Topic.user_id == UUID(user["id"])
+                Topic.user_id == user_id
             )
         )
     else:
@@ -65,13 +68,14 @@ async def list_topics(
     result = await db.execute(query)
     topics = result.scalars().all()
 
-    # Get paper counts
+    # Get paper counts (one grouped query, cached per user)
+    paper_counts = await TopicService(db).get_cached_paper_counts(
+        [topic.id for topic in topics], user_id=user_id
+    )
+
     response = []
     for topic in topics:
-        count_result = await db.execute(
-            select(PaperTopicMatch).where(PaperTopicMatch.topic_id == topic.id)
-        )
-        paper_count = len(count_result.scalars().all())
+        paper_count = paper_counts[topic.id]
 
         response.append(TopicResponse(
             id=str(topic.id),
@@ -115,6 +119,7 @@ async def create_topic(
     db.add(topic)
     await db.commit()
     await db.refresh(topic)
+    await get_cache().delete(paper_counts_cache_key(user_id))
 
     # Match papers to this new topic immediately
     from ...services import TopicMatchingService
@@ -185,10 +190,7 @@ async def update_topic(
         celery_app.send_task("match_topics.match_single_topic", args=[str(topic.id)])
 
     # Get paper count
-    count_result = await db.execute(
-        select(PaperTopicMatch).where(PaperTopicMatch.topic_id == topic.id)
-    )
-    paper_count = len(count_result.scalars().all())
+    paper_count = await TopicService(db).get_paper_count(topic.id)
 
     return TopicResponse(
         id=str(topic.id),
@@ -223,4 +225,5 @@ async def delete_topic(
 
     await db.delete(topic)
     await db.commit()
+    await get_cache().delete(paper_counts_cache_key(user_id))
     return None
@@ -6,13 +6,12 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import get_db
+from src.database import get_db, get_read_db
 from src.services.vote_service import VoteService
-from src.models.paper import Paper
 
 
 router = APIRouter(prefix="/api/papers", tags=["votes"])
@@ -41,6 +40,24 @@ class VoteStatusResponse(BaseModel):
     vote_type: Optional[str] = None
 
 
+class PaperVoteSummary(BaseModel):
+    """Vote tallies and the user's vote for one paper."""
+    paper_id: UUID
+    upvote_count: int
+    downvote_count: int
+    vote_count: int
+    user_vote: Optional[str] = None
+
+
+class PaperVotesResponse(BaseModel):
+    """Response for batched vote lookup."""
+    votes: list[PaperVoteSummary]
+
+
+# Maximum paper ids per batched vote lookup
+MAX_VOTE_LOOKUP_PAPERS = 200
+
+
 # Dependency: Get authenticated user ID from Supabase JWT
 # TODO: Implement proper Supabase JWT authentication
 async def get_current_user_id() -> UUID:
@@ -53,6 +70,58 @@ async def get_current_user_id() -> UUID:
     return UUID("00000000-0000-0000-0000-000000000001")
 
 
+@router.get(
+    "/votes",
+    response_model=PaperVotesResponse,
+    summary="Get vote tallies and user's votes for many papers"
+)
+async def get_paper_votes(
+    paper_ids: list[UUID] = Query(..., description="Paper UUIDs (repeat the parameter)"),
+    session: AsyncSession = Depends(get_read_db),
+    user_id: UUID = Depends(get_current_user_id)
+):
+    """Get vote tallies and the authenticated user's votes for a page of papers.
+
+    Used by list views to render vote state with two queries instead of one
+    request per paper. Unknown paper IDs are omitted.
+
+    Args:
+        paper_ids: Paper UUIDs
+        session: Database session
+        user_id: Authenticated user ID from JWT
+
+    Returns:
+        PaperVotesResponse with one entry per known paper
+
+    Raises:
+        400: More than MAX_VOTE_LOOKUP_PAPERS ids requested
+    """
+    paper_ids = list(dict.fromkeys(paper_ids))
+    if len(paper_ids) > MAX_VOTE_LOOKUP_PAPERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_VOTE_LOOKUP_PAPERS} paper_ids per request"
+        )
+
+    vote_service = VoteService(session)
+    tallies = await vote_service.get_paper_vote_tallies(paper_ids)
+    user_votes = await vote_service.get_user_votes_for_papers(user_id, list(tallies))
+
+    return PaperVotesResponse(
+        votes=[
+            PaperVoteSummary(
+                paper_id=paper_id,
+                upvote_count=tallies[paper_id][0],
+                downvote_count=tallies[paper_id][1],
+                vote_count=tallies[paper_id][2],
+                user_vote=user_votes.get(paper_id)
+            )
+            for paper_id in paper_ids
+            if paper_id in tallies
+        ]
+    )
+
+
 @router.post(
     "/{paper_id}/vote",
     response_model=VoteResponse,
@@ -69,7 +138,7 @@ async def cast_vote(
 
     - If user has no existing vote, creates a new vote
     - If user has existing vote, updates the vote_type
-    - Paper.vote_count is automatically updated by database trigger
+    - Paper vote tallies are updated by database trigger in the same transaction
 
     Args:
         paper_id: Paper UUID
@@ -93,12 +162,12 @@ async def cast_vote(
             vote_type=vote_request.vote_type
         )
 
-        # Fetch updated paper vote_count
-        paper = await session.get(Paper, paper_id)
+        # Fetch trigger-updated net votes
+        _, _, vote_count = await vote_service.get_paper_votes(paper_id)
 
         return VoteResponse(
             vote_type=vote.vote_type,
-            vote_count=paper.vote_count,
+            vote_count=vote_count,
             created_at=vote.created_at,
             updated_at=vote.updated_at
         )
@@ -151,7 +220,7 @@ async def remove_vote(
 )
 async def get_vote_status(
     paper_id: UUID,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     user_id: UUID = Depends(get_current_user_id)
 ):
     """Get authenticated user's vote status on a paper.
@@ -1,8 +1,12 @@
 """Celery application configuration for background job processing."""
 
 import os
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown
+
+from ..utils.page_fetcher import close_browser_pool
 
 # Use environment variable for Redis URL, or None to disable Celery
 # Note: This project now uses Cloudflare Workers + Upstash for async jobs
@@ -32,6 +36,17 @@ celery_app.conf.update(
     },
 )
 
+
+@worker_process_shutdown.connect
+def close_worker_browsers(**kwargs):
+    """Quit pooled headless browsers when a worker process exits.
+
+    Prefork children leave through ``os._exit``, so ``atexit`` handlers do
+    not run there.
+    """
+    close_browser_pool()
+
+
 # Import task modules for Celery task discovery
 # These imports must come after celery_app creation to avoid circular imports
 from . import paper_crawler  # noqa: F401, E402
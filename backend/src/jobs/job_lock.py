@@ -0,0 +1,198 @@
+"""Single-run guarantee for scheduled jobs across replicas.
+
+Every replica that starts the scheduler fires the same jobs. Before running,
+a replica takes a Postgres advisory lock keyed by the job name on a
+dedicated connection; replicas that fail to get it skip that run. The lock
+is transaction-scoped (``pg_try_advisory_xact_lock``) so it also works
+through transaction-mode poolers, and it is released when the job finishes
+or automatically when the holder's connection dies, so the next firing on
+another replica takes over.
+
+While the job runs the holder heartbeats its lock connection; if the
+connection is lost the job is cancelled, since the lock may already be held
+elsewhere. Run state (holder, heartbeat, lease expiry, skips, errors) is
+recorded in ``scheduled_job_status``. Because replicas fire the same trigger
+at slightly different times, a run that started less than
+``JOB_MIN_RERUN_SECONDS`` ago on any replica also makes the others skip.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from ..database import AsyncSessionLocal, engine
+from ..models import ScheduledJobStatus
+
+logger = logging.getLogger(__name__)
+
+# Seconds between heartbeats of a running job
+JOB_LOCK_HEARTBEAT_SECONDS = float(os.getenv("JOB_LOCK_HEARTBEAT_SECONDS", "15"))
+
+# Seconds without heartbeat after which a running state is considered stale
+JOB_LOCK_LEASE_SECONDS = float(os.getenv("JOB_LOCK_LEASE_SECONDS", "60"))
+
+# A job that started this recently on any replica is not started again
+JOB_MIN_RERUN_SECONDS = float(os.getenv("JOB_MIN_RERUN_SECONDS", "120"))
+
+# Identifies this replica in scheduled_job_status
+HOLDER = f"{socket.gethostname()}:{os.getpid()}"
+
+TRY_LOCK = text("SELECT pg_try_advisory_xact_lock(:key)")
+
+LAST_STARTED_AT = text("SELECT started_at FROM scheduled_job_status WHERE job_name = :job_name")
+
+
+class JobLockLost(RuntimeError):
+    """The lock connection failed while the job was running."""
+
+
+def job_lock_key(job_name: str) -> int:
+    """Stable signed 64-bit advisory lock key for a job name.
+
+    Args:
+        job_name: Scheduled job id
+
+    Returns:
+        Lock key
+    """
+    digest = hashlib.blake2b(f"scheduled_job:{job_name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+async def record_job_status(job_name: str, state: Optional[str] = None, **values: Any) -> None:
+    """Upsert a job's status row (failures are logged, never raised).
+
+    Args:
+        job_name: Scheduled job id
+        state: New state (left unchanged if None)
+        **values: Other ScheduledJobStatus columns to set
+    """
+    values["updated_at"] = datetime.now(timezone.utc)
+    if state is not None:
+        values["state"] = state
+    stmt = pg_insert(ScheduledJobStatus).values(job_name=job_name, **{"state": "unknown", **values})
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["job_name"],
+        set_={key: stmt.excluded[key] for key in values},
+    )
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(stmt)
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"Could not record status of job {job_name}: {e}")
+
+
+async def run_exclusive(
+    job_name: str,
+    func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    **kwargs: Any,
+) -> bool:
+    """Run a job unless another replica is already running it.
+
+    Args:
+        job_name: Scheduled job id (the lock key)
+        func: Job coroutine function
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        True if this replica ran the job, False if it was skipped
+
+    Raises:
+        JobLockLost: If the lock connection failed mid-run (job cancelled)
+    """
+    async with engine.connect() as conn:
+        acquired = await conn.scalar(TRY_LOCK, {"key": job_lock_key(job_name)})
+        started_at = datetime.now(timezone.utc)
+        last_started_at = None
+        if acquired:
+            last_started_at = await conn.scalar(LAST_STARTED_AT, {"job_name": job_name})
+        ran_recently = (
+            last_started_at is not None
+            and started_at - last_started_at < timedelta(seconds=JOB_MIN_RERUN_SECONDS)
+        )
+        if not acquired or ran_recently:
+            await conn.rollback()
+            reason = "running on another replica" if not acquired else f"started at {last_started_at}"
+            logger.info(f"Skipping job {job_name}: {reason}")
+            await record_job_status(job_name, last_skipped_at=started_at, skipped_by=HOLDER)
+            return False
+
+        await record_job_status(
+            job_name,
+            state="running",
+            holder=HOLDER,
+            started_at=started_at,
+            heartbeat_at=started_at,
+            lease_expires_at=started_at + timedelta(seconds=JOB_LOCK_LEASE_SECONDS),
+            finished_at=None,
+            last_error=None,
+        )
+
+        job = asyncio.ensure_future(func(*args, **kwargs))
+        try:
+            while True:
+                done, _ = await asyncio.wait({job}, timeout=JOB_LOCK_HEARTBEAT_SECONDS)
+                if done:
+                    break
+                try:
+                    await conn.execute(text("SELECT 1"))
+                except Exception as e:
+                    job.cancel()
+                    await record_job_status(
+                        job_name, state="lock_lost", holder=HOLDER,
+                        finished_at=datetime.now(timezone.utc), last_error=str(e),
+                    )
+                    raise JobLockLost(f"Lost lock connection for job {job_name}") from e
+
+                now = datetime.now(timezone.utc)
+                await record_job_status(
+                    job_name, state="running", holder=HOLDER, heartbeat_at=now,
+                    lease_expires_at=now + timedelta(seconds=JOB_LOCK_LEASE_SECONDS),
+                )
+
+            error: Optional[BaseException] = job.exception()
+            await record_job_status(
+                job_name,
+                state="failed" if error else "succeeded",
+                holder=HOLDER,
+                finished_at=datetime.now(timezone.utc),
+                lease_expires_at=None,
+                last_error=repr(error) if error else None,
+            )
+            if error:
+                raise error
+            return True
+        finally:
+            if not job.done():
+                job.cancel()
+            # Ends the transaction, releasing the advisory lock
+            try:
+                await conn.rollback()
+            except Exception as e:
+                logger.warning(f"Could not release lock of job {job_name}: {e}")
+
+
+def exclusive(job_name: str, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[bool]]:
+    """Wrap a job coroutine function so only one replica runs it at a time.
+
+    Args:
+        job_name: Scheduled job id (the lock key)
+        func: Job coroutine function
+
+    Returns:
+        Coroutine function taking ``func``'s arguments
+    """
+    async def run(*args: Any, **kwargs: Any) -> bool:
+        return await run_exclusive(job_name, func, *args, **kwargs)
+
+    run.__name__ = getattr(func, "__name__", job_name)
+    return run
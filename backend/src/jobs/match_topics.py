@@ -4,24 +4,55 @@ Matches papers to topics using LLM-based relevance scoring.
 Creates PaperTopicMatch records for papers with relevance >= 6.0.
 """
 import asyncio
+import os
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select
 
 from ..database import AsyncSessionLocal
 from ..models import Paper, PaperTopicMatch, Topic
-from ..services import TopicMatchingService
+from ..services import BatchTopicMatcher, TopicMatchingService
+from ..services.similarity_index import SimilarityIndex
+
+# Also score topics by TF-IDF similarity (requires a built similarity index)
+USE_EMBEDDING_RELEVANCE = os.getenv("TOPIC_MATCHING_EMBEDDINGS", "false").lower() == "true"
 
 
 class TopicMatchingJob:
     """Job for matching papers to topics using LLM."""
 
-    def __init__(self):
-        """Initialize topic matching job."""
-        pass
+    def __init__(self, batch_size: int = 1_000):
+        """Initialize topic matching job.
+
+        Args:
+            batch_size: Papers loaded and matched per batch
+        """
+        self.batch_size = batch_size
 
     async def match_unmatched_papers(self):
         """Match papers that don't have topic assignments yet."""
+        await self._match_papers(only_unmatched=True)
+
+    async def rematch_all_papers(self):
+        """Re-match all papers to topics (use sparingly).
+
+        This is useful if topic definitions change or LLM model improves.
+        """
+        print("Re-matching ALL papers to topics...")
+
+        async with AsyncSessionLocal() as session:
+            # Delete existing matches
+            await session.execute(delete(PaperTopicMatch))
+            await session.commit()
+
+        # Now match all papers
+        await self._match_papers(only_unmatched=False)
+
+    async def _match_papers(self, only_unmatched: bool):
+        """Scan papers in id-ordered batches and bulk-insert topic matches.
+
+        Args:
+            only_unmatched: Skip papers that already have topic matches
+        """
         print("Starting topic matching job...")
 
         async with AsyncSessionLocal() as session:
@@ -36,56 +67,53 @@ class TopicMatchingJob:
                 print("No topics found in database. Run seed_topics.py first.")
                 return
 
-            # Get papers without topic matches
-            # Query for papers that don't have any topic matches yet
-            subquery = select(PaperTopicMatch.paper_id).distinct()
-            paper_query = select(Paper).where(Paper.id.notin_(subquery))
-
-            result = await session.execute(paper_query)
-            unmatched_papers = list(result.scalars().all())
+            similarity_index = None
+            if USE_EMBEDDING_RELEVANCE:
+                similarity_index = SimilarityIndex(read_only=True)
+                if not len(similarity_index):
+                    print("Similarity index is empty; using keyword relevance only")
+                    similarity_index = None
 
-            print(f"Found {len(unmatched_papers)} papers to match against {len(topics)} topics...")
+            # Compile every topic name and keyword once for the whole run
+            matcher = BatchTopicMatcher(topics, similarity_index=similarity_index)
+            print(f"Matching papers against {len(topics)} topics ({len(matcher.automaton)} patterns)...")
 
+            processed = 0
             matched_count = 0
+            last_id = None
+
+            while True:
+                # Keyset pagination; only the columns the matcher reads
+                paper_query = (
+                    select(Paper.id, Paper.title, Paper.abstract)
+                    .order_by(Paper.id)
+                    .limit(self.batch_size)
+                )
+                if last_id is not None:
+                    paper_query = paper_query.where(Paper.id > last_id)
+                if only_unmatched:
+                    # Papers that don't have any topic matches yet
+                    has_match = select(PaperTopicMatch.id).where(PaperTopicMatch.paper_id == Paper.id)
+                    paper_query = paper_query.where(~has_match.exists())
+
+                batch = (await session.execute(paper_query)).all()
+                if not batch:
+                    break
 
-            for paper in unmatched_papers:
                 try:
-                    # Match paper to all topics
-                    matches = await matching_service.match_paper_to_topics(
-                        paper_id=paper.id,
-                        threshold=6.0,
-                    )
-
-                    if matches:
-                        matched_count += 1
-                        print(f"Matched paper '{paper.title[:50]}...' to {len(matches)} topics")
-
-                    if matched_count % 10 == 0:
-                        print(f"Processed {matched_count}/{len(unmatched_papers)} papers...")
-
+                    matches = await matching_service.match_papers_bulk(batch, matcher, threshold=6.0)
+                    await session.commit()
                 except Exception as e:
-                    print(f"Error matching paper {paper.id}: {e}")
-                    continue
-
-            await session.commit()
-            print(f"Topic matching complete: {matched_count} papers matched")
-
-    async def rematch_all_papers(self):
-        """Re-match all papers to topics (use sparingly).
-
-        This is useful if topic definitions change or LLM model improves.
-        """
-        print("Re-matching ALL papers to topics...")
+                    await session.rollback()
+                    print(f"Error matching batch after paper {last_id}: {e}")
+                    matches = {}
 
-        async with AsyncSessionLocal() as session:
-            # Delete existing matches
-            await session.execute(
-                "DELETE FROM paper_topic_matches"
-            )
-            await session.commit()
+                processed += len(batch)
+                matched_count += len(matches)
+                last_id = batch[-1].id
+                print(f"Processed {processed} papers, {matched_count} matched...")
 
-        # Now match all papers
-        await self.match_unmatched_papers()
+            print(f"Topic matching complete: {matched_count} papers matched")
 
     async def run(self, rematch_all: bool = False):
         """Run the topic matching job.
@@ -20,6 +20,7 @@ from ..database import AsyncSessionLocal
 # from ..services.pdf_service import PDFAnalysisService
 from ..services.pdf_storage_service import PDFStorageService
 from ..services.llm_service import OpenAILLMService, LlamaCppLLMService
+from ..services.extraction_cache_service import ExtractionCacheService, file_sha256
 from ..models.paper import Paper
 
 
@@ -132,6 +133,7 @@ async def _async_enrich_paper(task: Task, paper_id: str) -> Dict[str, Any]:
         Dict with enrichment results
     """
     extractions_count = 0
+    cached_count = 0
     paper_uuid = UUID(paper_id)
 
     # Create database session
@@ -202,11 +204,16 @@ async def _async_enrich_paper(task: Task, paper_id: str) -> Dict[str, Any]:
             else:
                 llm_service = LlamaCppLLMService()
 
+            # Results are reused for an unchanged (PDF, prompt, model)
+            extraction_cache = ExtractionCacheService(session)
+            pdf_sha256 = file_sha256(pdf_path)
+
             # Extract tasks
             try:
-                tasks_result = await llm_service.extract_metadata(
-                    pdf_path, EXTRACT_TASKS_PROMPT
+                tasks_result, cached = await extraction_cache.extract(
+                    llm_service, pdf_path, EXTRACT_TASKS_PROMPT, pdf_sha256
                 )
+                cached_count += cached
                 logger.info(f"Extracted tasks: {tasks_result}")
 
                 # Store LLMExtraction record (flagged for review)
@@ -219,9 +226,10 @@ async def _async_enrich_paper(task: Task, paper_id: str) -> Dict[str, Any]:
 
             # Extract methods
             try:
-                methods_result = await llm_service.extract_metadata(
-                    pdf_path, EXTRACT_METHODS_PROMPT
+                methods_result, cached = await extraction_cache.extract(
+                    llm_service, pdf_path, EXTRACT_METHODS_PROMPT, pdf_sha256
                 )
+                cached_count += cached
                 logger.info(f"Extracted methods: {methods_result}")
                 logger.info("Would store LLMExtraction for methods (pending_review)")
                 extractions_count += 1
@@ -231,9 +239,10 @@ async def _async_enrich_paper(task: Task, paper_id: str) -> Dict[str, Any]:
 
             # Extract datasets
             try:
-                datasets_result = await llm_service.extract_metadata(
-                    pdf_path, EXTRACT_DATASETS_PROMPT
+                datasets_result, cached = await extraction_cache.extract(
+                    llm_service, pdf_path, EXTRACT_DATASETS_PROMPT, pdf_sha256
                 )
+                cached_count += cached
                 logger.info(f"Extracted datasets: {datasets_result}")
                 logger.info("Would store LLMExtraction for datasets (pending_review)")
                 extractions_count += 1
@@ -243,9 +252,10 @@ async def _async_enrich_paper(task: Task, paper_id: str) -> Dict[str, Any]:
 
             # Extract metrics
             try:
-                metrics_result = await llm_service.extract_metadata(
-                    pdf_path, EXTRACT_METRICS_PROMPT
+                metrics_result, cached = await extraction_cache.extract(
+                    llm_service, pdf_path, EXTRACT_METRICS_PROMPT, pdf_sha256
                 )
+                cached_count += cached
                 logger.info(f"Extracted metrics: {metrics_result}")
                 logger.info("Would store LLMExtraction for metrics (pending_review)")
                 extractions_count += 1
@@ -266,6 +276,7 @@ async def _async_enrich_paper(task: Task, paper_id: str) -> Dict[str, Any]:
                 'paper_id': paper_id,
                 'paper_title': paper.title,
                 'extractions_count': extractions_count,
+                'cached_extractions': cached_count,
                 'text_length': len(full_text),
                 'tables_extracted': len(table_paths),
                 'pdf_path': str(pdf_path)
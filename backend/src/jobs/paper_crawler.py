@@ -17,6 +17,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .celery_app import celery_app
 from ..database import AsyncSessionLocal
 from ..services.arxiv_service import AsyncArxivService
+from ..services.conference_abstracts import ConferenceAbstractFetcher, normalize_title
+from ..utils.page_fetcher import get_page_fetcher, table_has_rows
 from ..models.paper import Paper
 
 
@@ -263,132 +265,111 @@ async def _crawl_conference(
 
     logger.info(f"Crawling {conference_name} {conference_year} from {conference_url}")
 
-    # Run scraping in thread pool to avoid blocking event loop
-    import asyncio
-    from concurrent.futures import ThreadPoolExecutor
-    from ..utils.web_scraper import WebScraper
-    from time import sleep
-
     papers_discovered = 0
     papers_stored = 0
 
-    # Initialize web scraper
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        loop = asyncio.get_event_loop()
+    # Fetch and parse conference page
+    task.update_state(
+        state='PROCESSING',
+        meta={'current': 0, 'total': 0, 'status': f'Loading {conference_name} {conference_year} page...'}
+    )
 
-        # Fetch and parse conference page
-        task.update_state(
-            state='PROCESSING',
-            meta={'current': 0, 'total': 0, 'status': f'Loading {conference_name} {conference_year} page...'}
+    def load_all_papers(scraper) -> None:
+        """Click "Fetch All" and wait until the paper table stops growing."""
+        rows_before = scraper.count_table_rows('paperlist')
+        scraper.click_element_by_id('btn_fetchall', wait_timeout=30, max_attempts=2)
+        rows = scraper.wait_for_table_rows(
+            'paperlist',
+            timeout=120,
+            previous_rows=rows_before,
+            trigger_id='btn_fetchall',
         )
+        logger.debug(f"Paper table loaded with {rows} rows")
+
+    # Plain HTTP if the static page already has the full table, else a pooled browser
+    fetcher = get_page_fetcher()
+    page_source = await asyncio.to_thread(
+        fetcher.fetch,
+        conference_url,
+        ready=table_has_rows('paperlist'),
+        browser_action=load_all_papers,
+    )
 
-        def scrape_conference_list():
-            """Scrape conference paper list in separate thread."""
-            scraper = WebScraper(request_timeout=300, headless=True)
-            try:
-                scraper.open()
-                scraper.fetch_url(conference_url)
-
-                # Click "Fetch All" button to load all papers
-                button_name = 'btn_fetchall'
-                scraper.click_element_by_id(button_name, wait_timeout=30, max_attempts=2, sleep_sec=5)
-
-                # Wait for papers to load
-                sleep_sec = 10
-                logger.debug(f"Waiting {sleep_sec} seconds for papers to load")
-                sleep(sleep_sec)
-
-                # Get page source
-                page_source = scraper.current_page_source()
-                return page_source
-            finally:
-                scraper.close()
-
-        # Run scraping in thread pool
-        page_source = await loop.run_in_executor(executor, scrape_conference_list)
-
-        # Parse paper list
-        raw_paper_data = _parse_conference_papers_list(
-            page_source,
-            table_id='paperlist',
-            conference_name=conference_name.upper()
-        )
+    # Parse paper list
+    raw_paper_data = _parse_conference_papers_list(
+        page_source,
+        table_id='paperlist',
+        conference_name=conference_name.upper()
+    )
 
-        papers_discovered = len(raw_paper_data)
-        logger.info(f"Found {papers_discovered} papers from {conference_name} {conference_year}")
+    papers_discovered = len(raw_paper_data)
+    logger.info(f"Found {papers_discovered} papers from {conference_name} {conference_year}")
 
-        task.update_state(
-            state='PROCESSING',
-            meta={'current': 0, 'total': papers_discovered, 'status': f'Processing {papers_discovered} papers...'}
-        )
+    task.update_state(
+        state='PROCESSING',
+        meta={'current': 0, 'total': papers_discovered, 'status': f'Processing {papers_discovered} papers...'}
+    )
 
-        # Process each paper
-        for i, paper_data in enumerate(raw_paper_data):
-            # Update progress
-            task.update_state(
-                state='PROCESSING',
-                meta={
-                    'current': i + 1,
-                    'total': papers_discovered,
-                    'status': f"Processing paper {i + 1}/{papers_discovered}: {paper_data['title'][:50]}..."
-                }
-            )
+    # Skip rejected papers and papers already stored
+    existing_titles, existing_arxiv_ids = await _load_conference_duplicates(
+        session, conference_name, raw_paper_data
+    )
 
-            # Skip rejected papers
-            if paper_data.get('session_type') and 'rejected' in paper_data['session_type'].lower():
-                logger.debug(f"Skipping rejected paper: {paper_data['title']}")
-                continue
+    new_paper_data = []
+    for paper_data in raw_paper_data:
+        if paper_data.get('session_type') and 'rejected' in paper_data['session_type'].lower():
+            logger.debug(f"Skipping rejected paper: {paper_data['title']}")
+            continue
 
-            # Fetch abstract in separate thread
-            conf_url = paper_data.get('conf_url')
-            if conf_url:
-                def fetch_abstract():
-                    return _get_abstract_from_conference_website(conf_url, conference_name.upper())
+        title_key = normalize_title(paper_data['title'])
+        if paper_data.get('arxiv_id') in existing_arxiv_ids or title_key in existing_titles:
+            logger.debug(f"Skipping duplicate paper: {paper_data['title']}")
+            continue
 
-                abstract = await loop.run_in_executor(executor, fetch_abstract)
-                paper_data['abstract'] = abstract
+        existing_titles.add(title_key)
+        if paper_data.get('arxiv_id'):
+            existing_arxiv_ids.add(paper_data['arxiv_id'])
+        new_paper_data.append(paper_data)
 
-            # Check for duplicates
-            existing = None
-            if paper_data.get('arxiv_id'):
-                result = await session.execute(
-                    select(Paper).where(Paper.arxiv_id == paper_data['arxiv_id'])
-                )
-                existing = result.scalar_one_or_none()
+    # Fetch abstracts concurrently
+    def report_progress(completed: int, total: int) -> None:
+        task.update_state(
+            state='PROCESSING',
+            meta={
+                'current': completed,
+                'total': total,
+                'status': f"Fetched abstract {completed}/{total}"
+            }
+        )
 
-            if not existing and paper_data.get('title'):
-                # Check by title similarity
-                from rapidfuzz import fuzz
-                result = await session.execute(
-                    select(Paper).where(Paper.venue.ilike(f"%{conference_name}%"))
-                )
-                conference_papers = result.scalars().all()
-                for existing_paper in conference_papers:
-                    similarity = fuzz.ratio(paper_data['title'].lower(), existing_paper.title.lower())
-                    if similarity > 95:
-                        existing = existing_paper
-                        break
-
-            if existing:
-                logger.debug(f"Skipping duplicate paper: {paper_data['title']}")
-                continue
+    conf_urls = [paper_data['conf_url'] for paper_data in new_paper_data if paper_data.get('conf_url')]
+    async with ConferenceAbstractFetcher(
+        browser_fallback=lambda url: _get_abstract_from_conference_website(url, conference_name.upper())
+    ) as abstract_fetcher:
+        abstracts = await abstract_fetcher.fetch_many(conf_urls, on_progress=report_progress)
+    logger.info(f"Abstract fetch stats: {abstract_fetcher.stats}")
 
-            # Create paper object
-            try:
-                paper = _create_paper_from_conference_data(
-                    paper_data,
-                    conference_name=conference_name.upper(),
-                    conference_year=conference_year
-                )
+    for paper_data in new_paper_data:
+        if paper_data.get('conf_url'):
+            paper_data['abstract'] = abstracts.get(paper_data['conf_url'])
+
+        # Create paper object
+        try:
+            paper = _create_paper_from_conference_data(
+                paper_data,
+                conference_name=conference_name.upper(),
+                conference_year=conference_year
+            )
 
-                session.add(paper)
-                papers_stored += 1
-                logger.info(f"Stored conference paper: {paper.title}")
+            session.add(paper)
+            papers_stored += 1
+            logger.info(f"Stored conference paper: {paper.title}")
 
-            except Exception as e:
-                logger.error(f"Failed to store paper {paper_data.get('title')}: {e}", exc_info=True)
-                continue
+        except Exception as e:
+            logger.error(f"Failed to store paper {paper_data.get('title')}: {e}", exc_info=True)
+            continue
 
+    logger.info(f"Page fetch stats: {fetcher.stats()}")
     logger.info(f"Conference crawl complete. Discovered: {papers_discovered}, Stored: {papers_stored}")
     return papers_discovered, papers_stored
 
@@ -976,6 +957,39 @@ async def _create_paper_reference(
 # ============================================================================
 
 
+async def _load_conference_duplicates(
+    session: AsyncSession,
+    conference_name: str,
+    papers_data: List[Dict[str, Any]]
+) -> tuple[set[str], set[str]]:
+    """
+    Load what is needed to detect already stored conference papers.
+
+    Args:
+        session: Database session
+        conference_name: Conference name
+        papers_data: Parsed conference papers
+
+    Returns:
+        Tuple of (normalized titles of the conference's stored papers,
+        stored arXiv IDs among the parsed papers)
+    """
+    result = await session.execute(
+        select(Paper.title).where(Paper.venue.ilike(f"%{conference_name}%"))
+    )
+    titles = {normalize_title(title) for title in result.scalars()}
+
+    arxiv_ids = [paper_data['arxiv_id'] for paper_data in papers_data if paper_data.get('arxiv_id')]
+    stored_arxiv_ids: set[str] = set()
+    if arxiv_ids:
+        result = await session.execute(
+            select(Paper.arxiv_id).where(Paper.arxiv_id.in_(arxiv_ids))
+        )
+        stored_arxiv_ids = set(result.scalars())
+
+    return titles, stored_arxiv_ids
+
+
 def _parse_conference_papers_list(
     html: str,
     table_id: str,
@@ -1123,7 +1137,7 @@ def _parse_conference_papers_list(
 
 def _get_abstract_from_conference_website(url: str, conference_name: str) -> Optional[str]:
     """
-    Extract abstract from conference paper webpage.
+    Extract abstract from conference paper webpage in a pooled browser.
 
     Args:
         url: Conference paper URL
@@ -1132,48 +1146,43 @@ def _get_abstract_from_conference_website(url: str, conference_name: str) -> Opt
     Returns:
         Abstract text or None if not found
     """
-    from ..utils.web_scraper import WebScraper
-
-    scraper = WebScraper(request_timeout=60, headless=True)
-    abstract = None
-
-    try:
-        scraper.open()
-        scraper.fetch_url(url)
+    from selenium.webdriver.common.by import By
 
+    def read_abstract(scraper) -> Optional[str]:
         if 'openaccess.thecvf.com' in url:
             element = scraper.find_element_by_id('abstract')
             if element:
-                abstract = element.text
+                return element.text
         elif 'cvpr.thecvf.com' in url:
             element = scraper.find_element_by_id('abstractExample')
             if element:
-                abstract = element.text
+                return element.text
         elif 'iclr.cc' in url:
-            scraper.click_element_by_classname('card-link')
+            if scraper.click_element_by_classname('card-link', wait_timeout=10, max_attempts=1):
+                scraper._wait_for_element_located(By.ID, 'abstractExample', timeout=10)
             elements = scraper.find_element('div', {'id': 'abstractExample'})
             if len(elements) > 0:
                 abstract_p = elements[0].find('p')
                 if abstract_p:
-                    abstract = abstract_p.text
-                else:
-                    abstract = elements[0].text.replace('Abstract:', '').strip()
+                    return abstract_p.text
+                return elements[0].text.replace('Abstract:', '').strip()
         elif 'openreview.net' in url:
+            scraper._wait_for_element_located(By.CLASS_NAME, 'note-content-value', timeout=10)
             elements = scraper.find_element('div', {'class': 'note-content-value markdown-rendered'})
             if len(elements) > 0:
                 abstract_p = elements[0].find('p')
                 if abstract_p:
-                    abstract = abstract_p.text
-                else:
-                    abstract = elements[0].text.replace('Abstract:', '').strip()
+                    return abstract_p.text
+                return elements[0].text.replace('Abstract:', '').strip()
+        return None
 
+    abstract = None
+    try:
+        abstract = get_page_fetcher().run_in_browser(url, read_abstract)
         if abstract is None:
             logger.warning(f"Failed to get abstract from {url}")
-
     except Exception as e:
         logger.error(f"Error fetching abstract from {url}: {e}")
-    finally:
-        scraper.close()
 
     return abstract
 
@@ -0,0 +1,24 @@
+"""Vote tally reconciliation job.
+
+Recounts votes per paper and repairs ``upvote_count``/``downvote_count``/
+``vote_count`` wherever the trigger-maintained tallies have drifted (e.g.
+after bulk loads with triggers disabled or manual edits).
+"""
+import asyncio
+
+from ..database import AsyncSessionLocal
+from ..services.vote_service import VoteService
+
+
+async def run_vote_tally_reconciliation_job():
+    """Entry point for running the vote tally reconciliation job."""
+    print("Reconciling paper vote tallies...")
+
+    async with AsyncSessionLocal() as session:
+        repaired = await VoteService(session).reconcile_tallies()
+
+    print(f"Vote tallies reconciled: {repaired} papers repaired")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_vote_tally_reconciliation_job())
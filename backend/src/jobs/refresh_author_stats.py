@@ -0,0 +1,52 @@
+"""Author statistics refresh job.
+
+Recomputes paper counts, total citations, h-index, publication year range
+and latest paper for authors with set-based SQL, a chunk of authors per
+statement. Incremental runs only touch authors whose papers were updated or
+linked since the previous complete run; the full run also repairs authors
+whose papers were unlinked or deleted.
+
+The watermark is the database time taken when a run starts and is stored
+only after all of that run's chunks have committed, so a run that fails
+part-way is repeated rather than skipped.
+"""
+import asyncio
+
+from ..database import AsyncSessionLocal
+from ..services.author_service import AUTHOR_STATS_CHUNK_SIZE, AuthorService
+
+
+async def run_author_stats_job(incremental: bool = True, chunk_size: int = AUTHOR_STATS_CHUNK_SIZE):
+    """Entry point for running the author statistics refresh job.
+
+    Args:
+        incremental: If True, only recompute authors whose papers changed
+            since the last run (falls back to all authors on the first run)
+        chunk_size: Authors per UPDATE statement
+    """
+    async with AsyncSessionLocal() as session:
+        service = AuthorService(session)
+        # Taken before listing authors: changes made during the run are
+        # picked up by the next one
+        run_started_at = await service.get_database_time()
+        watermark = await service.get_statistics_watermark() if incremental else None
+
+        if watermark is None:
+            print("Recomputing statistics for all authors...")
+            author_ids = await service.get_all_author_ids()
+        else:
+            print(f"Recomputing statistics for authors with papers changed since {watermark}...")
+            author_ids = await service.get_changed_author_ids(watermark)
+
+        updated = await service.recompute_statistics(
+            author_ids, chunk_size=chunk_size, computed_at=run_started_at
+        )
+        await service.advance_statistics_watermark(run_started_at)
+
+    print(f"Author statistics refreshed: {updated} authors updated")
+
+
+if __name__ == "__main__":
+    import sys
+
+    asyncio.run(run_author_stats_job(incremental="--full" not in sys.argv))
@@ -0,0 +1,24 @@
+"""Corpus statistics refresh job.
+
+Recomputes the ``corpus_stats`` counters exactly, repairing any drift in the
+trigger-maintained counts and updating aggregates used by
+``/api/v1/health/metrics``.
+"""
+import asyncio
+
+from ..database import AsyncSessionLocal
+from ..services.corpus_stats_service import CorpusStatsService
+
+
+async def run_corpus_stats_refresh_job():
+    """Entry point for running the corpus stats refresh job."""
+    print("Refreshing corpus statistics...")
+
+    async with AsyncSessionLocal() as session:
+        stats = await CorpusStatsService(session).refresh()
+
+    print(f"Corpus statistics refreshed: {len(stats)} stats updated")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_corpus_stats_refresh_job())
@@ -0,0 +1,24 @@
+"""History aggregates refresh job.
+
+Refreshes the weekly/monthly star and metric history aggregates when they
+are plain materialized views. TimescaleDB continuous aggregates refresh
+through their own policies and are left alone.
+"""
+import asyncio
+
+from ..database import AsyncSessionLocal
+from ..services.history_service import HistoryService
+
+
+async def run_history_aggregates_refresh_job():
+    """Entry point for running the history aggregates refresh job."""
+    print("Refreshing history aggregates...")
+
+    async with AsyncSessionLocal() as session:
+        refreshed = await HistoryService(session).refresh_aggregates()
+
+    print(f"History aggregates refreshed: {len(refreshed)} views")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_history_aggregates_refresh_job())
@@ -1,19 +1,36 @@
 """APScheduler configuration for background jobs.
 
-Schedules daily jobs at 2 AM UTC:
+Schedules daily jobs from 2 AM UTC:
 - Paper discovery
-- Metric updates
 - Topic matching
+
+Metrics of due papers are refreshed hourly (each paper on its own adaptive
+interval, see services.metric_refresh_service).
+
+Vote tallies are reconciled daily at 4 AM UTC and author statistics fully
+recomputed at 4:30 AM UTC. Corpus statistics are refreshed every 15
+minutes, the similarity index every 30 minutes, and history aggregates and
+changed authors' statistics hourly.
+
+Every replica may start the scheduler: each firing runs on one replica only
+(see job_lock), the others skip it.
 """
 import asyncio
 import logging
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from .discover_papers import run_discovery_job
+from .job_lock import exclusive as run_once_per_firing
 from .match_topics import run_topic_matching_job
+from .reconcile_vote_tallies import run_vote_tally_reconciliation_job
+from .refresh_author_stats import run_author_stats_job
+from .refresh_corpus_stats import run_corpus_stats_refresh_job
+from .refresh_history_aggregates import run_history_aggregates_refresh_job
 from .update_metrics import run_metric_update_job
+from .update_similarity_index import run_similarity_index_job
 
 # Configure logging
 logging.basicConfig(
@@ -30,11 +47,26 @@ class JobScheduler:
         """Initialize job scheduler."""
         self.scheduler = AsyncIOScheduler()
 
+    def add_job(self, func, id: str, exclusive: bool = True, **kwargs):
+        """Register a job that runs on only one replica per firing.
+
+        Args:
+            func: Job coroutine function
+            id: Job id (also the advisory lock key)
+            exclusive: Run on one replica only. Pass False for jobs that
+                maintain per-process local state (e.g. an on-disk index),
+                which every replica has to run itself.
+            **kwargs: Passed to ``AsyncIOScheduler.add_job``
+        """
+        if exclusive:
+            func = run_once_per_firing(id, func)
+        self.scheduler.add_job(func, id=id, **kwargs)
+
     def setup_jobs(self):
         """Configure all scheduled jobs."""
 
         # Daily paper discovery at 2:00 AM UTC
-        self.scheduler.add_job(
+        self.add_job(
             run_discovery_job,
             trigger=CronTrigger(hour=2, minute=0, timezone="UTC"),
             id="paper_discovery",
@@ -43,18 +75,19 @@ class JobScheduler:
         )
         logger.info("Scheduled: Paper discovery at 2:00 AM UTC")
 
-        # Daily metric updates at 2:30 AM UTC (after paper discovery)
-        self.scheduler.add_job(
+        # Hourly refresh of the most overdue papers' metrics
+        self.add_job(
             run_metric_update_job,
-            trigger=CronTrigger(hour=2, minute=30, timezone="UTC"),
+            trigger=IntervalTrigger(hours=1),
             id="metric_update",
-            name="Daily Metric Update",
+            name="Adaptive Metric Update",
             replace_existing=True,
+            max_instances=1,
         )
-        logger.info("Scheduled: Metric update at 2:30 AM UTC")
+        logger.info("Scheduled: Metric update of due papers every hour")
 
-        # Daily topic matching at 3:00 AM UTC (after both above)
-        self.scheduler.add_job(
+        # Daily topic matching at 3:00 AM UTC (after paper discovery)
+        self.add_job(
             run_topic_matching_job,
             trigger=CronTrigger(hour=3, minute=0, timezone="UTC"),
             id="topic_matching",
@@ -63,6 +96,72 @@ class JobScheduler:
         )
         logger.info("Scheduled: Topic matching at 3:00 AM UTC")
 
+        # Daily vote tally reconciliation at 4:00 AM UTC
+        self.add_job(
+            run_vote_tally_reconciliation_job,
+            trigger=CronTrigger(hour=4, minute=0, timezone="UTC"),
+            id="vote_tally_reconciliation",
+            name="Daily Vote Tally Reconciliation",
+            replace_existing=True,
+        )
+        logger.info("Scheduled: Vote tally reconciliation at 4:00 AM UTC")
+
+        # Daily full author statistics recompute at 4:30 AM UTC
+        self.add_job(
+            run_author_stats_job,
+            trigger=CronTrigger(hour=4, minute=30, timezone="UTC"),
+            kwargs={"incremental": False},
+            id="author_stats_full",
+            name="Daily Author Statistics Refresh",
+            replace_existing=True,
+        )
+        logger.info("Scheduled: Full author statistics refresh at 4:30 AM UTC")
+
+        # Corpus statistics for /api/v1/health/metrics every 15 minutes
+        self.add_job(
+            run_corpus_stats_refresh_job,
+            trigger=IntervalTrigger(minutes=15),
+            id="corpus_stats_refresh",
+            name="Corpus Statistics Refresh",
+            replace_existing=True,
+        )
+        logger.info("Scheduled: Corpus statistics refresh every 15 minutes")
+
+        # Star/metric history aggregates (no-op under TimescaleDB policies)
+        self.add_job(
+            run_history_aggregates_refresh_job,
+            trigger=IntervalTrigger(hours=1),
+            id="history_aggregates_refresh",
+            name="History Aggregates Refresh",
+            replace_existing=True,
+        )
+        logger.info("Scheduled: History aggregates refresh every hour")
+
+        # Statistics of authors whose papers changed since the last refresh
+        self.add_job(
+            run_author_stats_job,
+            trigger=IntervalTrigger(hours=1),
+            id="author_stats_incremental",
+            name="Incremental Author Statistics Refresh",
+            replace_existing=True,
+            max_instances=1,
+        )
+        logger.info("Scheduled: Incremental author statistics refresh every hour")
+
+        # Related-papers index: add newly ingested papers every 30 minutes.
+        # The index lives in each process's SIMILARITY_INDEX_DIR, so every
+        # replica updates its own copy.
+        self.add_job(
+            run_similarity_index_job,
+            trigger=IntervalTrigger(minutes=30),
+            id="similarity_index_update",
+            name="Similarity Index Update",
+            exclusive=False,
+            replace_existing=True,
+            max_instances=1,
+        )
+        logger.info("Scheduled: Similarity index update every 30 minutes")
+
     def start(self):
         """Start the scheduler."""
         self.setup_jobs()
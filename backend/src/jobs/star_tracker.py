@@ -7,7 +7,7 @@ papers with GitHub repositories, create snapshots, and calculate hype scores.
 
 import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence
 from datetime import datetime, date, timedelta
 
 from sqlalchemy import select
@@ -16,6 +16,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .celery_app import celery_app
 from ..database import AsyncSessionLocal
 from ..services.github_service import AsyncGitHubService
+from ..services.leaderboard_service import publish_leaderboard_refresh
+from ..services.paper_hype_service import publish_hype_refresh
 from ..models.paper import Paper
 from ..models.github_metrics import GitHubMetrics, GitHubStarSnapshot
 
@@ -66,10 +68,13 @@ def track_daily_stars() -> Dict[str, Any]:
         raise
 
 
-async def _async_track_stars() -> Dict[str, Any]:
+async def _async_track_stars(paper_ids: Optional[Sequence[Any]] = None) -> Dict[str, Any]:
     """
     Async implementation of daily star tracking.
 
+    Args:
+        paper_ids: Restrict tracking to these papers (default: all papers with GitHub URLs)
+
     Returns:
         Dict with tracking results and statistics
     """
@@ -81,9 +86,10 @@ async def _async_track_stars() -> Dict[str, Any]:
     async with AsyncSessionLocal() as session:
         try:
             # Get all papers with GitHub URLs
-            result = await session.execute(
-                select(Paper).where(Paper.github_url.isnot(None))
-            )
+            query = select(Paper).where(Paper.github_url.isnot(None))
+            if paper_ids is not None:
+                query = query.where(Paper.id.in_(paper_ids))
+            result = await session.execute(query)
             papers_with_github = result.scalars().all()
 
             total_papers = len(papers_with_github)
@@ -228,6 +234,13 @@ async def _async_track_stars() -> Dict[str, Any]:
             # Commit all changes
             await session.commit()
 
+            # Rankings and star histories changed: rebuild leaderboards, drop hype scores
+            try:
+                await publish_leaderboard_refresh()
+                await publish_hype_refresh()
+            except Exception as e:
+                logger.warning(f"Failed to publish leaderboard/hype refresh: {e}")
+
             logger.info(
                 f"Star tracking complete: {papers_updated} updated, "
                 f"{errors} errors, {total_stars_tracked} total stars tracked"
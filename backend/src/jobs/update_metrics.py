@@ -1,83 +1,98 @@
-"""Daily metric update job.
+"""Adaptive metric update job.
 
-Fetches GitHub stars and citation counts for all tracked papers,
-creates MetricSnapshot records.
+Fetches GitHub stars and citation counts for the papers that are most
+overdue in ``metric_refresh_schedule``, upserts the day's MetricSnapshot
+and reschedules each paper with an interval adapted to how much its
+numbers moved and how often it was viewed (see
+``services.metric_refresh_service``).
 """
 import asyncio
-from datetime import date
-
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+import os
+from datetime import date, datetime
 
 from ..database import AsyncSessionLocal
-from ..models import Paper
 from ..services import MetricService
+from ..services.metric_refresh_service import MetricRefreshScheduler, pop_paper_views
 from .github_client import GitHubClient
 from .semanticscholar_client import SemanticScholarClient
 
+# Papers refreshed per run (the API budget per run)
+METRIC_REFRESH_BATCH_SIZE = int(os.getenv("METRIC_REFRESH_BATCH_SIZE", "500"))
+
 
 class MetricUpdateJob:
-    """Job for updating paper metrics daily."""
+    """Job for refreshing the metrics of due papers."""
 
-    def __init__(self):
-        """Initialize metric update job."""
+    def __init__(self, batch_size: int = METRIC_REFRESH_BATCH_SIZE, commit_every: int = 50):
+        """Initialize metric update job.
+
+        Args:
+            batch_size: Maximum papers refreshed per run
+            commit_every: Papers refreshed between commits
+        """
+        self.batch_size = batch_size
+        self.commit_every = commit_every
         self.github_client = GitHubClient()
         self.scholar_client = SemanticScholarClient()
 
     async def update_metrics_for_papers(self):
-        """Update metrics for all papers in the database."""
+        """Refresh metrics for the most overdue papers."""
         print("Starting metric update job...")
 
         async with AsyncSessionLocal() as session:
             metric_service = MetricService(session)
+            scheduler = MetricRefreshScheduler(session)
 
-            # Get all papers
-            query = select(Paper)
-            result = await session.execute(query)
-            papers = list(result.scalars().all())
+            enqueued = await scheduler.enqueue_new_papers()
+            if enqueued:
+                print(f"Scheduled {enqueued} new papers for metric refresh")
 
-            print(f"Updating metrics for {len(papers)} papers...")
+            due = await scheduler.get_due(self.batch_size)
+            print(f"Updating metrics for {len(due)} due papers...")
 
+            views = await pop_paper_views([entry.paper_id for entry, *_ in due])
             snapshot_date = date.today()
             updated_count = 0
 
-            for paper in papers:
+            for entry, github_url, arxiv_id, doi in due:
                 try:
-                    # Check if snapshot already exists for today
-                    existing = await metric_service.get_metric_at_date(
-                        paper.id, snapshot_date
-                    )
-                    if existing:
-                        continue  # Skip if already updated today
-
                     # Fetch GitHub stars
                     github_stars = None
-                    if paper.github_url:
-                        github_stars = await self.github_client.get_star_count(
-                            paper.github_url
-                        )
+                    if github_url:
+                        github_stars = await self.github_client.get_star_count(github_url)
 
                     # Fetch citation count
                     citation_count = await self.scholar_client.get_citation_count(
-                        arxiv_id=paper.arxiv_id,
-                        doi=paper.doi,
+                        arxiv_id=arxiv_id,
+                        doi=doi,
                     )
 
-                    # Create metric snapshot
-                    await metric_service.create_metric_snapshot(
-                        paper_id=paper.id,
+                    await metric_service.upsert_metric_snapshot(
+                        paper_id=entry.paper_id,
                         snapshot_date=snapshot_date,
                         github_stars=github_stars,
                         citation_count=citation_count,
                     )
+                    # A failed fetch is not evidence that the numbers stopped moving
+                    partial = (
+                        (bool(github_url) and github_stars is None)
+                        or (bool(arxiv_id or doi) and citation_count is None)
+                    )
+                    scheduler.reschedule(
+                        entry, github_stars, citation_count,
+                        views=views.get(entry.paper_id, 0), now=datetime.utcnow(),
+                        partial=partial,
+                    )
 
                     updated_count += 1
 
-                    if updated_count % 10 == 0:
-                        print(f"Updated {updated_count}/{len(papers)} papers...")
+                    if updated_count % self.commit_every == 0:
+                        await session.commit()
+                        print(f"Updated {updated_count}/{len(due)} papers...")
 
                 except Exception as e:
-                    print(f"Error updating metrics for paper {paper.id}: {e}")
+                    print(f"Error updating metrics for paper {entry.paper_id}: {e}")
+                    scheduler.retry_later(entry)
                     continue
 
             await session.commit()
@@ -0,0 +1,92 @@
+"""Similarity index update job.
+
+Adds papers created since the last run to the on-disk similarity index
+(resuming from the (created_at, id) watermark stored with the index) and
+retrains its IVF partitions once the index has grown enough. Each run
+publishes a new index version; API processes swap it in from their
+background refresh task.
+"""
+import asyncio
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select
+
+from ..database import AsyncSessionLocal
+from ..models import Paper
+from ..services.similarity_index import INDEX_DIR, SimilarityIndex
+
+
+class SimilarityIndexJob:
+    """Job for incrementally indexing new papers."""
+
+    def __init__(self, batch_size: int = 2_000):
+        """Initialize similarity index job.
+
+        Args:
+            batch_size: Papers loaded and indexed per batch
+        """
+        self.batch_size = batch_size
+
+    async def run(self, rebuild: bool = False):
+        """Run the similarity index update.
+
+        Args:
+            rebuild: If True, discard the index and re-index all papers
+        """
+        if rebuild:
+            print("Rebuilding similarity index from scratch...")
+
+        # A rebuild starts empty; the current version is served until it is replaced
+        index = SimilarityIndex(INDEX_DIR, fresh=rebuild)
+        watermark = index.watermark
+        added = 0
+
+        async with AsyncSessionLocal() as session:
+            while True:
+                paper_query = (
+                    select(Paper.id, Paper.title, Paper.abstract, Paper.created_at)
+                    .order_by(Paper.created_at, Paper.id)
+                    .limit(self.batch_size)
+                )
+                if watermark is not None:
+                    created_at = datetime.fromisoformat(watermark["created_at"])
+                    paper_query = paper_query.where(
+                        or_(
+                            Paper.created_at > created_at,
+                            and_(Paper.created_at == created_at, Paper.id > UUID(watermark["id"])),
+                        )
+                    )
+
+                batch = (await session.execute(paper_query)).all()
+                if not batch:
+                    break
+
+                # Hashing and projection are CPU-bound; keep the event loop free
+                added += await asyncio.to_thread(
+                    index.add_many, ((row.id, row.title, row.abstract) for row in batch)
+                )
+                watermark = {"created_at": batch[-1].created_at.isoformat(), "id": str(batch[-1].id)}
+                print(f"Indexed {added} papers...")
+
+        if index.needs_training():
+            await asyncio.to_thread(index.train)
+        index.save(watermark=watermark)
+
+        print(f"Similarity index updated: {added} papers added, {len(index)} indexed")
+
+
+async def run_similarity_index_job(rebuild: bool = False):
+    """Entry point for running the similarity index update job.
+
+    Args:
+        rebuild: If True, re-index all papers (default False)
+    """
+    job = SimilarityIndexJob()
+    await job.run(rebuild=rebuild)
+
+
+if __name__ == "__main__":
+    import sys
+
+    asyncio.run(run_similarity_index_job(rebuild="--rebuild" in sys.argv))
@@ -2,6 +2,7 @@
 
 Entry point for the HypePaper backend API.
 """
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -13,10 +14,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from .api import papers, votes, authors
 from .api.v1 import citations, github, health, jobs, auth, admin, topics, papers_enhanced, profile, async_jobs
 from .api.v1 import papers as papers_v1
+from .database import engine, read_engine
 from .middleware.error_handler import ErrorHandlerMiddleware, RequestLoggingMiddleware
+from .middleware.query_profiler import QueryProfilerMiddleware, install_query_profiler
 from .middleware.security import SecurityHeadersMiddleware
 from .middleware.rate_limiter import RateLimiterMiddleware
 from .services.cache_service import close_cache
+from .services.similarity_index import refresh_similarity_index
 from .utils.logging_config import setup_logging
 
 
@@ -34,9 +38,13 @@ async def lifespan(app: FastAPI):
     json_format = os.getenv("LOG_JSON", "false").lower() == "true"
     setup_logging(log_level, log_file, json_format)
 
+    # Open the related-papers index and pick up new versions off the request path
+    similarity_refresh = asyncio.create_task(refresh_similarity_index())
+
     yield
 
     # Shutdown
+    similarity_refresh.cancel()
     await close_cache()
 
 
@@ -55,10 +63,14 @@ async def railway_health_check():
     """Railway health check endpoint - bypasses all middleware for reliability."""
     return {"status": "healthy", "service": "hypepaper-api"}
 
+# Per-request query counts, DB time and N+1 detection (sampled)
+install_query_profiler(engine, read_engine)
+
 # Add middleware (order matters - first added = outermost)
 app.add_middleware(RateLimiterMiddleware, requests_per_minute=60, requests_per_hour=1000)
 app.add_middleware(ErrorHandlerMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(QueryProfilerMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 
 # Configure CORS for frontend
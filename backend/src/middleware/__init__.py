@@ -1,10 +1,13 @@
 """Middleware modules."""
 
 from .error_handler import ErrorHandlerMiddleware, RequestLoggingMiddleware
+from .query_profiler import QueryProfilerMiddleware, install_query_profiler
 from .security import SecurityHeadersMiddleware
 
 __all__ = [
     "ErrorHandlerMiddleware",
     "RequestLoggingMiddleware",
+    "QueryProfilerMiddleware",
+    "install_query_profiler",
     "SecurityHeadersMiddleware",
 ]
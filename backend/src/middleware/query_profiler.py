@@ -0,0 +1,314 @@
+"""Per-request database query profiling and N+1 detection.
+
+SQLAlchemy ``before/after_cursor_execute`` hooks record every statement run
+while a request is being profiled: query count, DB time and rows returned.
+Statements are reduced to a *shape* (whitespace collapsed, bind placeholders
+and IN-lists normalized); a shape repeated ``N_PLUS_ONE_THRESHOLD`` times in
+one request is flagged as an N+1 pattern.
+
+Route latency is recorded for every request. Query profiling is sampled
+(``QUERY_PROFILE_SAMPLE_RATE``, default 0.1) and can be forced for a single
+request with the ``X-Debug-Queries: 1`` header. Profiled responses carry an
+``X-Query-Profile`` header and a ``Server-Timing`` ``db`` entry.
+"""
+import logging
+import os
+import random
+import re
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+logger = logging.getLogger(__name__)
+
+# Fraction of requests that get per-query profiling
+SAMPLE_RATE = float(os.getenv("QUERY_PROFILE_SAMPLE_RATE", "0.1"))
+
+# Identical statement shapes per request before flagging N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("QUERY_PROFILE_N_PLUS_ONE_THRESHOLD", "5"))
+
+# Request header that forces profiling of a single request
+DEBUG_HEADER = "x-debug-queries"
+
+# Route latency histogram bucket upper bounds (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Maximum distinct N+1 shapes remembered per route
+MAX_SHAPES_PER_ROUTE = 20
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|:\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_NUMBER_LITERAL = re.compile(r"\b\d+\b")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions compare equal.
+
+    Args:
+        statement: SQL text as sent to the driver
+
+    Returns:
+        Statement with collapsed whitespace and bind parameters, IN-lists
+        and numeric literals replaced by ``?``
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return _PLACEHOLDER_LIST.sub("(?...)", shape)
+
+
+@dataclass
+class RequestProfile:
+    """Query statistics collected during one request."""
+
+    query_count: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    shapes: Counter = field(default_factory=Counter)
+
+    def n_plus_one(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict[str, int]:
+        """Statement shapes executed at least ``threshold`` times."""
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "query_profile", default=None
+)
+
+
+@dataclass
+class RouteStats:
+    """Aggregated statistics for one route."""
+
+    requests: int = 0
+    latency_sum: float = 0.0
+    latency_buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    profiled_requests: int = 0
+    db_time_sum: float = 0.0
+    query_count_sum: int = 0
+    query_count_max: int = 0
+    rows_sum: int = 0
+    n_plus_one_requests: int = 0
+    n_plus_one_shapes: Counter = field(default_factory=Counter)
+
+    def observe_latency(self, seconds: float) -> None:
+        """Add a request latency observation."""
+        self.requests += 1
+        self.latency_sum += seconds
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.latency_buckets[i] += 1
+                break
+
+    def observe_profile(self, profile: RequestProfile) -> None:
+        """Add the query statistics of a profiled request."""
+        self.profiled_requests += 1
+        self.db_time_sum += profile.db_time
+        self.query_count_sum += profile.query_count
+        self.query_count_max = max(self.query_count_max, profile.query_count)
+        self.rows_sum += profile.rows
+
+        suspects = profile.n_plus_one()
+        if suspects:
+            self.n_plus_one_requests += 1
+            for shape, count in suspects.items():
+                if shape in self.n_plus_one_shapes or len(self.n_plus_one_shapes) < MAX_SHAPES_PER_ROUTE:
+                    self.n_plus_one_shapes[shape] = max(self.n_plus_one_shapes[shape], count)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the metrics endpoint."""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets, strict=True):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.requests
+
+        profiled = self.profiled_requests or 1
+        return {
+            "requests": self.requests,
+            "latency_seconds_sum": round(self.latency_sum, 6),
+            "latency_seconds_avg": round(self.latency_sum / self.requests, 6) if self.requests else 0,
+            "latency_buckets": buckets,
+            "profiled_requests": self.profiled_requests,
+            "db_time_seconds_avg": round(self.db_time_sum / profiled, 6),
+            "queries_avg": round(self.query_count_sum / profiled, 2),
+            "queries_max": self.query_count_max,
+            "rows_avg": round(self.rows_sum / profiled, 2),
+            "n_plus_one_requests": self.n_plus_one_requests,
+            "n_plus_one_shapes": [
+                {"statement": shape, "max_repeats": count}
+                for shape, count in self.n_plus_one_shapes.most_common()
+            ],
+        }
+
+
+class QueryProfileRegistry:
+    """Process-wide per-route query statistics."""
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self.routes: dict[str, RouteStats] = defaultdict(RouteStats)
+        self.started_at = time.time()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get statistics for every route seen so far."""
+        return {
+            "sample_rate": SAMPLE_RATE,
+            "n_plus_one_threshold": N_PLUS_ONE_THRESHOLD,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "routes": {route: stats.to_dict() for route, stats in sorted(self.routes.items())},
+        }
+
+    def render_prometheus(self, prefix: str = "hypepaper") -> str:
+        """Render route statistics in the Prometheus text exposition format."""
+        lines = [
+            f"# TYPE {prefix}_request_latency_seconds histogram",
+        ]
+        for route, stats in sorted(self.routes.items()):
+            label = route.replace("\\", "\\\\").replace('"', '\\"')
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.latency_buckets, strict=True):
+                cumulative += count
+                lines.append(
+                    f'{prefix}_request_latency_seconds_bucket{{route="{label}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{prefix}_request_latency_seconds_bucket{{route="{label}",le="+Inf"}} {stats.requests}')
+            lines.append(f'{prefix}_request_latency_seconds_sum{{route="{label}"}} {stats.latency_sum}')
+            lines.append(f'{prefix}_request_latency_seconds_count{{route="{label}"}} {stats.requests}')
+
+        counters = {
+            "profiled_requests_total": lambda s: s.profiled_requests,
+            "db_time_seconds_total": lambda s: s.db_time_sum,
+            "db_queries_total": lambda s: s.query_count_sum,
+            "db_rows_total": lambda s: s.rows_sum,
+            "n_plus_one_requests_total": lambda s: s.n_plus_one_requests,
+        }
+        for name, getter in counters.items():
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for route, stats in sorted(self.routes.items()):
+                label = route.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{prefix}_{name}{{route="{label}"}} {getter(stats)}')
+
+        return "\n".join(lines) + "\n"
+
+
+_registry: Optional[QueryProfileRegistry] = None
+
+
+def get_query_profile_registry() -> QueryProfileRegistry:
+    """Get or create the process-wide query profile registry.
+
+    Returns:
+        QueryProfileRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        _registry = QueryProfileRegistry()
+    return _registry
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault("query_profile_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    if profile is None:
+        return
+
+    starts = conn.info.get("query_profile_start")
+    if starts:
+        profile.db_time += time.perf_counter() - starts.pop()
+
+    profile.query_count += 1
+    profile.shapes[statement_shape(statement)] += 1
+
+    rowcount = getattr(cursor, "rowcount", -1)
+    if rowcount is not None and rowcount > 0:
+        profile.rows += rowcount
+
+
+def install_query_profiler(*engines: AsyncEngine) -> None:
+    """Attach the cursor execution hooks to the given engines.
+
+    Installing twice on the same engine is a no-op.
+
+    Args:
+        engines: Async (or sync) engines to instrument
+    """
+    for eng in engines:
+        sync_engine = getattr(eng, "sync_engine", eng)
+        if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+            continue
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryProfilerMiddleware(BaseHTTPMiddleware):
+    """Record route latency and, for sampled requests, per-query DB statistics."""
+
+    def __init__(self, app, sample_rate: Optional[float] = None):
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application
+            sample_rate: Fraction of requests to profile (default from env)
+        """
+        super().__init__(app)
+        self.sample_rate = SAMPLE_RATE if sample_rate is None else sample_rate
+        self.registry = get_query_profile_registry()
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        """Profile the request and attach debug headers.
+
+        Args:
+            request: HTTP request
+            call_next: Next middleware/handler
+
+        Returns:
+            HTTP response
+        """
+        forced = request.headers.get(DEBUG_HEADER) == "1"
+        profile = RequestProfile() if forced or random.random() < self.sample_rate else None
+        token = _current_profile.set(profile)
+
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            _current_profile.reset(token)
+        elapsed = time.perf_counter() - start
+
+        route = request.scope.get("route")
+        route_key = f"{request.method} {route.path if route is not None else 'unmatched'}"
+        stats = self.registry.routes[route_key]
+        stats.observe_latency(elapsed)
+
+        if profile is not None:
+            stats.observe_profile(profile)
+            suspects = profile.n_plus_one()
+            response.headers["X-Query-Profile"] = (
+                f"queries={profile.query_count}; db_ms={profile.db_time * 1000:.1f}; "
+                f"rows={profile.rows}; n_plus_one={len(suspects)}"
+            )
+            response.headers["Server-Timing"] = (
+                f'db;dur={profile.db_time * 1000:.1f};desc="{profile.query_count} queries", '
+                f"app;dur={elapsed * 1000:.1f}"
+            )
+            if suspects:
+                worst_shape, worst_count = max(suspects.items(), key=lambda item: item[1])
+                logger.warning(
+                    f"Possible N+1 on {route_key}: {worst_count}x {worst_shape[:200]}"
+                )
+
+        return response
@@ -14,11 +14,17 @@ from .paper_reference import PaperReference
 from .github_metrics import GitHubMetrics, GitHubStarSnapshot
 from .pdf_content import PDFContent
 from .llm_extraction import LLMExtraction, ExtractionType, VerificationStatus
+from .llm_extraction_cache import LLMExtractionCache
 from .admin_task_log import AdminTaskLog
 from .crawler_job import CrawlerJob
 from .citation_snapshot import CitationSnapshot
 from .vote import Vote
 from .user_profile import UserProfile
+from .corpus_stat import CorpusStat
+from .metric_refresh_schedule import MetricRefreshSchedule
+from .scheduled_job_status import ScheduledJobStatus
+from .queued_job import QueuedJob
+from .job_watermark import JobWatermark
 
 __all__ = [
     "Base",
@@ -35,9 +41,15 @@ __all__ = [
     "LLMExtraction",
     "ExtractionType",
     "VerificationStatus",
+    "LLMExtractionCache",
     "AdminTaskLog",
     "CrawlerJob",
     "CitationSnapshot",
     "Vote",
     "UserProfile",
+    "CorpusStat",
+    "MetricRefreshSchedule",
+    "ScheduledJobStatus",
+    "QueuedJob",
+    "JobWatermark",
 ]
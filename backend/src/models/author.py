@@ -66,6 +66,31 @@ class Author(Base):
         comment="Sum of citations from all author's papers"
     )
 
+    h_index: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default=text("0"),
+        nullable=False,
+        comment="h-index over the papers in the corpus"
+    )
+
+    first_publication_year: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Year of earliest paper"
+    )
+
+    last_publication_year: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Year of most recent paper"
+    )
+
+    stats_updated_at: Mapped[Optional[datetime]] = mapped_column(
+        nullable=True,
+        comment="When statistics were last recomputed (UTC)"
+    )
+
     latest_paper_id: Mapped[Optional[UUID]] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("papers.id", ondelete="SET NULL"),
@@ -120,6 +145,7 @@ class Author(Base):
             "affiliations",
             postgresql_using="gin",
         ),
+        Index("idx_authors_h_index", text("h_index DESC")),
     )
 
     @property
@@ -175,4 +201,5 @@ class PaperAuthor(Base):
     __table_args__ = (
         Index("idx_paper_authors_paper", "paper_id"),
         Index("idx_paper_authors_author", "author_id"),
+        Index("idx_paper_authors_created_at", "created_at"),
     )
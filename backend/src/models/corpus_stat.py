@@ -0,0 +1,45 @@
+"""Corpus statistics model for cheap monitoring metrics.
+
+One row per named counter. Row-count counters are maintained incrementally
+by statement-level triggers on the source tables; aggregate counters and
+breakdowns are refreshed periodically by the corpus stats job.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class CorpusStat(Base):
+    """Named corpus-wide counter (e.g. ``papers_total``)."""
+
+    __tablename__ = "corpus_stats"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Counter value",
+    )
+
+    data: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Breakdown payload for grouped statistics",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CorpusStat(name={self.name}, value={self.value})>"
@@ -0,0 +1,36 @@
+"""Job watermark model.
+
+One row per incremental job, holding the point in time up to which its last
+complete run processed changes. A run records the watermark it started from
+only after all of its work has committed, so an interrupted run is redone in
+full by the next one.
+"""
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class JobWatermark(Base):
+    """Resume point of an incremental job (e.g. ``author_stats``)."""
+
+    __tablename__ = "job_watermarks"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    watermark: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        comment="Start (UTC) of the last run whose work fully committed",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<JobWatermark(name={self.name}, watermark={self.watermark})>"
@@ -0,0 +1,56 @@
+"""LLM extraction cache model.
+
+Raw LLM extraction results keyed by the exact inputs that produced them:
+PDF content hash, prompt hash and model id. Re-running enrichment over an
+unchanged PDF with an unchanged prompt and model reuses the stored result
+instead of calling the LLM again.
+"""
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class LLMExtractionCache(Base):
+    """Cached LLM response for one (PDF, prompt, model) combination."""
+
+    __tablename__ = "llm_extraction_cache"
+
+    pdf_sha256: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="SHA-256 of the PDF bytes",
+    )
+
+    prompt_hash: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="SHA-256 of the extraction prompt",
+    )
+
+    model_id: Mapped[str] = mapped_column(
+        String(150),
+        primary_key=True,
+        comment="Provider and model, e.g. 'openai:gpt-4o'",
+    )
+
+    result: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Parsed extraction result",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LLMExtractionCache(pdf={self.pdf_sha256[:12]}, "
+            f"prompt={self.prompt_hash[:12]}, model={self.model_id})>"
+        )
@@ -0,0 +1,68 @@
+"""Metric refresh schedule model.
+
+One row per paper saying when its GitHub stars and citation count should
+next be fetched. The metric update job pulls the most overdue rows and
+reschedules each paper with an interval that adapts to how much its
+numbers moved since the previous refresh and how often it was viewed.
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Float, ForeignKey, Index, Integer, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class MetricRefreshSchedule(Base):
+    """Next metric refresh time and adaptive interval for a paper."""
+
+    __tablename__ = "metric_refresh_schedule"
+
+    paper_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("papers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    next_refresh_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+        server_default=text("timezone('utc', NOW())"),
+        comment="When the paper is next due for a refresh (UTC)",
+    )
+
+    refresh_interval_hours: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        server_default=text("24"),
+        comment="Current adaptive refresh interval",
+    )
+
+    last_refreshed_at: Mapped[Optional[datetime]] = mapped_column(
+        nullable=True,
+        comment="When metrics were last fetched (UTC)",
+    )
+
+    last_github_stars: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Stars at the last refresh",
+    )
+
+    last_citation_count: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Citations at the last refresh",
+    )
+
+    __table_args__ = (
+        Index("idx_metric_refresh_schedule_next", "next_refresh_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MetricRefreshSchedule(paper_id={self.paper_id}, "
+            f"next_refresh_at={self.next_refresh_at}, every {self.refresh_interval_hours:.1f}h)>"
+        )
@@ -243,6 +243,20 @@ class Paper(Base):
         server_default=text("0"),
         comment="Net votes (upvotes - downvotes), updated by trigger"
     )
+    upvote_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Number of upvotes, updated by trigger"
+    )
+    downvote_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Number of downvotes, updated by trigger"
+    )
 
     # Content enrichment fields
     quick_summary: Mapped[Optional[str]] = mapped_column(
@@ -384,6 +398,7 @@ class Paper(Base):
 
         # Performance indexes
         Index("idx_papers_published_date", "published_date", postgresql_ops={"published_date": "DESC"}),
+        Index("idx_papers_updated_at", "updated_at"),
         Index("idx_papers_year_desc", "year", postgresql_ops={"year": "DESC"}),
 
         # Full-text search indexes
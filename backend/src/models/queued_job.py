@@ -0,0 +1,65 @@
+"""Queued crawler job model for the SQL job queue backend.
+
+Used by ``SqlQueueBackend`` (Postgres in production-like setups, SQLite for
+local runs), so column types are kept portable.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import JSON, DateTime, Index, Integer, SmallInteger, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class QueuedJob(Base):
+    """Crawler job with its queue state, priority and result."""
+
+    __tablename__ = "job_queue"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+
+    job_type: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    params: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    user_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+
+    priority: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        default=1,
+        comment="0 = low, 1 = normal, 2 = high",
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="queued",
+        comment="queued, processing, success, failed or cancelled",
+    )
+
+    visible_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="Processing jobs are redelivered after this time (UTC)",
+    )
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    results: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_job_queue_dequeue", "status", "priority", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<QueuedJob(id={self.id}, type={self.job_type}, status={self.status})>"
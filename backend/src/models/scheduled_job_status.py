@@ -0,0 +1,64 @@
+"""Scheduled job status model.
+
+One row per scheduled job, written by whichever replica ran (or skipped) it
+most recently. Mutual exclusion itself comes from a Postgres advisory lock;
+this table only makes the leader, its lease and skipped runs observable.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ScheduledJobStatus(Base):
+    """Latest run state of a scheduled job across all replicas."""
+
+    __tablename__ = "scheduled_job_status"
+
+    job_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    state: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="running, succeeded, failed or lock_lost",
+    )
+
+    holder: Mapped[Optional[str]] = mapped_column(
+        String(200),
+        nullable=True,
+        comment="Replica (host:pid) holding or last holding the lock",
+    )
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Running state is stale after this time without a heartbeat",
+    )
+
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    last_skipped_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Last time a replica skipped the job because another held the lock",
+    )
+
+    skipped_by: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ScheduledJobStatus(job_name={self.job_name}, state={self.state}, holder={self.holder})>"
@@ -5,7 +5,7 @@ Exports all service classes.
 from .hype_score_service import HypeScoreService
 from .metric_service import MetricService
 from .paper_service import PaperService
-from .topic_matching_service import TopicMatchingService
+from .topic_matching_service import BatchTopicMatcher, TopicMatchingService
 from .topic_service import TopicService
 
 # SOTAPapers legacy integration services
@@ -23,6 +23,7 @@ __all__ = [
     "MetricService",
     "HypeScoreService",
     "TopicMatchingService",
+    "BatchTopicMatcher",
     # SOTAPapers integration services
     "AsyncArxivService",
     "AsyncGitHubService",
@@ -1,58 +1,192 @@
 """Author extraction service.
 
 Extracts author information from papers and creates Author records.
+
+Authors are resolved in bulk: the names of a whole batch of papers are
+looked up with one ``name = ANY(:names)`` query (after a per-job name → id
+LRU), missing authors are created with one ``INSERT ... RETURNING`` and the
+``paper_authors`` links are written with one multi-row insert. No
+relationship collections are loaded.
+
+Author names are not unique (namesakes are disambiguated by affiliation),
+so concurrent jobs cannot rely on ``ON CONFLICT`` to avoid creating the
+same author twice. Instead, before inserting, a job takes a transaction
+advisory lock per missing name and looks the names up again.
 """
-from sqlalchemy import select
+import hashlib
+from typing import Iterable, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..models import Paper, Author
+
+from ..models import Paper, Author, PaperAuthor
+from ..utils.ttl_cache import TTLCache
+
+
+# Name → author id entries kept per extractor (i.e. per job)
+AUTHOR_CACHE_SIZE = 100_000
+
+# paper_authors rows per INSERT statement (3 bind parameters each)
+LINK_CHUNK_SIZE = 5_000
+
+# Lowest id per name, matching AuthorService.find_or_create_author's
+# "first match" when names are shared by several authors
+SELECT_AUTHOR_IDS = text(
+    "SELECT id, name FROM authors WHERE name = ANY(:names) ORDER BY id"
+)
+
+# Transaction advisory locks on author names, taken in the order given
+# (sorted, so two jobs locking overlapping names cannot deadlock)
+LOCK_AUTHOR_NAMES = text(
+    "SELECT pg_advisory_xact_lock(key) FROM unnest(CAST(:keys AS bigint[])) AS key"
+)
+
+
+def author_name_lock_key(name: str) -> int:
+    """Stable signed 64-bit advisory lock key for an author name.
+
+    Args:
+        name: Author name
+
+    Returns:
+        Lock key
+    """
+    digest = hashlib.blake2b(f"author_name:{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _author_names(paper: Paper) -> list[str]:
+    """Distinct, non-empty author names of a paper in byline order."""
+    names = (name.strip() for name in paper.authors or [])
+    return list(dict.fromkeys(name for name in names if name))
 
 
 class AuthorExtractorService:
     """Service to extract and create author records from papers."""
 
-    async def extract_authors_from_paper(
+    def __init__(self, cache_size: int = AUTHOR_CACHE_SIZE):
+        """Initialize service with an empty name → id cache.
+
+        Args:
+            cache_size: Maximum cached author names
+        """
+        # Entries never expire; the cache only lives as long as the job
+        self._author_ids = TTLCache(cache_size, ttl=float("inf"))
+
+    async def resolve_author_ids(
         self,
-        paper: Paper,
+        names: Iterable[str],
         db: AsyncSession
-    ) -> list[Author]:
-        """Extract authors from a paper and create Author records.
+    ) -> tuple[dict[str, int], int]:
+        """Resolve author names to ids, creating missing authors.
+
+        Creating authors takes advisory locks on their names that are held
+        until ``db``'s transaction ends, so callers should commit promptly.
 
         Args:
-            paper: Paper object with authors list
+            names: Author names
             db: Database session
 
         Returns:
-            List of newly created Author objects
+            Tuple of (name → author id, number of authors created)
         """
-        if not paper.authors:
-            return []
+        ids: dict[str, int] = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            author_id = self._author_ids.get(name)
+            if author_id is None:
+                missing.append(name)
+            else:
+                ids[name] = author_id
+        if not missing:
+            return ids, 0
+
+        found = await self._select_author_ids(missing, db)
 
-        new_authors = []
+        created = 0
+        new_names = [name for name in missing if name not in found]
+        if new_names:
+            # Wait for jobs creating the same names, then pick up what they created
+            keys = sorted({author_name_lock_key(name) for name in new_names})
+            await db.execute(LOCK_AUTHOR_NAMES, {"keys": keys})
+            found.update(await self._select_author_ids(new_names, db))
+            new_names = [name for name in new_names if name not in found]
 
-        for author_name in paper.authors:
-            # Check if author already exists
+        if new_names:
             result = await db.execute(
-                select(Author).where(Author.name == author_name)
+                pg_insert(Author)
+                .values([{"name": name} for name in new_names])
+                .returning(Author.id, Author.name)
             )
-            existing_author = result.scalar_one_or_none()
-
-            if existing_author:
-                # Link existing author to paper via paper_authors table
-                if paper not in existing_author.papers:
-                    existing_author.papers.append(paper)
-                continue
-
-            # Create new author
-            author = Author(
-                name=author_name,
-                # These will be enriched later by other services
-                primary_affiliation=None,
-                paper_count=0,
-                total_citation_count=0
+            inserted = {name: author_id for author_id, name in result.all()}
+            created = len(inserted)
+            found.update(inserted)
+
+        for name, author_id in found.items():
+            self._author_ids.set(name, author_id)
+        ids.update(found)
+        return ids, created
+
+    async def _select_author_ids(
+        self,
+        names: list[str],
+        db: AsyncSession
+    ) -> dict[str, int]:
+        result = await db.execute(SELECT_AUTHOR_IDS, {"names": names})
+        ids: dict[str, int] = {}
+        for author_id, name in result.all():
+            ids.setdefault(name, author_id)
+        return ids
+
+    async def extract_authors_from_papers(
+        self,
+        papers: Sequence[Paper],
+        db: AsyncSession
+    ) -> int:
+        """Create Author records for a batch of papers and link them.
+
+        Existing links are left untouched, so re-running is safe.
+
+        Args:
+            papers: Paper objects with authors lists
+            db: Database session
+
+        Returns:
+            Number of newly created authors
+        """
+        paper_names = [(paper.id, _author_names(paper)) for paper in papers]
+        ids, created = await self.resolve_author_ids(
+            (name for _, names in paper_names for name in names), db
+        )
+
+        links = [
+            {"paper_id": paper_id, "author_id": ids[name], "position": position}
+            for paper_id, names in paper_names
+            for position, name in enumerate(names, start=1)
+            if name in ids
+        ]
+        for start in range(0, len(links), LINK_CHUNK_SIZE):
+            await db.execute(
+                pg_insert(PaperAuthor)
+                .values(links[start:start + LINK_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=["paper_id", "author_id"])
             )
 
-            db.add(author)
-            author.papers.append(paper)
-            new_authors.append(author)
+        return created
+
+    async def extract_authors_from_paper(
+        self,
+        paper: Paper,
+        db: AsyncSession
+    ) -> int:
+        """Extract authors from a paper and create Author records.
 
-        return new_authors
+        Args:
+            paper: Paper object with authors list
+            db: Database session
+
+        Returns:
+            Number of newly created authors
+        """
+        return await self.extract_authors_from_papers([paper], db)
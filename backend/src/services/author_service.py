@@ -3,16 +3,86 @@
 Provides search and statistics for paper authors with citation tracking.
 """
 from typing import Optional, Sequence
-from datetime import date
+from datetime import date, datetime
 
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, func, and_, or_, desc, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.models.author import Author, PaperAuthor
+from src.models.job_watermark import JobWatermark
 from src.models.paper import Paper
 
 
+# Authors recomputed per UPDATE statement in bulk refreshes
+AUTHOR_STATS_CHUNK_SIZE = 5000
+
+# job_watermarks row of the author statistics refresh
+AUTHOR_STATS_WATERMARK = "author_stats"
+
+# Recompute paper count, citations, h-index, publication years and latest
+# paper for a set of authors from paper_authors joined to papers. The
+# h-index is the number of papers whose citation count is at least their
+# rank when the author's papers are sorted by citations. Authors without
+# papers are reset.
+RECOMPUTE_AUTHOR_STATS = text(
+    """
+    WITH ranked AS (
+        SELECT pa.author_id,
+               p.id AS paper_id,
+               p.published_date,
+               COALESCE(p.citation_count, 0) AS citations,
+               ROW_NUMBER() OVER (
+                   PARTITION BY pa.author_id
+                   ORDER BY COALESCE(p.citation_count, 0) DESC
+               ) AS citation_rank
+        FROM paper_authors pa
+        JOIN papers p ON p.id = pa.paper_id
+        WHERE pa.author_id = ANY(:author_ids)
+    ),
+    stats AS (
+        SELECT author_id,
+               COUNT(*) AS paper_count,
+               SUM(citations) AS total_citations,
+               COUNT(*) FILTER (WHERE citations >= citation_rank) AS h_index,
+               MIN(EXTRACT(YEAR FROM published_date))::int AS first_year,
+               MAX(EXTRACT(YEAR FROM published_date))::int AS last_year,
+               (ARRAY_AGG(paper_id ORDER BY published_date DESC NULLS LAST))[1] AS latest_paper_id
+        FROM ranked
+        GROUP BY author_id
+    )
+    UPDATE authors a
+    SET paper_count = COALESCE(s.paper_count, 0),
+        total_citation_count = COALESCE(s.total_citations, 0),
+        h_index = COALESCE(s.h_index, 0),
+        first_publication_year = s.first_year,
+        last_publication_year = s.last_year,
+        latest_paper_id = s.latest_paper_id,
+        stats_updated_at = :computed_at
+    FROM authors target
+    LEFT JOIN stats s ON s.author_id = target.id
+    WHERE a.id = target.id
+      AND target.id = ANY(:author_ids)
+    """
+)
+
+# Authors with papers created, updated or linked after a point in time, plus
+# authors that have never been computed
+CHANGED_AUTHOR_IDS = text(
+    """
+    SELECT pa.author_id
+    FROM paper_authors pa
+    JOIN papers p ON p.id = pa.paper_id
+    WHERE p.updated_at > :since
+    UNION
+    SELECT author_id FROM paper_authors WHERE created_at > :since
+    UNION
+    SELECT id FROM authors WHERE stats_updated_at IS NULL
+    """
+)
+
+
 class AuthorService:
     """Service for managing author data and statistics."""
 
@@ -172,6 +242,8 @@ class AuthorService:
         Updates:
         - paper_count: Total papers by this author
         - total_citation_count: Sum of citations from all papers
+        - h_index: h-index over the author's papers
+        - first/last_publication_year: Publication year range
         - latest_paper_id: Most recent paper by published_date
 
         Args:
@@ -180,28 +252,109 @@ class AuthorService:
         Returns:
             Author: Updated author record
         """
-        author = await self.get_author_by_id(author_id, include_papers=True)
+        author = await self.get_author_by_id(author_id)
         if not author:
             raise ValueError(f"Author not found: {author_id}")
 
-        # Update paper_count
-        author.paper_count = len(author.papers)
+        await self.recompute_statistics([author_id])
+        await self.session.refresh(author)
+        return author
+
+    async def get_database_time(self) -> datetime:
+        """Get the database's current UTC time.
+
+        Returns:
+            datetime: Naive UTC timestamp (comparable with paper timestamps)
+        """
+        return await self.session.scalar(text("SELECT timezone('utc', NOW())"))
+
+    async def recompute_statistics(
+        self,
+        author_ids: Sequence[int],
+        chunk_size: int = AUTHOR_STATS_CHUNK_SIZE,
+        computed_at: Optional[datetime] = None
+    ) -> int:
+        """Recompute statistics for many authors with set-based updates.
+
+        Each chunk of authors is recomputed by a single UPDATE and committed.
+
+        Args:
+            author_ids: Author IDs to recompute
+            chunk_size: Authors per UPDATE statement
+            computed_at: stats_updated_at to record (default: database time now)
+
+        Returns:
+            int: Number of author rows updated
+        """
+        if computed_at is None:
+            computed_at = await self.get_database_time()
+        updated = 0
+        for start in range(0, len(author_ids), chunk_size):
+            chunk = list(author_ids[start:start + chunk_size])
+            result = await self.session.execute(
+                RECOMPUTE_AUTHOR_STATS,
+                {"author_ids": chunk, "computed_at": computed_at}
+            )
+            await self.session.commit()
+            updated += result.rowcount
+        return updated
+
+    async def get_all_author_ids(self) -> list[int]:
+        """Get IDs of all authors in ID order.
 
-        # Update total_citation_count
-        author.total_citation_count = sum(
-            paper.citation_count for paper in author.papers
+        Returns:
+            list[int]: Author IDs
+        """
+        result = await self.session.execute(select(Author.id).order_by(Author.id))
+        return list(result.scalars().all())
+
+    async def get_changed_author_ids(self, since: datetime) -> list[int]:
+        """Get authors whose papers changed after a point in time.
+
+        Covers papers updated or linked to the author after ``since`` and
+        authors whose statistics were never computed. Removed links are not
+        detected; the full refresh repairs those.
+
+        Args:
+            since: UTC timestamp of the previous refresh
+
+        Returns:
+            list[int]: Author IDs in ID order
+        """
+        result = await self.session.execute(CHANGED_AUTHOR_IDS, {"since": since})
+        return sorted(result.scalars().all())
+
+    async def get_statistics_watermark(self) -> Optional[datetime]:
+        """Get the start of the last complete statistics refresh run.
+
+        Returns:
+            Optional[datetime]: Run start (UTC), or None if no run has completed
+        """
+        return await self.session.scalar(
+            select(JobWatermark.watermark).where(JobWatermark.name == AUTHOR_STATS_WATERMARK)
         )
 
-        # Update latest_paper_id
-        if author.papers:
-            latest_paper = max(author.papers, key=lambda p: p.published_date)
-            author.latest_paper_id = latest_paper.id
-        else:
-            author.latest_paper_id = None
+    async def advance_statistics_watermark(self, run_started_at: datetime) -> None:
+        """Record a completed statistics refresh run.
+
+        Call only after every chunk of the run has committed; authors changed
+        after ``run_started_at`` are picked up by the next incremental run.
+        The watermark never moves backwards (e.g. when a full run that started
+        earlier finishes after an incremental one).
 
+        Args:
+            run_started_at: Database time taken before the run listed its authors
+        """
+        stmt = pg_insert(JobWatermark).values(name=AUTHOR_STATS_WATERMARK, watermark=run_started_at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "watermark": func.greatest(JobWatermark.watermark, stmt.excluded.watermark),
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
         await self.session.commit()
-        await self.session.refresh(author)
-        return author
 
     async def get_prolific_authors(
         self,
@@ -80,6 +80,71 @@ class CacheService:
             print(f"Cache set error for key {key}: {e}")
             return False
 
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get many values from cache in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values (None for misses) in the order of ``keys``
+        """
+        if not keys or not self.redis_available or not self.redis_client:
+            return [None] * len(keys)
+
+        try:
+            values = await self.redis_client.mget(keys)
+            return [None if value is None else json.loads(value) for value in values]
+        except Exception as e:
+            print(f"Cache get_many error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set many values in cache in one pipelined round trip.
+
+        Args:
+            items: Mapping of cache key to value (JSON-serializable)
+            ttl: Time-to-live in seconds (default: 300)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not items or not self.redis_available or not self.redis_client:
+            return False
+
+        try:
+            ttl = ttl or self.default_ttl
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, json.dumps(value))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            print(f"Cache set_many error for {len(items)} keys: {e}")
+            return False
+
+    async def pop_many(self, keys: list[str]) -> list[Optional[Any]]:
+        """Atomically get and delete many values (e.g. drain counters).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values (None for misses) in the order of ``keys``
+        """
+        if not keys or not self.redis_available or not self.redis_client:
+            return [None] * len(keys)
+
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.mget(keys)
+                pipe.delete(*keys)
+                values, _ = await pipe.execute()
+            return [None if value is None else json.loads(value) for value in values]
+        except Exception as e:
+            print(f"Cache pop_many error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
     async def delete(self, key: str) -> bool:
         """Delete value from cache.
 
@@ -0,0 +1,261 @@
+"""
+Concurrent abstract fetching for conference crawls.
+
+Conference paper pages (CVF open access, CVPR/ICLR virtual sites,
+OpenReview) are fetched over plain HTTP through one pooled aiohttp session,
+with a global concurrency bound and per-host politeness: at most
+``ABSTRACT_FETCH_PER_HOST`` requests in flight per host and at least
+``ABSTRACT_FETCH_HOST_DELAY`` seconds between request starts to the same
+host. Throttled (429) and 5xx responses are retried with backoff, honoring
+``Retry-After``. Pages whose abstract is not in the static HTML can be
+handed to a browser-based fallback, run in a small thread pool.
+"""
+import asyncio
+import logging
+import os
+import re
+import unicodedata
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+# Requests in flight across all hosts
+ABSTRACT_FETCH_CONCURRENCY = int(os.getenv("ABSTRACT_FETCH_CONCURRENCY", "16"))
+
+# Requests in flight per host
+ABSTRACT_FETCH_PER_HOST = int(os.getenv("ABSTRACT_FETCH_PER_HOST", "4"))
+
+# Minimum seconds between request starts to the same host
+ABSTRACT_FETCH_HOST_DELAY = float(os.getenv("ABSTRACT_FETCH_HOST_DELAY", "0.25"))
+
+# Attempts per page for 429/5xx responses and connection errors
+ABSTRACT_FETCH_ATTEMPTS = 3
+
+# Browser fallbacks run at once (each one drives a headless Chrome)
+BROWSER_FALLBACK_CONCURRENCY = 2
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a paper title for duplicate detection.
+
+    Accents, case, punctuation and repeated whitespace are ignored.
+
+    Args:
+        title: Raw title
+
+    Returns:
+        Normalized title
+    """
+    normalized = unicodedata.normalize('NFKD', title)
+    ascii_str = ''.join(c for c in normalized if ord(c) < 128)
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', ascii_str.lower()).split())
+
+
+def _element_text(element) -> str:
+    paragraph = element.find('p')
+    text = paragraph.get_text(' ', strip=True) if paragraph else element.get_text(' ', strip=True)
+    return text.replace('Abstract:', '').strip()
+
+
+def parse_abstract(html: str, url: str) -> Optional[str]:
+    """
+    Extract the abstract from a conference paper page.
+
+    Uses the same elements as the browser-based scraper, plus the
+    ``citation_abstract`` meta tag that OpenReview and CVF pages embed.
+
+    Args:
+        html: Page HTML
+        url: Page URL (selects the site layout)
+
+    Returns:
+        Abstract text or None if not found
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+
+    element = None
+    if 'openaccess.thecvf.com' in url:
+        element = soup.find(id='abstract')
+    elif 'cvpr.thecvf.com' in url or 'iclr.cc' in url:
+        element = soup.find(id='abstractExample')
+    elif 'openreview.net' in url:
+        element = soup.find('div', class_='note-content-value')
+
+    if element is not None:
+        text = _element_text(element)
+        if text:
+            return text
+
+    meta = soup.find('meta', attrs={'name': 'citation_abstract'})
+    if meta and meta.get('content', '').strip():
+        return meta['content'].strip()
+    return None
+
+
+class _HostThrottle:
+    """Per-host concurrency limit and minimum spacing between requests."""
+
+    def __init__(self, concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.delay = delay
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_turn(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            start = max(now, self._next_start)
+            self._next_start = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class ConferenceAbstractFetcher:
+    """Fetches conference paper abstracts concurrently over pooled connections."""
+
+    def __init__(
+        self,
+        concurrency: int = ABSTRACT_FETCH_CONCURRENCY,
+        per_host: int = ABSTRACT_FETCH_PER_HOST,
+        host_delay: float = ABSTRACT_FETCH_HOST_DELAY,
+        timeout: float = 60,
+        browser_fallback: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        """
+        Initialize fetcher.
+
+        Args:
+            concurrency: Requests in flight across all hosts
+            per_host: Requests in flight per host
+            host_delay: Minimum seconds between request starts per host
+            timeout: Total timeout per request in seconds
+            browser_fallback: Blocking ``url -> abstract`` function used when
+                the static page has no abstract (run in worker threads)
+        """
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.host_delay = host_delay
+        self.timeout = timeout
+        self.browser_fallback = browser_fallback
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._throttles: Dict[str, _HostThrottle] = {}
+        self._fallback_semaphore = asyncio.Semaphore(BROWSER_FALLBACK_CONCURRENCY)
+        self.stats = {'fetched': 0, 'missing': 0, 'failed': 0, 'retries': 0, 'browser_fallbacks': 0}
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.concurrency,
+                limit_per_host=self.per_host,
+                ttl_dns_cache=300,
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={'User-Agent': USER_AGENT},
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        if self.session:
+            await self.session.close()
+
+    def _throttle(self, url: str) -> _HostThrottle:
+        host = urlparse(url).netloc
+        throttle = self._throttles.get(host)
+        if throttle is None:
+            throttle = self._throttles[host] = _HostThrottle(self.per_host, self.host_delay)
+        return throttle
+
+    async def _get(self, url: str) -> Optional[str]:
+        throttle = self._throttle(url)
+        async with throttle.semaphore:
+            for attempt in range(ABSTRACT_FETCH_ATTEMPTS):
+                await throttle.wait_turn()
+                retry_after = None
+                try:
+                    async with self.session.get(url) as response:
+                        if response.status == 200:
+                            return await response.text()
+                        if response.status not in RETRY_STATUSES:
+                            logger.warning(f"Abstract page {url} returned HTTP {response.status}")
+                            return None
+                        retry_after = response.headers.get('Retry-After')
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.debug(f"Error fetching {url}: {e}")
+
+                if attempt + 1 < ABSTRACT_FETCH_ATTEMPTS:
+                    self.stats['retries'] += 1
+                    delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+                    await asyncio.sleep(delay)
+        return None
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Fetch the abstract of one conference paper page.
+
+        Args:
+            url: Conference paper URL
+
+        Returns:
+            Abstract text or None if not found
+        """
+        html = await self._get(url)
+        abstract = parse_abstract(html, url) if html else None
+
+        if abstract is None and self.browser_fallback is not None:
+            async with self._fallback_semaphore:
+                self.stats['browser_fallbacks'] += 1
+                abstract = await asyncio.to_thread(self.browser_fallback, url)
+
+        if abstract is not None:
+            self.stats['fetched'] += 1
+        elif html is None:
+            self.stats['failed'] += 1
+        else:
+            self.stats['missing'] += 1
+        return abstract
+
+    async def fetch_many(
+        self,
+        urls: Iterable[str],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Fetch abstracts for many pages concurrently.
+
+        Args:
+            urls: Conference paper URLs (duplicates are fetched once)
+            on_progress: Called with (completed, total) after each page
+
+        Returns:
+            Mapping of URL to abstract (None if not found)
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        total = len(unique_urls)
+        completed = 0
+        abstracts: Dict[str, Optional[str]] = {}
+
+        async def fetch_one(url: str) -> None:
+            nonlocal completed
+            try:
+                abstracts[url] = await self.fetch(url)
+            except Exception as e:
+                logger.error(f"Error fetching abstract from {url}: {e}")
+                abstracts[url] = None
+            completed += 1
+            if on_progress:
+                on_progress(completed, total)
+
+        await asyncio.gather(*(fetch_one(url) for url in unique_urls))
+        return abstracts
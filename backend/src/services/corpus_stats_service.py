@@ -0,0 +1,285 @@
+"""Corpus statistics service for the health metrics endpoint.
+
+Serves corpus-wide counts from the small ``corpus_stats`` table instead of
+scanning ``papers``, ``authors``, ``paper_references`` etc. on every scrape.
+
+- Row-count counters are kept current by insert/delete triggers
+  (see migration ``add_corpus_stats``) or by :meth:`CorpusStatsService.increment`.
+- Aggregates and breakdowns are recomputed by :meth:`CorpusStatsService.refresh`,
+  run periodically by the scheduler.
+- Counters that have never been populated fall back to the planner's
+  ``pg_class.reltuples`` estimate.
+"""
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Row-count counters maintained incrementally, keyed by stat name -> table
+COUNTER_TABLES: dict[str, str] = {
+    "papers_total": "papers",
+    "authors_total": "authors",
+    "citations_total": "paper_references",
+    "llm_extractions_total": "llm_extractions",
+    "pdfs_processed": "pdf_contents",
+}
+
+# Scalar aggregates recomputed on refresh
+AGGREGATE_QUERIES: dict[str, str] = {
+    "papers_with_github": "SELECT COUNT(*) FROM papers WHERE github_url IS NOT NULL",
+    "repos_tracked": "SELECT COUNT(*) FROM github_metrics WHERE current_stars > 0",
+    "total_stars_tracked": "SELECT COALESCE(SUM(current_stars), 0) FROM github_metrics",
+}
+
+# Grouped breakdowns recomputed on refresh (stored in the ``data`` column)
+BREAKDOWN_QUERIES: dict[str, str] = {
+    "llm_extractions_by_status": (
+        "SELECT verification_status, COUNT(*) FROM llm_extractions "
+        "GROUP BY verification_status"
+    ),
+    "top_tasks": (
+        "SELECT primary_task, COUNT(*) as count FROM papers "
+        "WHERE primary_task IS NOT NULL "
+        "GROUP BY primary_task "
+        "ORDER BY count DESC "
+        "LIMIT 10"
+    ),
+    "top_datasets": (
+        "SELECT jsonb_array_elements_text(datasets_used) as dataset, "
+        "COUNT(*) as count FROM papers "
+        "WHERE datasets_used IS NOT NULL "
+        "GROUP BY dataset "
+        "ORDER BY count DESC "
+        "LIMIT 10"
+    ),
+}
+
+UPSERT_STAT = text(
+    "INSERT INTO corpus_stats (name, value, data, updated_at) "
+    "VALUES (:name, :value, CAST(:data AS JSONB), NOW()) "
+    "ON CONFLICT (name) DO UPDATE SET "
+    "value = EXCLUDED.value, data = EXCLUDED.data, updated_at = NOW()"
+)
+
+INCREMENT_STAT = text(
+    "INSERT INTO corpus_stats (name, value, updated_at) "
+    "VALUES (:name, :delta, NOW()) "
+    "ON CONFLICT (name) DO UPDATE SET "
+    "value = corpus_stats.value + EXCLUDED.value, updated_at = NOW()"
+)
+
+# How long the endpoint may serve the same snapshot (seconds)
+CACHE_TTL = int(os.getenv("CORPUS_STATS_CACHE_TTL", "60"))
+
+_cached_stats: Optional[tuple[float, dict[str, Any]]] = None
+
+
+class CorpusStatsService:
+    """Service for reading and maintaining corpus-wide counters."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service with database session."""
+        self.session = session
+
+    async def increment(self, name: str, delta: int = 1) -> None:
+        """Atomically add ``delta`` to a counter.
+
+        Writers that bypass the table triggers (e.g. bulk loads into a new
+        table) can call this in their own transaction.
+
+        Args:
+            name: Counter name
+            delta: Amount to add (negative to subtract)
+        """
+        await self.session.execute(INCREMENT_STAT, {"name": name, "delta": delta})
+
+    async def refresh(self) -> dict[str, Any]:
+        """Recompute every statistic exactly and store it.
+
+        This repairs any drift in the incremental counters, so it is the only
+        place that scans the source tables. All scans run before any row is
+        written: the counter rows are also updated by the insert/delete
+        triggers on the source tables, so writers only wait for the short
+        final upsert-and-commit rather than for the whole refresh.
+
+        Returns:
+            Mapping of stat name to the stored value
+        """
+        breakdowns: dict[str, list[list[Any]]] = {}
+        for name, query in BREAKDOWN_QUERIES.items():
+            breakdowns[name] = [[row[0], row[1]] for row in await self.session.execute(text(query))]
+
+        scalars: dict[str, int] = {}
+        for name, query in AGGREGATE_QUERIES.items():
+            scalars[name] = int((await self.session.execute(text(query))).scalar() or 0)
+
+        # Counted last to keep the window for trigger updates we overwrite short
+        for name, table in COUNTER_TABLES.items():
+            scalars[name] = (await self.session.execute(text(f"SELECT COUNT(*) FROM {table}"))).scalar() or 0
+
+        for name, value in scalars.items():
+            await self.session.execute(UPSERT_STAT, {"name": name, "value": value, "data": None})
+        for name, rows in breakdowns.items():
+            await self.session.execute(
+                UPSERT_STAT,
+                {"name": name, "value": len(rows), "data": json.dumps({"rows": rows})},
+            )
+        await self.session.commit()
+        invalidate_corpus_stats_cache()
+
+        return {**scalars, **breakdowns}
+
+    async def _estimated_counts(self) -> dict[str, int]:
+        """Get planner row estimates for the counter tables.
+
+        Returns:
+            Mapping of counter name to ``pg_class.reltuples`` (0 if never analyzed)
+        """
+        result = await self.session.execute(
+            text(
+                "SELECT relname, GREATEST(reltuples, 0)::bigint FROM pg_class "
+                "WHERE relkind IN ('r', 'p') AND relname = ANY(:tables)"
+            ),
+            {"tables": list(COUNTER_TABLES.values())},
+        )
+        by_table = {row[0]: row[1] for row in result}
+        return {
+            name: by_table[table]
+            for name, table in COUNTER_TABLES.items()
+            if table in by_table
+        }
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Read all statistics in a single query (plus one estimate query if needed).
+
+        Returns:
+            Dict with ``metrics`` (name -> value), ``sources`` (name ->
+            "counter" | "estimate") and ``updated_at`` (oldest refresh time)
+        """
+        result = await self.session.execute(
+            text("SELECT name, value, data, updated_at FROM corpus_stats")
+        )
+        rows = {row[0]: row for row in result}
+
+        metrics: dict[str, Any] = {}
+        sources: dict[str, str] = {}
+        updated: list[datetime] = []
+
+        for name in COUNTER_TABLES:
+            if name in rows:
+                metrics[name] = rows[name][1]
+                sources[name] = "counter"
+                updated.append(rows[name][3])
+
+        missing = [name for name in COUNTER_TABLES if name not in metrics]
+        if missing:
+            estimates = await self._estimated_counts()
+            for name in missing:
+                metrics[name] = estimates.get(name, 0)
+                sources[name] = "estimate"
+
+        for name in AGGREGATE_QUERIES:
+            metrics[name] = rows[name][1] if name in rows else 0
+            sources[name] = "counter" if name in rows else "missing"
+
+        repos = metrics["repos_tracked"]
+        metrics["avg_stars_per_repo"] = metrics["total_stars_tracked"] / repos if repos > 0 else 0
+
+        status_rows = _breakdown_rows(rows.get("llm_extractions_by_status"))
+        metrics["llm_extractions_by_status"] = {row[0]: row[1] for row in status_rows}
+        metrics["top_tasks"] = [
+            {"task": row[0], "count": row[1]}
+            for row in _breakdown_rows(rows.get("top_tasks"))
+        ]
+        metrics["top_datasets"] = [
+            {"dataset": row[0], "count": row[1]}
+            for row in _breakdown_rows(rows.get("top_datasets"))
+        ]
+
+        return {
+            "metrics": metrics,
+            "sources": sources,
+            "updated_at": min(updated).isoformat() if updated else None,
+        }
+
+
+def _breakdown_rows(row: Optional[Any]) -> list[list[Any]]:
+    """Extract stored breakdown rows from a ``corpus_stats`` row."""
+    if row is None or not row[2]:
+        return []
+    return row[2].get("rows", [])
+
+
+async def get_cached_corpus_stats(session: AsyncSession) -> dict[str, Any]:
+    """Get corpus statistics, reusing the last snapshot for ``CACHE_TTL`` seconds.
+
+    Args:
+        session: Database session (only used on cache miss)
+
+    Returns:
+        Same structure as :meth:`CorpusStatsService.get_stats`
+    """
+    global _cached_stats
+    now = time.monotonic()
+    if _cached_stats is not None and now - _cached_stats[0] < CACHE_TTL:
+        return _cached_stats[1]
+
+    stats = await CorpusStatsService(session).get_stats()
+    _cached_stats = (now, stats)
+    return stats
+
+
+def invalidate_corpus_stats_cache() -> None:
+    """Drop the in-process statistics snapshot."""
+    global _cached_stats
+    _cached_stats = None
+
+
+def _escape_label(value: Any) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus(metrics: dict[str, Any], prefix: str = "hypepaper") -> str:
+    """Render corpus metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: ``metrics`` dict from :meth:`CorpusStatsService.get_stats`
+        prefix: Metric name prefix
+
+    Returns:
+        Exposition text (one gauge per scalar, labelled series for breakdowns)
+    """
+    lines: list[str] = []
+
+    for name, value in metrics.items():
+        if isinstance(value, (int, float)):
+            metric = f"{prefix}_{name}"
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {value}")
+
+    labelled = {
+        "llm_extractions_by_status": (
+            "status",
+            list(metrics.get("llm_extractions_by_status", {}).items()),
+        ),
+        "top_tasks": (
+            "task",
+            [(row["task"], row["count"]) for row in metrics.get("top_tasks", [])],
+        ),
+        "top_datasets": (
+            "dataset",
+            [(row["dataset"], row["count"]) for row in metrics.get("top_datasets", [])],
+        ),
+    }
+    for name, (label, series) in labelled.items():
+        metric = f"{prefix}_{name}"
+        lines.append(f"# TYPE {metric} gauge")
+        for label_value, count in series:
+            lines.append(f'{metric}{{{label}="{_escape_label(label_value)}"}} {count}')
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,142 @@
+"""
+Cached LLM metadata extraction.
+
+Wraps ``AsyncLLMService.extract_metadata`` with a result store keyed by
+(PDF sha256, prompt hash, model id), so re-running enrichment only spends
+LLM time on new PDFs, changed prompts or a different model.
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import LLMExtractionCache
+from .llm_service import AsyncLLMService
+
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of a file's contents.
+
+    Args:
+        path: File path
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def prompt_hash(prompt: str) -> str:
+    """
+    SHA-256 of a prompt (surrounding whitespace ignored).
+
+    Args:
+        prompt: Extraction prompt
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.sha256(prompt.strip().encode('utf-8')).hexdigest()
+
+
+class ExtractionCacheService:
+    """
+    LLM extraction results stored by (PDF, prompt, model).
+
+    Error results (dicts with an ``error`` key) are never stored, so failed
+    extractions are retried on the next run.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service with database session."""
+        self.session = session
+
+    async def get(self, pdf_sha256: str, prompt_digest: str, model_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored extraction result.
+
+        Args:
+            pdf_sha256: PDF content hash
+            prompt_digest: Prompt hash
+            model_id: Provider-qualified model id
+
+        Returns:
+            Stored result or None
+        """
+        result = await self.session.execute(
+            select(LLMExtractionCache.result).where(
+                LLMExtractionCache.pdf_sha256 == pdf_sha256,
+                LLMExtractionCache.prompt_hash == prompt_digest,
+                LLMExtractionCache.model_id == model_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def put(self, pdf_sha256: str, prompt_digest: str, model_id: str, result: Dict[str, Any]) -> None:
+        """
+        Store (or replace) an extraction result.
+
+        Args:
+            pdf_sha256: PDF content hash
+            prompt_digest: Prompt hash
+            model_id: Provider-qualified model id
+            result: Parsed extraction result
+        """
+        stmt = pg_insert(LLMExtractionCache).values(
+            pdf_sha256=pdf_sha256,
+            prompt_hash=prompt_digest,
+            model_id=model_id,
+            result=result,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['pdf_sha256', 'prompt_hash', 'model_id'],
+            set_={'result': stmt.excluded.result},
+        )
+        await self.session.execute(stmt)
+
+    async def extract(
+        self,
+        llm_service: AsyncLLMService,
+        pdf_path: Path,
+        prompt: str,
+        pdf_sha256: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Extract metadata, reusing a stored result for identical inputs.
+
+        Args:
+            llm_service: LLM backend
+            pdf_path: Path to PDF file
+            prompt: Extraction prompt
+            pdf_sha256: Precomputed PDF hash (computed if omitted)
+
+        Returns:
+            Tuple of (result, whether it came from the store)
+        """
+        pdf_sha256 = pdf_sha256 or file_sha256(pdf_path)
+        prompt_digest = prompt_hash(prompt)
+        model_id = llm_service.model_id
+
+        cached = await self.get(pdf_sha256, prompt_digest, model_id)
+        if cached is not None:
+            logger.info(f"Reusing cached extraction ({model_id}, pdf {pdf_sha256[:12]})")
+            return cached, True
+
+        result = await llm_service.extract_metadata(pdf_path, prompt)
+        if not (isinstance(result, dict) and 'error' in result):
+            await self.put(pdf_sha256, prompt_digest, model_id, result)
+        return result, False
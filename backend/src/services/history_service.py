@@ -0,0 +1,339 @@
+"""Range-adaptive star and metric history.
+
+Daily points come from the raw snapshot tables; weekly and monthly points
+come from the ``*_history_weekly`` / ``*_history_monthly`` aggregates
+(TimescaleDB continuous aggregates, or plain materialized views refreshed by
+the scheduler). With ``bucket="auto"`` the narrowest bucket that keeps the
+range under ``max_points`` is used, so a multi-year chart reads a few hundred
+pre-aggregated rows instead of thousands of daily snapshots.
+
+Point-capped responses can additionally be downsampled with LTTB
+(Largest-Triangle-Three-Buckets), which keeps the visual shape of the series.
+"""
+import logging
+from datetime import date, timedelta
+from typing import Any, Callable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import GitHubStarSnapshot, MetricSnapshot
+
+logger = logging.getLogger(__name__)
+
+BUCKETS = ("day", "week", "month")
+BUCKET_DAYS = {"day": 1, "week": 7, "month": 30}
+
+# Default point budget for auto bucket selection
+DEFAULT_MAX_POINTS = 400
+
+# Aggregate views by bucket (kept in sync with the add_history_aggregates migration)
+STAR_HISTORY_VIEWS = {
+    "week": table(
+        "star_history_weekly",
+        column("paper_id"), column("bucket"), column("stars"), column("samples"),
+    ),
+    "month": table(
+        "star_history_monthly",
+        column("paper_id"), column("bucket"), column("stars"), column("samples"),
+    ),
+}
+METRIC_HISTORY_VIEWS = {
+    "week": table(
+        "metric_history_weekly",
+        column("paper_id"), column("bucket"), column("github_stars"),
+        column("citation_count"), column("vote_count"), column("hype_score"),
+    ),
+    "month": table(
+        "metric_history_monthly",
+        column("paper_id"), column("bucket"), column("github_stars"),
+        column("citation_count"), column("vote_count"), column("hype_score"),
+    ),
+}
+
+
+def choose_bucket(
+    start_date: date,
+    end_date: date,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> str:
+    """Pick the narrowest bucket that keeps a date range under ``max_points``.
+
+    Args:
+        start_date: Start of range (inclusive)
+        end_date: End of range (inclusive)
+        max_points: Point budget
+
+    Returns:
+        "day", "week" or "month"
+    """
+    days = (end_date - start_date).days + 1
+    for bucket in BUCKETS[:-1]:
+        if days / BUCKET_DAYS[bucket] <= max_points:
+            return bucket
+    return BUCKETS[-1]
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    """Start of the bucket containing ``day`` (weeks start on Monday)."""
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> list[int]:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        xs: Monotonic x values
+        ys: y values
+        threshold: Number of points to keep (first and last always kept)
+
+    Returns:
+        Indices of the points to keep, in ascending order
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_len = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / avg_len
+        avg_y = sum(ys[avg_start:avg_end]) / avg_len
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+
+        ax, ay = xs[a], ys[a]
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        selected.append(next_a)
+        a = next_a
+
+    selected.append(n - 1)
+    return selected
+
+
+def downsample(
+    points: list[dict[str, Any]],
+    max_points: int,
+    value: Callable[[dict[str, Any]], Optional[float]],
+) -> list[dict[str, Any]]:
+    """Downsample date-keyed points to at most ``max_points`` with LTTB.
+
+    Args:
+        points: Points with a ``date`` key, ordered by date
+        max_points: Point cap
+        value: Extracts the y value (None counts as 0)
+
+    Returns:
+        Selected points
+    """
+    if len(points) <= max_points:
+        return points
+    xs = [point["date"].toordinal() for point in points]
+    ys = [value(point) or 0 for point in points]
+    return [points[i] for i in lttb(xs, ys, max_points)]
+
+
+class HistoryService:
+    """Bucketed star and metric history queries."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service with database session."""
+        self.session = session
+
+    @staticmethod
+    def _resolve_bucket(
+        bucket: str, start_date: date, end_date: date, max_points: Optional[int]
+    ) -> str:
+        if bucket == "auto":
+            return choose_bucket(start_date, end_date, max_points or DEFAULT_MAX_POINTS)
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unknown bucket: {bucket}")
+        return bucket
+
+    async def get_star_history(
+        self,
+        paper_id: UUID,
+        start_date: date,
+        end_date: Optional[date] = None,
+        bucket: str = "auto",
+        max_points: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Get star history for a paper.
+
+        Args:
+            paper_id: Paper UUID
+            start_date: Start of range (inclusive)
+            end_date: End of range (inclusive, default today)
+            bucket: "day", "week", "month" or "auto"
+            max_points: Optional point cap (LTTB downsampling)
+
+        Returns:
+            Points ``{"date", "stars", "delta"}`` ordered by date; ``date`` is
+            the bucket start and ``stars`` the last count in the bucket
+        """
+        end_date = end_date or date.today()
+        bucket = self._resolve_bucket(bucket, start_date, end_date, max_points)
+
+        if bucket == "day":
+            query = (
+                select(
+                    GitHubStarSnapshot.snapshot_date.label("bucket"),
+                    GitHubStarSnapshot.star_count.label("stars"),
+                )
+                .where(
+                    GitHubStarSnapshot.paper_id == paper_id,
+                    GitHubStarSnapshot.snapshot_date >= start_date,
+                    GitHubStarSnapshot.snapshot_date <= end_date,
+                )
+                .order_by(GitHubStarSnapshot.snapshot_date.asc())
+            )
+        else:
+            view = STAR_HISTORY_VIEWS[bucket]
+            query = (
+                select(view.c.bucket, view.c.stars)
+                .where(
+                    view.c.paper_id == paper_id,
+                    view.c.bucket >= bucket_start(start_date, bucket),
+                    view.c.bucket <= end_date,
+                )
+                .order_by(view.c.bucket.asc())
+            )
+
+        result = await self.session.execute(query)
+
+        points = []
+        previous = None
+        for row in result:
+            points.append({
+                "date": row.bucket,
+                "stars": row.stars,
+                "delta": None if previous is None else row.stars - previous,
+            })
+            previous = row.stars
+
+        if max_points:
+            points = downsample(points, max_points, lambda point: point["stars"])
+        return points
+
+    async def get_metric_history(
+        self,
+        paper_id: UUID,
+        start_date: date,
+        end_date: Optional[date] = None,
+        bucket: str = "auto",
+        max_points: Optional[int] = None,
+        value: str = "github_stars",
+    ) -> list[dict[str, Any]]:
+        """Get metric snapshot history for a paper.
+
+        Args:
+            paper_id: Paper UUID
+            start_date: Start of range (inclusive)
+            end_date: End of range (inclusive, default today)
+            bucket: "day", "week", "month" or "auto"
+            max_points: Optional point cap (LTTB downsampling)
+            value: Metric that drives LTTB point selection
+
+        Returns:
+            Points ``{"date", "github_stars", "citation_count", "vote_count",
+            "hype_score"}`` ordered by date. Aggregated buckets carry the last
+            counts in the bucket and the mean hype score.
+        """
+        end_date = end_date or date.today()
+        bucket = self._resolve_bucket(bucket, start_date, end_date, max_points)
+
+        if bucket == "day":
+            query = (
+                select(
+                    MetricSnapshot.snapshot_date.label("bucket"),
+                    MetricSnapshot.github_stars,
+                    MetricSnapshot.citation_count,
+                    MetricSnapshot.vote_count,
+                    MetricSnapshot.hype_score,
+                )
+                .where(
+                    MetricSnapshot.paper_id == paper_id,
+                    MetricSnapshot.snapshot_date >= start_date,
+                    MetricSnapshot.snapshot_date <= end_date,
+                )
+                .order_by(MetricSnapshot.snapshot_date.asc())
+            )
+        else:
+            view = METRIC_HISTORY_VIEWS[bucket]
+            query = (
+                select(
+                    view.c.bucket,
+                    view.c.github_stars,
+                    view.c.citation_count,
+                    view.c.vote_count,
+                    view.c.hype_score,
+                )
+                .where(
+                    view.c.paper_id == paper_id,
+                    view.c.bucket >= bucket_start(start_date, bucket),
+                    view.c.bucket <= end_date,
+                )
+                .order_by(view.c.bucket.asc())
+            )
+
+        result = await self.session.execute(query)
+        points = [
+            {
+                "date": row.bucket,
+                "github_stars": row.github_stars,
+                "citation_count": row.citation_count,
+                "vote_count": row.vote_count,
+                "hype_score": row.hype_score,
+            }
+            for row in result
+        ]
+
+        if max_points:
+            points = downsample(points, max_points, lambda point: point[value])
+        return points
+
+    async def refresh_aggregates(self) -> list[str]:
+        """Refresh the history aggregates that are plain materialized views.
+
+        Continuous aggregates are refreshed by their TimescaleDB policies and
+        are skipped.
+
+        Returns:
+            Names of the refreshed views
+        """
+        names = [
+            view.name
+            for views in (STAR_HISTORY_VIEWS, METRIC_HISTORY_VIEWS)
+            for view in views.values()
+        ]
+        result = await self.session.execute(
+            text("SELECT matviewname FROM pg_matviews WHERE matviewname = ANY(:names)"),
+            {"names": names},
+        )
+        refreshed = [row.matviewname for row in result]
+
+        for name in refreshed:
+            await self.session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+        await self.session.commit()
+
+        logger.info(f"Refreshed history aggregates: {', '.join(refreshed) or 'none'}")
+        return refreshed
@@ -13,8 +13,25 @@ hype_score = (
 Where log_component uses logarithmic scaling to prevent domination by outliers.
 """
 import math
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+# Component weights
+GITHUB_WEIGHT = 0.40
+CITATION_WEIGHT = 0.30
+VOTE_WEIGHT = 0.20
+RECENCY_WEIGHT = 0.10
+
+# Recency half-life in days
+RECENCY_HALF_LIFE = 365.0
+
+# Trend label thresholds on 7-day star growth rate
+# (same as HypeScoreService._get_trend_label)
+TREND_RISING_THRESHOLD = 0.1
+TREND_DECLINING_THRESHOLD = -0.05
 
 
 def calculate_log_component(value: int, base: float = 10) -> float:
@@ -81,8 +98,7 @@ def calculate_recency_component(published_date: date) -> float:
 
     # Exponential decay: score = 2^(-days / half_life)
     # Half-life = 365 days (1 year)
-    half_life = 365.0
-    recency_score = math.pow(2, -days_since_publication / half_life)
+    recency_score = math.pow(2, -days_since_publication / RECENCY_HALF_LIFE)
 
     return max(0.0, min(recency_score, 1.0))
 
@@ -117,22 +133,22 @@ def calculate_hype_score(
     # GitHub component (40%)
     github_component = 0.0
     if github_stars is not None:
-        github_component = 0.40 * calculate_log_component(github_stars, base=10)
+        github_component = GITHUB_WEIGHT * calculate_log_component(github_stars, base=10)
 
     # Citation component (30%)
     citation_component = 0.0
     if citation_count is not None:
-        citation_component = 0.30 * calculate_log_component(citation_count, base=10)
+        citation_component = CITATION_WEIGHT * calculate_log_component(citation_count, base=10)
 
     # Vote component (20%)
     vote_component_value = 0.0
     if vote_count is not None:
-        vote_component_value = 0.20 * calculate_vote_component(vote_count)
+        vote_component_value = VOTE_WEIGHT * calculate_vote_component(vote_count)
 
     # Recency component (10%)
     recency_component_value = 0.0
     if published_date is not None:
-        recency_component_value = 0.10 * calculate_recency_component(published_date)
+        recency_component_value = RECENCY_WEIGHT * calculate_recency_component(published_date)
 
     hype_score = (
         github_component +
@@ -144,6 +160,126 @@ def calculate_hype_score(
     return max(0.0, hype_score)
 
 
+@dataclass
+class HypeScoreBatch:
+    """Vectorized hype scores for a batch of papers.
+
+    Component arrays hold the *weighted* contributions, so
+    ``score == max(0, github + citations + votes + recency)`` element-wise.
+    """
+
+    score: np.ndarray
+    github: np.ndarray
+    citations: np.ndarray
+    votes: np.ndarray
+    recency: np.ndarray
+    trend_label: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+
+def _as_float_array(values: Any, size: Optional[int] = None) -> np.ndarray:
+    """Convert a metric column to float64, mapping ``None`` to NaN (missing)."""
+    if values is None:
+        return np.full(size or 0, np.nan)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _log_component_batch(values: np.ndarray, base: float) -> np.ndarray:
+    """Vectorized :func:`calculate_log_component` (NaN propagates)."""
+    max_log = 10.0 if base == 2 else 5.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_value = np.log(np.where(values < 0, 0.0, values) + 1) / math.log(base)
+    component = np.minimum(log_value / max_log, 1.0)
+    return np.where(values < 0, 0.0, component)
+
+
+def trend_labels_batch(star_growth_7d: Any) -> np.ndarray:
+    """Vectorized trend labels from 7-day star growth rates.
+
+    Args:
+        star_growth_7d: Array-like of growth rates
+
+    Returns:
+        Array of "rising", "stable" or "declining"
+    """
+    growth = np.asarray(star_growth_7d, dtype=np.float64)
+    labels = np.full(growth.shape, "stable", dtype=object)
+    labels[growth > TREND_RISING_THRESHOLD] = "rising"
+    labels[growth < TREND_DECLINING_THRESHOLD] = "declining"
+    return labels
+
+
+def calculate_hype_scores_batch(
+    github_stars: Any = None,
+    citation_counts: Any = None,
+    vote_counts: Any = None,
+    published_ordinals: Any = None,
+    star_growth_7d: Any = None,
+    today: Optional[date] = None,
+) -> HypeScoreBatch:
+    """Calculate hype scores for many papers at once with NumPy.
+
+    Equivalent to calling :func:`calculate_hype_score` per paper (to within
+    floating-point rounding of the vectorized ``log``/``exp2``). Missing
+    metrics are passed as ``None`` entries or NaN and contribute 0.0, like
+    ``None`` arguments to the scalar function.
+
+    Args:
+        github_stars: Array-like of star counts
+        citation_counts: Array-like of citation counts
+        vote_counts: Array-like of net vote counts
+        published_ordinals: Array-like of ``date.toordinal()`` values
+        star_growth_7d: Optional array-like of 7-day star growth rates for
+            trend labels
+        today: Reference date for recency (default: today)
+
+    Returns:
+        HypeScoreBatch with scores, weighted components and trend labels
+    """
+    columns = [github_stars, citation_counts, vote_counts, published_ordinals]
+    size = next((len(c) for c in columns if c is not None), 0)
+
+    stars = _as_float_array(github_stars, size)
+    citations = _as_float_array(citation_counts, size)
+    votes = _as_float_array(vote_counts, size)
+    published = _as_float_array(published_ordinals, size)
+
+    github_component = GITHUB_WEIGHT * _log_component_batch(stars, base=10)
+    citation_component = CITATION_WEIGHT * _log_component_batch(citations, base=10)
+
+    # Non-positive net votes score zero
+    vote_component = VOTE_WEIGHT * np.where(
+        votes <= 0, 0.0, _log_component_batch(votes, base=2)
+    )
+
+    today_ordinal = (today or date.today()).toordinal()
+    days = today_ordinal - published
+    recency = np.clip(np.exp2(-days / RECENCY_HALF_LIFE), 0.0, 1.0)
+    recency_component = RECENCY_WEIGHT * recency
+
+    # Missing metrics contribute nothing
+    github_component = np.nan_to_num(github_component, nan=0.0)
+    citation_component = np.nan_to_num(citation_component, nan=0.0)
+    vote_component = np.nan_to_num(vote_component, nan=0.0)
+    recency_component = np.nan_to_num(recency_component, nan=0.0)
+
+    score = np.maximum(
+        github_component + citation_component + vote_component + recency_component,
+        0.0,
+    )
+
+    return HypeScoreBatch(
+        score=score,
+        github=github_component,
+        citations=citation_component,
+        votes=vote_component,
+        recency=recency_component,
+        trend_label=None if star_growth_7d is None else trend_labels_batch(star_growth_7d),
+    )
+
+
 class HypeScoreService:
     """Service for calculating and updating paper hype scores."""
 
@@ -168,6 +304,31 @@ class HypeScoreService:
             published_date=paper.published_date
         )
 
+    @staticmethod
+    def calculate_for_papers(papers: Sequence[Any]) -> np.ndarray:
+        """Calculate hype scores for many Paper model instances in one pass.
+
+        Args:
+            papers: Paper model instances (with github_metrics loaded)
+
+        Returns:
+            np.ndarray: Hype scores in the same order as ``papers``
+        """
+        stars = [
+            paper.github_metrics.current_stars if paper.github_metrics else None
+            for paper in papers
+        ]
+        published = [
+            paper.published_date.toordinal() if paper.published_date else None
+            for paper in papers
+        ]
+        return calculate_hype_scores_batch(
+            github_stars=stars,
+            citation_counts=[paper.citation_count for paper in papers],
+            vote_counts=[paper.vote_count for paper in papers],
+            published_ordinals=published,
+        ).score
+
     @staticmethod
     def calculate_for_snapshot(
         github_stars: Optional[int],
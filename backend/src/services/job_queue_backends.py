@@ -0,0 +1,677 @@
+"""
+Async queue backends for JobQueueService.
+
+Three drivers implement :class:`QueueBackend`:
+
+- ``UpstashQueueBackend``: Upstash REST API via ``upstash_redis.asyncio``
+  (the Cloudflare crawler worker consumes the same keys);
+- ``RedisQueueBackend``: a native Redis server via ``redis.asyncio``;
+- ``SqlQueueBackend``: the ``job_queue`` table, dequeued with
+  ``FOR UPDATE SKIP LOCKED`` on Postgres (SQLite for local runs).
+
+All of them enqueue many jobs in one round trip, dequeue in batches in
+priority order (high, normal, low; FIFO within a priority), and lease
+dequeued jobs for a visibility timeout: jobs that are not completed before
+it expires are delivered again (with ``retry_count`` incremented) until they
+have been delivered ``JOB_QUEUE_MAX_ATTEMPTS`` times, after which they are
+marked failed and dead-lettered. ``JOB_QUEUE_BACKEND`` (``upstash``,
+``redis`` or ``sql``) selects the driver; see :func:`get_queue_backend`.
+"""
+import json
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from ..models import QueuedJob
+
+PRIORITIES = {"low": 0, "normal": 1, "high": 2}
+
+# Job metadata (status) lifetime in seconds
+JOB_METADATA_TTL = 3600
+
+# Job result lifetime in seconds (matches the crawler worker)
+JOB_RESULT_TTL = 86400
+
+# Default seconds a dequeued job stays invisible before redelivery
+DEFAULT_VISIBILITY_TIMEOUT = int(os.getenv("JOB_QUEUE_VISIBILITY_TIMEOUT", "300"))
+
+# Deliveries before a job whose lease keeps expiring is failed and
+# dead-lettered (the crawler worker likewise retries a failing job 3 times)
+MAX_JOB_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "4"))
+
+# Jobs per enqueue script call
+ENQUEUE_CHUNK_SIZE = 500
+
+FINAL_STATES = ("success", "failed")
+
+
+def new_job(
+    job_id: str,
+    job_type: str,
+    params: Dict[str, Any],
+    user_id: Optional[str] = None,
+    priority: str = "normal",
+) -> Dict[str, Any]:
+    """
+    Build a job payload.
+
+    Args:
+        job_id: Job ID
+        job_type: Type of crawler job
+        params: Job parameters
+        user_id: Optional submitting user ID
+        priority: 'high', 'normal' or 'low'
+
+    Returns:
+        Job payload dict
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Invalid priority: {priority}. Must be one of: {', '.join(PRIORITIES)}")
+    return {
+        "id": job_id,
+        "type": job_type,
+        "params": params,
+        "user_id": user_id,
+        "created_at": datetime.utcnow().isoformat(),
+        "retry_count": 0,
+        "priority": priority,
+    }
+
+
+class QueueBackend(ABC):
+    """Storage and delivery of crawler jobs."""
+
+    @abstractmethod
+    async def enqueue_many(self, jobs: Sequence[Dict[str, Any]]) -> int:
+        """
+        Enqueue jobs (built with :func:`new_job`) in one round trip.
+
+        Returns:
+            Number of jobs enqueued
+        """
+
+    @abstractmethod
+    async def dequeue(
+        self,
+        count: int,
+        visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT,
+        max_attempts: int = MAX_JOB_ATTEMPTS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Lease up to ``count`` jobs, highest priority first.
+
+        Jobs whose previous lease expired are delivered again with
+        ``retry_count`` incremented; once a job has been delivered
+        ``max_attempts`` times an expired lease fails it instead.
+
+        Returns:
+            Job payloads
+        """
+
+    @abstractmethod
+    async def complete(
+        self,
+        job_id: str,
+        status: str,
+        results: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Finish a leased job and store its result.
+
+        Args:
+            job_id: Job ID
+            status: 'success' or 'failed'
+            results: Job results
+            error: Error message for failed jobs
+        """
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job payload with its current status, or None."""
+
+    @abstractmethod
+    async def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Result of a finished job, or None."""
+
+    @abstractmethod
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or processing job; True if it was cancelled."""
+
+    @abstractmethod
+    async def counts(self) -> Dict[str, int]:
+        """Job counts per state (and queued jobs per priority)."""
+
+    async def close(self) -> None:
+        """Release connections (nothing to release by default)."""
+        return None
+
+
+# Redis key layout (shared with workers/crawler-worker)
+QUEUE_KEYS = {"high": "crawler:queue:high", "normal": "crawler:queue", "low": "crawler:queue:low"}
+JOB_KEY_PREFIX = "crawler:job:"
+RESULT_KEY_PREFIX = "crawler:result:"
+INFLIGHT_KEY = "crawler:inflight"
+INFLIGHT_JOBS_KEY = "crawler:inflight:jobs"
+STATS_KEY = "crawler:stats"
+DEAD_LETTER_KEY = "crawler:dead"
+
+# Error recorded for jobs failed by the attempt cap
+LEASE_EXPIRED_ERROR = "Lease expired after {attempts} delivery attempts"
+
+# KEYS: (queue, metadata) per job; ARGV: ttl, then (payload, metadata) per job
+ENQUEUE_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+for i = 1, #KEYS / 2 do
+    redis.call('RPUSH', KEYS[2 * i - 1], ARGV[2 * i])
+    redis.call('SET', KEYS[2 * i], ARGV[2 * i + 1], 'EX', ttl)
+end
+return #KEYS / 2
+"""
+
+# KEYS: high, normal, low queues, in-flight zset, in-flight payload hash,
+# dead-letter list, stats
+# ARGV: count, lease deadline, now, metadata prefix, metadata ttl, started_at,
+# max attempts, result prefix, result ttl, expired-lease error
+# Metadata and result keys are derived from job ids, so this needs a
+# single-node Redis (as Upstash and the default deployment are).
+DEQUEUE_SCRIPT = """
+local function queue_for(job)
+    if job.priority == 'high' then return KEYS[1] end
+    if job.priority == 'low' then return KEYS[3] end
+    return KEYS[2]
+end
+
+local max_attempts = tonumber(ARGV[7])
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[4], '-inf', ARGV[3])) do
+    local payload = redis.call('HGET', KEYS[5], id)
+    redis.call('ZREM', KEYS[4], id)
+    redis.call('HDEL', KEYS[5], id)
+    if payload then
+        local job = cjson.decode(payload)
+        job.retry_count = (tonumber(job.retry_count) or 0) + 1
+        if job.retry_count >= max_attempts then
+            job.status = 'failed'
+            job.error = ARGV[10]
+            job.failed_at = ARGV[6]
+            redis.call('RPUSH', KEYS[6], cjson.encode(job))
+            redis.call('SET', ARGV[8] .. id, cjson.encode({
+                job_id = id, status = 'failed', results = cjson.null,
+                error = ARGV[10], processed_at = ARGV[6],
+            }), 'EX', tonumber(ARGV[9]))
+            redis.call('DEL', ARGV[4] .. id)
+            redis.call('HINCRBY', KEYS[7], 'failed', 1)
+        else
+            redis.call('LPUSH', queue_for(job), cjson.encode(job))
+        end
+    end
+end
+
+local count = tonumber(ARGV[1])
+local leased = {}
+for q = 1, 3 do
+    while #leased < count do
+        local payload = redis.call('LPOP', KEYS[q])
+        if not payload then break end
+        local job = cjson.decode(payload)
+        local meta_key = ARGV[4] .. job.id
+        local meta = redis.call('GET', meta_key)
+        if not (meta and cjson.decode(meta).status == 'cancelled') then
+            redis.call('ZADD', KEYS[4], ARGV[2], job.id)
+            redis.call('HSET', KEYS[5], job.id, payload)
+            job.status = 'processing'
+            job.started_at = ARGV[6]
+            redis.call('SET', meta_key, cjson.encode(job), 'EX', tonumber(ARGV[5]))
+            table.insert(leased, payload)
+        end
+    end
+end
+return leased
+"""
+
+# KEYS: in-flight zset, in-flight hash, result, metadata, stats
+# ARGV: job id, result json, result ttl, status
+COMPLETE_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('SET', KEYS[3], ARGV[2], 'EX', tonumber(ARGV[3]))
+redis.call('DEL', KEYS[4])
+redis.call('HINCRBY', KEYS[5], ARGV[4], 1)
+return 1
+"""
+
+# KEYS: metadata, stats, in-flight zset, in-flight hash; ARGV: job id, ttl, cancelled_at
+CANCEL_SCRIPT = """
+local meta = redis.call('GET', KEYS[1])
+if not meta then return 0 end
+local job = cjson.decode(meta)
+if job.status ~= 'queued' and job.status ~= 'processing' then return 0 end
+job.status = 'cancelled'
+job.cancelled_at = ARGV[3]
+redis.call('SET', KEYS[1], cjson.encode(job), 'EX', tonumber(ARGV[2]))
+redis.call('ZREM', KEYS[3], ARGV[1])
+redis.call('HDEL', KEYS[4], ARGV[1])
+redis.call('HINCRBY', KEYS[2], 'cancelled', 1)
+return 1
+"""
+
+# KEYS: high, normal, low queues, in-flight zset, stats, dead-letter list; ARGV: now
+COUNTS_SCRIPT = """
+local counts = {
+    redis.call('LLEN', KEYS[1]),
+    redis.call('LLEN', KEYS[2]),
+    redis.call('LLEN', KEYS[3]),
+    redis.call('ZCARD', KEYS[4]),
+    redis.call('ZCOUNT', KEYS[4], '-inf', ARGV[1]),
+    redis.call('LLEN', KEYS[6]),
+}
+for _, value in ipairs(redis.call('HGETALL', KEYS[5])) do
+    table.insert(counts, value)
+end
+return counts
+"""
+
+
+class RedisQueueBackend(QueueBackend):
+    """Queue in a Redis server (``redis.asyncio``), one script call per operation."""
+
+    def __init__(self, client: Any):
+        """
+        Initialize backend.
+
+        Args:
+            client: ``redis.asyncio.Redis`` client
+        """
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisQueueBackend":
+        """Create a backend from a ``redis://`` URL."""
+        import redis.asyncio as redis
+
+        return cls(redis.from_url(url, decode_responses=True))
+
+    async def _eval(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        return await self.client.eval(script, len(keys), *keys, *args)
+
+    async def _get_json(self, key: str) -> Optional[Dict[str, Any]]:
+        value = await self.client.get(key)
+        return json.loads(value) if value else None
+
+    async def enqueue_many(self, jobs: Sequence[Dict[str, Any]]) -> int:
+        for start in range(0, len(jobs), ENQUEUE_CHUNK_SIZE):
+            keys: List[str] = []
+            args: List[Any] = [JOB_METADATA_TTL]
+            for job in jobs[start:start + ENQUEUE_CHUNK_SIZE]:
+                keys += [QUEUE_KEYS[job["priority"]], f"{JOB_KEY_PREFIX}{job['id']}"]
+                args += [json.dumps(job), json.dumps({**job, "status": "queued"})]
+            await self._eval(ENQUEUE_SCRIPT, keys, args)
+        return len(jobs)
+
+    async def dequeue(
+        self,
+        count: int,
+        visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT,
+        max_attempts: int = MAX_JOB_ATTEMPTS,
+    ) -> List[Dict[str, Any]]:
+        now = datetime.utcnow()
+        payloads = await self._eval(
+            DEQUEUE_SCRIPT,
+            [QUEUE_KEYS["high"], QUEUE_KEYS["normal"], QUEUE_KEYS["low"], INFLIGHT_KEY, INFLIGHT_JOBS_KEY,
+             DEAD_LETTER_KEY, STATS_KEY],
+            [count, now.timestamp() + visibility_timeout, now.timestamp(),
+             JOB_KEY_PREFIX, JOB_METADATA_TTL, now.isoformat(),
+             max_attempts, RESULT_KEY_PREFIX, JOB_RESULT_TTL, LEASE_EXPIRED_ERROR.format(attempts=max_attempts)],
+        )
+        return [json.loads(payload) for payload in payloads or []]
+
+    async def complete(
+        self,
+        job_id: str,
+        status: str,
+        results: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        if status not in FINAL_STATES:
+            raise ValueError(f"Invalid status: {status}. Must be 'success' or 'failed'")
+        result = {
+            "job_id": job_id,
+            "status": status,
+            "results": results,
+            "error": error,
+            "processed_at": datetime.utcnow().isoformat(),
+        }
+        await self._eval(
+            COMPLETE_SCRIPT,
+            [INFLIGHT_KEY, INFLIGHT_JOBS_KEY, f"{RESULT_KEY_PREFIX}{job_id}", f"{JOB_KEY_PREFIX}{job_id}", STATS_KEY],
+            [job_id, json.dumps(result), JOB_RESULT_TTL, status],
+        )
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self._get_json(f"{JOB_KEY_PREFIX}{job_id}")
+
+    async def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self._get_json(f"{RESULT_KEY_PREFIX}{job_id}")
+
+    async def cancel(self, job_id: str) -> bool:
+        cancelled = await self._eval(
+            CANCEL_SCRIPT,
+            [f"{JOB_KEY_PREFIX}{job_id}", STATS_KEY, INFLIGHT_KEY, INFLIGHT_JOBS_KEY],
+            [job_id, JOB_METADATA_TTL, datetime.utcnow().isoformat()],
+        )
+        return bool(int(cancelled))
+
+    async def counts(self) -> Dict[str, int]:
+        values = await self._eval(
+            COUNTS_SCRIPT,
+            [QUEUE_KEYS["high"], QUEUE_KEYS["normal"], QUEUE_KEYS["low"], INFLIGHT_KEY, STATS_KEY,
+             DEAD_LETTER_KEY],
+            [datetime.utcnow().timestamp()],
+        )
+        high, normal, low, processing, expired, dead = (int(value) for value in values[:6])
+        totals = values[6:]
+        counts = {
+            "queued": high + normal + low,
+            "queued_high": high,
+            "queued_normal": normal,
+            "queued_low": low,
+            "processing": processing,
+            "expired": expired,
+            "dead_lettered": dead,
+            "success": 0,
+            "failed": 0,
+            "cancelled": 0,
+        }
+        counts.update({totals[i]: int(totals[i + 1]) for i in range(0, len(totals), 2)})
+        return counts
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class UpstashQueueBackend(RedisQueueBackend):
+    """Queue in Upstash Redis over its REST API (``upstash_redis.asyncio``)."""
+
+    @classmethod
+    def from_env(cls) -> "UpstashQueueBackend":
+        """Create a backend from ``UPSTASH_REDIS_REST_URL``/``UPSTASH_REDIS_REST_TOKEN``."""
+        from upstash_redis.asyncio import Redis
+
+        redis_url = os.getenv("UPSTASH_REDIS_REST_URL")
+        redis_token = os.getenv("UPSTASH_REDIS_REST_TOKEN")
+        if not redis_url or not redis_token:
+            raise ValueError(
+                "UPSTASH_REDIS_REST_URL and UPSTASH_REDIS_REST_TOKEN must be set"
+            )
+        return cls(Redis(url=redis_url, token=redis_token))
+
+    async def _eval(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        return await self.client.eval(script, keys=keys, args=args)
+
+
+class SqlQueueBackend(QueueBackend):
+    """Queue in the ``job_queue`` table (``SKIP LOCKED`` on Postgres)."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        create_schema: bool = False,
+        engine: Optional[AsyncEngine] = None,
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            session_factory: Async session factory
+            create_schema: Create the job_queue table on first use (local SQLite)
+            engine: Engine owned by the backend, disposed on close
+        """
+        self.session_factory = session_factory
+        self._create_schema = create_schema
+        self._engine = engine
+
+    @classmethod
+    def from_url(cls, url: Optional[str] = None) -> "SqlQueueBackend":
+        """
+        Create a backend.
+
+        Args:
+            url: Database URL (e.g. ``sqlite+aiosqlite:///./job_queue.db``);
+                None uses the application database
+
+        Returns:
+            SqlQueueBackend
+        """
+        if not url:
+            from ..database import AsyncSessionLocal
+
+            return cls(AsyncSessionLocal)
+        engine = create_async_engine(url)
+        return cls(async_sessionmaker(engine, expire_on_commit=False), create_schema=True, engine=engine)
+
+    async def _session(self) -> AsyncSession:
+        session = self.session_factory()
+        if self._create_schema:
+            connection = await session.connection()
+            await connection.run_sync(QueuedJob.__table__.create, checkfirst=True)
+            await session.commit()
+            self._create_schema = False
+        return session
+
+    @staticmethod
+    def _payload(job: QueuedJob) -> Dict[str, Any]:
+        return {
+            "id": job.id,
+            "type": job.job_type,
+            "params": job.params,
+            "user_id": job.user_id,
+            "created_at": job.created_at.isoformat(),
+            "retry_count": max(job.attempts - 1, 0),
+            "priority": next(name for name, value in PRIORITIES.items() if value == job.priority),
+        }
+
+    async def enqueue_many(self, jobs: Sequence[Dict[str, Any]]) -> int:
+        if not jobs:
+            return 0
+        async with await self._session() as session:
+            session.add_all([
+                QueuedJob(
+                    id=job["id"],
+                    job_type=job["type"],
+                    params=job["params"],
+                    user_id=job["user_id"],
+                    priority=PRIORITIES[job["priority"]],
+                    status="queued",
+                    attempts=0,
+                    created_at=datetime.fromisoformat(job["created_at"]),
+                )
+                for job in jobs
+            ])
+            await session.commit()
+        return len(jobs)
+
+    async def dequeue(
+        self,
+        count: int,
+        visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT,
+        max_attempts: int = MAX_JOB_ATTEMPTS,
+    ) -> List[Dict[str, Any]]:
+        now = datetime.utcnow()
+        expired = and_(QueuedJob.status == "processing", QueuedJob.visible_at <= now)
+        candidates = (
+            select(QueuedJob.id)
+            .where(or_(QueuedJob.status == "queued", expired))
+            .order_by(QueuedJob.priority.desc(), QueuedJob.created_at)
+            .limit(count)
+            .with_for_update(skip_locked=True)
+        )
+        async with await self._session() as session:
+            # Dead-letter: expired leases of jobs out of attempts fail
+            # instead of being delivered again
+            await session.execute(
+                update(QueuedJob)
+                .where(expired, QueuedJob.attempts >= max_attempts)
+                .values(
+                    status="failed",
+                    error=LEASE_EXPIRED_ERROR.format(attempts=max_attempts),
+                    visible_at=None,
+                    processed_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(
+                update(QueuedJob)
+                .where(QueuedJob.id.in_(candidates.scalar_subquery()))
+                .values(
+                    status="processing",
+                    visible_at=now + timedelta(seconds=visibility_timeout),
+                    started_at=now,
+                    attempts=QueuedJob.attempts + 1,
+                )
+                .returning(QueuedJob)
+                .execution_options(synchronize_session=False)
+            )
+            jobs = list(result.scalars().all())
+            await session.commit()
+        jobs.sort(key=lambda job: (-job.priority, job.created_at))
+        return [self._payload(job) for job in jobs]
+
+    async def complete(
+        self,
+        job_id: str,
+        status: str,
+        results: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        if status not in FINAL_STATES:
+            raise ValueError(f"Invalid status: {status}. Must be 'success' or 'failed'")
+        async with await self._session() as session:
+            await session.execute(
+                update(QueuedJob)
+                .where(QueuedJob.id == job_id)
+                .values(
+                    status=status,
+                    results=results,
+                    error=error,
+                    visible_at=None,
+                    processed_at=datetime.utcnow(),
+                )
+            )
+            await session.commit()
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        async with await self._session() as session:
+            job = await session.get(QueuedJob, job_id)
+        if job is None:
+            return None
+        return {
+            **self._payload(job),
+            "status": job.status,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "processed_at": job.processed_at.isoformat() if job.processed_at else None,
+            "error": job.error,
+        }
+
+    async def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        async with await self._session() as session:
+            job = await session.get(QueuedJob, job_id)
+        if job is None or job.status not in FINAL_STATES:
+            return None
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "results": job.results,
+            "error": job.error,
+            "processed_at": job.processed_at.isoformat() if job.processed_at else None,
+        }
+
+    async def cancel(self, job_id: str) -> bool:
+        async with await self._session() as session:
+            result = await session.execute(
+                update(QueuedJob)
+                .where(QueuedJob.id == job_id, QueuedJob.status.in_(("queued", "processing")))
+                .values(status="cancelled", visible_at=None, processed_at=datetime.utcnow())
+            )
+            await session.commit()
+        return result.rowcount > 0
+
+    async def counts(self) -> Dict[str, int]:
+        now = datetime.utcnow()
+        async with await self._session() as session:
+            rows = (await session.execute(
+                select(
+                    QueuedJob.status,
+                    QueuedJob.priority,
+                    func.count(),
+                    func.count().filter(QueuedJob.visible_at <= now),
+                ).group_by(QueuedJob.status, QueuedJob.priority)
+            )).all()
+
+        counts = {
+            "queued": 0, "queued_high": 0, "queued_normal": 0, "queued_low": 0,
+            "processing": 0, "expired": 0, "dead_lettered": 0, "success": 0, "failed": 0, "cancelled": 0,
+        }
+        priority_names = {value: name for name, value in PRIORITIES.items()}
+        for status, priority, total, expired in rows:
+            counts[status] = counts.get(status, 0) + total
+            if status == "queued":
+                counts[f"queued_{priority_names[priority]}"] += total
+            elif status == "processing":
+                counts["expired"] += expired
+        return counts
+
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+
+
+_queue_backend: Optional[QueueBackend] = None
+
+
+def create_queue_backend(kind: Optional[str] = None) -> QueueBackend:
+    """
+    Create the configured queue backend.
+
+    ``JOB_QUEUE_BACKEND`` selects the driver (default ``upstash``):
+
+    - ``upstash``: ``UPSTASH_REDIS_REST_URL`` and ``UPSTASH_REDIS_REST_TOKEN``
+    - ``redis``: ``JOB_QUEUE_REDIS_URL`` (default ``REDIS_URL``)
+    - ``sql``: ``JOB_QUEUE_DATABASE_URL`` (default: the application database)
+
+    Args:
+        kind: Driver name (overrides ``JOB_QUEUE_BACKEND``)
+
+    Returns:
+        QueueBackend
+
+    Raises:
+        ValueError: If the driver is unknown or not configured
+    """
+    kind = (kind or os.getenv("JOB_QUEUE_BACKEND", "upstash")).lower()
+    if kind == "upstash":
+        return UpstashQueueBackend.from_env()
+    if kind == "redis":
+        url = os.getenv("JOB_QUEUE_REDIS_URL") or os.getenv("REDIS_URL")
+        if not url:
+            raise ValueError("JOB_QUEUE_REDIS_URL or REDIS_URL must be set")
+        return RedisQueueBackend.from_url(url)
+    if kind == "sql":
+        return SqlQueueBackend.from_url(os.getenv("JOB_QUEUE_DATABASE_URL"))
+    raise ValueError(f"Unknown JOB_QUEUE_BACKEND: {kind}. Must be upstash, redis or sql")
+
+
+def get_queue_backend() -> QueueBackend:
+    """
+    Get or create the process-wide queue backend.
+
+    Returns:
+        QueueBackend instance
+    """
+    global _queue_backend
+    if _queue_backend is None:
+        _queue_backend = create_queue_backend()
+    return _queue_backend
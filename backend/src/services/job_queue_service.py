@@ -1,43 +1,48 @@
 """
-Job Queue Service for async crawler job management using Upstash Redis.
+Job Queue Service for async crawler job management.
+
+Jobs are stored by a pluggable async backend (see ``job_queue_backends``):
+Upstash Redis by default, which the Cloudflare crawler worker consumes.
 """
-import json
-import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import uuid4
 
-from upstash_redis import Redis
+from .job_queue_backends import (
+    DEFAULT_VISIBILITY_TIMEOUT,
+    QueueBackend,
+    get_queue_backend,
+    new_job,
+)
 
 
 class JobQueueService:
-    """Service for managing crawler jobs in Upstash Redis queue."""
-
-    def __init__(self):
-        """Initialize Redis connection."""
-        redis_url = os.getenv("UPSTASH_REDIS_REST_URL")
-        redis_token = os.getenv("UPSTASH_REDIS_REST_TOKEN")
+    """Service for managing crawler jobs in the job queue."""
 
-        if not redis_url or not redis_token:
-            raise ValueError(
-                "UPSTASH_REDIS_REST_URL and UPSTASH_REDIS_REST_TOKEN must be set"
-            )
+    def __init__(self, backend: Optional[QueueBackend] = None):
+        """
+        Initialize service.
 
-        self.redis = Redis(url=redis_url, token=redis_token)
+        Args:
+            backend: Queue backend (default: the one selected by JOB_QUEUE_BACKEND)
+        """
+        self.backend = backend or get_queue_backend()
 
     async def enqueue_crawler_job(
         self,
         job_type: str,
         params: Dict[str, Any],
         user_id: Optional[str] = None,
+        priority: str = "normal",
     ) -> str:
         """
-        Enqueue a crawler job to the Redis queue.
+        Enqueue a crawler job.
 
         Args:
             job_type: Type of crawler job ('arxiv', 'github', 'semantic_scholar')
             params: Job parameters (query, url, limit, etc.)
             user_id: Optional user ID who submitted the job
+            priority: 'high', 'normal' or 'low'
 
         Returns:
             Job ID
@@ -50,27 +55,78 @@ class JobQueueService:
             ...     user_id='user-123'
             ... )
         """
-        job_id = str(uuid4())
-        job_data = {
-            "id": job_id,
-            "type": job_type,
-            "params": params,
-            "user_id": user_id,
-            "created_at": datetime.utcnow().isoformat(),
-            "retry_count": 0,
-        }
+        job_ids = await self.enqueue_crawler_jobs(
+            [{"job_type": job_type, "params": params}], user_id=user_id, priority=priority
+        )
+        return job_ids[0]
+
+    async def enqueue_crawler_jobs(
+        self,
+        jobs: Sequence[Dict[str, Any]],
+        user_id: Optional[str] = None,
+        priority: str = "normal",
+    ) -> List[str]:
+        """
+        Enqueue many crawler jobs in one round trip.
 
-        # Add to queue (RPUSH adds to end, LPOP removes from beginning - FIFO)
-        self.redis.rpush("crawler:queue", json.dumps(job_data))
+        Args:
+            jobs: Dicts with 'job_type', 'params' and optionally 'priority'
+            user_id: Optional user ID who submitted the jobs
+            priority: Default priority for jobs without one
 
-        # Store job metadata with 1 hour TTL
-        self.redis.setex(
-            f"crawler:job:{job_id}",
-            3600,
-            json.dumps({**job_data, "status": "queued"}),
-        )
+        Returns:
+            Job IDs, in input order
+        """
+        payloads = [
+            new_job(
+                str(uuid4()),
+                job["job_type"],
+                job["params"],
+                user_id=user_id,
+                priority=job.get("priority", priority),
+            )
+            for job in jobs
+        ]
+        await self.backend.enqueue_many(payloads)
+        return [payload["id"] for payload in payloads]
+
+    async def dequeue_jobs(
+        self,
+        count: int = 10,
+        visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT,
+    ) -> List[Dict[str, Any]]:
+        """
+        Lease up to ``count`` jobs for processing, highest priority first.
+
+        Jobs not completed within ``visibility_timeout`` seconds are
+        delivered again.
+
+        Args:
+            count: Maximum number of jobs
+            visibility_timeout: Lease duration in seconds
+
+        Returns:
+            Job payloads
+        """
+        return await self.backend.dequeue(count, visibility_timeout)
+
+    async def complete_job(
+        self,
+        job_id: str,
+        status: str,
+        results: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Store the result of a leased job.
 
-        return job_id
+        Args:
+            job_id: Job ID
+            status: 'success' or 'failed'
+            results: Job results
+            error: Error message for failed jobs
+        """
+        await self.backend.complete(job_id, status, results=results, error=error)
 
     async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -87,15 +143,13 @@ class JobQueueService:
             >>> status = await service.get_job_status('job-123')
             >>> print(status['status'])  # 'queued', 'processing', 'success', 'failed'
         """
-        # Check job metadata
-        job_data = self.redis.get(f"crawler:job:{job_id}")
-        if job_data:
-            return json.loads(job_data)
+        job = await self.backend.get_job(job_id)
+        if job and job.get("status") not in ("success", "failed"):
+            return job
 
         # Check if result exists
-        result_data = self.redis.get(f"crawler:result:{job_id}")
-        if result_data:
-            result = json.loads(result_data)
+        result = await self.backend.get_result(job_id)
+        if result:
             return {
                 "id": job_id,
                 "status": result["status"],
@@ -104,7 +158,7 @@ class JobQueueService:
                 "error": result.get("error"),
             }
 
-        return None
+        return job
 
     async def get_job_result(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -122,47 +176,48 @@ class JobQueueService:
             >>> if result and result['status'] == 'success':
             ...     papers = result['results']['papers']
         """
-        result_data = self.redis.get(f"crawler:result:{job_id}")
-        if result_data:
-            return json.loads(result_data)
-        return None
+        return await self.backend.get_result(job_id)
 
     async def get_queue_length(self) -> int:
         """
         Get current length of the job queue.
 
         Returns:
-            Number of jobs in queue
+            Number of queued jobs (all priorities)
 
         Example:
             >>> service = JobQueueService()
             >>> length = await service.get_queue_length()
             >>> print(f"Jobs in queue: {length}")
         """
-        return self.redis.llen("crawler:queue")
+        counts = await self.backend.counts()
+        return counts["queued"]
 
     async def get_queue_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the job queue.
 
         Returns:
-            Dictionary with queue statistics
+            Dictionary with queue length and job counts per state
 
         Example:
             >>> service = JobQueueService()
             >>> stats = await service.get_queue_stats()
             >>> print(f"Queue length: {stats['queue_length']}")
         """
-        queue_length = await self.get_queue_length()
+        counts = await self.backend.counts()
 
         return {
-            "queue_length": queue_length,
+            "queue_length": counts["queued"],
+            "counts": counts,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
     async def cancel_job(self, job_id: str) -> bool:
         """
-        Cancel a queued job (best effort - only works if not yet processed).
+        Cancel a queued or processing job.
+
+        Cancelled jobs are skipped when dequeued.
 
         Args:
             job_id: Job ID to cancel
@@ -174,17 +229,4 @@ class JobQueueService:
             >>> service = JobQueueService()
             >>> success = await service.cancel_job('job-123')
         """
-        job_data = self.redis.get(f"crawler:job:{job_id}")
-        if not job_data:
-            return False
-
-        job = json.loads(job_data)
-        if job.get("status") not in ["queued", "processing"]:
-            return False
-
-        # Mark as cancelled
-        job["status"] = "cancelled"
-        job["cancelled_at"] = datetime.utcnow().isoformat()
-        self.redis.setex(f"crawler:job:{job_id}", 3600, json.dumps(job))
-
-        return True
+        return await self.backend.cancel(job_id)
@@ -0,0 +1,360 @@
+"""Precomputed trending leaderboards.
+
+``GET /api/v1/github/trending`` is the most requested page. Instead of
+joining, filtering, sorting and counting ``papers``/``github_metrics`` on
+every hit, each API process keeps a compact NumPy snapshot of the ranking
+columns (one row per tracked repository). A ranking for a
+(period, sort_by, primary_task, language, min_stars) combination is an array
+of row indices built once from the snapshot and kept in a small LRU, so a
+page fetch is an array slice plus one id-batched hydration query.
+
+The star tracker calls :func:`publish_leaderboard_refresh` after each run:
+it drops the local snapshot and bumps a version key in Redis that other
+processes check every few seconds. Without Redis, snapshots expire after
+``LEADERBOARD_TTL`` seconds.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import GitHubMetrics, Paper, PaperReference
+from .cache_service import get_cache
+
+logger = logging.getLogger(__name__)
+
+# Maximum snapshot age in seconds
+LEADERBOARD_TTL = int(os.getenv("LEADERBOARD_TTL", "900"))
+
+# Seconds between Redis version checks
+VERSION_CHECK_INTERVAL = 5.0
+
+# Redis key bumped after every star tracker run
+VERSION_KEY = "leaderboards:version"
+
+# Rankings kept per snapshot (LRU)
+MAX_CACHED_RANKINGS = 256
+
+# Trending period -> minimum days tracked (None = all time)
+PERIOD_DAYS: dict[str, Optional[int]] = {
+    "day": 1,
+    "week": 7,
+    "month": 30,
+    "quarter": 90,
+    "year": 365,
+    "all_time": None,
+}
+
+SORT_COLUMNS = {
+    "weekly_hype": GitHubMetrics.weekly_hype,
+    "monthly_hype": GitHubMetrics.monthly_hype,
+    "average_hype": GitHubMetrics.average_hype,
+    "total_stars": GitHubMetrics.current_stars,
+}
+
+
+def period_cutoff(period: str, today: Optional[date] = None) -> Optional[date]:
+    """Latest tracking start date that qualifies for a trending period."""
+    days = PERIOD_DAYS[period]
+    if days is None:
+        return None
+    return (today or date.today()) - timedelta(days=days)
+
+
+@dataclass
+class LeaderboardSnapshot:
+    """Column arrays for every tracked repository, plus cached rankings."""
+
+    paper_ids: np.ndarray
+    tracking_start: np.ndarray
+    stars: np.ndarray
+    scores: dict[str, np.ndarray]
+    tasks: np.ndarray
+    languages: np.ndarray
+    version: Optional[int] = None
+    built_at: float = field(default_factory=time.time)
+    rankings: OrderedDict = field(default_factory=OrderedDict)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any], version: Optional[int] = None) -> "LeaderboardSnapshot":
+        """Build a snapshot from (paper_id, tracking_start_date, current_stars,
+        weekly_hype, monthly_hype, average_hype, primary_task, primary_language) rows."""
+        size = len(rows)
+        paper_ids = np.empty(size, dtype=object)
+        tasks = np.empty(size, dtype=object)
+        languages = np.empty(size, dtype=object)
+        tracking_start = np.empty(size, dtype=np.int64)
+        stars = np.empty(size, dtype=np.int64)
+        weekly = np.empty(size, dtype=np.float64)
+        monthly = np.empty(size, dtype=np.float64)
+        average = np.empty(size, dtype=np.float64)
+
+        for i, (paper_id, started, star_count, w, m, a, task, language) in enumerate(rows):
+            paper_ids[i] = paper_id
+            tracking_start[i] = started.toordinal()
+            stars[i] = star_count or 0
+            weekly[i] = np.nan if w is None else w
+            monthly[i] = np.nan if m is None else m
+            average[i] = np.nan if a is None else a
+            tasks[i] = task
+            languages[i] = language
+
+        return cls(
+            paper_ids=paper_ids,
+            tracking_start=tracking_start,
+            stars=stars,
+            scores={
+                "weekly_hype": weekly,
+                "monthly_hype": monthly,
+                "average_hype": average,
+                "total_stars": stars.astype(np.float64),
+            },
+            tasks=tasks,
+            languages=languages,
+            version=version,
+        )
+
+    def __len__(self) -> int:
+        return len(self.paper_ids)
+
+    def ranking(
+        self,
+        period: str,
+        sort_by: str,
+        primary_task: Optional[str] = None,
+        language: Optional[str] = None,
+        min_stars: int = 0,
+    ) -> np.ndarray:
+        """Row indices matching the filters, best first (null scores last).
+
+        Args:
+            period: Trending period (see ``PERIOD_DAYS``)
+            sort_by: Score column (see ``SORT_COLUMNS``)
+            primary_task: Optional exact task filter
+            language: Optional exact language filter
+            min_stars: Minimum current stars
+
+        Returns:
+            Array of row indices into the snapshot
+        """
+        cutoff = period_cutoff(period)
+        key = (period, cutoff, sort_by, primary_task, language, min_stars)
+        cached = self.rankings.get(key)
+        if cached is not None:
+            self.rankings.move_to_end(key)
+            return cached
+
+        mask = self.stars >= min_stars
+        if cutoff is not None:
+            mask &= self.tracking_start <= cutoff.toordinal()
+        if primary_task:
+            mask &= self.tasks == primary_task
+        if language:
+            mask &= self.languages == language
+
+        indices = np.flatnonzero(mask)
+        scores = self.scores[sort_by][indices]
+        missing = np.isnan(scores)
+        # lexsort: last key is primary -> present scores first, then score desc
+        order = np.lexsort((-np.where(missing, 0.0, scores), missing))
+        ranking = indices[order]
+
+        self.rankings[key] = ranking
+        if len(self.rankings) > MAX_CACHED_RANKINGS:
+            self.rankings.popitem(last=False)
+        return ranking
+
+    def page(self, ranking: np.ndarray, offset: int, limit: int) -> list[UUID]:
+        """Paper ids for one page of a ranking."""
+        return list(self.paper_ids[ranking[offset:offset + limit]])
+
+
+async def build_snapshot(session: AsyncSession, version: Optional[int] = None) -> LeaderboardSnapshot:
+    """Load the ranking columns of every tracked repository.
+
+    Args:
+        session: Database session
+        version: Redis version the snapshot corresponds to
+
+    Returns:
+        LeaderboardSnapshot
+    """
+    start = time.perf_counter()
+    result = await session.execute(
+        select(
+            GitHubMetrics.paper_id,
+            GitHubMetrics.tracking_start_date,
+            GitHubMetrics.current_stars,
+            GitHubMetrics.weekly_hype,
+            GitHubMetrics.monthly_hype,
+            GitHubMetrics.average_hype,
+            Paper.primary_task,
+            GitHubMetrics.primary_language,
+        ).join(Paper, Paper.id == GitHubMetrics.paper_id)
+    )
+    snapshot = LeaderboardSnapshot.from_rows(result.all(), version=version)
+    logger.info(
+        f"Built trending leaderboard snapshot: {len(snapshot)} repositories "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+    return snapshot
+
+
+class LeaderboardStore:
+    """Process-local leaderboard snapshot with Redis-versioned invalidation."""
+
+    def __init__(self, ttl: int = LEADERBOARD_TTL):
+        """Initialize empty store.
+
+        Args:
+            ttl: Maximum snapshot age in seconds
+        """
+        self.ttl = ttl
+        self._snapshot: Optional[LeaderboardSnapshot] = None
+        self._lock = asyncio.Lock()
+        self._checked_at = 0.0
+
+    async def _remote_version(self) -> Optional[int]:
+        return await get_cache().get(VERSION_KEY)
+
+    async def _is_stale(self, snapshot: LeaderboardSnapshot) -> bool:
+        now = time.time()
+        if now - snapshot.built_at > self.ttl:
+            return True
+        if now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return False
+        self._checked_at = now
+        version = await self._remote_version()
+        return version is not None and version != snapshot.version
+
+    async def get_snapshot(self, session: AsyncSession) -> LeaderboardSnapshot:
+        """Get the current snapshot, rebuilding it if missing or stale.
+
+        Args:
+            session: Database session used for a rebuild
+
+        Returns:
+            LeaderboardSnapshot
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and not await self._is_stale(snapshot):
+            return snapshot
+
+        async with self._lock:
+            # Another request may have rebuilt it while we waited
+            if self._snapshot is not None and self._snapshot is not snapshot:
+                return self._snapshot
+            version = await self._remote_version()
+            self._snapshot = await build_snapshot(session, version=version)
+            self._checked_at = time.time()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the local snapshot (rebuilt on next request)."""
+        self._snapshot = None
+
+
+_store: Optional[LeaderboardStore] = None
+
+
+def get_leaderboard_store() -> LeaderboardStore:
+    """Get or create the process-wide leaderboard store.
+
+    Returns:
+        LeaderboardStore instance
+    """
+    global _store
+    if _store is None:
+        _store = LeaderboardStore()
+    return _store
+
+
+async def publish_leaderboard_refresh() -> None:
+    """Invalidate leaderboards in this process and signal other processes."""
+    get_leaderboard_store().invalidate()
+    await get_cache().increment(VERSION_KEY)
+
+
+async def query_trending_ids(
+    session: AsyncSession,
+    period: str,
+    sort_by: str,
+    min_stars: int,
+    offset: int,
+    limit: int,
+    primary_task: Optional[str] = None,
+    venue: Optional[str] = None,
+    year: Optional[int] = None,
+    language: Optional[str] = None,
+) -> tuple[int, list[UUID]]:
+    """Rank trending papers in SQL (for filters the leaderboards do not cover).
+
+    Returns:
+        Tuple of (total matches, paper ids for the requested page)
+    """
+    filters = [GitHubMetrics.current_stars >= min_stars]
+    if primary_task:
+        filters.append(Paper.primary_task == primary_task)
+    if venue:
+        filters.append(Paper.venue.ilike(f"%{venue}%"))
+    if year:
+        filters.append(Paper.year == year)
+    if language:
+        filters.append(GitHubMetrics.primary_language == language)
+    cutoff = period_cutoff(period)
+    if cutoff:
+        filters.append(GitHubMetrics.tracking_start_date <= cutoff)
+
+    base = (
+        select(Paper.id)
+        .join(GitHubMetrics, GitHubMetrics.paper_id == Paper.id)
+        .where(and_(*filters))
+    )
+
+    total = (await session.execute(select(func.count()).select_from(base.subquery()))).scalar() or 0
+
+    order = SORT_COLUMNS[sort_by].desc()
+    if sort_by != "total_stars":
+        order = order.nulls_last()
+    result = await session.execute(base.order_by(order).offset(offset).limit(limit))
+    return total, list(result.scalars().all())
+
+
+async def hydrate_trending(
+    session: AsyncSession,
+    paper_ids: Sequence[UUID],
+) -> list[tuple[Paper, GitHubMetrics, int]]:
+    """Load papers, their GitHub metrics and cited-by counts in one query.
+
+    Args:
+        session: Database session
+        paper_ids: Paper ids in ranking order
+
+    Returns:
+        (paper, metrics, cited_by_count) tuples in the order of ``paper_ids``
+    """
+    if not paper_ids:
+        return []
+
+    cited_by = (
+        select(func.count(PaperReference.id))
+        .where(PaperReference.target_paper_id == Paper.id)
+        .correlate(Paper)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        select(Paper, GitHubMetrics, cited_by)
+        .join(GitHubMetrics, GitHubMetrics.paper_id == Paper.id)
+        .where(Paper.id.in_(list(paper_ids)))
+    )
+    by_id = {paper.id: (paper, metrics, count) for paper, metrics, count in result.all()}
+    return [by_id[paper_id] for paper_id in paper_ids if paper_id in by_id]
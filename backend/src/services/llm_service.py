@@ -8,9 +8,10 @@ using either cloud-based (OpenAI) or local (LlamaCpp) LLM providers.
 import asyncio
 import json
 import re
+import weakref
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, Hashable, Iterable, Optional, Tuple, Union
 
 import aiohttp
 
@@ -23,6 +24,14 @@ class AsyncLLMService(ABC):
     using various LLM providers.
     """
 
+    provider: str = "unknown"
+    model: str = "unknown"
+
+    @property
+    def model_id(self) -> str:
+        """Provider-qualified model identifier (e.g. 'openai:gpt-4o')."""
+        return f"{self.provider}:{self.model}"
+
     @abstractmethod
     async def extract_metadata(
         self,
@@ -80,18 +89,36 @@ class AsyncLLMService(ABC):
             }
 
 
+# Assistant ids by (base_url, model), reused by every service instance
+_assistant_ids: Dict[Tuple[str, str], str] = {}
+
+# Per-event-loop locks guarding assistant creation (Celery tasks run their own loops)
+_assistant_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 class OpenAILLMService(AsyncLLMService):
     """
     OpenAI-based LLM service using Assistants API with file search.
 
     Supports GPT-4 and other OpenAI models with file upload capability.
+    One assistant is created per process and model and reused for every
+    paper; each PDF is uploaded once per service instance, however many
+    prompts run against it. Run status is polled with exponential backoff.
     """
 
+    provider = "openai"
+
     def __init__(
         self,
         api_key: str,
         model: str = "gpt-4o",
-        assistant_id: Optional[str] = None
+        assistant_id: Optional[str] = None,
+        base_url: str = "https://api.openai.com/v1",
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 8.0,
+        poll_backoff: float = 1.5,
     ):
         """
         Initialize OpenAI LLM service.
@@ -100,17 +127,27 @@ class OpenAILLMService(AsyncLLMService):
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o)
             assistant_id: Pre-created assistant ID (optional)
+            base_url: API base URL (override for proxies or a mock server)
+            poll_interval: First delay between run status polls (seconds)
+            max_poll_interval: Upper bound for the poll delay (seconds)
+            poll_backoff: Poll delay growth factor
         """
         self.api_key = api_key
         self.model = model
         self.assistant_id = assistant_id
-        self.base_url = "https://api.openai.com/v1"
+        self.base_url = base_url.rstrip('/')
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_backoff = poll_backoff
 
         self.headers = {
             'Authorization': f'Bearer {api_key}',
             'OpenAI-Beta': 'assistants=v2'
         }
 
+        # (path, mtime) -> upload task, shared by concurrent prompts for one PDF
+        self._uploads: Dict[Tuple[str, float], asyncio.Future] = {}
+
     async def extract_metadata(
         self,
         pdf_path: Path,
@@ -127,30 +164,77 @@ class OpenAILLMService(AsyncLLMService):
             Extracted metadata as dictionary
         """
         async with aiohttp.ClientSession() as session:
-            # Step 1: Upload file
-            file_id = await self._upload_file(session, pdf_path)
+            return await self.extract_with_session(session, pdf_path, prompt)
+
+    async def extract_with_session(
+        self,
+        session: aiohttp.ClientSession,
+        pdf_path: Path,
+        prompt: str
+    ) -> Dict[str, Any]:
+        """
+        Extract metadata over an existing HTTP session (see AssistantRunDispatcher).
 
-            # Step 2: Create or use existing assistant
-            if not self.assistant_id:
-                self.assistant_id = await self._create_assistant(session)
+        Args:
+            session: HTTP session
+            pdf_path: Path to PDF file
+            prompt: Extraction prompt
 
-            # Step 3: Create thread
-            thread_id = await self._create_thread(session)
+        Returns:
+            Extracted metadata as dictionary
+        """
+        # Step 1: Upload file (once per PDF)
+        file_id = await self._get_file_id(session, pdf_path)
 
-            # Step 4: Add message with file attachment
-            await self._add_message(session, thread_id, prompt, file_id)
+        # Step 2: Reuse the process-wide assistant
+        assistant_id = await self._get_assistant_id(session)
 
-            # Step 5: Run assistant
-            run_id = await self._create_run(session, thread_id)
+        # Step 3: Create thread
+        thread_id = await self._create_thread(session)
 
-            # Step 6: Wait for completion
-            await self._wait_for_completion(session, thread_id, run_id)
+        # Step 4: Add message with file attachment
+        await self._add_message(session, thread_id, prompt, file_id)
 
-            # Step 7: Get response
-            response = await self._get_response(session, thread_id)
+        # Step 5: Run assistant
+        run_id = await self._create_run(session, thread_id, assistant_id)
 
-            # Parse JSON from response
-            return self.parse_json_response(response)
+        # Step 6: Wait for completion
+        await self._wait_for_completion(session, thread_id, run_id)
+
+        # Step 7: Get response
+        response = await self._get_response(session, thread_id)
+
+        # Parse JSON from response
+        return self.parse_json_response(response)
+
+    async def _get_file_id(
+        self,
+        session: aiohttp.ClientSession,
+        pdf_path: Path
+    ) -> str:
+        """Upload a PDF once; concurrent callers share the upload."""
+        key = (str(pdf_path), pdf_path.stat().st_mtime)
+        upload = self._uploads.get(key)
+        if upload is None:
+            upload = self._uploads[key] = asyncio.ensure_future(self._upload_file(session, pdf_path))
+        try:
+            return await asyncio.shield(upload)
+        except Exception:
+            self._uploads.pop(key, None)
+            raise
+
+    async def _get_assistant_id(self, session: aiohttp.ClientSession) -> str:
+        """Assistant for this model, created at most once per process."""
+        if self.assistant_id:
+            return self.assistant_id
+
+        key = (self.base_url, self.model)
+        lock = _assistant_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+        async with lock:
+            if key not in _assistant_ids:
+                _assistant_ids[key] = await self._create_assistant(session)
+        self.assistant_id = _assistant_ids[key]
+        return self.assistant_id
 
     async def _upload_file(
         self,
@@ -162,7 +246,7 @@ class OpenAILLMService(AsyncLLMService):
         data.add_field('purpose', 'assistants')
         data.add_field(
             'file',
-            open(pdf_path, 'rb'),
+            pdf_path.read_bytes(),
             filename=pdf_path.name,
             content_type='application/pdf'
         )
@@ -229,11 +313,12 @@ class OpenAILLMService(AsyncLLMService):
     async def _create_run(
         self,
         session: aiohttp.ClientSession,
-        thread_id: str
+        thread_id: str,
+        assistant_id: str
     ) -> str:
         """Start assistant run."""
         data = {
-            'assistant_id': self.assistant_id
+            'assistant_id': assistant_id
         }
 
         async with session.post(
@@ -251,8 +336,10 @@ class OpenAILLMService(AsyncLLMService):
         run_id: str,
         timeout: int = 300
     ) -> None:
-        """Poll until run completes."""
-        start_time = asyncio.get_event_loop().time()
+        """Poll until run completes, backing off exponentially between polls."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = self.poll_interval
 
         while True:
             async with session.get(
@@ -262,16 +349,18 @@ class OpenAILLMService(AsyncLLMService):
                 result = await response.json()
                 status = result['status']
 
-                if status == 'completed':
-                    return
-                elif status in ['failed', 'cancelled', 'expired']:
-                    raise Exception(f"Run {status}: {result.get('last_error')}")
+            if status == 'completed':
+                return
+            elif status in ['failed', 'cancelled', 'expired']:
+                raise Exception(f"Run {status}: {result.get('last_error')}")
 
-                # Check timeout
-                if asyncio.get_event_loop().time() - start_time > timeout:
-                    raise TimeoutError("Run timed out")
+            # Check timeout
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError("Run timed out")
 
-                await asyncio.sleep(2)
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * self.poll_backoff, self.max_poll_interval)
 
     async def _get_response(
         self,
@@ -297,13 +386,96 @@ class OpenAILLMService(AsyncLLMService):
         return ''
 
 
+class AssistantRunDispatcher:
+    """
+    Runs many Assistants API extractions concurrently.
+
+    Keeps up to ``max_concurrency`` runs in flight over one HTTP session and
+    yields results as runs finish, so a batch takes roughly
+    ``ceil(n / max_concurrency)`` run latencies instead of ``n``.
+    """
+
+    def __init__(self, llm_service: OpenAILLMService, max_concurrency: int = 16):
+        """
+        Initialize dispatcher.
+
+        Args:
+            llm_service: OpenAI service (its assistant and uploads are shared)
+            max_concurrency: Maximum runs in flight
+        """
+        self.llm_service = llm_service
+        self.max_concurrency = max_concurrency
+
+    async def stream(
+        self,
+        jobs: Iterable[Tuple[Hashable, Path, str]]
+    ) -> AsyncIterator[Tuple[Hashable, Union[Dict[str, Any], Exception]]]:
+        """
+        Run (key, pdf_path, prompt) jobs, yielding (key, result) as they finish.
+
+        Failed jobs yield their exception instead of a result.
+
+        Args:
+            jobs: Extraction jobs; keys identify results
+
+        Yields:
+            Tuples of (key, result or exception) in completion order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def run_one(key: Hashable, pdf_path: Path, prompt: str):
+                async with semaphore:
+                    try:
+                        return key, await self.llm_service.extract_with_session(session, pdf_path, prompt)
+                    except Exception as e:
+                        return key, e
+
+            tasks = [asyncio.ensure_future(run_one(*job)) for job in jobs]
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    yield await finished
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def run(
+        self,
+        jobs: Iterable[Tuple[Hashable, Path, str]]
+    ) -> Dict[Hashable, Union[Dict[str, Any], Exception]]:
+        """
+        Run jobs and collect all results.
+
+        Args:
+            jobs: (key, pdf_path, prompt) extraction jobs
+
+        Returns:
+            Mapping of key to result (or exception)
+        """
+        return {key: result async for key, result in self.stream(jobs)}
+
+
 class LlamaCppLLMService(AsyncLLMService):
     """
     Local LLM service using llama.cpp server.
 
     Connects to local llama.cpp server for inference without API costs.
+
+    Requests put the fixed system prompt first, then the paper text, then the
+    extraction prompt, and ask the server to keep the KV cache
+    (``cache_prompt``). Consecutive requests then only evaluate the tokens
+    after their common prefix: the system prompt across papers, and the whole
+    paper text across the extraction prompts for one paper.
     """
 
+    provider = "llamacpp"
+
+    SYSTEM_PROMPT = (
+        'You are a helpful assistant that extracts metadata from research papers. '
+        'Always respond with valid JSON.'
+    )
+
     def __init__(
         self,
         server_url: str = "http://localhost:10002/v1/chat/completions",
@@ -318,6 +490,26 @@ class LlamaCppLLMService(AsyncLLMService):
         """
         self.server_url = server_url
         self.model = model
+        # (path, mtime, text) of the last PDF, reused across extraction prompts
+        self._text_cache: Optional[tuple[str, float, str]] = None
+
+    async def _paper_text(self, pdf_path: Path) -> str:
+        """Extracted (truncated) PDF text, reusing the last PDF's text."""
+        mtime = pdf_path.stat().st_mtime
+        if self._text_cache and self._text_cache[:2] == (str(pdf_path), mtime):
+            return self._text_cache[2]
+
+        from .pdf_service import PDFAnalysisService
+        pdf_service = PDFAnalysisService()
+        full_text = await pdf_service.extract_text(pdf_path)
+
+        # Truncate if too long (most models have token limits)
+        max_chars = 12000  # Rough estimate for ~3000 tokens
+        if len(full_text) > max_chars:
+            full_text = full_text[:max_chars] + "\n\n[...truncated...]"
+
+        self._text_cache = (str(pdf_path), mtime, full_text)
+        return full_text
 
     async def extract_metadata(
         self,
@@ -335,14 +527,7 @@ class LlamaCppLLMService(AsyncLLMService):
             Extracted metadata
         """
         # First extract text locally
-        from .pdf_service import PDFAnalysisService
-        pdf_service = PDFAnalysisService()
-        full_text = await pdf_service.extract_text(pdf_path)
-
-        # Truncate if too long (most models have token limits)
-        max_chars = 12000  # Rough estimate for ~3000 tokens
-        if len(full_text) > max_chars:
-            full_text = full_text[:max_chars] + "\n\n[...truncated...]"
+        full_text = await self._paper_text(pdf_path)
 
         # Call local LLM server
         async with aiohttp.ClientSession() as session:
@@ -351,15 +536,18 @@ class LlamaCppLLMService(AsyncLLMService):
                 'messages': [
                     {
                         'role': 'system',
-                        'content': 'You are a helpful assistant that extracts metadata from research papers. Always respond with valid JSON.'
+                        'content': self.SYSTEM_PROMPT
                     },
                     {
                         'role': 'user',
-                        'content': f"{prompt}\n\nPaper text:\n{full_text}"
+                        # Paper text before the prompt: shared prefix across prompts
+                        'content': f"Paper text:\n{full_text}\n\n{prompt}"
                     }
                 ],
                 'temperature': 0.7,
-                'max_tokens': 1000
+                'max_tokens': 1000,
+                # Reuse the KV cache for the common prompt prefix
+                'cache_prompt': True
             }
 
             async with session.post(
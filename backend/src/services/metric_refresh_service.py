@@ -0,0 +1,213 @@
+"""Adaptive scheduling of per-paper metric refreshes.
+
+Every paper has a row in ``metric_refresh_schedule`` with the time it is next
+due. The metric update job refreshes the most overdue papers first and then
+reschedules each one:
+
+- papers whose stars/citations moved get an interval that aims for roughly
+  ``METRIC_REFRESH_TARGET_CHANGE`` units of change per refresh (damped
+  against the previous interval);
+- papers whose numbers did not move back off geometrically (unless a fetch
+  failed, which keeps the current interval);
+- page views since the last refresh shorten the interval.
+
+Intervals are clamped to [``METRIC_REFRESH_MIN_HOURS``,
+``METRIC_REFRESH_MAX_HOURS``], so API calls go to papers whose numbers
+actually change while dormant papers are still checked every two weeks.
+"""
+import math
+import os
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import MetricRefreshSchedule, Paper
+from .cache_service import get_cache
+
+# Interval bounds in hours
+METRIC_REFRESH_MIN_HOURS = float(os.getenv("METRIC_REFRESH_MIN_HOURS", "6"))
+METRIC_REFRESH_MAX_HOURS = float(os.getenv("METRIC_REFRESH_MAX_HOURS", "336"))
+
+# Interval for papers without history
+METRIC_REFRESH_DEFAULT_HOURS = 24.0
+
+# Desired change (stars + weighted citations) between two refreshes
+METRIC_REFRESH_TARGET_CHANGE = float(os.getenv("METRIC_REFRESH_TARGET_CHANGE", "5"))
+
+# A citation counts as this many stars of change
+CITATION_CHANGE_WEIGHT = 10.0
+
+# Interval growth factor when nothing changed
+UNCHANGED_BACKOFF = 2.0
+
+# Page views since the last refresh that halve the interval
+VIEWS_PER_HALVING = 50.0
+
+# Redis key prefix for per-paper view counters
+VIEW_COUNTER_PREFIX = "paper_views:"
+
+ENQUEUE_NEW_PAPERS = text(
+    """
+    INSERT INTO metric_refresh_schedule (paper_id)
+    SELECT p.id
+    FROM papers p
+    WHERE NOT EXISTS (
+        SELECT 1 FROM metric_refresh_schedule s WHERE s.paper_id = p.id
+    )
+    ON CONFLICT (paper_id) DO NOTHING
+    """
+)
+
+
+def next_refresh_interval(
+    interval_hours: float,
+    elapsed_hours: Optional[float],
+    star_delta: int,
+    citation_delta: int,
+    views: int = 0,
+    backoff: bool = True,
+) -> float:
+    """Next refresh interval from the change observed since the last refresh.
+
+    Args:
+        interval_hours: Current interval
+        elapsed_hours: Hours since the previous refresh (None on the first one)
+        star_delta: Star change since the previous refresh
+        citation_delta: Citation change since the previous refresh
+        views: Page views since the previous refresh
+        backoff: Whether no change may lengthen the interval (False when a
+            value could not be fetched, so "no change" is not known)
+
+    Returns:
+        New interval in hours
+    """
+    if elapsed_hours is not None:
+        change = abs(star_delta) + CITATION_CHANGE_WEIGHT * abs(citation_delta)
+        if change > 0:
+            rate = change / max(elapsed_hours, METRIC_REFRESH_MIN_HOURS)
+            target = METRIC_REFRESH_TARGET_CHANGE / rate
+            interval_hours = math.sqrt(interval_hours * target)
+        elif backoff:
+            interval_hours *= UNCHANGED_BACKOFF
+
+    interval_hours /= 1 + views / VIEWS_PER_HALVING
+    return min(max(interval_hours, METRIC_REFRESH_MIN_HOURS), METRIC_REFRESH_MAX_HOURS)
+
+
+def _delta(current: Optional[int], previous: Optional[int]) -> int:
+    return current - previous if current is not None and previous is not None else 0
+
+
+async def record_paper_view(paper_id: UUID) -> None:
+    """Count a paper page view towards its refresh priority."""
+    await get_cache().increment(f"{VIEW_COUNTER_PREFIX}{paper_id}")
+
+
+async def pop_paper_views(paper_ids: Sequence[UUID]) -> dict[UUID, int]:
+    """Drain page view counters for papers.
+
+    Args:
+        paper_ids: Paper UUIDs
+
+    Returns:
+        Mapping of paper id to views since the last drain (0 if none)
+    """
+    values = await get_cache().pop_many([f"{VIEW_COUNTER_PREFIX}{paper_id}" for paper_id in paper_ids])
+    return {paper_id: int(value or 0) for paper_id, value in zip(paper_ids, values, strict=True)}
+
+
+class MetricRefreshScheduler:
+    """Queue of papers ordered by when their metrics are next due."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize scheduler with database session."""
+        self.session = session
+
+    async def enqueue_new_papers(self) -> int:
+        """Add papers without a schedule row, due immediately.
+
+        Returns:
+            Number of papers enqueued
+        """
+        result = await self.session.execute(ENQUEUE_NEW_PAPERS)
+        return result.rowcount
+
+    async def get_due(self, limit: int, now: Optional[datetime] = None) -> list:
+        """Most overdue papers first.
+
+        Args:
+            limit: Maximum papers
+            now: Reference time (default utcnow)
+
+        Returns:
+            Rows of (MetricRefreshSchedule, github_url, arxiv_id, doi)
+        """
+        now = now or datetime.utcnow()
+        result = await self.session.execute(
+            select(MetricRefreshSchedule, Paper.github_url, Paper.arxiv_id, Paper.doi)
+            .join(Paper, Paper.id == MetricRefreshSchedule.paper_id)
+            .where(MetricRefreshSchedule.next_refresh_at <= now)
+            .order_by(MetricRefreshSchedule.next_refresh_at)
+            .limit(limit)
+        )
+        return list(result.all())
+
+    def reschedule(
+        self,
+        entry: MetricRefreshSchedule,
+        github_stars: Optional[int],
+        citation_count: Optional[int],
+        views: int = 0,
+        now: Optional[datetime] = None,
+        partial: bool = False,
+    ) -> float:
+        """Record a refresh and compute when the paper is next due.
+
+        Args:
+            entry: Schedule row of the refreshed paper
+            github_stars: Stars fetched now (None if unavailable)
+            citation_count: Citations fetched now (None if unavailable)
+            views: Page views since the previous refresh
+            now: Refresh time (default utcnow)
+            partial: A value the paper should have (e.g. stars of a linked
+                repo) failed to fetch; an unchanged reading then keeps the
+                current interval instead of backing off
+
+        Returns:
+            New interval in hours
+        """
+        now = now or datetime.utcnow()
+        elapsed_hours = None
+        if entry.last_refreshed_at is not None:
+            elapsed_hours = (now - entry.last_refreshed_at).total_seconds() / 3600
+
+        interval = next_refresh_interval(
+            entry.refresh_interval_hours or METRIC_REFRESH_DEFAULT_HOURS,
+            elapsed_hours,
+            _delta(github_stars, entry.last_github_stars),
+            _delta(citation_count, entry.last_citation_count),
+            views,
+            backoff=not partial,
+        )
+
+        entry.refresh_interval_hours = interval
+        entry.next_refresh_at = now + timedelta(hours=interval)
+        entry.last_refreshed_at = now
+        if github_stars is not None:
+            entry.last_github_stars = github_stars
+        if citation_count is not None:
+            entry.last_citation_count = citation_count
+        return interval
+
+    def retry_later(self, entry: MetricRefreshSchedule, now: Optional[datetime] = None) -> None:
+        """Push a paper whose refresh failed back by the minimum interval.
+
+        Args:
+            entry: Schedule row of the paper
+            now: Reference time (default utcnow)
+        """
+        now = now or datetime.utcnow()
+        entry.next_refresh_at = now + timedelta(hours=METRIC_REFRESH_MIN_HOURS)
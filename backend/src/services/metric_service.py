@@ -3,10 +3,12 @@ from datetime import date, datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import MetricSnapshot
+from .history_service import HistoryService
 
 
 class MetricService:
@@ -120,6 +122,39 @@ class MetricService:
         await self.session.flush()
         return metric
 
+    async def upsert_metric_snapshot(
+        self,
+        paper_id: UUID,
+        snapshot_date: date,
+        github_stars: Optional[int] = None,
+        citation_count: Optional[int] = None,
+    ) -> None:
+        """Create the day's snapshot, or overwrite it on a later refresh that day.
+
+        A value that could not be fetched (None) on a later refresh keeps the
+        value already recorded for the day.
+
+        Args:
+            paper_id: Paper UUID
+            snapshot_date: Date of snapshot
+            github_stars: GitHub star count (optional)
+            citation_count: Citation count (optional)
+        """
+        stmt = pg_insert(MetricSnapshot).values(
+            paper_id=paper_id,
+            snapshot_date=snapshot_date,
+            github_stars=github_stars,
+            citation_count=citation_count,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["paper_id", "snapshot_date"],
+            set_={
+                "github_stars": func.coalesce(stmt.excluded.github_stars, MetricSnapshot.github_stars),
+                "citation_count": func.coalesce(stmt.excluded.citation_count, MetricSnapshot.citation_count),
+            },
+        )
+        await self.session.execute(stmt)
+
     async def get_metric_range(
         self,
         paper_id: UUID,
@@ -150,3 +185,30 @@ class MetricService:
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
+
+    async def get_metric_history(
+        self,
+        paper_id: UUID,
+        start_date: date,
+        end_date: Optional[date] = None,
+        bucket: str = "auto",
+        max_points: Optional[int] = None,
+    ) -> list[dict]:
+        """Get bucketed metric history for a date range.
+
+        Unlike :meth:`get_metric_range`, long ranges are read from the
+        weekly/monthly aggregates instead of raw daily snapshots.
+
+        Args:
+            paper_id: Paper UUID
+            start_date: Start of range (inclusive)
+            end_date: End of range (inclusive, default today)
+            bucket: "day", "week", "month" or "auto"
+            max_points: Optional point cap (LTTB downsampling)
+
+        Returns:
+            List of metric points ordered by date
+        """
+        return await HistoryService(self.session).get_metric_history(
+            paper_id, start_date, end_date, bucket=bucket, max_points=max_points
+        )
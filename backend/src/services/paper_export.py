@@ -0,0 +1,520 @@
+"""Streaming bulk export of the paper corpus.
+
+``GET /api/v1/papers/export`` and ``scripts/export_papers.py`` read papers
+through a server-side cursor (``AsyncSession.stream`` with ``yield_per``)
+and write each batch out as soon as it arrives, so memory stays bounded
+by ``EXPORT_BATCH_SIZE`` rows whatever the corpus size. GitHub metrics and
+citation/reference counts are joined in the export query itself rather
+than loaded per paper.
+
+Supported formats are NDJSON, CSV and Parquet. Parquet needs ``pyarrow``
+and is written one row group per batch.
+"""
+import csv
+import io
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import GitHubMetrics, Paper, PaperReference, PaperTopicMatch
+
+# Rows fetched from the cursor (and written per Parquet row group) at a time
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Exported columns, in output order
+EXPORT_COLUMNS = [
+    "id",
+    "arxiv_id",
+    "doi",
+    "legacy_id",
+    "title",
+    "authors",
+    "abstract",
+    "published_date",
+    "year",
+    "venue",
+    "primary_task",
+    "secondary_task",
+    "tertiary_task",
+    "primary_method",
+    "secondary_method",
+    "tertiary_method",
+    "datasets_used",
+    "metrics_used",
+    "paper_type",
+    "session_type",
+    "accept_status",
+    "github_url",
+    "arxiv_url",
+    "pdf_url",
+    "youtube_url",
+    "project_page_url",
+    "github_stars",
+    "github_forks",
+    "github_average_hype",
+    "github_weekly_hype",
+    "github_monthly_hype",
+    "citation_count",
+    "citations_total",
+    "references_total",
+    "created_at",
+    "updated_at",
+]
+
+LIST_COLUMNS = ("authors", "datasets_used", "metrics_used")
+
+
+@dataclass(frozen=True)
+class PaperFilters:
+    """Filters shared by ``GET /api/v1/papers`` and the export."""
+
+    topic_id: Optional[str] = None
+    primary_task: Optional[str] = None
+    secondary_task: Optional[str] = None
+    method: Optional[str] = None
+    datasets_used: Optional[str] = None
+    metrics_used: Optional[str] = None
+    min_github_stars: Optional[int] = None
+    min_citations: Optional[int] = None
+    venue: Optional[str] = None
+    year: Optional[int] = None
+    year_min: Optional[int] = None
+    year_max: Optional[int] = None
+    has_github: Optional[bool] = None
+    paper_type: Optional[str] = None
+    accept_status: Optional[str] = None
+    search: Optional[str] = None
+
+
+def paper_filter_conditions(filters: PaperFilters) -> list[Any]:
+    """
+    WHERE conditions on ``papers`` columns for the given filters.
+
+    ``topic_id``, ``min_github_stars`` and ``min_citations`` need joins and
+    are applied by the caller.
+
+    Args:
+        filters: Paper filters
+
+    Returns:
+        List of SQLAlchemy conditions
+    """
+    conditions = []
+
+    if filters.primary_task:
+        conditions.append(Paper.primary_task == filters.primary_task)
+
+    if filters.secondary_task:
+        conditions.append(Paper.secondary_task == filters.secondary_task)
+
+    if filters.method:
+        conditions.append(
+            or_(
+                Paper.primary_method == filters.method,
+                Paper.secondary_method == filters.method,
+                Paper.tertiary_method == filters.method,
+            )
+        )
+
+    if filters.datasets_used:
+        # JSONB containment query
+        conditions.append(Paper.datasets_used.contains([filters.datasets_used]))
+
+    if filters.metrics_used:
+        conditions.append(Paper.metrics_used.contains([filters.metrics_used]))
+
+    if filters.venue:
+        conditions.append(Paper.venue.ilike(f"%{filters.venue}%"))
+
+    if filters.year:
+        conditions.append(Paper.year == filters.year)
+
+    if filters.year_min:
+        conditions.append(Paper.year >= filters.year_min)
+
+    if filters.year_max:
+        conditions.append(Paper.year <= filters.year_max)
+
+    if filters.has_github is not None:
+        if filters.has_github:
+            conditions.append(Paper.github_url.isnot(None))
+        else:
+            conditions.append(Paper.github_url.is_(None))
+
+    if filters.paper_type:
+        conditions.append(Paper.paper_type == filters.paper_type)
+
+    if filters.accept_status:
+        conditions.append(Paper.accept_status == filters.accept_status)
+
+    if filters.search:
+        conditions.append(
+            or_(
+                Paper.title.ilike(f"%{filters.search}%"),
+                Paper.abstract.ilike(f"%{filters.search}%"),
+            )
+        )
+
+    return conditions
+
+
+def build_export_query(filters: PaperFilters, sort: str = "published_date_desc") -> Select:
+    """
+    Build the export query: one row per paper with metrics and counts joined.
+
+    Args:
+        filters: Paper filters
+        sort: Sort option (same values as ``GET /api/v1/papers``)
+
+    Returns:
+        Select producing ``EXPORT_COLUMNS``
+    """
+    citations_in = (
+        select(PaperReference.target_paper_id.label("paper_id"), func.count().label("total"))
+        .group_by(PaperReference.target_paper_id)
+        .subquery("citations_in")
+    )
+    citations_out = (
+        select(PaperReference.source_paper_id.label("paper_id"), func.count().label("total"))
+        .group_by(PaperReference.source_paper_id)
+        .subquery("citations_out")
+    )
+    citations_total = func.coalesce(citations_in.c.total, 0)
+    # Scraped stars are preferred over GitHubMetrics, as in the list view
+    github_stars = func.coalesce(Paper.github_stars_scraped, GitHubMetrics.current_stars)
+
+    query = (
+        select(
+            Paper.id,
+            Paper.arxiv_id,
+            Paper.doi,
+            Paper.legacy_id,
+            Paper.title,
+            Paper.authors,
+            Paper.abstract,
+            Paper.published_date,
+            Paper.year,
+            Paper.venue,
+            Paper.primary_task,
+            Paper.secondary_task,
+            Paper.tertiary_task,
+            Paper.primary_method,
+            Paper.secondary_method,
+            Paper.tertiary_method,
+            Paper.datasets_used,
+            Paper.metrics_used,
+            Paper.paper_type,
+            Paper.session_type,
+            Paper.accept_status,
+            Paper.github_url,
+            Paper.arxiv_url,
+            Paper.pdf_url,
+            Paper.youtube_url,
+            Paper.project_page_url,
+            github_stars.label("github_stars"),
+            GitHubMetrics.current_forks.label("github_forks"),
+            GitHubMetrics.average_hype.label("github_average_hype"),
+            GitHubMetrics.weekly_hype.label("github_weekly_hype"),
+            GitHubMetrics.monthly_hype.label("github_monthly_hype"),
+            Paper.citation_count,
+            citations_total.label("citations_total"),
+            func.coalesce(citations_out.c.total, 0).label("references_total"),
+            Paper.created_at,
+            Paper.updated_at,
+        )
+        .outerjoin(GitHubMetrics, GitHubMetrics.paper_id == Paper.id)
+        .outerjoin(citations_in, citations_in.c.paper_id == Paper.id)
+        .outerjoin(citations_out, citations_out.c.paper_id == Paper.id)
+    )
+
+    if filters.topic_id:
+        query = query.join(PaperTopicMatch, Paper.id == PaperTopicMatch.paper_id).where(
+            PaperTopicMatch.topic_id == filters.topic_id
+        )
+
+    conditions = paper_filter_conditions(filters)
+    if filters.min_github_stars is not None:
+        conditions.append(GitHubMetrics.current_stars >= filters.min_github_stars)
+    if filters.min_citations is not None:
+        conditions.append(citations_total >= filters.min_citations)
+    if conditions:
+        query = query.where(and_(*conditions))
+
+    if sort == "github_stars_desc":
+        order = [GitHubMetrics.current_stars.desc().nulls_last()]
+    elif sort == "weekly_hype_desc":
+        order = [GitHubMetrics.weekly_hype.desc().nulls_last()]
+    elif sort == "monthly_hype_desc":
+        order = [GitHubMetrics.monthly_hype.desc().nulls_last()]
+    elif sort == "stars":
+        order = [func.coalesce(github_stars, 0).desc(), Paper.published_date.desc()]
+    elif sort == "citations":
+        order = [Paper.citation_count.desc().nulls_last()]
+    elif sort == "citations_desc":
+        order = [citations_total.desc()]
+    elif sort == "published_date_asc":
+        order = [Paper.published_date.asc()]
+    else:
+        order = [Paper.published_date.desc()]
+
+    # Unique tie-breaker keeps the order stable across exports
+    return query.order_by(*order, Paper.id)
+
+
+def _export_record(row: Any) -> dict[str, Any]:
+    record = dict(row)
+    record["id"] = str(record["id"])
+    return record
+
+
+async def stream_export_rows(
+    db: AsyncSession,
+    filters: PaperFilters,
+    sort: str = "published_date_desc",
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Stream export rows from a server-side cursor.
+
+    Args:
+        db: Database session
+        filters: Paper filters
+        sort: Sort option
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        Batches of row dicts keyed by ``EXPORT_COLUMNS``
+    """
+    query = build_export_query(filters, sort).execution_options(yield_per=batch_size)
+    result = await db.stream(query)
+    async for partition in result.mappings().partitions():
+        yield [_export_record(row) for row in partition]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_ndjson(rows: Iterable[dict[str, Any]]) -> bytes:
+    """
+    Encode rows as newline-delimited JSON.
+
+    Args:
+        rows: Export rows
+
+    Returns:
+        One JSON object per line
+    """
+    return b"".join(
+        json.dumps(row, default=_json_default, ensure_ascii=False).encode() + b"\n"
+        for row in rows
+    )
+
+
+def _csv_value(column: str, value: Any) -> Any:
+    if value is None:
+        return ""
+    if column in LIST_COLUMNS:
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def encode_csv(rows: Iterable[dict[str, Any]], header: bool = False) -> bytes:
+    """
+    Encode rows as CSV; list columns are written as JSON arrays.
+
+    Args:
+        rows: Export rows
+        header: Write the header line first
+
+    Returns:
+        CSV bytes
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        writer.writerow([_csv_value(column, row[column]) for column in EXPORT_COLUMNS])
+    return buffer.getvalue().encode()
+
+
+def parquet_schema() -> Any:
+    """
+    Arrow schema of the Parquet export.
+
+    Returns:
+        pyarrow.Schema
+
+    Raises:
+        ImportError: pyarrow is not installed
+    """
+    import pyarrow as pa
+
+    text = pa.string()
+    types = {column: text for column in EXPORT_COLUMNS}
+    types.update(
+        {
+            "authors": pa.list_(text),
+            "datasets_used": pa.list_(text),
+            "metrics_used": pa.list_(text),
+            "published_date": pa.date32(),
+            "year": pa.int32(),
+            "github_stars": pa.int64(),
+            "github_forks": pa.int64(),
+            "github_average_hype": pa.float64(),
+            "github_weekly_hype": pa.float64(),
+            "github_monthly_hype": pa.float64(),
+            "citation_count": pa.int64(),
+            "citations_total": pa.int64(),
+            "references_total": pa.int64(),
+            "created_at": pa.timestamp("us", tz="UTC"),
+            "updated_at": pa.timestamp("us", tz="UTC"),
+        }
+    )
+    return pa.schema([(column, types[column]) for column in EXPORT_COLUMNS])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back in chunks."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetStreamWriter:
+    """
+    Parquet writer that emits the file incrementally.
+
+    Each call to :meth:`write_batch` writes one row group and returns the
+    bytes produced so far; :meth:`close` returns the footer. Concatenating
+    all returned chunks gives a complete Parquet file. Pass ``sink`` to
+    write to a file instead (the methods then return ``b""``).
+    """
+
+    def __init__(self, sink: Optional[Any] = None):
+        """
+        Initialize writer.
+
+        Args:
+            sink: Path or binary file to write to (default: return chunks)
+
+        Raises:
+            ImportError: pyarrow is not installed
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._chunk_sink = _ChunkSink() if sink is None else None
+        self.schema = parquet_schema()
+        target = pa.PythonFile(self._chunk_sink, mode="w") if sink is None else sink
+        self._writer = pq.ParquetWriter(target, self.schema, compression="zstd")
+
+    def _drain(self) -> bytes:
+        return self._chunk_sink.drain() if self._chunk_sink is not None else b""
+
+    def write_batch(self, rows: list[dict[str, Any]]) -> bytes:
+        """
+        Write rows as one row group.
+
+        Args:
+            rows: Export rows
+
+        Returns:
+            Parquet bytes produced by this batch
+        """
+        if rows:
+            table = self._pa.Table.from_pylist(rows, schema=self.schema)
+            self._writer.write_table(table)
+        return self._drain()
+
+    def close(self) -> bytes:
+        """
+        Finish the file.
+
+        Returns:
+            Remaining bytes (including the footer)
+        """
+        self._writer.close()
+        return self._drain()
+
+
+async def export_chunks(
+    db: AsyncSession,
+    filters: PaperFilters,
+    export_format: str,
+    sort: str = "published_date_desc",
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Encode the export as a stream of byte chunks, one per cursor batch.
+
+    Args:
+        db: Database session
+        filters: Paper filters
+        export_format: "ndjson", "csv" or "parquet"
+        sort: Sort option
+        batch_size: Rows per chunk
+
+    Yields:
+        Encoded chunks
+
+    Raises:
+        ValueError: Unknown format
+        ImportError: Parquet requested without pyarrow
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {export_format}")
+
+    rows = stream_export_rows(db, filters, sort, batch_size)
+
+    if export_format == "parquet":
+        writer = ParquetStreamWriter()
+        async for batch in rows:
+            chunk = writer.write_batch(batch)
+            if chunk:
+                yield chunk
+        yield writer.close()
+        return
+
+    if export_format == "csv":
+        yield encode_csv([], header=True)
+        async for batch in rows:
+            yield encode_csv(batch)
+        return
+
+    async for batch in rows:
+        yield encode_ndjson(batch)
@@ -0,0 +1,262 @@
+"""Per-paper hype score breakdowns with a two-tier cache.
+
+Backs ``GET /papers/{id}/hype-scores`` and the bulk
+``POST /papers/hype-scores``. Scores are computed for many papers with two
+queries (papers, then 30 days of star snapshots) and cached:
+
+- in-process: a size-bounded LRU (``HYPE_CACHE_MAX_ENTRIES``) whose entries
+  expire after ``HYPE_CACHE_TTL`` seconds;
+- shared: Redis (when configured), so uvicorn workers reuse each other's
+  results.
+
+The star tracker calls :func:`publish_hype_refresh` after writing new star
+snapshots: it clears the local tier and bumps a version key that is part of
+every Redis key, and other processes check it every few seconds.
+"""
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import GitHubStarSnapshot, Paper
+from ..utils.ttl_cache import TTLCache
+from .cache_service import get_cache
+
+# In-process entries kept per worker
+HYPE_CACHE_MAX_ENTRIES = int(os.getenv("HYPE_CACHE_MAX_ENTRIES", "10000"))
+
+# Entry lifetime in seconds (both tiers)
+HYPE_CACHE_TTL = int(os.getenv("HYPE_CACHE_TTL", "3600"))
+
+# Redis key bumped whenever star snapshots are written
+VERSION_KEY = "hype_scores:version"
+
+# Seconds between Redis version checks
+VERSION_CHECK_INTERVAL = 5.0
+
+# Maximum paper ids per bulk request
+MAX_BULK_PAPERS = 200
+
+
+def hype_scores_from_history(
+    published_date: Optional[date],
+    citations: int,
+    points: Sequence[tuple[date, int]],
+    today: Optional[date] = None,
+    now: Optional[datetime] = None,
+) -> dict[str, Any]:
+    """Hype score breakdown from the last 30 days of daily star counts.
+
+    Args:
+        published_date: Paper publication date
+        citations: Citation count
+        points: (snapshot_date, stars) for the last 30 days, oldest first
+        today: Reference date for the weekly window (default today)
+        now: Reference time for the paper age (default utcnow)
+
+    Returns:
+        Dict with average_hype, weekly_hype, monthly_hype and formula_explanation
+    """
+    today = today or date.today()
+    now = now or datetime.utcnow()
+
+    # Current stars (latest snapshot)
+    stars = points[-1][1] if points else 0
+
+    # Age in days
+    if published_date:
+        if isinstance(published_date, date) and not isinstance(published_date, datetime):
+            pub_datetime = datetime.combine(published_date, datetime.min.time())
+        else:
+            pub_datetime = published_date
+        age_days = (now - pub_datetime).days
+    else:
+        age_days = 1
+    age_days = max(age_days, 1)
+
+    # SOTAPapers formula: (citations * 100 + stars) / age_days
+    average_hype = (citations * 100 + stars) / age_days
+
+    # Weekly hype (last 7 days growth)
+    seven_days_ago = today - timedelta(days=7)
+    weekly_points = [stars for day, stars in points if day >= seven_days_ago]
+    weekly_hype = 0.0
+    if len(weekly_points) >= 2:
+        weekly_hype = (weekly_points[-1] - weekly_points[0]) / 7
+
+    # Monthly hype (last 30 days growth)
+    monthly_hype = 0.0
+    if len(points) >= 2:
+        monthly_hype = (points[-1][1] - points[0][1]) / 30
+
+    return {
+        "average_hype": round(average_hype, 2),
+        "weekly_hype": round(weekly_hype, 2),
+        "monthly_hype": round(monthly_hype, 2),
+        "formula_explanation": (
+            f"Average: (citations×100 + stars) / age_days = ({citations}×100 + {stars}) / {age_days}"
+        ),
+    }
+
+
+async def compute_paper_hype_scores(
+    session: AsyncSession,
+    paper_ids: Sequence[UUID],
+) -> dict[UUID, dict[str, Any]]:
+    """Compute hype score breakdowns for many papers with two queries.
+
+    Args:
+        session: Database session
+        paper_ids: Paper UUIDs
+
+    Returns:
+        Mapping of paper id to breakdown (unknown papers are omitted)
+    """
+    if not paper_ids:
+        return {}
+
+    papers = (
+        await session.execute(
+            select(Paper.id, Paper.published_date, Paper.citation_count)
+            .where(Paper.id.in_(list(paper_ids)))
+        )
+    ).all()
+    if not papers:
+        return {}
+
+    today = date.today()
+    snapshots = await session.execute(
+        select(
+            GitHubStarSnapshot.paper_id,
+            GitHubStarSnapshot.snapshot_date,
+            GitHubStarSnapshot.star_count,
+        )
+        .where(
+            GitHubStarSnapshot.paper_id.in_([paper.id for paper in papers]),
+            GitHubStarSnapshot.snapshot_date >= today - timedelta(days=30),
+            GitHubStarSnapshot.snapshot_date <= today,
+        )
+        .order_by(GitHubStarSnapshot.paper_id, GitHubStarSnapshot.snapshot_date.asc())
+    )
+    history: dict[UUID, list[tuple[date, int]]] = {}
+    for paper_id, snapshot_date, star_count in snapshots:
+        history.setdefault(paper_id, []).append((snapshot_date, star_count))
+
+    now = datetime.utcnow()
+    return {
+        paper.id: hype_scores_from_history(
+            paper.published_date,
+            paper.citation_count or 0,
+            history.get(paper.id, []),
+            today=today,
+            now=now,
+        )
+        for paper in papers
+    }
+
+
+class PaperHypeCache:
+    """Local LRU/TTL tier in front of a versioned Redis tier."""
+
+    def __init__(self, maxsize: int = HYPE_CACHE_MAX_ENTRIES, ttl: int = HYPE_CACHE_TTL):
+        """Initialize empty cache.
+
+        Args:
+            maxsize: Maximum in-process entries
+            ttl: Entry lifetime in seconds
+        """
+        self.ttl = ttl
+        self._local = TTLCache(maxsize, ttl)
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    async def _sync_version(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        version = await get_cache().get(VERSION_KEY)
+        if version != self._version:
+            self._local.clear()
+            self._version = version
+
+    def _redis_key(self, paper_id: UUID) -> str:
+        return f"hype_scores:{self._version or 0}:{paper_id}"
+
+    async def get_many(
+        self,
+        session: AsyncSession,
+        paper_ids: Sequence[UUID],
+    ) -> dict[UUID, dict[str, Any]]:
+        """Hype score breakdowns for many papers (local, then Redis, then DB).
+
+        Args:
+            session: Database session (only used for misses)
+            paper_ids: Paper UUIDs
+
+        Returns:
+            Mapping of paper id to breakdown (unknown papers are omitted)
+        """
+        await self._sync_version()
+        scores: dict[UUID, dict[str, Any]] = {}
+
+        missing = []
+        for paper_id in dict.fromkeys(paper_ids):
+            cached = self._local.get(paper_id)
+            if cached is None:
+                missing.append(paper_id)
+            else:
+                scores[paper_id] = cached
+        if not missing:
+            return scores
+
+        cache = get_cache()
+        remote = await cache.get_many([self._redis_key(paper_id) for paper_id in missing])
+        uncached = []
+        for paper_id, value in zip(missing, remote, strict=True):
+            if value is None:
+                uncached.append(paper_id)
+            else:
+                scores[paper_id] = value
+                self._local.set(paper_id, value)
+        if not uncached:
+            return scores
+
+        computed = await compute_paper_hype_scores(session, uncached)
+        for paper_id, value in computed.items():
+            scores[paper_id] = value
+            self._local.set(paper_id, value)
+        await cache.set_many(
+            {self._redis_key(paper_id): value for paper_id, value in computed.items()},
+            ttl=self.ttl,
+        )
+        return scores
+
+    def invalidate(self) -> None:
+        """Drop the local tier."""
+        self._local.clear()
+
+
+_hype_cache: Optional[PaperHypeCache] = None
+
+
+def get_paper_hype_cache() -> PaperHypeCache:
+    """Get or create the process-wide hype score cache.
+
+    Returns:
+        PaperHypeCache instance
+    """
+    global _hype_cache
+    if _hype_cache is None:
+        _hype_cache = PaperHypeCache()
+    return _hype_cache
+
+
+async def publish_hype_refresh() -> None:
+    """Invalidate hype scores in this process and signal other processes."""
+    get_paper_hype_cache().invalidate()
+    await get_cache().increment(VERSION_KEY)
@@ -0,0 +1,491 @@
+"""CPU-only paper similarity index (hashed TF-IDF + IVF).
+
+Titles and abstracts are tokenized into unigrams and bigrams, hashed into a
+fixed feature space, weighted by TF-IDF and folded (signed feature hashing)
+into dense ``VECTOR_DIM``-dimensional unit vectors. Vectors are stored as
+float16 in memory-mapped ``.npy`` files under ``SIMILARITY_INDEX_DIR``.
+
+Approximate nearest-neighbour search uses an inverted-file (IVF) layout:
+spherical k-means centroids partition the vectors, a query probes the
+``SIMILARITY_INDEX_NPROBE`` nearest partitions and reranks their members
+exactly. Below ``MIN_TRAIN_SIZE`` vectors the index is searched exhaustively.
+
+The index is built incrementally by ``jobs/update_similarity_index.py``
+(one writer). Each save publishes a new version directory (``v000001``, ...)
+by atomically replacing the ``CURRENT`` pointer file; published versions are
+never modified, since readers map them. The writer copies the arrays into a
+new version on its first change. API processes open the current version
+read-only at startup and a background task swaps in the next one.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = Path(os.getenv("SIMILARITY_INDEX_DIR", "data/similarity_index"))
+
+# Dense vector size and hashed feature space (power of two)
+VECTOR_DIM = 384
+HASH_SPACE = 1 << 20
+
+# Vectors needed before IVF partitions are trained
+MIN_TRAIN_SIZE = 2_000
+
+# Partitions probed per query
+NPROBE = int(os.getenv("SIMILARITY_INDEX_NPROBE", "8"))
+
+# Retrain partitions once the index has grown this much since training
+RETRAIN_GROWTH = 4.0
+
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE = 100_000
+
+# Seconds between checks for a newer on-disk version (API processes)
+RELOAD_CHECK_INTERVAL = 10.0
+
+# Pointer file naming the published version directory
+CURRENT_FILE = "CURRENT"
+
+_VERSION = re.compile(r"v(\d+)")
+
+STOPWORDS = frozenset(
+    "a an and are as at be been but by can for from has have in into is it its of on "
+    "or our that the their these this to using via was we were which while with "
+    "approach based method methods paper propose proposed results show also new use".split()
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Unigrams and bigrams of lowercase alphanumeric tokens (stopwords removed)."""
+    words = [w for w in _TOKEN.findall(text.lower()) if len(w) > 1 and w not in STOPWORDS]
+    return words + [f"{a} {b}" for a, b in zip(words[:-1], words[1:], strict=True)]
+
+
+def _paper_text(title: str, abstract: Optional[str]) -> str:
+    # Title counted twice: it is short and the most specific signal
+    return f"{title} {title} {abstract or ''}"
+
+
+class SimilarityIndex:
+    """Memory-mapped hashed TF-IDF vectors with an IVF search structure."""
+
+    def __init__(
+        self,
+        path: Path = INDEX_DIR,
+        read_only: bool = False,
+        dim: int = VECTOR_DIM,
+        fresh: bool = False,
+    ):
+        """Open the current version of the index at ``path`` (or start a new one in write mode).
+
+        Args:
+            path: Index directory
+            read_only: Refuse writes (API processes)
+            dim: Vector dimension for a new index
+            fresh: Start empty instead of opening the current version, which
+                stays published until :meth:`save` (write mode only)
+        """
+        self.path = Path(path)
+        self.read_only = read_only
+        self.dim = dim
+        # Published version held by this instance, and the directory its
+        # arrays live in (an unpublished version once the writer changed it)
+        self.version: Optional[str] = None
+        self._dir: Optional[Path] = None
+        self._working = False
+        self.size = 0
+        self.n_docs = 0
+        self.trained_size = 0
+        self.watermark: Optional[dict] = None
+        self.df = np.zeros(HASH_SPACE, dtype=np.int32)
+        self.centroids: Optional[np.ndarray] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._ids: Optional[np.ndarray] = None
+        self._lists: Optional[np.ndarray] = None
+        # Row lookup: ids sorted as 16-byte keys (searched with np.searchsorted)
+        # plus a dict for rows added since the index was opened
+        self._sorted_ids = np.empty(0, dtype="S16")
+        self._sorted_rows = np.empty(0, dtype=np.int64)
+        self._added: dict[UUID, int] = {}
+        if not fresh:
+            self._load()
+
+    # -- persistence -------------------------------------------------------
+
+    def _current_version(self) -> Optional[str]:
+        """Name of the published version directory, or None if nothing was saved."""
+        try:
+            return (self.path / CURRENT_FILE).read_text().strip()
+        except FileNotFoundError:
+            return None
+
+    def _load(self) -> None:
+        version = self._current_version()
+        if version is None:
+            return
+
+        directory = self.path / version
+        meta = json.loads((directory / "meta.json").read_text())
+        self.version = version
+        self._dir = directory
+        self.dim = meta["dim"]
+        self.size = meta["size"]
+        self.n_docs = meta["n_docs"]
+        self.trained_size = meta["trained_size"]
+        self.watermark = meta.get("watermark")
+
+        # Published versions are never written; the writer copies on first change
+        self._vectors = np.load(directory / "vectors.npy", mmap_mode="r")
+        self._ids = np.load(directory / "ids.npy", mmap_mode="r")
+        self._lists = np.load(directory / "lists.npy", mmap_mode="r")
+        self.df = np.load(directory / "df.npy")
+        centroids_path = directory / "centroids.npy"
+        self.centroids = np.load(centroids_path) if centroids_path.exists() else None
+
+        keys = self._ids[:self.size].view("S16").ravel()
+        self._sorted_rows = np.argsort(keys)
+        self._sorted_ids = keys[self._sorted_rows]
+        self._added = {}
+
+    def _row(self, paper_id: UUID) -> Optional[int]:
+        """Row of an indexed paper, or None."""
+        row = self._added.get(paper_id)
+        if row is not None:
+            return row
+        key = np.frombuffer(paper_id.bytes, dtype="S16")[0]
+        pos = int(np.searchsorted(self._sorted_ids, key))
+        if pos < len(self._sorted_ids) and self._sorted_ids[pos] == key:
+            return int(self._sorted_rows[pos])
+        return None
+
+    def _versions(self) -> dict[str, int]:
+        """Version directories under the index path, by name -> number."""
+        if not self.path.exists():
+            return {}
+        return {
+            entry.name: int(match.group(1))
+            for entry in self.path.iterdir()
+            if entry.is_dir() and (match := _VERSION.fullmatch(entry.name))
+        }
+
+    def _begin_version(self) -> None:
+        """Copy the arrays into a new, unpublished version before the first change."""
+        if self.read_only:
+            raise RuntimeError("Similarity index opened read-only")
+        if self._working:
+            return
+
+        number = max(self._versions().values(), default=0) + 1
+        directory = self.path / f"v{number:06d}"
+        directory.mkdir(parents=True)
+        self._dir = directory
+        self._working = True
+        if self._vectors is not None:
+            self._allocate(len(self._vectors))
+
+    def _allocate(self, capacity: int) -> None:
+        """Copy the arrays into ``capacity``-row memory maps in the working version."""
+        self._begin_version()
+        arrays = {
+            "vectors": (np.float16, (capacity, self.dim)),
+            "ids": (np.uint8, (capacity, 16)),
+            "lists": (np.int32, (capacity,)),
+        }
+        for name, (dtype, shape) in arrays.items():
+            tmp = self._dir / f"{name}.tmp.npy"
+            grown = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=shape)
+            old = getattr(self, f"_{name}")
+            if old is not None and self.size:
+                grown[:self.size] = old[:self.size]
+            grown.flush()
+            del grown
+            os.replace(tmp, self._dir / f"{name}.npy")
+            setattr(self, f"_{name}", np.load(self._dir / f"{name}.npy", mmap_mode="r+"))
+
+    def save(self, watermark: Optional[dict] = None) -> None:
+        """Publish the index as a new version.
+
+        Writes IDF statistics, centroids and metadata into the working
+        version, then points ``CURRENT`` at it. Versions other than the new
+        one and the one it replaced are removed; readers still mapping the
+        replaced version keep a valid view until they swap.
+
+        Args:
+            watermark: Ingestion position to resume from (stored in metadata)
+        """
+        if self.read_only:
+            raise RuntimeError("Similarity index opened read-only")
+        if not self._working and self.version is not None and watermark in (None, self.watermark):
+            return  # Nothing changed since the version was opened
+        if self._vectors is None:
+            self._allocate(1_024)
+        self._begin_version()
+
+        for array in (self._vectors, self._ids, self._lists):
+            array.flush()
+        np.save(self._dir / "df.npy", self.df)
+        if self.centroids is not None:
+            np.save(self._dir / "centroids.npy", self.centroids)
+
+        if watermark is not None:
+            self.watermark = watermark
+        meta = {
+            "dim": self.dim,
+            "size": self.size,
+            "n_docs": self.n_docs,
+            "trained_size": self.trained_size,
+            "watermark": self.watermark,
+            "saved_at": time.time(),
+        }
+        (self._dir / "meta.json").write_text(json.dumps(meta))
+
+        replaced = self._current_version()
+        tmp = self.path / f"{CURRENT_FILE}.tmp"
+        tmp.write_text(self._dir.name)
+        os.replace(tmp, self.path / CURRENT_FILE)
+        self.version = self._dir.name
+        self._working = False
+
+        for name in self._versions().keys() - {self.version, replaced}:
+            shutil.rmtree(self.path / name, ignore_errors=True)
+        logger.info(f"Published similarity index {self.version}: {self.size} papers")
+
+    def is_stale(self) -> bool:
+        """Whether the writer published a newer version since this index was opened."""
+        current = self._current_version()
+        return current is not None and current != self.version
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, paper_id: UUID) -> bool:
+        return self._row(paper_id) is not None
+
+    # -- vectors -----------------------------------------------------------
+
+    @staticmethod
+    def _features(text: str) -> tuple[np.ndarray, np.ndarray]:
+        counts = Counter(zlib.crc32(token.encode()) & (HASH_SPACE - 1) for token in tokenize(text))
+        features = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        return features, tf
+
+    def _vectorize(self, features: np.ndarray, tf: np.ndarray) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if len(features) == 0:
+            return vector
+        idf = np.log((1 + self.n_docs) / (1 + self.df[features])) + 1.0
+        weights = (1.0 + np.log(tf)) * idf
+        # Signed feature hashing into the dense space
+        signs = 1.0 - 2.0 * ((features // self.dim) & 1)
+        vector += np.bincount(features % self.dim, weights=weights * signs, minlength=self.dim)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def embed(self, text: str) -> np.ndarray:
+        """Unit vector for arbitrary text using the current IDF statistics."""
+        return self._vectorize(*self._features(text))
+
+    def embed_paper(self, title: str, abstract: Optional[str]) -> np.ndarray:
+        """Unit vector for a paper's title and abstract."""
+        return self.embed(_paper_text(title, abstract))
+
+    def vector(self, paper_id: UUID) -> Optional[np.ndarray]:
+        """Stored vector of an indexed paper."""
+        row = self._row(paper_id)
+        if row is None:
+            return None
+        return self._vectors[row].astype(np.float32)
+
+    # -- writes ------------------------------------------------------------
+
+    def add(self, paper_id: UUID, title: str, abstract: Optional[str]) -> None:
+        """Add a paper, or re-embed it if it is already indexed.
+
+        Args:
+            paper_id: Paper UUID
+            title: Paper title
+            abstract: Paper abstract
+        """
+        self._begin_version()
+
+        features, tf = self._features(_paper_text(title, abstract))
+        row = self._row(paper_id)
+        if row is None:
+            # Document frequencies only count each paper once
+            self.df[features] += 1
+            self.n_docs += 1
+            capacity = 0 if self._vectors is None else len(self._vectors)
+            if self.size >= capacity:
+                self._allocate(max(1_024, capacity * 2))
+            row = self.size
+            self.size += 1
+            self._added[paper_id] = row
+            self._ids[row] = np.frombuffer(paper_id.bytes, dtype=np.uint8)
+
+        vector = self._vectorize(features, tf)
+        self._vectors[row] = vector
+        self._lists[row] = self._nearest_list(vector[None, :])[0] if self.centroids is not None else 0
+
+    def add_many(self, papers: Iterable[tuple[UUID, str, Optional[str]]]) -> int:
+        """Add (paper_id, title, abstract) tuples; returns the number added."""
+        count = 0
+        for paper_id, title, abstract in papers:
+            self.add(paper_id, title, abstract)
+            count += 1
+        return count
+
+    # -- IVF ---------------------------------------------------------------
+
+    def _nearest_list(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    def needs_training(self) -> bool:
+        """Whether partitions are missing or stale for the current size."""
+        if self.size < MIN_TRAIN_SIZE:
+            return False
+        return self.centroids is None or self.size >= self.trained_size * RETRAIN_GROWTH
+
+    def train(self, nlist: Optional[int] = None, seed: int = 0) -> None:
+        """Train IVF partitions with spherical k-means and reassign every vector.
+
+        Args:
+            nlist: Number of partitions (default ~4 * sqrt(size))
+            seed: Random seed for sampling and initialization
+        """
+        if self.read_only:
+            raise RuntimeError("Similarity index opened read-only")
+        if self.size == 0:
+            return
+        self._begin_version()
+
+        nlist = nlist or int(np.clip(4 * np.sqrt(self.size), 16, 4_096))
+        nlist = min(nlist, self.size)
+        rng = np.random.default_rng(seed)
+
+        sample_rows = np.sort(rng.choice(self.size, min(self.size, KMEANS_SAMPLE), replace=False))
+        sample = self._vectors[sample_rows].astype(np.float32)
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+        for _ in range(KMEANS_ITERATIONS):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            nonempty = norms[:, 0] > 0
+            centroids[nonempty] = sums[nonempty] / norms[nonempty]
+
+        self.centroids = centroids
+        for start in range(0, self.size, 65_536):
+            chunk = self._vectors[start:start + 65_536].astype(np.float32)
+            self._lists[start:start + len(chunk)] = self._nearest_list(chunk)
+        self.trained_size = self.size
+        logger.info(f"Trained similarity index: {nlist} partitions over {self.size} vectors")
+
+    # -- search ------------------------------------------------------------
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        exclude: Sequence[UUID] = (),
+        nprobe: int = NPROBE,
+    ) -> list[tuple[UUID, float]]:
+        """Approximate k nearest papers by cosine similarity.
+
+        Args:
+            query: Unit query vector
+            k: Number of results
+            exclude: Paper ids to leave out
+            nprobe: Partitions to probe
+
+        Returns:
+            (paper_id, similarity) pairs, most similar first
+        """
+        if self.size == 0:
+            return []
+
+        if self.centroids is None:
+            candidates = np.arange(self.size)
+        else:
+            probe = np.argsort(-(self.centroids @ query))[:nprobe]
+            candidates = np.flatnonzero(np.isin(self._lists[:self.size], probe))
+
+        excluded = {row for row in map(self._row, exclude) if row is not None}
+        if excluded:
+            candidates = candidates[~np.isin(candidates, list(excluded))]
+        if len(candidates) == 0:
+            return []
+
+        scores = self._vectors[candidates].astype(np.float32) @ query
+        top = min(k, len(candidates))
+        best = np.argpartition(-scores, top - 1)[:top]
+        best = best[np.argsort(-scores[best])]
+
+        return [
+            (UUID(bytes=self._ids[candidates[i]].tobytes()), float(scores[i]))
+            for i in best
+        ]
+
+    def related(self, paper_id: UUID, k: int = 10) -> list[tuple[UUID, float]]:
+        """Papers most similar to an indexed paper (empty if not indexed)."""
+        vector = self.vector(paper_id)
+        if vector is None:
+            return []
+        return self.search(vector, k=k, exclude=[paper_id])
+
+
+_index: Optional[SimilarityIndex] = None
+
+
+def get_similarity_index() -> SimilarityIndex:
+    """Get the process-wide read-only similarity index.
+
+    The index is normally opened at startup and kept current by
+    ``refresh_similarity_index``; it is opened here only if that has not run.
+
+    Returns:
+        SimilarityIndex instance
+    """
+    global _index
+    if _index is None:
+        _index = SimilarityIndex(read_only=True)
+    return _index
+
+
+async def refresh_similarity_index(interval: float = RELOAD_CHECK_INTERVAL) -> None:
+    """Open the read-only index, then swap in a new copy whenever the writer saves one.
+
+    Runs as a background task in API processes so that opening the index
+    (which sorts every id) never happens on a request. The replacement is
+    opened in a worker thread and swapped in whole, so in-flight searches
+    keep using the copy they started with.
+
+    Args:
+        interval: Seconds between checks for a newer version
+    """
+    global _index
+    if _index is None:
+        _index = await asyncio.to_thread(SimilarityIndex, read_only=True)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if _index.is_stale():
+                _index = await asyncio.to_thread(SimilarityIndex, _index.path, read_only=True)
+                logger.info(f"Reloaded similarity index: {len(_index)} papers")
+        except Exception as e:
+            logger.warning(f"Similarity index reload failed: {e}")
@@ -1,13 +1,145 @@
 """TopicMatchingService for LLM-based paper-topic matching.
 
 Uses local LLM (llama.cpp) to calculate relevance scores between papers and topics.
+
+:class:`BatchTopicMatcher` scores a paper against every topic in one pass
+over its text (Aho–Corasick over all topic names and keywords), with the
+same scores as the per-topic keyword fallback.
+
+Given a :class:`~.similarity_index.SimilarityIndex`, both also score topics
+by TF-IDF cosine similarity between the paper and the topic's name,
+description and keywords, and keep the higher of the two scores.
 """
-from typing import Optional
+import os
+from typing import Any, Iterable, Optional, Sequence
 from uuid import UUID
 
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Paper, PaperTopicMatch, Topic
+from ..utils.aho_corasick import AhoCorasick
+from .similarity_index import SimilarityIndex
+
+# Rows per INSERT ... ON CONFLICT statement (4 bind params per row)
+UPSERT_CHUNK_SIZE = 5_000
+
+# Paper-topic cosine similarity that earns the maximum relevance of 10.0
+TOPIC_SIMILARITY_FULL_SCORE = float(os.getenv("TOPIC_SIMILARITY_FULL_SCORE", "0.5"))
+
+
+def keyword_relevance(name_matched: bool, keyword_matches: int) -> float:
+    """Relevance score from keyword matching (see ``_keyword_matching_fallback``).
+
+    Args:
+        name_matched: Topic name occurs in the paper text
+        keyword_matches: Number of topic keywords occurring in the paper text
+
+    Returns:
+        Relevance score (0.0-10.0)
+    """
+    if name_matched:
+        return 8.0  # High relevance if exact match
+    if keyword_matches > 0:
+        # Score based on keyword matches (max 10.0)
+        return min(10.0, 6.0 + (keyword_matches * 0.5))
+    return 5.0  # Neutral score as fallback
+
+
+def embedding_relevance(similarity: float) -> float:
+    """Relevance score from paper-topic cosine similarity.
+
+    Args:
+        similarity: Cosine similarity of the TF-IDF vectors
+
+    Returns:
+        Relevance score (5.0-10.0); non-positive similarity is neutral
+    """
+    return 5.0 + 5.0 * min(1.0, max(0.0, similarity) / TOPIC_SIMILARITY_FULL_SCORE)
+
+
+def topic_text(topic: Topic) -> str:
+    """Text a topic is embedded from (name, description and keywords)."""
+    return " ".join([topic.name, topic.description or "", *(topic.keywords or [])])
+
+
+class BatchTopicMatcher:
+    """Scores papers against all topics with one keyword automaton.
+
+    Compile once per job; :meth:`score` then scans each paper's title and
+    abstract once, however many topics there are.
+    """
+
+    def __init__(self, topics: Sequence[Topic], similarity_index: Optional[SimilarityIndex] = None):
+        """Compile topic names and keywords into one automaton.
+
+        Args:
+            topics: Topics to match against
+            similarity_index: Optional index for embedding relevance
+        """
+        self.topic_ids: list[UUID] = [topic.id for topic in topics]
+        self.similarity_index = similarity_index
+        self._topic_vectors: Optional[np.ndarray] = None
+        if similarity_index is not None and topics:
+            self._topic_vectors = np.stack([similarity_index.embed(topic_text(topic)) for topic in topics])
+
+        pattern_ids: dict[str, int] = {}
+        # pattern id -> [(topic index, is_name), ...] (one entry per occurrence)
+        self._targets: list[list[tuple[int, bool]]] = []
+
+        def add(pattern: str, topic_index: int, is_name: bool) -> None:
+            pattern_id = pattern_ids.get(pattern)
+            if pattern_id is None:
+                pattern_id = pattern_ids[pattern] = len(self._targets)
+                self._targets.append([])
+            self._targets[pattern_id].append((topic_index, is_name))
+
+        for index, topic in enumerate(topics):
+            add(topic.name.lower(), index, True)
+            for keyword in topic.keywords or []:
+                add(keyword.lower(), index, False)
+
+        self.automaton = AhoCorasick(pattern_ids)
+
+    def score(self, title: str, abstract: Optional[str]) -> dict[UUID, float]:
+        """Relevance of every topic with at least one hit.
+
+        Topics without any name or keyword hit (or positive similarity, with
+        an index) score 5.0 and are omitted.
+
+        Args:
+            title: Paper title
+            abstract: Paper abstract
+
+        Returns:
+            Mapping of topic id to relevance score
+        """
+        paper_text = f"{title.lower()} {(abstract or '').lower()}"
+
+        name_hits: set[int] = set()
+        keyword_hits: dict[int, int] = {}
+        for pattern_id in self.automaton.find(paper_text):
+            for topic_index, is_name in self._targets[pattern_id]:
+                if is_name:
+                    name_hits.add(topic_index)
+                else:
+                    keyword_hits[topic_index] = keyword_hits.get(topic_index, 0) + 1
+
+        scores = {
+            self.topic_ids[index]: keyword_relevance(index in name_hits, keyword_hits.get(index, 0))
+            for index in name_hits | keyword_hits.keys()
+        }
+
+        if self._topic_vectors is not None:
+            similarities = self._topic_vectors @ self.similarity_index.embed_paper(title, abstract)
+            for index in np.flatnonzero(similarities > 0):
+                topic_id = self.topic_ids[index]
+                relevance = embedding_relevance(float(similarities[index]))
+                scores[topic_id] = max(scores.get(topic_id, 5.0), relevance)
+
+        return scores
 
 
 class TopicMatchingService:
@@ -17,15 +149,22 @@ class TopicMatchingService:
     Real implementation will use llama.cpp with a quantized 7B model.
     """
 
-    def __init__(self, session: AsyncSession, llm_model_path: Optional[str] = None):
+    def __init__(
+        self,
+        session: AsyncSession,
+        llm_model_path: Optional[str] = None,
+        similarity_index: Optional[SimilarityIndex] = None,
+    ):
         """Initialize service with database session and LLM model.
 
         Args:
             session: Database session
             llm_model_path: Path to llama.cpp model file (optional for MVP)
+            similarity_index: Optional index for embedding relevance
         """
         self.session = session
         self.llm_model_path = llm_model_path
+        self.similarity_index = similarity_index
         self.llm = None  # Will be initialized when needed
 
     def _load_llm_model(self):
@@ -63,6 +202,13 @@ class TopicMatchingService:
 
         # For MVP, use simple keyword matching as placeholder
         score = self._keyword_matching_fallback(paper, topic)
+
+        if self.similarity_index is not None:
+            similarity = float(
+                self.similarity_index.embed_paper(paper.title, paper.abstract)
+                @ self.similarity_index.embed(topic_text(topic))
+            )
+            score = max(score, embedding_relevance(similarity))
         return score
 
     def _keyword_matching_fallback(
@@ -87,19 +233,14 @@ class TopicMatchingService:
 
         # Check if topic name appears in paper
         if topic_name in paper_text:
-            return 8.0  # High relevance if exact match
+            return keyword_relevance(True, 0)
 
         # Check keywords if available
-        if topic.keywords:
-            matches = sum(
-                1 for keyword in topic.keywords
-                if keyword.lower() in paper_text
-            )
-            if matches > 0:
-                # Score based on keyword matches (max 10.0)
-                return min(10.0, 6.0 + (matches * 0.5))
-
-        return 5.0  # Neutral score as fallback
+        matches = sum(
+            1 for keyword in topic.keywords or []
+            if keyword.lower() in paper_text
+        )
+        return keyword_relevance(False, matches)
 
     async def match_paper_to_topics(
         self,
@@ -118,31 +259,19 @@ class TopicMatchingService:
             List of created PaperTopicMatch entities
         """
         from .paper_service import PaperService
-        from .topic_service import TopicService
 
         paper_service = PaperService(self.session)
-        topic_service = TopicService(self.session)
 
         # Get paper
         paper = await paper_service.get_paper_by_id(paper_id)
         if not paper:
             return []
 
-        # Get topics to match
+        # Get topics to match (None = all topics), in one query
+        topic_query = select(Topic)
         if topic_ids:
-            topics = [
-                await topic_service.get_topic_by_id(tid)
-                for tid in topic_ids
-            ]
-            topics = [t for t in topics if t is not None]
-        else:
-            # Match against all topics
-            topics_data = await topic_service.get_all_topics()
-            topics = [
-                await topic_service.get_topic_by_id(UUID(t["id"]))
-                for t in topics_data
-            ]
-            topics = [t for t in topics if t is not None]
+            topic_query = topic_query.where(Topic.id.in_(topic_ids))
+        topics = list((await self.session.execute(topic_query)).scalars().all())
 
         # Calculate relevance and create matches
         matches = []
@@ -161,3 +290,62 @@ class TopicMatchingService:
 
         await self.session.flush()
         return matches
+
+    async def upsert_matches(self, rows: Iterable[dict[str, Any]]) -> int:
+        """Bulk-insert paper-topic matches, updating scores of existing LLM matches.
+
+        Manually curated matches are left untouched.
+
+        Args:
+            rows: Dicts with paper_id, topic_id and relevance_score
+
+        Returns:
+            Number of rows sent
+        """
+        rows = [{**row, "matched_by": "llm"} for row in rows]
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = pg_insert(PaperTopicMatch).values(rows[start:start + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                constraint="unique_paper_topic_pair",
+                set_={
+                    "relevance_score": stmt.excluded.relevance_score,
+                    "matched_at": func.now(),
+                },
+                where=PaperTopicMatch.matched_by == "llm",
+            )
+            await self.session.execute(stmt)
+        return len(rows)
+
+    async def match_papers_bulk(
+        self,
+        papers: Iterable[Any],
+        matcher: BatchTopicMatcher,
+        threshold: float = 6.0,
+    ) -> dict[UUID, int]:
+        """Match many papers against all topics and bulk-insert the matches.
+
+        Args:
+            papers: Rows/objects with id, title and abstract
+            matcher: Compiled batch matcher
+            threshold: Minimum relevance score for match (default 6.0; must be
+                above the neutral 5.0, which topics without hits get)
+
+        Returns:
+            Mapping of paper id to number of topics matched (matched papers only)
+        """
+        rows = []
+        matched: dict[UUID, int] = {}
+        for paper in papers:
+            scores = matcher.score(paper.title, paper.abstract)
+            for topic_id, relevance_score in scores.items():
+                if relevance_score >= threshold:
+                    rows.append({
+                        "paper_id": paper.id,
+                        "topic_id": topic_id,
+                        "relevance_score": relevance_score,
+                    })
+                    matched[paper.id] = matched.get(paper.id, 0) + 1
+
+        if rows:
+            await self.upsert_matches(rows)
+        return matched
@@ -1,11 +1,21 @@
 """TopicService for CRUD operations on topics."""
-from typing import Optional
+import os
+from typing import Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import PaperTopicMatch, Topic
+from .cache_service import get_cache
+
+# Seconds topic paper counts are cached per user
+TOPIC_COUNTS_TTL = int(os.getenv("TOPIC_COUNTS_TTL", "300"))
+
+
+def paper_counts_cache_key(user_id: Optional[UUID] = None) -> str:
+    """Cache key for the paper counts of the topics a user can see."""
+    return f"topics:paper_counts:{user_id or 'public'}"
 
 
 class TopicService:
@@ -105,9 +115,58 @@ class TopicService:
         Returns:
             Number of papers matched to this topic
         """
-        query = select(func.count(PaperTopicMatch.id)).where(
-            PaperTopicMatch.topic_id == topic_id
-        )
+        # count(*) is answered from idx_paper_topic_matches_topic alone
+        query = select(func.count()).where(PaperTopicMatch.topic_id == topic_id)
         result = await self.session.execute(query)
         count = result.scalar_one()
         return count
+
+    async def get_paper_counts(self, topic_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """Get paper counts for many topics in one grouped query.
+
+        Args:
+            topic_ids: Topic UUIDs
+
+        Returns:
+            Mapping of topic id to number of matched papers (0 if none)
+        """
+        if not topic_ids:
+            return {}
+
+        query = (
+            select(PaperTopicMatch.topic_id, func.count())
+            .where(PaperTopicMatch.topic_id.in_(list(topic_ids)))
+            .group_by(PaperTopicMatch.topic_id)
+        )
+        result = await self.session.execute(query)
+        counts = dict(result.all())
+        return {topic_id: counts.get(topic_id, 0) for topic_id in topic_ids}
+
+    async def get_cached_paper_counts(
+        self,
+        topic_ids: Sequence[UUID],
+        user_id: Optional[UUID] = None,
+    ) -> dict[UUID, int]:
+        """Get paper counts, cached per user for ``TOPIC_COUNTS_TTL`` seconds.
+
+        Args:
+            topic_ids: Topic UUIDs visible to the user
+            user_id: Requesting user (None = anonymous)
+
+        Returns:
+            Mapping of topic id to number of matched papers
+        """
+        cache = get_cache()
+        key = paper_counts_cache_key(user_id)
+
+        cached = await cache.get(key)
+        if cached is not None and all(str(topic_id) in cached for topic_id in topic_ids):
+            return {topic_id: cached[str(topic_id)] for topic_id in topic_ids}
+
+        counts = await self.get_paper_counts(topic_ids)
+        await cache.set(
+            key,
+            {str(topic_id): count for topic_id, count in counts.items()},
+            ttl=TOPIC_COUNTS_TTL,
+        )
+        return counts
@@ -1,12 +1,13 @@
 """Vote service for managing user votes on papers.
 
-Provides CRUD operations for upvoting/downvoting papers with vote_count
-automatically maintained by database trigger.
+Provides CRUD operations for upvoting/downvoting papers. Paper.upvote_count,
+downvote_count and vote_count (net) are maintained by a database trigger in
+the same transaction as the vote change; ``reconcile_tallies`` repairs drift.
 """
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import Integer, and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.vote import Vote
@@ -152,17 +153,38 @@ class VoteService:
         Returns:
             tuple[int, int, int]: (upvotes, downvotes, net_votes)
         """
-        # Query all votes for this paper
+        tallies = await self.get_paper_vote_tallies([paper_id])
+        return tallies.get(paper_id, (0, 0, 0))
+
+    async def get_paper_vote_tallies(
+        self,
+        paper_ids: list[UUID]
+    ) -> dict[UUID, tuple[int, int, int]]:
+        """Get vote statistics for multiple papers in one query.
+
+        Args:
+            paper_ids: List of paper IDs
+
+        Returns:
+            dict[UUID, tuple[int, int, int]]: Mapping of paper_id → (upvotes, downvotes, net_votes);
+                unknown papers are omitted
+        """
+        if not paper_ids:
+            return {}
+
         result = await self.session.execute(
-            select(Vote).where(Vote.paper_id == paper_id)
+            select(
+                Paper.id,
+                Paper.upvote_count,
+                Paper.downvote_count,
+                Paper.vote_count,
+            ).where(Paper.id.in_(paper_ids))
         )
-        votes = result.scalars().all()
-
-        upvotes = sum(1 for v in votes if v.vote_type == "upvote")
-        downvotes = sum(1 for v in votes if v.vote_type == "downvote")
-        net_votes = upvotes - downvotes
 
-        return (upvotes, downvotes, net_votes)
+        return {
+            paper_id: (upvotes, downvotes, net_votes)
+            for paper_id, upvotes, downvotes, net_votes in result.all()
+        }
 
     async def get_user_votes_for_papers(
         self,
@@ -192,3 +214,82 @@ class VoteService:
         votes = result.scalars().all()
 
         return {vote.paper_id: vote.vote_type for vote in votes}
+
+    async def reconcile_tallies(self) -> int:
+        """Recount vote tallies from the votes table and fix papers that drifted.
+
+        Drifted papers are found without locks, then locked ``FOR UPDATE``
+        and recounted by a later statement. A concurrent vote either commits
+        before the lock is granted (and is included in the recount) or its
+        trigger waits for the lock and applies its delta on top of the
+        corrected tallies, so no vote is lost.
+
+        Returns:
+            int: Number of papers whose tallies were corrected
+        """
+        drifted_ids = (await self.session.execute(
+            select(_drifted_tallies().c.id)
+        )).scalars().all()
+        if not drifted_ids:
+            await self.session.commit()
+            return 0
+
+        await self.session.execute(
+            select(Paper.id)
+            .where(Paper.id.in_(drifted_ids))
+            .order_by(Paper.id)
+            .with_for_update()
+        )
+
+        drifted = _drifted_tallies(drifted_ids)
+        result = await self.session.execute(
+            update(Paper)
+            .where(Paper.id == drifted.c.id)
+            .values(
+                upvote_count=drifted.c.upvotes,
+                downvote_count=drifted.c.downvotes,
+                vote_count=drifted.c.upvotes - drifted.c.downvotes,
+                updated_at=Paper.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+
+def _drifted_tallies(paper_ids: Optional[list[UUID]] = None):
+    """Build a subquery of papers whose stored tallies disagree with a recount.
+
+    Includes papers that have no votes left but non-zero tallies.
+
+    Args:
+        paper_ids: Restrict the recount to these papers (all papers if None)
+
+    Returns:
+        Subquery with ``id``, ``upvotes`` and ``downvotes`` columns
+    """
+    counts = select(
+        Vote.paper_id,
+        func.count().filter(Vote.vote_type == "upvote").cast(Integer).label("upvotes"),
+        func.count().filter(Vote.vote_type == "downvote").cast(Integer).label("downvotes"),
+    )
+    if paper_ids is not None:
+        counts = counts.where(Vote.paper_id.in_(paper_ids))
+    counts = counts.group_by(Vote.paper_id).subquery()
+    upvotes = func.coalesce(counts.c.upvotes, 0)
+    downvotes = func.coalesce(counts.c.downvotes, 0)
+
+    query = (
+        select(Paper.id, upvotes.label("upvotes"), downvotes.label("downvotes"))
+        .outerjoin(counts, counts.c.paper_id == Paper.id)
+        .where(
+            or_(
+                Paper.upvote_count != upvotes,
+                Paper.downvote_count != downvotes,
+                Paper.vote_count != upvotes - downvotes,
+            )
+        )
+    )
+    if paper_ids is not None:
+        query = query.where(Paper.id.in_(paper_ids))
+    return query.subquery()
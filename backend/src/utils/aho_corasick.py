@@ -0,0 +1,76 @@
+"""Aho–Corasick multi-pattern substring matcher.
+
+Finds which of many patterns occur in a text in a single pass over the text,
+regardless of the number of patterns.
+"""
+from collections import deque
+from typing import Iterable
+
+
+class AhoCorasick:
+    """Automaton over a fixed set of patterns (plain substring semantics)."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """Compile the automaton.
+
+        Args:
+            patterns: Patterns to search for; ids are their positions
+        """
+        self.patterns: list[str] = list(patterns)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        outputs: list[list[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(pattern_id)
+
+        # Breadth-first failure links; outputs inherit their suffix outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+
+        self._out = [tuple(ids) for ids in outputs]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def find(self, text: str) -> set[int]:
+        """Ids of all patterns occurring in ``text``.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of pattern ids
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
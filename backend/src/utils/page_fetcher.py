@@ -0,0 +1,360 @@
+"""
+HTTP-first page fetching with a pool of warm headless browsers.
+
+Most conference pages (CVF open access, virtual conference sites) are
+static, so a plain HTTP GET over a pooled ``requests`` session is tried
+first. Only when the response is unusable (error status, or the caller's
+``ready`` check fails, e.g. a table that is filled in by JavaScript) is the
+page loaded in a browser borrowed from :class:`BrowserPool`. The pool keeps
+up to ``BROWSER_POOL_SIZE`` Chrome sessions open and hands them out again
+instead of starting a new Chrome per page.
+
+The process-wide pool is closed at interpreter exit, and by the Celery
+``worker_process_shutdown`` hook in pool workers (which skip ``atexit``);
+see :func:`close_browser_pool`.
+
+Fetches are counted per mode (``http``, ``browser``) together with their
+cumulative latency; see :meth:`PageFetcher.stats`.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Chrome sessions kept open per process
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+
+# Seconds to wait for a free browser before failing
+BROWSER_ACQUIRE_TIMEOUT = 300
+
+# Pooled HTTP connections per host
+HTTP_POOL_SIZE = 16
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
+)
+
+
+class BrowserPool:
+    """
+    Thread-safe pool of reusable headless browser sessions.
+
+    Browsers are started lazily, up to ``size``, and returned to the pool
+    after use. A browser whose use raised is closed rather than reused.
+    """
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, factory: Optional[Callable[[], Any]] = None):
+        """
+        Initialize pool.
+
+        Args:
+            size: Maximum number of open browsers
+            factory: Creates an opened scraper (default: headless WebScraper)
+        """
+        self.size = size
+        self.factory = factory or self._open_scraper
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._open = 0
+        self._closed = False
+        self.started = 0
+
+    @staticmethod
+    def _open_scraper():
+        from .web_scraper import WebScraper
+
+        scraper = WebScraper(request_timeout=300, headless=True)
+        scraper.open()
+        if scraper.driver is None:
+            raise RuntimeError("Failed to start headless Chrome")
+        return scraper
+
+    def _acquire(self, timeout: float) -> Any:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_start = self._open < self.size
+            if can_start:
+                self._open += 1
+        if can_start:
+            try:
+                scraper = self.factory()
+            except Exception:
+                with self._lock:
+                    self._open -= 1
+                raise
+            self.started += 1
+            return scraper
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No browser available within {timeout} seconds") from None
+
+    def _discard(self, scraper: Any) -> None:
+        with self._lock:
+            self._open -= 1
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.warning(f"Error while closing browser: {e}")
+
+    @contextmanager
+    def session(self, timeout: float = BROWSER_ACQUIRE_TIMEOUT) -> Iterator[Any]:
+        """
+        Borrow a browser for the duration of the block.
+
+        Args:
+            timeout: Seconds to wait for a free browser
+
+        Yields:
+            Opened scraper
+        """
+        scraper = self._acquire(timeout)
+        try:
+            yield scraper
+        except BaseException:
+            self._discard(scraper)
+            raise
+        if self._closed:
+            self._discard(scraper)
+        else:
+            self._idle.put(scraper)
+
+    def close(self) -> None:
+        """Close all idle browsers; browsers in use are closed when returned."""
+        self._closed = True
+        while True:
+            try:
+                scraper = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(scraper)
+
+
+class PageFetcher:
+    """Fetches pages over HTTP, falling back to a pooled browser."""
+
+    def __init__(
+        self,
+        browser_pool: Optional[BrowserPool] = None,
+        request_timeout: float = 30,
+        http_session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize fetcher.
+
+        Args:
+            browser_pool: Pool for the browser fallback (default: process-wide pool)
+            request_timeout: HTTP timeout in seconds
+            http_session: HTTP session (default: pooled session with a browser User-Agent)
+        """
+        self._browser_pool = browser_pool
+        self.request_timeout = request_timeout
+        if http_session is None:
+            http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            http_session.mount("http://", adapter)
+            http_session.mount("https://", adapter)
+            http_session.headers["User-Agent"] = USER_AGENT
+        self.http = http_session
+        self._lock = threading.Lock()
+        self._counts = {"http": 0, "browser": 0, "http_fallbacks": 0, "errors": 0}
+        self._seconds = {"http": 0.0, "browser": 0.0}
+
+    @property
+    def browser_pool(self) -> BrowserPool:
+        if self._browser_pool is None:
+            self._browser_pool = get_browser_pool()
+        return self._browser_pool
+
+    def _record(self, mode: str, started: float) -> None:
+        with self._lock:
+            self._counts[mode] += 1
+            self._seconds[mode] += time.monotonic() - started
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def fetch_http(self, url: str) -> Optional[str]:
+        """
+        Fetch a page with a plain HTTP GET.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Page HTML, or None on error status or connection failure
+        """
+        started = time.monotonic()
+        try:
+            response = self.http.get(url, timeout=self.request_timeout)
+        except requests.RequestException as e:
+            logger.debug(f"HTTP fetch of {url} failed: {e}")
+            return None
+        finally:
+            self._record("http", started)
+        if response.status_code != 200:
+            logger.debug(f"HTTP fetch of {url} returned {response.status_code}")
+            return None
+        return response.text
+
+    def fetch(
+        self,
+        url: str,
+        ready: Optional[Callable[[str], bool]] = None,
+        browser_action: Optional[Callable[[Any], None]] = None,
+        http_first: bool = True,
+    ) -> str:
+        """
+        Fetch a page, over HTTP if possible.
+
+        Args:
+            url: Page URL
+            ready: Whether fetched HTML is usable; when it returns False the
+                page is loaded in a browser instead
+            browser_action: Called with the browser after loading the page
+                (clicks, condition waits) before its source is read
+            http_first: Try plain HTTP before the browser
+
+        Returns:
+            Page HTML ('' if the browser could not load it)
+        """
+        if http_first:
+            html = self.fetch_http(url)
+            if html is not None and (ready is None or ready(html)):
+                return html
+            self._count("http_fallbacks")
+
+        started = time.monotonic()
+        try:
+            with self.browser_pool.session() as scraper:
+                scraper.fetch_url(url)
+                if browser_action is not None:
+                    browser_action(scraper)
+                return scraper.current_page_source()
+        except Exception as e:
+            self._count("errors")
+            logger.error(f"Browser fetch of {url} failed: {e}")
+            return ""
+        finally:
+            self._record("browser", started)
+
+    def run_in_browser(self, url: str, action: Callable[[Any], Any]) -> Any:
+        """
+        Load a page in a pooled browser and run ``action`` on it.
+
+        Args:
+            url: Page URL
+            action: Called with the browser after the page loaded
+
+        Returns:
+            Result of ``action``
+        """
+        started = time.monotonic()
+        try:
+            with self.browser_pool.session() as scraper:
+                scraper.fetch_url(url)
+                return action(scraper)
+        finally:
+            self._record("browser", started)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Fetch counters.
+
+        Returns:
+            Counts per mode, HTTP fallbacks, errors, and total/mean latency
+            per mode in seconds
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counts)
+            for mode, seconds in self._seconds.items():
+                stats[f"{mode}_seconds"] = round(seconds, 3)
+                stats[f"{mode}_mean_seconds"] = round(seconds / self._counts[mode], 3) if self._counts[mode] else None
+        stats["browsers_started"] = self._browser_pool.started if self._browser_pool else 0
+        return stats
+
+
+_browser_pool: Optional[BrowserPool] = None
+_page_fetcher: Optional[PageFetcher] = None
+_singleton_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Get or create the process-wide browser pool.
+
+    Returns:
+        BrowserPool instance
+    """
+    global _browser_pool
+    with _singleton_lock:
+        if _browser_pool is None:
+            _browser_pool = BrowserPool()
+            atexit.register(close_browser_pool)
+        return _browser_pool
+
+
+def close_browser_pool() -> None:
+    """Close the process-wide browser pool, if one was started."""
+    global _browser_pool
+    with _singleton_lock:
+        pool, _browser_pool = _browser_pool, None
+    if pool is not None:
+        atexit.unregister(close_browser_pool)
+        pool.close()
+
+
+def get_page_fetcher() -> PageFetcher:
+    """
+    Get or create the process-wide page fetcher.
+
+    Returns:
+        PageFetcher instance
+    """
+    global _page_fetcher
+    with _singleton_lock:
+        if _page_fetcher is None:
+            _page_fetcher = PageFetcher()
+    return _page_fetcher
+
+
+def table_has_rows(table_id: str) -> Callable[[str], bool]:
+    """
+    ``ready`` check for pages whose table is complete in the static HTML.
+
+    The page is not ready if the table has no rows yet, or if a
+    ``btn_fetchall`` button shows that more rows are loaded on demand.
+
+    Args:
+        table_id: ID of the table element
+
+    Returns:
+        Predicate over page HTML
+    """
+    from bs4 import BeautifulSoup
+
+    def ready(html: str) -> bool:
+        soup = BeautifulSoup(html, "html.parser")
+        table = soup.find("table", {"id": table_id})
+        if table is None or table.find("tbody") is None:
+            return False
+        rows: List[Any] = table.find("tbody").find_all("tr")
+        return bool(rows) and soup.find(id="btn_fetchall") is None
+
+    return ready
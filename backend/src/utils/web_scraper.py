@@ -7,9 +7,9 @@ import asyncio
 import itertools
 import logging
 import random
+import time
 from pathlib import Path
-from time import sleep
-from typing import Optional
+from typing import Callable, Optional
 
 import requests
 import undetected_chromedriver as uc
@@ -197,6 +197,85 @@ class WebScraper:
             logger.error(f"Failed to wait for element clickable: {by} {value} (error: {e})")
             return None
 
+    def wait_until(self, condition: Callable, timeout: float = 10, poll_frequency: float = 0.25) -> bool:
+        """
+        Wait until a condition on the driver holds.
+
+        Args:
+            condition: Called with the driver; waiting stops once it returns a truthy value
+            timeout: Maximum wait time in seconds
+            poll_frequency: Seconds between checks
+
+        Returns:
+            True if the condition held before the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(condition)
+            return True
+        except Exception as e:
+            logger.warning(f"Condition not met within {timeout} seconds: {e}")
+            return False
+
+    _TABLE_STATE_SCRIPT = (
+        "const t = document.getElementById(arguments[0]);"
+        "const rows = t && t.tBodies.length ? t.tBodies[0].rows.length : 0;"
+        "const trigger = arguments[1] ? document.getElementById(arguments[1]) : null;"
+        "return [rows, trigger !== null && trigger.offsetParent !== null];"
+    )
+
+    def count_table_rows(self, table_id: str) -> int:
+        """Number of rows in a table's first body (0 if the table is missing)."""
+        rows, _ = self.driver.execute_script(self._TABLE_STATE_SCRIPT, table_id, None)
+        return rows
+
+    def wait_for_table_rows(
+        self,
+        table_id: str,
+        min_rows: int = 1,
+        timeout: float = 60,
+        settle_time: float = 1.0,
+        previous_rows: Optional[int] = None,
+        trigger_id: Optional[str] = None
+    ) -> int:
+        """
+        Wait until a table has rows and its row count stopped growing.
+
+        When waiting on an action that loads more rows (e.g. a "fetch all"
+        button), pass the row count from before the action: the rows already
+        there do not count as settled until loading has visibly started.
+
+        Args:
+            table_id: Table element ID
+            min_rows: Rows required before the count is considered
+            timeout: Maximum wait time in seconds
+            settle_time: Seconds the row count must stay unchanged
+            previous_rows: Row count before the action; the settle window
+                starts once the count exceeds it (or ``trigger_id`` is gone)
+            trigger_id: ID of the element that started loading; its
+                disappearance also means loading has started
+
+        Returns:
+            Number of rows when waiting stopped
+        """
+        state = {"rows": -1 if previous_rows is None else previous_rows, "since": 0.0, "loading": previous_rows is None}
+
+        def settled(driver) -> bool:
+            rows, trigger_visible = driver.execute_script(self._TABLE_STATE_SCRIPT, table_id, trigger_id)
+            now = time.monotonic()
+            if not state["loading"]:
+                if rows <= previous_rows and (trigger_id is None or trigger_visible):
+                    return False
+                state["loading"] = True
+                state["rows"], state["since"] = rows, now
+                return False
+            if rows != state["rows"]:
+                state["rows"], state["since"] = rows, now
+                return False
+            return rows >= min_rows and now - state["since"] >= settle_time
+
+        self.wait_until(settled, timeout=timeout)
+        return max(state["rows"], 0)
+
     def find_element_by_id(self, element_id: str):
         """Find element by ID."""
         return self._find_element(By.ID, element_id)
@@ -255,74 +334,75 @@ class WebScraper:
         self,
         element_id: str,
         wait_timeout: int = 30,
-        max_attempts: int = 3,
-        sleep_sec: int = 5
-    ):
+        max_attempts: int = 3
+    ) -> bool:
         """
         Click an element by ID.
 
         Args:
             element_id: Element ID
-            wait_timeout: Maximum wait time for element
-            max_attempts: Maximum retry attempts
-            sleep_sec: Sleep time between retries
+            wait_timeout: Maximum wait time for element per attempt
+            max_attempts: Maximum attempts
+
+        Returns:
+            True if the element was clicked
         """
-        return self._click_element(By.ID, element_id, wait_timeout, max_attempts, sleep_sec)
+        return self._click_element(By.ID, element_id, wait_timeout, max_attempts)
 
     def click_element_by_classname(
         self,
         classname: str,
         wait_timeout: int = 30,
-        max_attempts: int = 3,
-        sleep_sec: int = 5
-    ):
+        max_attempts: int = 3
+    ) -> bool:
         """
         Click an element by class name.
 
         Args:
             classname: Element class name
-            wait_timeout: Maximum wait time for element
-            max_attempts: Maximum retry attempts
-            sleep_sec: Sleep time between retries
+            wait_timeout: Maximum wait time for element per attempt
+            max_attempts: Maximum attempts
+
+        Returns:
+            True if the element was clicked
         """
-        return self._click_element(By.CLASS_NAME, classname, wait_timeout, max_attempts, sleep_sec)
+        return self._click_element(By.CLASS_NAME, classname, wait_timeout, max_attempts)
 
     def _click_element(
         self,
         by: By,
         value: str,
         wait_timeout: int = 30,
-        max_attempts: int = 3,
-        sleep_sec: int = 5
-    ):
+        max_attempts: int = 3
+    ) -> bool:
         """
-        Click an element with retry logic.
+        Click an element once it is present, retrying if the click is intercepted.
 
         Args:
             by: Selenium By locator type
             value: Locator value
-            wait_timeout: Maximum wait time for element
-            max_attempts: Maximum retry attempts
-            sleep_sec: Sleep time between retries
+            wait_timeout: Maximum wait time for element per attempt
+            max_attempts: Maximum attempts
+
+        Returns:
+            True if the element was clicked
         """
         if self.driver is None:
             self.open()
 
         for attempt in range(max_attempts):
+            if not self._wait_for_element_located(by, value, wait_timeout):
+                continue
             try:
-                if self._wait_for_element_located(by, value, wait_timeout):
-                    break
-            except Exception as e:
-                logger.warning(
-                    f"Element [{value}] not located yet, retrying... "
-                    f"(Attempt {attempt + 1}, sleeping {sleep_sec} sec)"
-                )
-                sleep(sleep_sec)
-                sleep_sec *= 1.5
-
-        element = self.driver.find_element(by, value)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        self.driver.execute_script("arguments[0].click();", element)
+                element = self.driver.find_element(by, value)
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                self.driver.execute_script("arguments[0].click();", element)
+                return True
+            except (ElementClickInterceptedException, NoSuchElementException) as e:
+                logger.warning(f"Click on [{value}] failed (attempt {attempt + 1}): {e}")
+
+        logger.error(f"Could not click element [{value}] after {max_attempts} attempts")
+        return False
 
     def download_file(self, url: str, save_path: Path):
         """
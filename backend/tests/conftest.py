@@ -53,13 +53,14 @@ async def db_session(engine):
 async def client(db_session):
     """Create test HTTP client with database session override."""
     from src.main import app
-    from src.database import get_db
+    from src.database import get_db, get_read_db
 
     # Override database dependency with test session
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
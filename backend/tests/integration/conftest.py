@@ -0,0 +1,49 @@
+"""Fixtures for integration tests that need objects created by migrations.
+
+The session-wide ``engine`` fixture builds the schema with
+``Base.metadata.create_all``, which does not install triggers. These
+fixtures run the trigger DDL from the migrations inside the test's
+``db_session`` transaction, so it is rolled back with the test data.
+"""
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "alembic" / "versions"
+
+
+def load_migration(filename: str) -> ModuleType:
+    """Import a migration module by file name (they start with a date)."""
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{Path(filename).stem}", MIGRATIONS_DIR / filename
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+async def corpus_stats_triggers(db_session: AsyncSession) -> AsyncSession:
+    """Seed the corpus_stats counters and install their triggers."""
+    migration = load_migration("20261018_0100_add_corpus_stats.py")
+    await db_session.execute(text("DELETE FROM corpus_stats"))
+    for statement in migration.COUNTER_FUNCTIONS:
+        await db_session.execute(text(statement))
+    for name, table in migration.COUNTER_TABLES.items():
+        for statement in migration.counter_statements(name, table):
+            await db_session.execute(text(statement))
+    return db_session
+
+
+@pytest.fixture
+async def vote_tally_trigger(db_session: AsyncSession) -> AsyncSession:
+    """Install the incremental vote tally trigger on ``votes``."""
+    migration = load_migration("20261018_0400_add_vote_tallies.py")
+    await db_session.execute(text(migration.VOTE_TALLY_FUNCTION))
+    await db_session.execute(text("DROP TRIGGER IF EXISTS vote_count_trigger ON votes"))
+    await db_session.execute(text(migration.VOTE_TALLY_TRIGGER))
+    return db_session
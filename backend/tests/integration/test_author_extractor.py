@@ -0,0 +1,114 @@
+"""Integration tests for bulk author resolution during ingestion."""
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.models.author import Author, PaperAuthor
+from src.models.paper import Paper
+from src.services.author_extractor import AuthorExtractorService
+
+
+async def make_paper(session: AsyncSession, *authors: str) -> Paper:
+    paper = Paper(
+        title="Authored paper",
+        authors=list(authors),
+        abstract="Abstract",
+        published_date=date(2026, 1, 1),
+    )
+    session.add(paper)
+    await session.flush()
+    return paper
+
+
+async def make_author(session: AsyncSession, name: str) -> Author:
+    author = Author(name=name, paper_count=0, total_citation_count=0)
+    session.add(author)
+    await session.flush()
+    return author
+
+
+def unique(name: str) -> str:
+    return f"{name} {uuid4().hex[:8]}"
+
+
+@pytest.mark.asyncio
+async def test_batch_creates_missing_authors_and_links(db_session: AsyncSession):
+    ada, turing, hopper = unique("Ada Lovelace"), unique("Alan Turing"), unique("Grace Hopper")
+    existing = await make_author(db_session, ada)
+    first = await make_paper(db_session, ada, turing)
+    second = await make_paper(db_session, turing, f" {hopper} ", "")
+    extractor = AuthorExtractorService()
+
+    created = await extractor.extract_authors_from_papers([first, second], db_session)
+
+    assert created == 2
+    ids = dict((await db_session.execute(
+        select(Author.name, Author.id).where(Author.name.in_([ada, turing, hopper]))
+    )).all())
+    assert ids[ada] == existing.id
+    links = set((await db_session.execute(
+        select(PaperAuthor.paper_id, PaperAuthor.author_id, PaperAuthor.position)
+        .where(PaperAuthor.paper_id.in_([first.id, second.id]))
+    )).all())
+    assert links == {
+        (first.id, ids[ada], 1), (first.id, ids[turing], 2),
+        (second.id, ids[turing], 1), (second.id, ids[hopper], 2),
+    }
+
+    # Re-running creates nothing and leaves the links alone
+    assert await AuthorExtractorService().extract_authors_from_papers([first, second], db_session) == 0
+    assert await db_session.scalar(
+        select(PaperAuthor.author_id).where(PaperAuthor.paper_id == second.id, PaperAuthor.position == 2)
+    ) == ids[hopper]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_names_resolve_to_first_author(db_session: AsyncSession):
+    name = unique("Wei Zhang")
+    first = await make_author(db_session, name)
+    await make_author(db_session, name)
+
+    ids, created = await AuthorExtractorService().resolve_author_ids([name], db_session)
+
+    assert ids == {name: first.id}
+    assert created == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_names_skip_the_database(db_session: AsyncSession):
+    name = unique("Cached Author")
+    extractor = AuthorExtractorService()
+    ids, _ = await extractor.resolve_author_ids([name], db_session)
+    await db_session.execute(delete(Author).where(Author.name == name))
+
+    assert await extractor.resolve_author_ids([name], db_session) == (ids, 0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jobs_create_an_author_once(engine):
+    """A job waiting on the name lock reuses the author the other job committed."""
+    name = unique("Concurrent Author")
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as first, session_factory() as second:
+            first_ids, first_created = await AuthorExtractorService().resolve_author_ids([name], first)
+
+            waiting = asyncio.create_task(AuthorExtractorService().resolve_author_ids([name], second))
+            await asyncio.sleep(0.2)
+            assert not waiting.done()
+
+            await first.commit()
+            second_ids, second_created = await asyncio.wait_for(waiting, timeout=5)
+            await second.commit()
+
+        assert (first_created, second_created) == (1, 0)
+        assert second_ids == first_ids
+    finally:
+        async with session_factory() as cleanup:
+            await cleanup.execute(delete(Author).where(Author.name == name))
+            await cleanup.commit()
@@ -4,12 +4,19 @@ Tests author stat calculations and integrity from quickstart.md.
 
 TDD: These tests MUST fail before implementation.
 """
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.jobs import refresh_author_stats
 from src.models.author import Author, PaperAuthor
+from src.models.job_watermark import JobWatermark
 from src.models.paper import Paper
+from src.services.author_service import AUTHOR_STATS_WATERMARK, AuthorService
 
 
 @pytest.mark.asyncio
@@ -81,3 +88,157 @@ async def test_edge_case_4_author_no_affiliation(async_client: AsyncClient):
         # primary_affiliation should be null if no affiliations exist
         if data.get("affiliation_history") is None or len(data["affiliation_history"]) == 0:
             assert data["primary_affiliation"] is None
+
+
+@pytest.mark.asyncio
+async def test_h_index_recomputed_from_citation_counts(db_session: AsyncSession, monkeypatch):
+    """recompute_statistics yields the textbook h-index for known citation vectors."""
+    # Chunks commit; keep them inside the test transaction
+    monkeypatch.setattr(db_session, "commit", db_session.flush)
+    cases = [
+        ((10, 8, 5, 4, 3), 4),
+        ((25, 8, 5, 3, 3), 3),
+        ((6, 6, 6, 6, 6, 6, 6), 6),
+        ((1, 0, 0), 1),
+        ((0, 0), 0),
+        ((100,), 1),
+        ((), 0),
+    ]
+    authors = []
+    for i, (citations, expected) in enumerate(cases):
+        author = Author(name=f"H-Index Author {i}", paper_count=0, total_citation_count=0)
+        db_session.add(author)
+        await db_session.flush()
+        for position, count in enumerate(citations):
+            paper = Paper(
+                title=f"H-Index Paper {i}-{position}",
+                authors=[author.name],
+                abstract="Test abstract",
+                published_date=date(2024, 1, position + 1),
+                citation_count=count,
+            )
+            db_session.add(paper)
+            await db_session.flush()
+            db_session.add(PaperAuthor(paper_id=paper.id, author_id=author.id, position=1))
+        authors.append((author, citations, expected))
+    await db_session.flush()
+
+    await AuthorService(db_session).recompute_statistics([author.id for author, _, _ in authors])
+
+    for author, citations, expected in authors:
+        await db_session.refresh(author)
+        assert author.h_index == expected, citations
+        assert author.paper_count == len(citations)
+        assert author.total_citation_count == sum(citations)
+
+
+async def make_author(session: AsyncSession, name: str, citations=(), updated_at=None, linked_at=None, **kwargs):
+    author = Author(name=name, paper_count=0, total_citation_count=0, **kwargs)
+    session.add(author)
+    await session.flush()
+    for position, count in enumerate(citations):
+        paper = Paper(
+            title=f"{name} paper {position}",
+            authors=[name],
+            abstract="Test abstract",
+            published_date=date(2020 + position, 1, 1),
+            citation_count=count,
+        )
+        if updated_at is not None:
+            paper.updated_at = updated_at
+        session.add(paper)
+        await session.flush()
+        link = PaperAuthor(paper_id=paper.id, author_id=author.id, position=1)
+        if linked_at is not None:
+            link.created_at = linked_at
+        session.add(link)
+    await session.flush()
+    return author
+
+
+@pytest.mark.asyncio
+async def test_recompute_statistics_in_chunks(db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(db_session, "commit", db_session.flush)
+    authors = [
+        await make_author(db_session, f"Chunked Author {i}", citations=[i, 2 * i])
+        for i in range(1, 4)
+    ]
+    # Stale statistics for an author whose papers are gone are reset
+    orphan = await make_author(db_session, "Orphaned Author", paper_count=5, total_citation_count=50)
+    computed_at = datetime(2026, 10, 18, 5)
+
+    updated = await AuthorService(db_session).recompute_statistics(
+        [author.id for author in authors] + [orphan.id], chunk_size=3, computed_at=computed_at
+    )
+
+    assert updated == 4
+    for i, author in enumerate(authors, start=1):
+        await db_session.refresh(author)
+        assert (author.paper_count, author.total_citation_count) == (2, 3 * i)
+        assert (author.first_publication_year, author.last_publication_year) == (2020, 2021)
+        assert author.stats_updated_at == computed_at
+    await db_session.refresh(orphan)
+    assert (orphan.paper_count, orphan.total_citation_count, orphan.h_index) == (0, 0, 0)
+    assert orphan.latest_paper_id is None
+
+
+@pytest.mark.asyncio
+async def test_changed_authors_since_watermark(db_session: AsyncSession):
+    since = datetime(2026, 10, 18, 4)
+    before, after = datetime(2026, 10, 18, 3), datetime(2026, 10, 18, 5)
+    computed = {"stats_updated_at": before}
+    paper_updated = await make_author(db_session, "Updated Paper Author", [1], updated_at=after, linked_at=before, **computed)
+    newly_linked = await make_author(db_session, "Linked Author", [1], updated_at=before, linked_at=after, **computed)
+    never_computed = await make_author(db_session, "Never Computed Author", [1], updated_at=before, linked_at=before)
+    unchanged = await make_author(db_session, "Unchanged Author", [1], updated_at=before, linked_at=before, **computed)
+
+    changed = await AuthorService(db_session).get_changed_author_ids(since)
+
+    assert {paper_updated.id, newly_linked.id, never_computed.id} <= set(changed)
+    assert unchanged.id not in changed
+    assert changed == sorted(changed)
+
+
+@asynccontextmanager
+async def job_session(session: AsyncSession):
+    yield session
+
+
+@pytest.mark.asyncio
+async def test_job_stores_run_start_as_watermark(db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(db_session, "commit", db_session.flush)
+    monkeypatch.setattr(refresh_author_stats, "AsyncSessionLocal", lambda: job_session(db_session))
+    await db_session.execute(JobWatermark.__table__.delete())
+    author = await make_author(db_session, "Job Author", citations=[3, 3, 3])
+    service = AuthorService(db_session)
+    run_started_at = await service.get_database_time()
+
+    await refresh_author_stats.run_author_stats_job(chunk_size=2)
+
+    await db_session.refresh(author)
+    assert (author.paper_count, author.h_index) == (3, 3)
+    assert await service.get_statistics_watermark() == run_started_at
+
+    # An older run finishing later does not move the watermark back
+    await service.advance_statistics_watermark(datetime(2000, 1, 1))
+    assert await service.get_statistics_watermark() == run_started_at
+
+
+@pytest.mark.asyncio
+async def test_job_keeps_watermark_when_a_chunk_fails(db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(db_session, "commit", db_session.flush)
+    monkeypatch.setattr(refresh_author_stats, "AsyncSessionLocal", lambda: job_session(db_session))
+    await db_session.execute(JobWatermark.__table__.delete())
+    await make_author(db_session, "Failing Job Author", citations=[1])
+
+    async def fail(*args, **kwargs):
+        raise RuntimeError("connection lost")
+
+    monkeypatch.setattr(AuthorService, "recompute_statistics", fail)
+
+    with pytest.raises(RuntimeError):
+        await refresh_author_stats.run_author_stats_job()
+
+    assert await db_session.scalar(
+        select(JobWatermark.watermark).where(JobWatermark.name == AUTHOR_STATS_WATERMARK)
+    ) is None
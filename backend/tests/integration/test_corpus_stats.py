@@ -0,0 +1,123 @@
+"""Integration tests for the trigger-maintained corpus statistics."""
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.author import Author
+from src.models.corpus_stat import CorpusStat
+from src.models.paper import Paper
+from src.services import corpus_stats_service
+from src.services.corpus_stats_service import (
+    COUNTER_TABLES,
+    CorpusStatsService,
+    get_cached_corpus_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    corpus_stats_service.invalidate_corpus_stats_cache()
+    yield
+    corpus_stats_service.invalidate_corpus_stats_cache()
+
+
+def make_paper(title: str, **kwargs) -> Paper:
+    return Paper(
+        title=title,
+        authors=["A. Author"],
+        abstract="Abstract",
+        published_date=date(2026, 1, 1),
+        **kwargs,
+    )
+
+
+async def counter(session: AsyncSession, name: str) -> int:
+    return await session.scalar(select(CorpusStat.value).where(CorpusStat.name == name))
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_inserts_and_deletes(corpus_stats_triggers: AsyncSession):
+    session = corpus_stats_triggers
+    papers_before = await counter(session, "papers_total")
+    authors_before = await counter(session, "authors_total")
+
+    papers = [make_paper(f"Counted paper {i}") for i in range(3)]
+    session.add_all(papers)
+    session.add(Author(name="Counted Author", paper_count=0, total_citation_count=0))
+    await session.flush()
+
+    assert await counter(session, "papers_total") == papers_before + 3
+    assert await counter(session, "authors_total") == authors_before + 1
+
+    # One bulk statement: the statement-level trigger counts every row
+    await session.execute(delete(Paper).where(Paper.id.in_([p.id for p in papers[:2]])))
+
+    assert await counter(session, "papers_total") == papers_before + 1
+    assert await counter(session, "authors_total") == authors_before + 1
+
+
+@pytest.mark.asyncio
+async def test_get_stats_reads_counters(corpus_stats_triggers: AsyncSession):
+    session = corpus_stats_triggers
+    session.add(make_paper("Stats paper"))
+    await session.flush()
+    expected = await counter(session, "papers_total")
+
+    stats = await CorpusStatsService(session).get_stats()
+
+    assert stats["metrics"]["papers_total"] == expected
+    assert all(stats["sources"][name] == "counter" for name in COUNTER_TABLES)
+    assert stats["updated_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_get_stats_estimates_missing_counters(corpus_stats_triggers: AsyncSession):
+    session = corpus_stats_triggers
+    await session.execute(delete(CorpusStat).where(CorpusStat.name == "authors_total"))
+
+    stats = await CorpusStatsService(session).get_stats()
+
+    assert stats["sources"]["authors_total"] == "estimate"
+    assert stats["metrics"]["authors_total"] >= 0
+    assert stats["sources"]["papers_total"] == "counter"
+
+
+@pytest.mark.asyncio
+async def test_refresh_repairs_drifted_counters(corpus_stats_triggers: AsyncSession, monkeypatch):
+    session = corpus_stats_triggers
+    session.add(make_paper("Starred paper", github_url="https://github.com/org/repo", primary_task="segmentation"))
+    await session.flush()
+    exact = await counter(session, "papers_total")
+    await session.execute(
+        CorpusStat.__table__.update()
+        .where(CorpusStat.name == "papers_total")
+        .values(value=exact + 100)
+    )
+    # Keep the refresh inside the test transaction
+    monkeypatch.setattr(session, "commit", session.flush)
+    await get_cached_corpus_stats(session)
+
+    refreshed = await CorpusStatsService(session).refresh()
+
+    assert refreshed["papers_total"] == exact
+    assert await counter(session, "papers_total") == exact
+    assert refreshed["papers_with_github"] >= 1
+    assert any(task == "segmentation" for task, _ in refreshed["top_tasks"])
+    top_tasks = await session.scalar(select(CorpusStat.data).where(CorpusStat.name == "top_tasks"))
+    assert top_tasks == {"rows": refreshed["top_tasks"]}
+    # The refresh drops the cached snapshot
+    assert corpus_stats_service._cached_stats is None
+
+
+@pytest.mark.asyncio
+async def test_cached_stats_reused_within_ttl(corpus_stats_triggers: AsyncSession):
+    session = corpus_stats_triggers
+
+    stats = await get_cached_corpus_stats(session)
+    session.add(make_paper("Uncached paper"))
+    await session.flush()
+    again = await get_cached_corpus_stats(session)
+
+    assert again is stats
@@ -0,0 +1,35 @@
+"""Integration tests for daily metric snapshot upserts."""
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.metric_snapshot import MetricSnapshot
+from src.models.paper import Paper
+from src.services.metric_service import MetricService
+
+
+@pytest.mark.asyncio
+async def test_later_refresh_keeps_values_it_could_not_fetch(db_session: AsyncSession):
+    paper = Paper(
+        title="Tracked paper",
+        authors=["A. Author"],
+        abstract="Abstract",
+        published_date=date(2026, 1, 1),
+    )
+    db_session.add(paper)
+    await db_session.flush()
+    service = MetricService(db_session)
+    today = date(2026, 10, 18)
+
+    await service.upsert_metric_snapshot(paper.id, today, github_stars=120, citation_count=4)
+    # Later the same day: GitHub is unreachable, citations moved
+    await service.upsert_metric_snapshot(paper.id, today, github_stars=None, citation_count=5)
+    await service.upsert_metric_snapshot(paper.id, today, github_stars=125, citation_count=None)
+
+    row = (await db_session.execute(
+        select(MetricSnapshot.github_stars, MetricSnapshot.citation_count)
+        .where(MetricSnapshot.paper_id == paper.id, MetricSnapshot.snapshot_date == today)
+    )).one()
+    assert tuple(row) == (125, 5)
@@ -0,0 +1,161 @@
+"""Integration tests for the streaming paper export."""
+import csv
+import io
+import json
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.github_metrics import GitHubMetrics
+from src.models.paper import Paper
+from src.models.paper_reference import PaperReference
+from src.services.paper_export import EXPORT_COLUMNS, PaperFilters, export_chunks
+
+
+@pytest.fixture
+async def corpus(db_session: AsyncSession) -> dict[str, Paper]:
+    """Three papers in a venue of their own: ``starred`` is cited by the other two."""
+    venue = f"ExportConf {uuid4().hex[:8]}"
+    papers = {
+        "starred": Paper(
+            title="Starred paper",
+            authors=["A. Author"],
+            abstract="Abstract",
+            published_date=date(2022, 6, 1),
+            year=2022,
+            venue=venue,
+            github_url="https://github.com/org/starred",
+        ),
+        "recent": Paper(
+            title="Recent paper",
+            authors=["B. Author"],
+            abstract="Abstract",
+            published_date=date(2023, 6, 1),
+            year=2023,
+            venue=venue,
+        ),
+        "old": Paper(
+            title="Old paper",
+            authors=["C. Author"],
+            abstract="Abstract",
+            published_date=date(2021, 6, 1),
+            year=2021,
+            venue=venue,
+        ),
+    }
+    db_session.add_all(papers.values())
+    await db_session.flush()
+
+    db_session.add(
+        GitHubMetrics(
+            paper_id=papers["starred"].id,
+            repository_url="https://github.com/org/starred",
+            repository_owner="org",
+            repository_name="starred",
+            current_stars=500,
+            current_forks=20,
+            tracking_start_date=date(2026, 1, 1),
+        )
+    )
+    db_session.add_all(
+        [
+            PaperReference(source_paper_id=papers["recent"].id, target_paper_id=papers["starred"].id),
+            PaperReference(source_paper_id=papers["old"].id, target_paper_id=papers["starred"].id),
+            PaperReference(source_paper_id=papers["old"].id, target_paper_id=papers["recent"].id),
+        ]
+    )
+    await db_session.flush()
+    return papers
+
+
+async def export_records(session: AsyncSession, filters: PaperFilters, **kwargs) -> list[dict]:
+    chunks = [chunk async for chunk in export_chunks(session, filters, "ndjson", **kwargs)]
+    return [json.loads(line) for chunk in chunks for line in chunk.decode().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_export_joins_metrics_and_counts(db_session: AsyncSession, corpus):
+    venue = corpus["starred"].venue
+
+    records = await export_records(db_session, PaperFilters(venue=venue))
+
+    assert [r["title"] for r in records] == ["Recent paper", "Starred paper", "Old paper"]
+    by_title = {r["title"]: r for r in records}
+    starred = by_title["Starred paper"]
+    assert starred["id"] == str(corpus["starred"].id)
+    assert starred["github_stars"] == 500
+    assert starred["github_forks"] == 20
+    assert starred["citations_total"] == 2
+    assert starred["references_total"] == 0
+    assert by_title["Recent paper"]["github_stars"] is None
+    assert (by_title["Recent paper"]["citations_total"], by_title["Recent paper"]["references_total"]) == (1, 1)
+    assert (by_title["Old paper"]["citations_total"], by_title["Old paper"]["references_total"]) == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_export_applies_filters(db_session: AsyncSession, corpus):
+    venue = corpus["starred"].venue
+
+    async def titles(**filters) -> list[str]:
+        records = await export_records(db_session, PaperFilters(venue=venue, **filters))
+        return [r["title"] for r in records]
+
+    assert await titles(has_github=True) == ["Starred paper"]
+    assert await titles(min_github_stars=100) == ["Starred paper"]
+    assert await titles(min_citations=1) == ["Recent paper", "Starred paper"]
+    assert await titles(year_min=2022) == ["Recent paper", "Starred paper"]
+    assert await titles(venue=f"{venue} missing") == []
+
+
+@pytest.mark.asyncio
+async def test_export_sort_is_stable(db_session: AsyncSession, corpus):
+    filters = PaperFilters(venue=corpus["starred"].venue)
+
+    records = await export_records(db_session, filters, sort="citations_desc")
+    assert [r["title"] for r in records] == ["Starred paper", "Recent paper", "Old paper"]
+
+    # Same published date: the id tie-breaker decides
+    corpus["old"].published_date = corpus["recent"].published_date
+    await db_session.flush()
+    tied = sorted([corpus["recent"].id, corpus["old"].id])
+
+    records = await export_records(db_session, filters, sort="published_date_asc")
+    assert [r["id"] for r in records] == [str(corpus["starred"].id), *map(str, tied)]
+
+
+@pytest.mark.asyncio
+async def test_export_streams_one_chunk_per_batch(db_session: AsyncSession, corpus):
+    filters = PaperFilters(venue=corpus["starred"].venue)
+
+    chunks = [chunk async for chunk in export_chunks(db_session, filters, "ndjson", batch_size=2)]
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_export_csv_header_first(db_session: AsyncSession, corpus):
+    filters = PaperFilters(venue=corpus["starred"].venue)
+
+    chunks = [chunk async for chunk in export_chunks(db_session, filters, "csv")]
+
+    assert chunks[0].decode().strip() == ",".join(EXPORT_COLUMNS)
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert [row["title"] for row in rows] == ["Recent paper", "Starred paper", "Old paper"]
+    assert json.loads(rows[0]["authors"]) == ["B. Author"]
+
+
+@pytest.mark.asyncio
+async def test_export_parquet_round_trip(db_session: AsyncSession, corpus):
+    pq = pytest.importorskip("pyarrow.parquet")
+    filters = PaperFilters(venue=corpus["starred"].venue)
+
+    chunks = [chunk async for chunk in export_chunks(db_session, filters, "parquet", batch_size=2)]
+
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.metadata.num_rows == 3
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.column_names == EXPORT_COLUMNS
+    assert table.column("github_stars").to_pylist() == [None, 500, None]
@@ -0,0 +1,89 @@
+"""Integration tests for grouped, per-user cached topic paper counts."""
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.paper import Paper
+from src.models.paper_topic_match import PaperTopicMatch
+from src.models.topic import Topic
+from src.services import topic_service
+from src.services.topic_service import TopicService, paper_counts_cache_key
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fake = FakeCache()
+    monkeypatch.setattr(topic_service, "get_cache", lambda: fake)
+    return fake
+
+
+async def make_topic(session: AsyncSession, name: str, papers: int) -> Topic:
+    topic = Topic(name=name, description="Counted topic")
+    session.add(topic)
+    await session.flush()
+    for _ in range(papers):
+        await match_paper(session, topic)
+    return topic
+
+
+async def match_paper(session: AsyncSession, topic: Topic) -> None:
+    paper = Paper(
+        title="Matched paper",
+        authors=["A. Author"],
+        abstract="Abstract",
+        published_date=date(2026, 1, 1),
+    )
+    session.add(paper)
+    await session.flush()
+    session.add(PaperTopicMatch(paper_id=paper.id, topic_id=topic.id, relevance_score=8.0))
+    await session.flush()
+
+
+@pytest.mark.asyncio
+async def test_paper_counts_for_many_topics(db_session: AsyncSession):
+    busy = await make_topic(db_session, "counted busy topic", papers=3)
+    quiet = await make_topic(db_session, "counted quiet topic", papers=1)
+    empty = await make_topic(db_session, "counted empty topic", papers=0)
+
+    counts = await TopicService(db_session).get_paper_counts([busy.id, quiet.id, empty.id, uuid4()])
+
+    assert counts[busy.id] == 3
+    assert counts[quiet.id] == 1
+    assert counts[empty.id] == 0
+    assert len(counts) == 4
+    assert await TopicService(db_session).get_paper_counts([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_paper_counts_are_cached_per_user(db_session: AsyncSession, cache):
+    topic = await make_topic(db_session, "cached counts topic", papers=2)
+    user_id = uuid4()
+    service = TopicService(db_session)
+
+    assert await service.get_cached_paper_counts([topic.id], user_id=user_id) == {topic.id: 2}
+    assert cache.store[paper_counts_cache_key(user_id)] == {str(topic.id): 2}
+
+    await match_paper(db_session, topic)
+    # Served from the user's cached map until it expires
+    assert await service.get_cached_paper_counts([topic.id], user_id=user_id) == {topic.id: 2}
+    # Another user (or a topic missing from the cached map) recomputes
+    assert await service.get_cached_paper_counts([topic.id]) == {topic.id: 3}
+    other = await make_topic(db_session, "uncached counts topic", papers=1)
+    assert await service.get_cached_paper_counts([topic.id, other.id], user_id=user_id) == {
+        topic.id: 3,
+        other.id: 1,
+    }
@@ -0,0 +1,100 @@
+"""Integration tests for the trigger-maintained vote tallies on papers."""
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.paper import Paper
+from src.services.vote_service import VoteService
+
+
+@pytest.fixture
+async def voting(vote_tally_trigger: AsyncSession, monkeypatch) -> AsyncSession:
+    """Session with the tally trigger whose commits stay in the test transaction."""
+    monkeypatch.setattr(vote_tally_trigger, "commit", vote_tally_trigger.flush)
+    return vote_tally_trigger
+
+
+async def make_paper(session: AsyncSession) -> Paper:
+    paper = Paper(
+        title="Voted paper",
+        authors=["A. Author"],
+        abstract="Abstract",
+        published_date=date(2026, 1, 1),
+    )
+    session.add(paper)
+    await session.flush()
+    return paper
+
+
+async def make_user(session: AsyncSession):
+    user_id = uuid4()
+    await session.execute(text("INSERT INTO auth.users (id) VALUES (:id)"), {"id": user_id})
+    return user_id
+
+
+@pytest.mark.asyncio
+async def test_trigger_tracks_cast_flip_and_remove(voting: AsyncSession):
+    paper = await make_paper(voting)
+    alice, bob = await make_user(voting), await make_user(voting)
+    service = VoteService(voting)
+
+    await service.cast_vote(alice, paper.id, "upvote")
+    assert await service.get_paper_votes(paper.id) == (1, 0, 1)
+
+    await service.cast_vote(bob, paper.id, "upvote")
+    assert await service.get_paper_votes(paper.id) == (2, 0, 2)
+
+    # Flip: one upvote becomes a downvote
+    await service.cast_vote(alice, paper.id, "downvote")
+    assert await service.get_paper_votes(paper.id) == (1, 1, 0)
+
+    # Re-casting the same vote leaves the tallies alone
+    await service.cast_vote(alice, paper.id, "downvote")
+    assert await service.get_paper_votes(paper.id) == (1, 1, 0)
+
+    assert await service.remove_vote(alice, paper.id)
+    assert await service.get_paper_votes(paper.id) == (1, 0, 1)
+
+    assert await service.remove_vote(bob, paper.id)
+    assert await service.get_paper_votes(paper.id) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_tallies_batch_lookup(voting: AsyncSession):
+    up, down = await make_paper(voting), await make_paper(voting)
+    user = await make_user(voting)
+    service = VoteService(voting)
+    await service.cast_vote(user, up.id, "upvote")
+    await service.cast_vote(user, down.id, "downvote")
+
+    tallies = await service.get_paper_vote_tallies([up.id, down.id, uuid4()])
+
+    assert tallies == {up.id: (1, 0, 1), down.id: (0, 1, -1)}
+    assert await service.get_paper_vote_tallies([]) == {}
+    assert await service.get_paper_votes(uuid4()) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_drift(voting: AsyncSession):
+    drifted, clean = await make_paper(voting), await make_paper(voting)
+    user = await make_user(voting)
+    service = VoteService(voting)
+    await service.cast_vote(user, drifted.id, "upvote")
+    await service.cast_vote(user, clean.id, "downvote")
+    await voting.execute(
+        update(Paper)
+        .where(Paper.id == drifted.id)
+        .values(upvote_count=7, downvote_count=2, vote_count=5)
+    )
+
+    repaired = await service.reconcile_tallies()
+
+    assert repaired >= 1
+    assert await service.get_paper_vote_tallies([drifted.id, clean.id]) == {
+        drifted.id: (1, 0, 1),
+        clean.id: (0, 1, -1),
+    }
+    assert await service.reconcile_tallies() == 0
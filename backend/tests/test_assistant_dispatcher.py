@@ -0,0 +1,75 @@
+"""Tests for assistant reuse, adaptive polling and concurrent run dispatch."""
+import pytest
+
+from benchmarks.mock_openai import MockOpenAIServer
+from src.services.llm_service import AssistantRunDispatcher, OpenAILLMService
+
+
+@pytest.fixture
+async def mock_openai():
+    server = MockOpenAIServer(run_latency=0.3)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+def pdfs(tmp_path):
+    paths = []
+    for i in range(12):
+        path = tmp_path / f"paper_{i}.pdf"
+        path.write_bytes(b"%PDF-1.4 " + str(i).encode())
+        paths.append(path)
+    return paths
+
+
+def make_service(server):
+    return OpenAILLMService(api_key="test", base_url=server.url, poll_interval=0.05, max_poll_interval=0.2)
+
+
+async def test_dispatcher_caps_concurrency_and_collects_all(mock_openai, pdfs):
+    dispatcher = AssistantRunDispatcher(make_service(mock_openai), max_concurrency=4)
+    jobs = [(path.stem, path, "Extract datasets.") for path in pdfs]
+
+    results = await dispatcher.run(jobs)
+
+    assert set(results) == {path.stem for path in pdfs}
+    assert all(result == {"datasets": ["ImageNet", "COCO"]} for result in results.values())
+    assert mock_openai.max_active_runs <= 4
+    assert mock_openai.counts["runs"] == len(pdfs)
+
+
+async def test_assistant_and_uploads_are_reused(mock_openai, pdfs):
+    service = make_service(mock_openai)
+    prompts = ["Extract tasks.", "Extract methods.", "Extract datasets."]
+    jobs = [((path.stem, prompt), path, prompt) for path in pdfs[:3] for prompt in prompts]
+
+    await AssistantRunDispatcher(service, max_concurrency=9).run(jobs)
+    # A new service instance (e.g. the next Celery task) reuses the assistant
+    await make_service(mock_openai).extract_metadata(pdfs[3], "Extract tasks.")
+
+    assert mock_openai.counts["assistants"] == 1
+    assert mock_openai.counts["files"] == 4
+
+
+async def test_polling_backs_off(mock_openai, pdfs):
+    mock_openai.run_latency = 1.0
+    service = make_service(mock_openai)
+
+    await service.extract_metadata(pdfs[0], "Extract datasets.")
+
+    # Fixed 0.05s polling would need ~20 polls; backoff needs far fewer
+    assert mock_openai.counts["polls"] <= 10
+
+
+async def test_failed_jobs_yield_exceptions(mock_openai, pdfs):
+    service = make_service(mock_openai)
+    missing = pdfs[0].with_name("missing.pdf")
+
+    results = await AssistantRunDispatcher(service, max_concurrency=2).run([
+        ("ok", pdfs[0], "Extract datasets."),
+        ("missing", missing, "Extract datasets."),
+    ])
+
+    assert isinstance(results["missing"], FileNotFoundError)
+    assert results["ok"] == {"datasets": ["ImageNet", "COCO"]}
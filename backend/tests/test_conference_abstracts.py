@@ -0,0 +1,157 @@
+"""Tests for concurrent conference abstract fetching against a local site."""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.services.conference_abstracts import (
+    ConferenceAbstractFetcher,
+    normalize_title,
+    parse_abstract,
+)
+
+PAGES = {
+    # Paths mimic the hosts so parse_abstract picks the matching layout
+    "/openaccess.thecvf.com/cvpr.html": '<div id="abstract">\nCVF abstract.\n</div>',
+    "/iclr.cc/virtual.html": '<div id="abstractExample"><p>ICLR abstract.</p></div>',
+    "/openreview.net/forum.html": (
+        '<meta name="citation_abstract" content="OpenReview abstract.">'
+        '<div id="root"></div>'
+    ),
+    "/empty.html": "<html><body>No abstract here</body></html>",
+}
+
+
+class FixtureSite:
+    """Local conference site recording request concurrency."""
+
+    def __init__(self, latency: float = 0.02, throttle_first: int = 0):
+        self.latency = latency
+        self.throttle_first = throttle_first
+        self.requests = 0
+        self.active = 0
+        self.max_active = 0
+        self.url = ""
+        self._runner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.throttle_first > 0:
+                self.throttle_first -= 1
+                return web.Response(status=429, headers={"Retry-After": "0"})
+            path = request.path
+            if path.startswith("/openaccess.thecvf.com/paper/"):
+                return web.Response(
+                    text=f'<div id="abstract">Abstract {path.rsplit("/", 1)[-1]}</div>',
+                    content_type="text/html",
+                )
+            if path not in PAGES:
+                return web.Response(status=404)
+            return web.Response(text=PAGES[path], content_type="text/html")
+        finally:
+            self.active -= 1
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        return self.url
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+
+@pytest.fixture
+async def site():
+    site = FixtureSite()
+    await site.start()
+    yield site
+    await site.stop()
+
+
+def test_normalize_title():
+    assert normalize_title("  Déjà Vu:  A   Transformer-Based  Model! ") == "deja vu a transformer based model"
+    assert normalize_title("NeRF: Neural Radiance Fields") == normalize_title("nerf - neural radiance fields")
+
+
+def test_parse_abstract_layouts():
+    assert parse_abstract(PAGES["/openaccess.thecvf.com/cvpr.html"], "https://openaccess.thecvf.com/x") == "CVF abstract."
+    assert parse_abstract(PAGES["/iclr.cc/virtual.html"], "https://iclr.cc/virtual/x") == "ICLR abstract."
+    assert parse_abstract(PAGES["/openreview.net/forum.html"], "https://openreview.net/forum?id=x") == "OpenReview abstract."
+    assert parse_abstract(PAGES["/empty.html"], "https://openaccess.thecvf.com/x") is None
+
+
+async def test_fetch_many_layouts(site):
+    urls = [f"{site.url}{path}" for path in PAGES] + [f"{site.url}/missing.html"]
+
+    async with ConferenceAbstractFetcher(host_delay=0) as fetcher:
+        abstracts = await fetcher.fetch_many(urls + urls[:1])
+
+    assert abstracts == {
+        urls[0]: "CVF abstract.",
+        urls[1]: "ICLR abstract.",
+        urls[2]: "OpenReview abstract.",
+        urls[3]: None,
+        urls[4]: None,
+    }
+    assert site.requests == 5
+    assert fetcher.stats["fetched"] == 3
+    assert fetcher.stats["missing"] == 1
+    assert fetcher.stats["failed"] == 1
+
+
+async def test_per_host_concurrency_is_bounded(site):
+    urls = [f"{site.url}/openaccess.thecvf.com/paper/{i}" for i in range(20)]
+    progress = []
+
+    async with ConferenceAbstractFetcher(concurrency=16, per_host=3, host_delay=0) as fetcher:
+        abstracts = await fetcher.fetch_many(urls, on_progress=lambda done, total: progress.append((done, total)))
+
+    assert abstracts[urls[7]] == "Abstract 7"
+    assert 1 < site.max_active <= 3
+    assert progress[-1] == (20, 20)
+
+
+async def test_host_delay_spaces_requests(site):
+    urls = [f"{site.url}/openaccess.thecvf.com/paper/{i}" for i in range(4)]
+    loop = asyncio.get_running_loop()
+
+    async with ConferenceAbstractFetcher(per_host=4, host_delay=0.05) as fetcher:
+        started = loop.time()
+        await fetcher.fetch_many(urls)
+
+    assert loop.time() - started >= 0.15
+
+
+async def test_throttled_responses_are_retried(site):
+    site.throttle_first = 2
+
+    async with ConferenceAbstractFetcher(per_host=1, host_delay=0) as fetcher:
+        abstract = await fetcher.fetch(f"{site.url}/openaccess.thecvf.com/paper/1")
+
+    assert abstract == "Abstract 1"
+    assert fetcher.stats["retries"] == 2
+
+
+async def test_browser_fallback_for_dynamic_pages(site):
+    fallback_urls = []
+
+    def browser_fallback(url):
+        fallback_urls.append(url)
+        return "Rendered abstract."
+
+    url = f"{site.url}/empty.html"
+    async with ConferenceAbstractFetcher(host_delay=0, browser_fallback=browser_fallback) as fetcher:
+        abstracts = await fetcher.fetch_many([url, f"{site.url}/openaccess.thecvf.com/paper/1"])
+
+    assert abstracts[url] == "Rendered abstract."
+    assert fallback_urls == [url]
+    assert fetcher.stats["browser_fallbacks"] == 1
@@ -0,0 +1,31 @@
+"""Tests for Prometheus rendering of corpus statistics.
+
+Counter maintenance, reads and refreshes are covered against a database in
+``tests/integration/test_corpus_stats.py``.
+"""
+from src.services.corpus_stats_service import render_prometheus
+
+
+def test_render_prometheus_scalars_and_breakdowns():
+    metrics = {
+        "papers_total": 1200,
+        "avg_stars_per_repo": 12.5,
+        "llm_extractions_by_status": {"pending_review": 3},
+        "top_tasks": [{"task": 'Image "Gen"', "count": 7}],
+        "top_datasets": [],
+    }
+
+    output = render_prometheus(metrics)
+
+    assert "# TYPE hypepaper_papers_total gauge\nhypepaper_papers_total 1200\n" in output
+    assert "hypepaper_avg_stars_per_repo 12.5" in output
+    assert 'hypepaper_llm_extractions_by_status{status="pending_review"} 3' in output
+    assert 'hypepaper_top_tasks{task="Image \\"Gen\\""} 7' in output
+    assert output.endswith("\n")
+
+
+def test_render_prometheus_skips_non_numeric_values():
+    output = render_prometheus({"papers_total": 1, "top_tasks": [], "note": "text"})
+
+    assert "hypepaper_note" not in output
+    assert "hypepaper_papers_total 1" in output
@@ -0,0 +1,87 @@
+"""Tests for cached LLM metadata extraction."""
+import hashlib
+
+import pytest
+
+from src.services.extraction_cache_service import ExtractionCacheService, file_sha256, prompt_hash
+from src.services.llm_service import AsyncLLMService, LlamaCppLLMService, OpenAILLMService
+
+
+class FakeLLMService(AsyncLLMService):
+    provider = "fake"
+
+    def __init__(self, model="m1", result=None):
+        self.model = model
+        self.result = result if result is not None else {"datasets": ["ImageNet"]}
+        self.calls = 0
+
+    async def extract_metadata(self, pdf_path, prompt):
+        self.calls += 1
+        return self.result
+
+
+class InMemoryExtractionCache(ExtractionCacheService):
+    def __init__(self):
+        super().__init__(session=None)
+        self.store = {}
+
+    async def get(self, pdf_sha256, prompt_digest, model_id):
+        return self.store.get((pdf_sha256, prompt_digest, model_id))
+
+    async def put(self, pdf_sha256, prompt_digest, model_id, result):
+        self.store[(pdf_sha256, prompt_digest, model_id)] = result
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4 fake")
+    return path
+
+
+def test_hashes(pdf):
+    assert file_sha256(pdf, chunk_size=4) == hashlib.sha256(b"%PDF-1.4 fake").hexdigest()
+    assert prompt_hash("\nExtract datasets.\n") == prompt_hash("Extract datasets.")
+    assert prompt_hash("Extract datasets.") != prompt_hash("Extract metrics.")
+
+
+def test_model_ids():
+    assert OpenAILLMService(api_key="x").model_id == "openai:gpt-4o"
+    assert LlamaCppLLMService(model="qwen").model_id == "llamacpp:qwen"
+
+
+async def test_extraction_reused_for_identical_inputs(pdf):
+    cache = InMemoryExtractionCache()
+    llm = FakeLLMService()
+
+    first, first_cached = await cache.extract(llm, pdf, "Extract datasets.")
+    second, second_cached = await cache.extract(llm, pdf, "Extract datasets.")
+
+    assert first == second == {"datasets": ["ImageNet"]}
+    assert (first_cached, second_cached) == (False, True)
+    assert llm.calls == 1
+
+
+async def test_changed_inputs_call_llm_again(pdf):
+    cache = InMemoryExtractionCache()
+    llm = FakeLLMService()
+    await cache.extract(llm, pdf, "Extract datasets.")
+
+    await cache.extract(llm, pdf, "Extract datasets and splits.")
+    await cache.extract(FakeLLMService(model="m2"), pdf, "Extract datasets.")
+    pdf.write_bytes(b"%PDF-1.4 revised")
+    await cache.extract(llm, pdf, "Extract datasets.")
+
+    assert llm.calls == 3
+    assert len(cache.store) == 4
+
+
+async def test_errors_are_not_stored(pdf):
+    cache = InMemoryExtractionCache()
+    llm = FakeLLMService(result={"error": "Failed to parse JSON response"})
+
+    await cache.extract(llm, pdf, "Extract datasets.")
+    await cache.extract(llm, pdf, "Extract datasets.")
+
+    assert llm.calls == 2
+    assert cache.store == {}
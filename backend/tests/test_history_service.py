@@ -0,0 +1,84 @@
+"""Tests for history bucket selection and LTTB downsampling."""
+from datetime import date, timedelta
+
+import pytest
+
+from src.services.history_service import (
+    DEFAULT_MAX_POINTS,
+    HistoryService,
+    bucket_start,
+    choose_bucket,
+    downsample,
+    lttb,
+)
+
+
+@pytest.mark.parametrize(
+    "days, expected",
+    [
+        (30, "day"),
+        (DEFAULT_MAX_POINTS - 1, "day"),
+        (DEFAULT_MAX_POINTS + 1, "week"),
+        (3 * 365, "week"),
+        (10 * 365, "month"),
+    ],
+)
+def test_choose_bucket(days, expected):
+    end = date(2026, 10, 18)
+    assert choose_bucket(end - timedelta(days=days), end) == expected
+
+
+def test_choose_bucket_respects_max_points():
+    end = date(2026, 10, 18)
+    assert choose_bucket(end - timedelta(days=90), end, max_points=50) == "week"
+    assert choose_bucket(end - timedelta(days=900), end, max_points=50) == "month"
+
+
+def test_bucket_start():
+    day = date(2026, 10, 18)  # Sunday
+    assert bucket_start(day, "day") == day
+    assert bucket_start(day, "week") == date(2026, 10, 12)
+    assert bucket_start(day, "month") == date(2026, 10, 1)
+
+
+def test_resolve_bucket_rejects_unknown():
+    with pytest.raises(ValueError):
+        HistoryService._resolve_bucket("year", date(2026, 1, 1), date(2026, 2, 1), None)
+
+
+def test_lttb_keeps_endpoints_and_size():
+    xs = list(range(1000))
+    ys = [x % 17 for x in xs]
+
+    indices = lttb(xs, ys, 100)
+
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert indices == sorted(set(indices))
+
+
+def test_lttb_keeps_spike():
+    xs = list(range(500))
+    ys = [0] * 500
+    ys[321] = 1000
+
+    assert 321 in lttb(xs, ys, 20)
+
+
+def test_lttb_returns_all_points_under_threshold():
+    assert lttb([0, 1, 2], [5, 6, 7], 10) == [0, 1, 2]
+    assert lttb(list(range(10)), list(range(10)), 2) == list(range(10))
+
+
+def test_downsample_points():
+    start = date(2020, 1, 1)
+    points = [
+        {"date": start + timedelta(days=i), "stars": i * 2 if i != 700 else None}
+        for i in range(1000)
+    ]
+
+    sampled = downsample(points, 50, lambda point: point["stars"])
+
+    assert len(sampled) == 50
+    assert sampled[0] is points[0] and sampled[-1] is points[-1]
+    assert downsample(points[:10], 50, lambda point: point["stars"]) == points[:10]
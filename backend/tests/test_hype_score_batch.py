@@ -0,0 +1,99 @@
+"""Equivalence tests for the vectorized hype score batch API."""
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.services.hype_score import (
+    HypeScoreService,
+    calculate_hype_score,
+    calculate_hype_scores_batch,
+    trend_labels_batch,
+)
+
+TODAY = date(2026, 10, 18)
+
+counts = st.one_of(st.none(), st.integers(min_value=-1_000, max_value=10_000_000))
+published_dates = st.one_of(
+    st.none(),
+    st.dates(min_value=date(1990, 1, 1), max_value=TODAY + timedelta(days=30)),
+)
+papers = st.lists(st.tuples(counts, counts, counts, published_dates), max_size=50)
+
+
+@pytest.fixture(autouse=True)
+def fixed_today(monkeypatch):
+    """Pin date.today() in the scalar module so both paths share a reference date."""
+    import src.services.hype_score as hype_score
+
+    class FixedDate(date):
+        @classmethod
+        def today(cls):
+            return TODAY
+
+    monkeypatch.setattr(hype_score, "date", FixedDate)
+
+
+@settings(max_examples=200, deadline=None)
+@given(papers)
+def test_batch_matches_scalar(rows):
+    expected = [calculate_hype_score(s, c, v, d) for s, c, v, d in rows]
+
+    batch = calculate_hype_scores_batch(
+        github_stars=[s for s, _, _, _ in rows],
+        citation_counts=[c for _, c, _, _ in rows],
+        vote_counts=[v for _, _, v, _ in rows],
+        published_ordinals=[d.toordinal() if d else None for _, _, _, d in rows],
+        today=TODAY,
+    )
+
+    assert len(batch) == len(rows)
+    np.testing.assert_allclose(batch.score, expected, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(
+        batch.github + batch.citations + batch.votes + batch.recency,
+        batch.score,
+        rtol=1e-12,
+        atol=1e-15,
+    )
+
+
+@settings(max_examples=100, deadline=None)
+@given(st.lists(st.floats(min_value=-1.0, max_value=10.0, allow_nan=False), max_size=50))
+def test_trend_labels_match_service(growth):
+    from src.services.hype_score_service import HypeScoreService as TrendService
+
+    expected = [TrendService._get_trend_label(None, g) for g in growth]
+    assert list(trend_labels_batch(growth)) == expected
+
+
+def test_missing_columns_contribute_zero():
+    batch = calculate_hype_scores_batch(github_stars=[0, 99_999], today=TODAY)
+    np.testing.assert_allclose(batch.score, [0.0, 0.4])
+    assert not batch.recency.any()
+    assert batch.trend_label is None
+
+
+def test_calculate_for_papers_matches_calculate_for_paper():
+    class Metrics:
+        current_stars = 1_234
+
+    class Paper:
+        def __init__(self, github_metrics, citation_count, vote_count, published_date):
+            self.github_metrics = github_metrics
+            self.citation_count = citation_count
+            self.vote_count = vote_count
+            self.published_date = published_date
+
+    papers = [
+        Paper(Metrics(), 10, 3, TODAY - timedelta(days=100)),
+        Paper(None, None, -2, None),
+        Paper(None, 500, 0, TODAY - timedelta(days=2_000)),
+    ]
+
+    scores = HypeScoreService.calculate_for_papers(papers)
+
+    np.testing.assert_allclose(
+        scores, [HypeScoreService.calculate_for_paper(p) for p in papers], rtol=1e-12
+    )
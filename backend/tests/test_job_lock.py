@@ -0,0 +1,152 @@
+"""Tests for advisory-lock based single-run scheduled jobs."""
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.jobs import job_lock
+from src.jobs.job_lock import JobLockLost, exclusive, job_lock_key, run_exclusive
+
+
+class FakeConnection:
+    def __init__(self, acquired=True, last_started_at=None, fail_heartbeat=False):
+        self.acquired = acquired
+        self.last_started_at = last_started_at
+        self.fail_heartbeat = fail_heartbeat
+        self.rollbacks = 0
+
+    async def scalar(self, statement, params):
+        if statement is job_lock.TRY_LOCK:
+            return self.acquired
+        return self.last_started_at
+
+    async def execute(self, statement):
+        if self.fail_heartbeat:
+            raise ConnectionError("connection reset")
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def lock(monkeypatch):
+    conn = FakeConnection()
+    statuses = []
+
+    async def record(job_name, state=None, **values):
+        statuses.append((job_name, state, values))
+
+    monkeypatch.setattr(job_lock, "engine", type("Engine", (), {"connect": lambda self: conn})())
+    monkeypatch.setattr(job_lock, "record_job_status", record)
+    monkeypatch.setattr(job_lock, "JOB_LOCK_HEARTBEAT_SECONDS", 0.01)
+    return conn, statuses
+
+
+def test_lock_keys_are_stable_and_distinct():
+    assert job_lock_key("metric_update") == job_lock_key("metric_update")
+    assert job_lock_key("metric_update") != job_lock_key("paper_discovery")
+    assert -2 ** 63 <= job_lock_key("metric_update") < 2 ** 63
+
+
+async def test_holder_runs_job_and_records_state(lock):
+    conn, statuses = lock
+    calls = []
+
+    async def job(value, flag=False):
+        await asyncio.sleep(0.05)
+        calls.append((value, flag))
+
+    assert await exclusive("demo", job)(1, flag=True) is True
+    assert calls == [(1, True)]
+    states = [state for _, state, _ in statuses]
+    assert states[0] == "running" and states[-1] == "succeeded"
+    assert "running" in states[1:-1]  # heartbeats
+    assert conn.rollbacks == 1  # lock released
+
+
+async def test_other_replicas_skip(lock):
+    conn, statuses = lock
+    conn.acquired = False
+    calls = []
+
+    async def job():
+        calls.append(1)
+
+    assert await run_exclusive("demo", job) is False
+    assert calls == []
+    (_, state, values), = statuses
+    assert state is None and "last_skipped_at" in values
+
+
+async def test_recent_run_on_another_replica_is_not_repeated(lock):
+    conn, _ = lock
+    conn.last_started_at = datetime.now(UTC) - timedelta(seconds=5)
+    calls = []
+
+    async def job():
+        calls.append(1)
+
+    assert await run_exclusive("demo", job) is False
+    assert calls == []
+
+
+async def test_failures_are_recorded_and_raised(lock):
+    _, statuses = lock
+
+    async def job():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await run_exclusive("demo", job)
+    _, state, values = statuses[-1]
+    assert state == "failed" and "boom" in values["last_error"]
+
+
+async def test_lost_lock_connection_cancels_job(lock):
+    conn, statuses = lock
+    conn.fail_heartbeat = True
+    cancelled = asyncio.Event()
+
+    async def job():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(JobLockLost):
+        await run_exclusive("demo", job)
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+    assert statuses[-1][1] == "lock_lost"
+
+
+def test_scheduler_wraps_jobs_unless_opted_out():
+    from apscheduler.triggers.interval import IntervalTrigger
+
+    from src.jobs.scheduler import JobScheduler
+
+    async def job():
+        pass
+
+    scheduler = JobScheduler()
+    scheduler.add_job(job, id="shared_job", trigger=IntervalTrigger(minutes=5))
+    scheduler.add_job(job, id="local_job", trigger=IntervalTrigger(minutes=5), exclusive=False)
+
+    assert scheduler.scheduler.get_job("shared_job").func is not job
+    assert scheduler.scheduler.get_job("local_job").func is job
+
+
+def test_similarity_index_job_runs_on_every_replica():
+    from src.jobs.scheduler import JobScheduler, run_similarity_index_job
+
+    scheduler = JobScheduler()
+    scheduler.setup_jobs()
+
+    assert scheduler.scheduler.get_job("similarity_index_update").func is run_similarity_index_job
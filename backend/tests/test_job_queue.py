@@ -0,0 +1,216 @@
+"""Tests for the job queue service and its SQL backend (SQLite)."""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from src.models import QueuedJob
+from src.services import job_queue_backends
+from src.services.job_queue_backends import (
+    RedisQueueBackend,
+    SqlQueueBackend,
+    create_queue_backend,
+    new_job,
+)
+from src.services.job_queue_service import JobQueueService
+
+
+@pytest.fixture
+async def backend(tmp_path):
+    backend = SqlQueueBackend.from_url(f"sqlite+aiosqlite:///{tmp_path / 'queue.db'}")
+    yield backend
+    await backend.close()
+
+
+@pytest.fixture
+def service(backend):
+    return JobQueueService(backend=backend)
+
+
+async def expire_lease(backend, job_id):
+    async with backend.session_factory() as session:
+        await session.execute(
+            update(QueuedJob)
+            .where(QueuedJob.id == job_id)
+            .values(visible_at=datetime.utcnow() - timedelta(seconds=1))
+        )
+        await session.commit()
+
+
+async def test_enqueue_many_and_status(service):
+    job_ids = await service.enqueue_crawler_jobs(
+        [
+            {"job_type": "arxiv", "params": {"query": "diffusion"}},
+            {"job_type": "github", "params": {"url": "https://github.com/a/b"}},
+        ],
+        user_id="user-1",
+    )
+
+    assert len(set(job_ids)) == 2
+    status = await service.get_job_status(job_ids[0])
+    assert status["status"] == "queued"
+    assert status["type"] == "arxiv"
+    assert status["params"] == {"query": "diffusion"}
+    assert status["user_id"] == "user-1"
+    assert await service.get_queue_length() == 2
+
+
+async def test_dequeue_in_priority_order(service):
+    low = await service.enqueue_crawler_job("arxiv", {"query": "a"}, priority="low")
+    normal = await service.enqueue_crawler_job("arxiv", {"query": "b"})
+    high = await service.enqueue_crawler_job("arxiv", {"query": "c"}, priority="high")
+    normal_2 = await service.enqueue_crawler_job("arxiv", {"query": "d"})
+
+    jobs = await service.dequeue_jobs(count=3)
+
+    assert [job["id"] for job in jobs] == [high, normal, normal_2]
+    assert (await service.get_job_status(high))["status"] == "processing"
+    assert [job["id"] for job in await service.dequeue_jobs(count=3)] == [low]
+    assert await service.dequeue_jobs(count=3) == []
+
+
+async def test_invalid_priority_rejected(service):
+    with pytest.raises(ValueError):
+        await service.enqueue_crawler_job("arxiv", {}, priority="urgent")
+
+
+async def test_expired_lease_is_redelivered(service, backend):
+    job_id = await service.enqueue_crawler_job("arxiv", {"query": "a"})
+    [job] = await service.dequeue_jobs(count=1, visibility_timeout=60)
+    assert job["retry_count"] == 0
+    assert await service.dequeue_jobs(count=1) == []
+
+    await expire_lease(backend, job_id)
+
+    assert (await service.get_queue_stats())["counts"]["expired"] == 1
+    [job] = await service.dequeue_jobs(count=1)
+    assert job["id"] == job_id
+    assert job["retry_count"] == 1
+
+
+async def test_expired_lease_dead_lettered_after_max_attempts(service, backend):
+    job_id = await service.enqueue_crawler_job("arxiv", {"query": "a"})
+
+    for retry_count in range(3):
+        [job] = await backend.dequeue(1, max_attempts=3)
+        assert job["retry_count"] == retry_count
+        await expire_lease(backend, job_id)
+
+    assert await backend.dequeue(1, max_attempts=3) == []
+    status = await service.get_job_status(job_id)
+    assert status["status"] == "failed"
+    assert status["error"] == "Lease expired after 3 delivery attempts"
+    assert (await service.get_job_result(job_id))["status"] == "failed"
+    counts = (await service.get_queue_stats())["counts"]
+    assert counts["failed"] == 1 and counts["processing"] == 0
+
+
+class FakeRedis:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        self.calls.append((script, keys_and_args[:numkeys], keys_and_args[numkeys:]))
+        return self.replies.pop(0)
+
+
+async def test_redis_dequeue_passes_attempt_cap_and_dead_letter_key():
+    client = FakeRedis([[json.dumps(new_job("job-1", "arxiv", {}))]])
+
+    [job] = await RedisQueueBackend(client).dequeue(5, visibility_timeout=60, max_attempts=2)
+
+    script, keys, args = client.calls[0]
+    assert script is job_queue_backends.DEQUEUE_SCRIPT
+    assert keys[5:] == (job_queue_backends.DEAD_LETTER_KEY, job_queue_backends.STATS_KEY)
+    assert args[6] == 2
+    assert args[7] == job_queue_backends.RESULT_KEY_PREFIX
+    assert args[9] == "Lease expired after 2 delivery attempts"
+    assert job["id"] == "job-1"
+
+
+async def test_redis_counts_include_dead_letters():
+    client = FakeRedis([[1, 2, 0, 3, 1, 4, "failed", "6", "success", "2"]])
+
+    counts = await RedisQueueBackend(client).counts()
+
+    assert counts["queued"] == 3
+    assert counts["dead_lettered"] == 4
+    assert counts["failed"] == 6
+    assert counts["cancelled"] == 0
+
+
+async def test_complete_stores_result(service):
+    job_id = await service.enqueue_crawler_job("arxiv", {"query": "a"})
+    await service.dequeue_jobs(count=1)
+
+    await service.complete_job(job_id, "success", results={"papers": 3})
+
+    result = await service.get_job_result(job_id)
+    assert result["status"] == "success"
+    assert result["results"] == {"papers": 3}
+    status = await service.get_job_status(job_id)
+    assert status["status"] == "success"
+    assert status["results"] == {"papers": 3}
+    assert await service.dequeue_jobs(count=1) == []
+
+    with pytest.raises(ValueError):
+        await service.complete_job(job_id, "done")
+
+
+async def test_cancelled_job_is_not_delivered(service):
+    job_id = await service.enqueue_crawler_job("arxiv", {"query": "a"})
+
+    assert await service.cancel_job(job_id) is True
+    assert await service.cancel_job(job_id) is False
+    assert await service.cancel_job("missing") is False
+    assert await service.dequeue_jobs(count=1) == []
+    assert await service.get_job_result(job_id) is None
+
+
+async def test_queue_stats_counts_per_state(service):
+    job_ids = await service.enqueue_crawler_jobs(
+        [{"job_type": "arxiv", "params": {"query": str(i)}} for i in range(4)]
+        + [{"job_type": "arxiv", "params": {}, "priority": "high"}]
+    )
+    await service.dequeue_jobs(count=2)
+    await service.complete_job(job_ids[4], "failed", error="boom")
+    await service.cancel_job(job_ids[3])
+
+    stats = await service.get_queue_stats()
+
+    assert stats["queue_length"] == 2
+    counts = stats["counts"]
+    assert counts["queued"] == 2
+    assert counts["queued_normal"] == 2
+    assert counts["queued_high"] == 0
+    assert counts["processing"] == 1
+    assert counts["expired"] == 0
+    assert counts["failed"] == 1
+    assert counts["cancelled"] == 1
+    assert counts["success"] == 0
+
+
+def test_new_job_payload():
+    job = new_job("job-1", "arxiv", {"query": "a"}, priority="high")
+
+    assert job["id"] == "job-1"
+    assert job["priority"] == "high"
+    assert job["retry_count"] == 0
+
+
+def test_create_queue_backend_from_env(monkeypatch):
+    monkeypatch.setenv("JOB_QUEUE_BACKEND", "sql")
+    monkeypatch.setenv("JOB_QUEUE_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+    assert isinstance(create_queue_backend(), SqlQueueBackend)
+
+    monkeypatch.setenv("JOB_QUEUE_BACKEND", "redis")
+    monkeypatch.delenv("JOB_QUEUE_REDIS_URL", raising=False)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    with pytest.raises(ValueError):
+        create_queue_backend()
+
+    with pytest.raises(ValueError):
+        create_queue_backend("kafka")
+
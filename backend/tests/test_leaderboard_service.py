@@ -0,0 +1,110 @@
+"""Tests for precomputed trending leaderboards."""
+from datetime import date, timedelta
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.services import leaderboard_service
+from src.services.leaderboard_service import LeaderboardSnapshot, LeaderboardStore
+
+TODAY = date.today()
+
+
+def make_row(stars, weekly, monthly=None, average=None, days_tracked=400,
+             task="Image Generation", language="Python"):
+    return (
+        uuid4(), TODAY - timedelta(days=days_tracked), stars,
+        weekly, monthly, average, task, language,
+    )
+
+
+@pytest.fixture
+def rows():
+    return [
+        make_row(500, 10.0, language="C++"),
+        make_row(50, 99.0),                                 # below default min_stars
+        make_row(1_000, None),                              # null score sorts last
+        make_row(2_000, 30.0, days_tracked=3),              # too new for "week"
+        make_row(800, 20.0, task="Object Detection"),
+    ]
+
+
+def test_ranking_orders_by_score_with_nulls_last(rows):
+    snapshot = LeaderboardSnapshot.from_rows(rows)
+
+    ranking = snapshot.ranking("all_time", "weekly_hype", min_stars=100)
+
+    ids = snapshot.page(ranking, 0, 10)
+    assert ids == [rows[3][0], rows[4][0], rows[0][0], rows[2][0]]
+
+
+def test_ranking_filters(rows):
+    snapshot = LeaderboardSnapshot.from_rows(rows)
+
+    week = snapshot.page(snapshot.ranking("week", "weekly_hype", min_stars=100), 0, 10)
+    assert rows[3][0] not in week
+
+    task = snapshot.ranking("all_time", "weekly_hype", primary_task="Object Detection")
+    assert snapshot.page(task, 0, 10) == [rows[4][0]]
+
+    language = snapshot.ranking("all_time", "total_stars", language="Python", min_stars=0)
+    assert snapshot.page(language, 0, 10) == [rows[3][0], rows[2][0], rows[4][0], rows[1][0]]
+
+
+def test_ranking_is_cached_and_paged(rows):
+    snapshot = LeaderboardSnapshot.from_rows(rows)
+
+    first = snapshot.ranking("all_time", "total_stars")
+    assert snapshot.ranking("all_time", "total_stars") is first
+    assert snapshot.page(first, 1, 2) == [rows[2][0], rows[4][0]]
+    assert snapshot.page(first, 10, 2) == []
+
+
+def test_ranking_matches_sql_style_sort_on_random_data():
+    rng = np.random.default_rng(0)
+    rows = [
+        make_row(int(rng.integers(0, 10_000)),
+                 None if rng.random() < 0.2 else float(rng.random() * 100))
+        for _ in range(500)
+    ]
+    snapshot = LeaderboardSnapshot.from_rows(rows)
+
+    ids = snapshot.page(snapshot.ranking("all_time", "weekly_hype", min_stars=100), 0, 1_000)
+
+    expected = sorted(
+        (row for row in rows if row[2] >= 100),
+        key=lambda row: (row[3] is None, -(row[3] or 0.0)),
+    )
+    assert ids == [row[0] for row in expected]
+
+
+@pytest.mark.asyncio
+async def test_store_rebuilds_on_version_change(monkeypatch, rows):
+    builds = []
+    remote = {"version": 1}
+
+    async def fake_build(session, version=None):
+        builds.append(version)
+        return LeaderboardSnapshot.from_rows(rows, version=version)
+
+    store = LeaderboardStore(ttl=3600)
+
+    async def fake_remote_version():
+        return remote["version"]
+
+    monkeypatch.setattr(leaderboard_service, "build_snapshot", fake_build)
+    monkeypatch.setattr(leaderboard_service, "VERSION_CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(store, "_remote_version", fake_remote_version)
+
+    first = await store.get_snapshot(None)
+    assert await store.get_snapshot(None) is first
+
+    remote["version"] = 2
+    second = await store.get_snapshot(None)
+    assert second is not first
+    assert builds == [1, 2]
+
+    store.invalidate()
+    await store.get_snapshot(None)
+    assert len(builds) == 3
@@ -0,0 +1,94 @@
+"""Tests for adaptive per-paper metric refresh scheduling."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.services import metric_refresh_service
+from src.services.metric_refresh_service import (
+    METRIC_REFRESH_MAX_HOURS,
+    METRIC_REFRESH_MIN_HOURS,
+    MetricRefreshScheduler,
+    next_refresh_interval,
+    pop_paper_views,
+)
+
+NOW = datetime(2026, 10, 18, 12)
+
+
+def test_volatile_papers_are_refreshed_sooner():
+    # 50 stars in a day is 10x the target change per refresh
+    assert next_refresh_interval(24, 24, star_delta=50, citation_delta=0) == pytest.approx(24 / 10 ** 0.5)
+    # A citation weighs as much as ten stars
+    assert next_refresh_interval(24, 24, 0, 5) == next_refresh_interval(24, 24, 50, 0)
+
+
+def test_flat_papers_back_off_up_to_the_maximum():
+    assert next_refresh_interval(24, 24, 0, 0) == 48
+    assert next_refresh_interval(300, 300, 0, 0) == METRIC_REFRESH_MAX_HOURS
+
+
+def test_failed_fetch_keeps_the_interval():
+    assert next_refresh_interval(24, 24, 0, 0, backoff=False) == 24
+    # Observed change still adapts the interval
+    assert next_refresh_interval(24, 24, 50, 0, backoff=False) == next_refresh_interval(24, 24, 50, 0)
+
+
+def test_views_shorten_the_interval_down_to_the_minimum():
+    assert next_refresh_interval(48, None, 0, 0, views=50) == 24
+    assert next_refresh_interval(24, 24, 10_000, 0, views=1_000) == METRIC_REFRESH_MIN_HOURS
+
+
+def entry(**kwargs):
+    defaults = {
+        "paper_id": uuid4(), "refresh_interval_hours": 24.0, "next_refresh_at": NOW,
+        "last_refreshed_at": None, "last_github_stars": None, "last_citation_count": None,
+    }
+    return SimpleNamespace(**{**defaults, **kwargs})
+
+
+def test_reschedule_records_values_and_next_due_time():
+    scheduler = MetricRefreshScheduler(session=None)
+    first = entry()
+
+    assert scheduler.reschedule(first, 100, 3, now=NOW) == 24
+    assert first.next_refresh_at == NOW + timedelta(hours=24)
+    assert (first.last_github_stars, first.last_citation_count) == (100, 3)
+
+    later = NOW + timedelta(hours=24)
+    assert scheduler.reschedule(first, 100, None, now=later) == 48
+    assert first.last_refreshed_at == later
+    assert first.last_citation_count == 3
+
+
+def test_partial_refresh_does_not_back_off():
+    scheduler = MetricRefreshScheduler(session=None)
+    paper = entry(last_refreshed_at=NOW - timedelta(hours=24), last_github_stars=100, last_citation_count=3)
+
+    assert scheduler.reschedule(paper, None, 3, now=NOW, partial=True) == 24
+    assert paper.last_github_stars == 100
+    assert scheduler.reschedule(paper, 100, 3, now=NOW + timedelta(hours=24)) == 48
+
+
+def test_failed_refresh_is_retried_after_minimum_interval():
+    failed = entry(refresh_interval_hours=96.0)
+    MetricRefreshScheduler(session=None).retry_later(failed, now=NOW)
+
+    assert failed.next_refresh_at == NOW + timedelta(hours=METRIC_REFRESH_MIN_HOURS)
+    assert failed.refresh_interval_hours == 96.0
+
+
+async def test_view_counters_are_drained(monkeypatch):
+    popped = []
+
+    class FakeCache:
+        async def pop_many(self, keys):
+            popped.extend(keys)
+            return [7, None]
+
+    monkeypatch.setattr(metric_refresh_service, "get_cache", lambda: FakeCache())
+    a, b = uuid4(), uuid4()
+
+    assert await pop_paper_views([a, b]) == {a: 7, b: 0}
+    assert popped == [f"paper_views:{a}", f"paper_views:{b}"]
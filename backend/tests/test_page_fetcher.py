@@ -0,0 +1,166 @@
+"""Tests for HTTP-first page fetching and the browser pool."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.utils import page_fetcher
+from src.utils.page_fetcher import BrowserPool, PageFetcher, table_has_rows
+
+STATIC_TABLE = (
+    '<table id="paperlist"><thead></thead><tbody><tr><td>Paper</td></tr></tbody></table>'
+)
+DYNAMIC_TABLE = (
+    '<button id="btn_fetchall">Fetch All</button>'
+    '<table id="paperlist"><thead></thead><tbody></tbody></table>'
+)
+PAGES = {"/static": STATIC_TABLE, "/dynamic": DYNAMIC_TABLE}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = PAGES.get(self.path)
+        self.send_response(200 if body else 404)
+        self.end_headers()
+        self.wfile.write((body or "").encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+class FakeScraper:
+    def __init__(self):
+        self.urls = []
+        self.closed = False
+        self.fail = False
+
+    def fetch_url(self, url):
+        if self.fail:
+            raise RuntimeError("chrome crashed")
+        self.urls.append(url)
+
+    def current_page_source(self):
+        return f"<html>rendered {self.urls[-1]}</html>"
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def scrapers():
+    return []
+
+
+@pytest.fixture
+def pool(scrapers):
+    def factory():
+        scraper = FakeScraper()
+        scrapers.append(scraper)
+        return scraper
+
+    return BrowserPool(size=2, factory=factory)
+
+
+def test_static_page_is_fetched_over_http(site, pool, scrapers):
+    fetcher = PageFetcher(browser_pool=pool)
+
+    html = fetcher.fetch(f"{site}/static", ready=table_has_rows("paperlist"))
+
+    assert html == STATIC_TABLE
+    assert scrapers == []
+    stats = fetcher.stats()
+    assert stats["http"] == 1
+    assert stats["browser"] == 0
+    assert stats["http_mean_seconds"] is not None
+
+
+def test_dynamic_page_falls_back_to_pooled_browser(site, pool, scrapers):
+    fetcher = PageFetcher(browser_pool=pool)
+    actions = []
+
+    for _ in range(3):
+        html = fetcher.fetch(
+            f"{site}/dynamic",
+            ready=table_has_rows("paperlist"),
+            browser_action=lambda scraper: actions.append(scraper),
+        )
+
+    assert html == f"<html>rendered {site}/dynamic</html>"
+    assert len(scrapers) == 1  # one warm browser reused
+    assert actions == scrapers * 3
+    stats = fetcher.stats()
+    assert stats["http_fallbacks"] == 3
+    assert stats["browser"] == 3
+    assert stats["browsers_started"] == 1
+
+
+def test_error_status_falls_back_to_browser(site, pool, scrapers):
+    fetcher = PageFetcher(browser_pool=pool)
+
+    fetcher.fetch(f"{site}/missing")
+
+    assert scrapers[0].urls == [f"{site}/missing"]
+
+
+def test_failed_browser_is_discarded(pool, scrapers):
+    with pool.session() as scraper:
+        scraper.fail = True
+
+    fetcher = PageFetcher(browser_pool=pool)
+    assert fetcher.fetch("http://unused", http_first=False) == ""
+    assert scrapers[0].closed
+    assert fetcher.stats()["errors"] == 1
+
+    with pool.session() as scraper:
+        assert scraper is scrapers[1]
+    assert not scrapers[1].closed
+
+
+def test_pool_size_is_bounded(pool, scrapers):
+    with pool.session() as first, pool.session() as second:
+        assert first is not second
+        with pytest.raises(TimeoutError):
+            with pool.session(timeout=0.01):
+                pass
+
+    pool.close()
+    assert all(scraper.closed for scraper in scrapers)
+
+
+def test_process_pool_is_closed_on_shutdown(monkeypatch):
+    registered = []
+    monkeypatch.setattr(page_fetcher.atexit, "register", registered.append)
+    monkeypatch.setattr(page_fetcher.atexit, "unregister", registered.remove)
+    monkeypatch.setattr(page_fetcher, "_browser_pool", None)
+    monkeypatch.setattr(page_fetcher, "BrowserPool", lambda: BrowserPool(size=2, factory=FakeScraper))
+
+    shared = page_fetcher.get_browser_pool()
+    assert page_fetcher.get_browser_pool() is shared
+    assert registered == [page_fetcher.close_browser_pool]
+    with shared.session() as scraper:
+        pass
+
+    page_fetcher.close_browser_pool()
+
+    assert scraper.closed
+    assert registered == []
+    assert page_fetcher._browser_pool is None
+    # Closing again (e.g. atexit after the Celery hook) is a no-op
+    page_fetcher.close_browser_pool()
+
+
+def test_table_has_rows():
+    ready = table_has_rows("paperlist")
+
+    assert ready(STATIC_TABLE)
+    assert not ready(DYNAMIC_TABLE)
+    assert not ready("<html></html>")
@@ -0,0 +1,71 @@
+"""Tests for the streaming paper export encoders.
+
+The export query and streaming are covered against a database in
+``tests/integration/test_paper_export.py``.
+"""
+import csv
+import io
+import json
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.services.paper_export import (
+    EXPORT_COLUMNS,
+    PaperFilters,
+    encode_csv,
+    encode_ndjson,
+    export_chunks,
+)
+
+
+def make_row(**overrides):
+    row = {column: None for column in EXPORT_COLUMNS}
+    row.update(
+        id=str(uuid4()),
+        title="Neural Radiance Fields",
+        authors=["Ben Mildenhall", "Pratul Srinivasan"],
+        abstract="We present a method.",
+        published_date=date(2020, 3, 19),
+        year=2020,
+        datasets_used=["LLFF"],
+        github_stars=9000,
+        github_weekly_hype=1.5,
+        citation_count=42,
+        citations_total=3,
+        references_total=12,
+        created_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+        updated_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+    )
+    row.update(overrides)
+    return row
+
+
+def test_encode_ndjson():
+    row = make_row()
+
+    lines = encode_ndjson([row, make_row(title="Second")]).decode().splitlines()
+
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record["authors"] == ["Ben Mildenhall", "Pratul Srinivasan"]
+    assert record["published_date"] == "2020-03-19"
+    assert record["created_at"] == "2024-01-02T03:04:05+00:00"
+    assert record["github_stars"] == 9000
+
+
+def test_encode_csv():
+    data = encode_csv([make_row(venue=None)], header=True).decode()
+
+    rows = list(csv.DictReader(io.StringIO(data)))
+    assert list(rows[0].keys()) == EXPORT_COLUMNS
+    assert json.loads(rows[0]["authors"]) == ["Ben Mildenhall", "Pratul Srinivasan"]
+    assert rows[0]["venue"] == ""
+    assert rows[0]["citations_total"] == "3"
+
+
+async def test_export_chunks_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        async for _ in export_chunks(None, PaperFilters(), "xml"):
+            pass
@@ -0,0 +1,120 @@
+"""Tests for the bounded, versioned per-paper hype score cache."""
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.services import paper_hype_service
+from src.services.paper_hype_service import PaperHypeCache, hype_scores_from_history
+from src.utils.ttl_cache import TTLCache
+
+TODAY = date(2026, 10, 18)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    clock = [1_000.0]
+    monkeypatch.setattr("src.utils.ttl_cache.time.monotonic", lambda: clock[0])
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+
+    clock[0] += 59
+    assert cache.get("a") == 1
+    clock[0] += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_hype_scores_from_history():
+    points = [(TODAY - timedelta(days=29), 100), (TODAY - timedelta(days=7), 160), (TODAY, 230)]
+
+    scores = hype_scores_from_history(
+        date(2026, 9, 18), 2, points, today=TODAY, now=datetime(2026, 10, 18, 12),
+    )
+
+    assert scores["average_hype"] == round((2 * 100 + 230) / 30, 2)
+    assert scores["weekly_hype"] == 10.0
+    assert scores["monthly_hype"] == round(130 / 30, 2)
+    assert hype_scores_from_history(None, 0, [], today=TODAY)["weekly_hype"] == 0.0
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def get_many(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set_many(self, items, ttl=None):
+        self.store.update(items)
+        return True
+
+    async def increment(self, key, amount=1):
+        self.store[key] = self.store.get(key, 0) + amount
+        return self.store[key]
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeCache()
+    monkeypatch.setattr(paper_hype_service, "get_cache", lambda: fake)
+    monkeypatch.setattr(paper_hype_service, "VERSION_CHECK_INTERVAL", 0.0)
+    return fake
+
+
+@pytest.fixture
+def computed(monkeypatch):
+    calls = []
+
+    async def compute(session, paper_ids):
+        calls.append(list(paper_ids))
+        return {paper_id: {"average_hype": 1.0} for paper_id in paper_ids if paper_id != unknown}
+
+    unknown = uuid4()
+    monkeypatch.setattr(paper_hype_service, "compute_paper_hype_scores", compute)
+    return calls, unknown
+
+
+async def test_bulk_lookup_computes_only_misses(redis, computed):
+    calls, unknown = computed
+    cache = PaperHypeCache(maxsize=100, ttl=60)
+    a, b = uuid4(), uuid4()
+
+    first = await cache.get_many(None, [a, b, unknown, a])
+    assert set(first) == {a, b}
+    assert calls == [[a, b, unknown]]
+
+    await cache.get_many(None, [a, b])
+    assert len(calls) == 1
+
+    # A second worker reuses the shared tier
+    other = PaperHypeCache(maxsize=100, ttl=60)
+    assert set(await other.get_many(None, [a, b])) == {a, b}
+    assert len(calls) == 1
+
+
+async def test_publish_refresh_invalidates_both_tiers(redis, computed, monkeypatch):
+    calls, _ = computed
+    cache = PaperHypeCache(maxsize=100, ttl=60)
+    monkeypatch.setattr(paper_hype_service, "_hype_cache", cache)
+    a = uuid4()
+
+    await cache.get_many(None, [a])
+    await paper_hype_service.publish_hype_refresh()
+    await cache.get_many(None, [a])
+
+    assert calls == [[a], [a]]
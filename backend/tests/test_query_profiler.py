@@ -0,0 +1,67 @@
+"""Tests for per-request query profiling and N+1 detection."""
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import create_engine, text
+
+from src.middleware.query_profiler import (
+    N_PLUS_ONE_THRESHOLD,
+    QueryProfilerMiddleware,
+    get_query_profile_registry,
+    install_query_profiler,
+    statement_shape,
+)
+
+
+def test_statement_shape_normalizes_parameters():
+    a = statement_shape("SELECT * FROM papers\n WHERE id = $1 LIMIT 10")
+    b = statement_shape("SELECT *  FROM papers WHERE id = $7 LIMIT 20")
+    assert a == b
+
+    in_list = statement_shape("SELECT * FROM authors WHERE id IN ($1, $2, $3)")
+    assert in_list == statement_shape("SELECT * FROM authors WHERE id IN ($4, $5)")
+
+
+@pytest.fixture
+def profiled_app():
+    engine = create_engine("sqlite://")
+    install_query_profiler(engine)
+    install_query_profiler(engine)  # idempotent
+
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware, sample_rate=0.0)
+
+    @app.get("/items/{count}")
+    def read_items(count: int):
+        with engine.connect() as conn:
+            for i in range(count):
+                conn.execute(text("SELECT :value"), {"value": i})
+        return {"count": count}
+
+    return app
+
+
+async def test_profiled_request_reports_queries_and_n_plus_one(profiled_app):
+    async with AsyncClient(app=profiled_app, base_url="http://test") as client:
+        response = await client.get(
+            f"/items/{N_PLUS_ONE_THRESHOLD}", headers={"X-Debug-Queries": "1"}
+        )
+
+    assert response.status_code == 200
+    header = response.headers["X-Query-Profile"]
+    assert f"queries={N_PLUS_ONE_THRESHOLD}" in header
+    assert "n_plus_one=1" in header
+    assert "db;dur=" in response.headers["Server-Timing"]
+
+    stats = get_query_profile_registry().snapshot()["routes"]["GET /items/{count}"]
+    assert stats["profiled_requests"] >= 1
+    assert stats["n_plus_one_requests"] >= 1
+
+
+async def test_unsampled_request_only_records_latency(profiled_app):
+    async with AsyncClient(app=profiled_app, base_url="http://test") as client:
+        response = await client.get("/items/1")
+
+    assert "X-Query-Profile" not in response.headers
+    stats = get_query_profile_registry().snapshot()["routes"]["GET /items/{count}"]
+    assert stats["requests"] >= 1
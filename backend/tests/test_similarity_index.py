@@ -0,0 +1,227 @@
+"""Tests for the hashed TF-IDF similarity index."""
+import asyncio
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from src.services import similarity_index as similarity_module
+from src.services.similarity_index import SimilarityIndex, tokenize
+from src.services.topic_matching_service import BatchTopicMatcher, TopicMatchingService
+
+TOPICS = [
+    "graph neural networks message passing node classification",
+    "denoising diffusion models image generation sampling",
+    "reinforcement learning policy gradient reward agents",
+    "transformer language model pretraining tokens",
+    "object detection bounding box anchors",
+]
+FILLER = ["data", "training", "benchmark", "robust", "efficient", "large", "evaluation", "analysis"]
+
+
+def make_corpus(size, seed=0):
+    rng = np.random.default_rng(seed)
+    papers = []
+    for i in range(size):
+        topic = i % len(TOPICS)
+        words = TOPICS[topic].split()
+        title = " ".join(rng.choice(words, 3, replace=False))
+        abstract = " ".join(list(rng.choice(words, 6)) + list(rng.choice(FILLER, 6)))
+        papers.append((uuid4(), title, abstract, topic))
+    return papers
+
+
+def build(path, papers):
+    index = SimilarityIndex(path)
+    index.add_many((paper_id, title, abstract) for paper_id, title, abstract, _ in papers)
+    return index
+
+
+def test_tokenize_drops_stopwords_and_adds_bigrams():
+    assert tokenize("The Graph of Neural Networks") == [
+        "graph", "neural", "networks", "graph neural", "neural networks",
+    ]
+
+
+def test_related_papers_share_topic(tmp_path):
+    papers = make_corpus(300)
+    index = build(tmp_path, papers)
+    topic_of = {paper_id: topic for paper_id, _, _, topic in papers}
+
+    for paper_id, _, _, topic in papers[:20]:
+        related = index.related(paper_id, k=5)
+        assert len(related) == 5
+        assert paper_id not in {related_id for related_id, _ in related}
+        assert all(topic_of[related_id] == topic for related_id, _ in related)
+        similarities = [similarity for _, similarity in related]
+        assert similarities == sorted(similarities, reverse=True)
+
+
+def test_persisted_index_reopens_read_only(tmp_path):
+    papers = make_corpus(200)
+    index = build(tmp_path, papers)
+    index.save(watermark={"created_at": "2026-10-18T00:00:00", "id": str(papers[-1][0])})
+    expected = index.related(papers[0][0], k=10)
+
+    reopened = SimilarityIndex(tmp_path, read_only=True)
+    assert len(reopened) == 200
+    assert reopened.watermark["id"] == str(papers[-1][0])
+    assert [pid for pid, _ in reopened.related(papers[0][0], k=10)] == [pid for pid, _ in expected]
+    with pytest.raises(RuntimeError):
+        reopened.add(uuid4(), "title", "abstract")
+
+
+def test_incremental_add_grows_capacity_and_upserts(tmp_path):
+    papers = make_corpus(1_500)
+    index = build(tmp_path, papers[:1_000])
+    index.save()
+    n_docs = index.n_docs
+
+    index = SimilarityIndex(tmp_path)
+    index.add_many((paper_id, title, abstract) for paper_id, title, abstract, _ in papers[1_000:])
+    # Re-adding a paper re-embeds it without counting it twice
+    paper_id, title, abstract, _ = papers[0]
+    index.add(paper_id, title, abstract)
+    index.save()
+
+    assert len(index) == 1_500
+    assert index.n_docs == n_docs + 500
+    assert papers[1_499][0] in SimilarityIndex(tmp_path, read_only=True)
+
+
+def test_ivf_search_matches_exhaustive_search(tmp_path, monkeypatch):
+    monkeypatch.setattr(similarity_module, "MIN_TRAIN_SIZE", 500)
+    papers = make_corpus(2_000, seed=1)
+    index = build(tmp_path, papers)
+    queries = [paper_id for paper_id, _, _, _ in papers[:25]]
+    exhaustive = {paper_id: index.related(paper_id, k=10) for paper_id in queries}
+
+    assert index.needs_training()
+    index.train(nlist=16)
+    assert not index.needs_training()
+
+    recall = np.mean([
+        len({pid for pid, _ in index.related(paper_id, k=10)} & {pid for pid, _ in exhaustive[paper_id]}) / 10
+        for paper_id in queries
+    ])
+    assert recall >= 0.9
+
+    # Papers added after training land in a partition and are searchable
+    new_id = uuid4()
+    index.add(new_id, papers[0][1], papers[0][2])
+    assert new_id in {pid for pid, _ in index.related(papers[0][0], k=5)}
+
+
+async def test_embedding_relevance_in_topic_matching(tmp_path):
+    index = build(tmp_path, make_corpus(200))
+    topics = [
+        SimpleNamespace(id=uuid4(), name="Graph Learning", description="graph neural networks", keywords=["node classification"]),
+        SimpleNamespace(id=uuid4(), name="Generative Models", description="diffusion image generation", keywords=None),
+    ]
+    paper = SimpleNamespace(title="Message passing on graphs", abstract="Neural networks for node classification.")
+
+    keyword_only = BatchTopicMatcher(topics).score(paper.title, paper.abstract)
+    combined = BatchTopicMatcher(topics, similarity_index=index).score(paper.title, paper.abstract)
+
+    assert topics[0].id not in keyword_only or keyword_only[topics[0].id] <= combined[topics[0].id]
+    assert combined[topics[0].id] > combined.get(topics[1].id, 5.0)
+
+    service = TopicMatchingService(session=None, similarity_index=index)
+    for topic in topics:
+        assert await service.calculate_relevance(paper, topic) == pytest.approx(combined.get(topic.id, 5.0))
+
+
+def test_row_lookup_handles_ids_with_trailing_zero_bytes(tmp_path):
+    papers = make_corpus(50)
+    padded_id = UUID(bytes=papers[0][0].bytes[:12] + b"\x00" * 4)
+    papers[0] = (padded_id, *papers[0][1:])
+    build(tmp_path, papers).save()
+
+    reopened = SimilarityIndex(tmp_path, read_only=True)
+    assert all(paper_id in reopened for paper_id, _, _, _ in papers)
+    assert UUID(bytes=padded_id.bytes[:12] + b"\x00\x00\x00\x01") not in reopened
+    assert reopened.vector(padded_id) is not None
+    assert padded_id not in {pid for pid, _ in reopened.related(padded_id, k=49)}
+
+
+async def test_refresh_swaps_in_new_version(tmp_path, monkeypatch):
+    papers = make_corpus(100)
+    index = build(tmp_path, papers[:60])
+    index.save()
+    monkeypatch.setattr(similarity_module, "INDEX_DIR", tmp_path)
+    monkeypatch.setattr(similarity_module, "_index", SimilarityIndex(tmp_path, read_only=True))
+    opened = similarity_module.get_similarity_index()
+
+    index.add_many((paper_id, title, abstract) for paper_id, title, abstract, _ in papers[60:])
+    index.save()
+    refresh = asyncio.create_task(similarity_module.refresh_similarity_index(interval=0.01))
+    try:
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if similarity_module.get_similarity_index() is not opened:
+                break
+    finally:
+        refresh.cancel()
+
+    # Searches already holding the old copy keep a consistent view
+    assert len(opened) == 60
+    assert len(similarity_module.get_similarity_index()) == 100
+
+
+def test_writes_never_touch_the_published_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(similarity_module, "MIN_TRAIN_SIZE", 100)
+    papers = make_corpus(300)
+    writer = build(tmp_path, papers[:200])
+    writer.save()
+    published = writer.version
+    files = {path.name: path.read_bytes() for path in (tmp_path / published).iterdir()}
+    reader = SimilarityIndex(tmp_path, read_only=True)
+    expected = reader.related(papers[0][0], k=10)
+
+    writer = SimilarityIndex(tmp_path)
+    writer.add_many((paper_id, title, abstract) for paper_id, title, abstract, _ in papers[200:])
+    writer.add(papers[0][0], "object detection", "bounding box anchors")
+    writer.train(nlist=8)
+
+    assert {path.name: path.read_bytes() for path in (tmp_path / published).iterdir()} == files
+    assert not reader.is_stale()
+    assert reader.related(papers[0][0], k=10) == expected
+
+    writer.save()
+    assert writer.version != published
+    assert (tmp_path / "CURRENT").read_text() == writer.version
+    assert reader.is_stale()
+    assert len(SimilarityIndex(tmp_path, read_only=True)) == 300
+
+
+def test_save_keeps_current_and_replaced_versions(tmp_path):
+    papers = make_corpus(40)
+    versions = []
+    for start in range(0, 40, 10):
+        index = SimilarityIndex(tmp_path)
+        index.add_many((paper_id, title, abstract) for paper_id, title, abstract, _ in papers[start:start + 10])
+        index.save()
+        versions.append(index.version)
+
+    assert len(set(versions)) == 4
+    assert sorted(path.name for path in tmp_path.iterdir() if path.is_dir()) == versions[-2:]
+
+    # Saving without changes publishes nothing new
+    unchanged = SimilarityIndex(tmp_path)
+    unchanged.save(watermark=unchanged.watermark)
+    assert unchanged.version == versions[-1]
+
+
+def test_fresh_index_replaces_current_version_on_save(tmp_path):
+    papers = make_corpus(60)
+    build(tmp_path, papers[:50]).save()
+
+    rebuilt = SimilarityIndex(tmp_path, fresh=True)
+    rebuilt.add_many((paper_id, title, abstract) for paper_id, title, abstract, _ in papers[50:])
+    assert len(SimilarityIndex(tmp_path, read_only=True)) == 50
+
+    rebuilt.save()
+    reopened = SimilarityIndex(tmp_path, read_only=True)
+    assert len(reopened) == 10
+    assert papers[0][0] not in reopened
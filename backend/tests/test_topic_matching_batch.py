@@ -0,0 +1,84 @@
+"""Tests for the single-pass batch topic matcher."""
+import random
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.services.topic_matching_service import BatchTopicMatcher, TopicMatchingService
+from src.utils.aho_corasick import AhoCorasick
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers", "", "sh"])
+
+    assert automaton.find("ushers") == {0, 1, 3, 5}
+    assert automaton.find("ahishe") == {0, 1, 2, 5}
+    assert automaton.find("xyz") == set()
+
+
+def test_aho_corasick_matches_substring_search():
+    rng = random.Random(0)
+    alphabet = "abc "
+    patterns = ["".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(40)]
+    automaton = AhoCorasick(patterns)
+
+    for _ in range(200):
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 30)))
+        expected = {i for i, pattern in enumerate(patterns) if pattern in text}
+        assert automaton.find(text) == expected
+
+
+def make_topic(name, keywords=None):
+    return SimpleNamespace(id=uuid4(), name=name, keywords=keywords)
+
+
+@pytest.fixture
+def topics():
+    return [
+        make_topic("neural rendering", ["nerf", "radiance field", "view synthesis"]),
+        make_topic("diffusion models", ["diffusion", "denoising", "score-based", "diffusion"]),
+        make_topic("object detection", ["detector", "bounding box"]),
+        make_topic("graph learning", None),
+        make_topic("speech", ["asr"]),
+    ]
+
+
+def test_batch_scores_match_scalar_fallback(topics):
+    service = TopicMatchingService(session=None)
+    matcher = BatchTopicMatcher(topics)
+    papers = [
+        SimpleNamespace(title="NeRF-W: Radiance Fields in the Wild", abstract="Novel View Synthesis from photos."),
+        SimpleNamespace(title="Denoising Diffusion Probabilistic Models", abstract="We present diffusion."),
+        SimpleNamespace(title="Speech recognition", abstract="An object detection approach for ASR"),
+        SimpleNamespace(title="Unrelated", abstract="Nothing to see here."),
+        SimpleNamespace(title="Graph Learning at scale", abstract=""),
+    ]
+
+    for paper in papers:
+        scores = matcher.score(paper.title, paper.abstract)
+        for topic in topics:
+            expected = service._keyword_matching_fallback(paper, topic)
+            assert scores.get(topic.id, 5.0) == expected, (paper.title, topic.name)
+
+
+@pytest.mark.asyncio
+async def test_match_papers_bulk_collects_rows_above_threshold(topics):
+    service = TopicMatchingService(session=None)
+    captured = []
+
+    async def upsert(rows):
+        captured.extend(rows)
+        return len(rows)
+
+    service.upsert_matches = upsert
+    papers = [
+        SimpleNamespace(id=uuid4(), title="Diffusion detector", abstract="bounding box denoising"),
+        SimpleNamespace(id=uuid4(), title="Unrelated", abstract=None),
+    ]
+
+    matched = await service.match_papers_bulk(papers, BatchTopicMatcher(topics))
+
+    assert matched == {papers[0].id: 2}
+    assert {row["topic_id"] for row in captured} == {topics[1].id, topics[2].id}
+    assert all(row["relevance_score"] >= 6.0 for row in captured)
@@ -21,6 +21,32 @@ export interface CrawlerJob {
   user_id?: string;
   created_at: string;
   retry_count: number;
+  priority?: 'high' | 'normal' | 'low';
+}
+
+// Queue lists, highest priority first (shared with backend job_queue_backends.py)
+const QUEUE_KEYS = {
+  high: 'crawler:queue:high',
+  normal: 'crawler:queue',
+  low: 'crawler:queue:low',
+} as const;
+
+function queueKey(job: CrawlerJob): string {
+  return QUEUE_KEYS[job.priority ?? 'normal'] ?? QUEUE_KEYS.normal;
+}
+
+// Pop the next job that has not been cancelled, highest priority first
+async function nextJob(redis: Redis): Promise<CrawlerJob | null> {
+  for (const key of Object.values(QUEUE_KEYS)) {
+    let job: CrawlerJob | null;
+    while ((job = await redis.lpop<CrawlerJob>(key))) {
+      const meta = await redis.get<{ status?: string }>(`crawler:job:${job.id}`);
+      if (meta?.status !== 'cancelled') {
+        return job;
+      }
+    }
+  }
+  return null;
 }
 
 export interface JobResult {
@@ -69,6 +95,7 @@ async function processJob(job: CrawlerJob, env: Env, redis: Redis): Promise<void
     };
 
     await redis.setex(`crawler:result:${job.id}`, 86400, JSON.stringify(jobResult));
+    await redis.hincrby('crawler:stats', 'success', 1);
 
     // Update backend
     await notifyBackend(jobResult, env);
@@ -80,7 +107,7 @@ async function processJob(job: CrawlerJob, env: Env, redis: Redis): Promise<void
     // Retry logic
     if (job.retry_count < 3) {
       job.retry_count++;
-      await redis.rpush('crawler:queue', JSON.stringify(job));
+      await redis.rpush(queueKey(job), JSON.stringify(job));
       console.log(`Job ${job.id} requeued for retry ${job.retry_count}`);
     } else {
       // Max retries reached, mark as failed
@@ -92,6 +119,7 @@ async function processJob(job: CrawlerJob, env: Env, redis: Redis): Promise<void
       };
 
       await redis.setex(`crawler:result:${job.id}`, 86400, JSON.stringify(jobResult));
+      await redis.hincrby('crawler:stats', 'failed', 1);
       await notifyBackend(jobResult, env);
     }
   }
@@ -220,7 +248,7 @@ export default {
 
     // Process up to 10 jobs per execution
     for (let i = 0; i < 10; i++) {
-      const jobData = await redis.lpop<CrawlerJob>('crawler:queue');
+      const jobData = await nextJob(redis);
 
       if (!jobData) {
         console.log('No more jobs in queue');
@@ -257,11 +285,14 @@ export default {
 
     // Queue status endpoint
     if (url.pathname === '/status' && request.method === 'GET') {
-      const queueLength = await redis.llen('crawler:queue');
+      const [high, normal, low] = await Promise.all(
+        Object.values(QUEUE_KEYS).map((key) => redis.llen(key))
+      );
 
       return new Response(
         JSON.stringify({
-          queue_length: queueLength,
+          queue_length: high + normal + low,
+          queued: { high, normal, low },
           timestamp: new Date().toISOString(),
         }),
         {
@@ -285,7 +316,7 @@ export default {
           job.retry_count = 0;
         }
 
-        await redis.rpush('crawler:queue', JSON.stringify(job));
+        await redis.rpush(queueKey(job), JSON.stringify(job));
 
         return new Response(
           JSON.stringify({